@@ -7,6 +7,8 @@ import json
 import os
 import re
 
+from ticker_parser import parse_ticker_map
+
 def calculate_total_deposits():
     """Calculate total successful deposits from deposits.txt"""
     deposits_file = os.path.join('..', 'deposits.txt')
@@ -56,8 +58,10 @@ def generate_improved_dashboard():
     # Replace the deposits placeholder with actual value
     html_content = html_content.replace('${total_deposits:,.2f}', f'${total_deposits:,.2f}')
     
-    # Embed the data directly in JavaScript
-    data_js = f"const EMBEDDED_DATA = {json.dumps(data, indent=2)};"
+    # Embed the data directly in JavaScript, with every fill ticker pre-parsed by the shared parser
+    ticker_info = parse_ticker_map(fill.get('ticker') for fill in data.get('fills', []))
+    data_js = (f"const EMBEDDED_DATA = {json.dumps(data, indent=2)};\n"
+               f"        const TICKER_INFO = {json.dumps(ticker_info)};")
     
     # Add the embedded data script
     script_insertion_point = "<script>"
@@ -530,120 +534,21 @@ def create_improved_dashboard_html(total_deposits=0.0):
         }
 
         function parseMarketName(ticker) {
-            // Parse tickers like "KXWTAMATCH-25AUG17STAANN-STA" into readable format
-            try {
-                const parts = ticker.split('-');
-                
-                if (parts.length === 3) {
-                    // Format: KXWTAMATCH-25AUG17STAANN-STA
-                    const datePart = parts[1]; // "25AUG17STAANN"
-                    const selectedSide = parts[2]; // "STA"
-                    
-                    // Extract match part from date part (remove date prefix)
-                    // Date format is YYMONDD (7 chars), so match starts at position 7
-                    if (datePart.length > 7) {
-                        const matchPart = datePart.substring(7); // "STAANN"
-                        
-                        // Find teams by removing selected side from match part
-                        const teams = extractTeamsFromMatch(matchPart, selectedSide);
-                        if (teams) {
-                            return formatMatchup(teams.team1, teams.team2, selectedSide);
-                        }
-                    }
-                } else if (parts.length >= 4) {
-                    // Format: KX...-DATE-MATCHPART-SELECTED
-                    const matchPart = parts[2];
-                    const selectedSide = parts[3];
-                    
-                    const teams = extractTeamsFromMatch(matchPart, selectedSide);
-                    if (teams) {
-                        return formatMatchup(teams.team1, teams.team2, selectedSide);
-                    }
-                }
-                
-                // Special cases
-                if (ticker.includes('PRES')) {
-                    return 'Presidential Election';
-                } else if (ticker.includes('ECON')) {
-                    return 'Economic Event';
-                }
-                
-                // Fallback: return a cleaned version of the ticker
-                return ticker.replace(/^KX/, '').replace(/-.*$/, '');
-            } catch (e) {
-                return ticker;
-            }
-        }
-
-        function extractTeamsFromMatch(matchPart, selectedSide) {
-            // Examples:
-            // STAANN - STA -> STA vs ANN
-            // MURPIC - PIC -> MUR vs PIC  
-            // JACNO - NO -> JAC vs NO
-            // ABCDEF - DEF -> ABC vs DEF
-            // HGJFSU - HGJ -> HGJ vs FSU
-            
-            const selected = selectedSide.toUpperCase();
-            const match = matchPart.toUpperCase();
-            
-            // Check if selected side is at the beginning
-            if (match.startsWith(selected)) {
-                const opponent = match.substring(selected.length);
-                return {
-                    team1: selected,
-                    team2: opponent
-                };
+            // Tickers are parsed once in Python (ticker_parser.py) and embedded as TICKER_INFO
+            const info = TICKER_INFO[ticker];
+            if (info && info.team_codes.length === 2) {
+                return formatMatchup(info.team_codes[0], info.team_codes[1], info.side || '');
             }
             
-            // Check if selected side is at the end
-            if (match.endsWith(selected)) {
-                const opponent = match.substring(0, match.length - selected.length);
-                return {
-                    team1: opponent,
-                    team2: selected
-                };
+            // Special cases
+            if (ticker.includes('PRES')) {
+                return 'Presidential Election';
+            } else if (ticker.includes('ECON')) {
+                return 'Economic Event';
             }
             
-            // If no exact match, try to split evenly and see which half matches
-            const midPoint = Math.floor(match.length / 2);
-            const firstHalf = match.substring(0, midPoint);
-            const secondHalf = match.substring(midPoint);
-            
-            if (firstHalf === selected) {
-                return {
-                    team1: selected,
-                    team2: secondHalf
-                };
-            }
-            
-            if (secondHalf === selected) {
-                return {
-                    team1: firstHalf,
-                    team2: selected
-                };
-            }
-            
-            // Last resort: try to find selected as substring and split accordingly
-            const selectedIndex = match.indexOf(selected);
-            if (selectedIndex === 0) {
-                // Selected is at start
-                return {
-                    team1: selected,
-                    team2: match.substring(selected.length)
-                };
-            } else if (selectedIndex === match.length - selected.length) {
-                // Selected is at end
-                return {
-                    team1: match.substring(0, selectedIndex),
-                    team2: selected
-                };
-            }
-            
-            // Fallback: split in half
-            return {
-                team1: firstHalf,
-                team2: secondHalf
-            };
+            // Fallback: return a cleaned version of the ticker
+            return ticker.replace(/^KX/, '').replace(/-.*$/, '');
         }
 
         function formatMatchup(team1, team2, selectedTeam) {
@@ -663,36 +568,9 @@ def create_improved_dashboard_html(total_deposits=0.0):
         }
 
         function extractEventDate(ticker) {
-            // Extract event date from ticker like "KXWTAMATCH-25AUG17STAANN-STA"
-            try {
-                const parts = ticker.split('-');
-                if (parts.length >= 2) {
-                    let datePart = parts[1]; // "25AUG17STAANN"
-                    
-                    // For format like "25AUG17STAANN", extract just the date part (first 7 chars)
-                    if (datePart.length > 7) {
-                        datePart = datePart.substring(0, 7); // "25AUG17"
-                    }
-                    
-                    if (datePart.length >= 7) {
-                        const year = '20' + datePart.substring(0, 2); // "2025"
-                        const month = datePart.substring(2, 5); // "AUG"
-                        const day = datePart.substring(5, 7); // "17"
-                        
-                        const monthMap = {
-                            'JAN': '01', 'FEB': '02', 'MAR': '03', 'APR': '04',
-                            'MAY': '05', 'JUN': '06', 'JUL': '07', 'AUG': '08',
-                            'SEP': '09', 'OCT': '10', 'NOV': '11', 'DEC': '12'
-                        };
-                        
-                        const monthNum = monthMap[month] || '01';
-                        return `${year}-${monthNum}-${day}`;
-                    }
-                }
-                return '';
-            } catch (e) {
-                return '';
-            }
+            // YYYY-MM-DD from the embedded ticker records ('' for tickers without a date)
+            const info = TICKER_INFO[ticker];
+            return info ? info.date : '';
         }
 
         function extractSport(ticker) {
@@ -1,7 +1,8 @@
 import requests
+import asyncio
 import base64
 import time
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Union
 from datetime import datetime, timedelta
 from enum import Enum
 import json
@@ -25,7 +26,9 @@ except ImportError as e:
         def connect(*args, **kwargs):
             raise NotImplementedError("Websockets not available due to SSL issues")
         
-        class ConnectionClosed(Exception):
+        class WebSocketException(Exception):
+            pass
+        class ConnectionClosed(WebSocketException):
             def __init__(self, code=None, reason=None):
                 self.code = code
                 self.reason = reason
@@ -232,27 +235,171 @@ class KalshiHttpClient(KalshiBaseClient):
         params = {k: v for k, v in params.items() if v is not None}
         return self.get(self.markets_url + '/trades', params=params)
 
+class TickerPriceBook:
+    """In-memory latest ticker state for each market, built from WebSocket ticker messages."""
+
+    # Fields carried over from ticker messages into the book
+    PRICE_FIELDS = ("price", "yes_bid", "yes_ask", "volume", "open_interest",
+                    "dollar_volume", "dollar_open_interest")
+
+    def __init__(self):
+        self._markets: Dict[str, Dict[str, Any]] = {}
+        self.updates_applied = 0
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._markets
+
+    def apply(self, msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Merges one ticker message into the book.
+
+        Only fields present in the message are overwritten, so partial updates keep the
+        rest of the market's last known state. A `*_delta` field is added to its base field
+        unless the message also carries the base field itself, which already includes it.
+
+        Args:
+            msg (dict): The "msg" body of a ticker message.
+
+        Returns:
+            dict: A copy of the market's updated state, or None if the message has no ticker.
+        """
+        ticker = msg.get("market_ticker")
+        if not ticker:
+            return None
+
+        market = self._markets.setdefault(ticker, {"market_ticker": ticker})
+        for field in self.PRICE_FIELDS:
+            if field in msg:
+                market[field] = msg[field]
+                continue
+            delta = msg.get(field + "_delta")
+            if delta is not None:
+                market[field] = market.get(field, 0) + delta
+
+        # The NO bid is the complement of the YES ask (prices are in cents)
+        if market.get("yes_ask") is not None:
+            market["no_bid"] = 100 - market["yes_ask"]
+        if "ts" in msg:
+            market["ts"] = msg["ts"]
+
+        self.updates_applied += 1
+        return dict(market)
+
+    def get(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the latest state for a ticker."""
+        market = self._markets.get(ticker)
+        return dict(market) if market else None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Returns a copy of every market in the book."""
+        return {ticker: dict(market) for ticker, market in self._markets.items()}
+
 class KalshiWebSocketClient(KalshiBaseClient):
-    """Client for handling WebSocket connections to the Kalshi API."""
+    """Client for handling WebSocket connections to the Kalshi API.
+
+    Streams the ticker channel into a TickerPriceBook. Consumers can register callbacks
+    with add_callback() or iterate over updates with `async for update in client.stream()`.
+    """
     def __init__(
         self,
         key_id: str,
         private_key: rsa.RSAPrivateKey,
         environment: Environment = Environment.DEMO,
+        market_tickers: Optional[List[str]] = None,
+        reconnect: bool = True,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        record_path: Optional[str] = None,
     ):
+        """Initializes the WebSocket client.
+
+        Args:
+            key_id (str): Your Kalshi API key ID.
+            private_key (rsa.RSAPrivateKey): Your RSA private key.
+            environment (Environment): The API environment to use (DEMO or PROD).
+            market_tickers (list): Tickers to subscribe to; all markets when None.
+            reconnect (bool): Reconnect and resubscribe when the connection drops.
+            reconnect_delay (float): First reconnect backoff (seconds), doubled per failed attempt.
+            max_reconnect_delay (float): Upper bound (seconds) for reconnect backoff.
+            record_path (str): Append every received frame to this file for later replay.
+        """
         super().__init__(key_id, private_key, environment)
         self.ws = None
         self.url_suffix = "/trade-api/ws/v2"
         self.message_id = 1  # Add counter for message IDs
+        self.market_tickers = market_tickers
+        self.reconnect = reconnect
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.record_path = record_path
+
+        self.price_book = TickerPriceBook()
+        self.connection_count = 0
+        self._callbacks: List[Callable[[Dict[str, Any]], Any]] = []
+        self._queues: List[asyncio.Queue] = []
+        self._stopped = False
+        self._running = False
+        # connect() started on behalf of stream() consumers, shared by all of them
+        self._connect_task: Optional[asyncio.Future] = None
+
+    def add_callback(self, callback: Callable[[Dict[str, Any]], Any]) -> None:
+        """Registers a sync or async callable invoked with each updated market state."""
+        self._callbacks.append(callback)
 
     async def connect(self):
-        """Establishes a WebSocket connection using authentication."""
+        """Establishes a WebSocket connection using authentication.
+
+        Reconnects with exponential backoff (and resubscribes in on_open) until stop()
+        is called, unless reconnect is disabled. Dropped connections and rejected
+        handshakes (e.g. HTTP 429/5xx) both back off and retry.
+        """
+        if self._running:
+            return
+        self._running = True
+        try:
+            await self._connect_loop()
+        finally:
+            self._running = False
+
+    async def _connect_loop(self):
+        """Connection attempts and reconnect backoff for connect()."""
         host = self.WS_BASE_URL + self.url_suffix
-        auth_headers = self.request_headers("GET", self.url_suffix)
-        async with websockets.connect(host, additional_headers=auth_headers) as websocket:
-            self.ws = websocket
-            await self.on_open()
-            await self.handler()
+        delay = self.reconnect_delay
+        self._stopped = False
+        while not self._stopped:
+            try:
+                # Fresh auth headers each attempt; the signature includes a timestamp
+                auth_headers = self.request_headers("GET", self.url_suffix)
+                async with websockets.connect(host, additional_headers=auth_headers) as websocket:
+                    self.ws = websocket
+                    self.connection_count += 1
+                    delay = self.reconnect_delay
+                    await self.on_open()
+                    await self.handler()
+            except (OSError, websockets.WebSocketException) as e:
+                await self.on_error(e)
+            finally:
+                self.ws = None
+
+            if self._stopped or not self.reconnect:
+                break
+            print(f"Reconnecting in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+        # Let stream() consumers finish once the connection is gone for good
+        for queue in self._queues:
+            queue.put_nowait(None)
+
+    async def stop(self):
+        """Stops streaming and closes the current connection."""
+        self._stopped = True
+        if self.ws is not None:
+            await self.ws.close()
+        for queue in self._queues:
+            queue.put_nowait(None)
 
     async def on_open(self):
         """Callback when WebSocket connection is opened."""
@@ -260,30 +407,124 @@ class KalshiWebSocketClient(KalshiBaseClient):
         await self.subscribe_to_tickers()
 
     async def subscribe_to_tickers(self):
-        """Subscribe to ticker updates for all markets."""
+        """Subscribe to ticker updates for the configured markets (all markets by default)."""
+        params = {"channels": ["ticker"]}
+        if self.market_tickers:
+            params["market_tickers"] = list(self.market_tickers)
         subscription_message = {
             "id": self.message_id,
             "cmd": "subscribe",
-            "params": {
-                "channels": ["ticker"]
-            }
+            "params": params
         }
         await self.ws.send(json.dumps(subscription_message))
         self.message_id += 1
 
     async def handler(self):
-        """Handle incoming messages."""
+        """Handle incoming messages.
+
+        Only a closed connection ends the loop (and triggers a reconnect); bad frames and
+        callback errors are logged in on_message/_dispatch and the socket stays open.
+        """
         try:
             async for message in self.ws:
+                if self.record_path:
+                    self._record_frame(message)
                 await self.on_message(message)
         except websockets.ConnectionClosed as e:
             await self.on_close(e.code, e.reason)
-        except Exception as e:
-            await self.on_error(e)
 
-    async def on_message(self, message):
-        """Callback for handling incoming messages."""
-        print("Received message:", message)
+    def _record_frame(self, message: Union[str, bytes]):
+        """Appends a raw frame to record_path, one frame per line."""
+        frame = message.decode() if isinstance(message, bytes) else message
+        with open(self.record_path, "a") as f:
+            f.write(frame.rstrip("\n") + "\n")
+
+    async def on_message(self, message: Union[str, bytes, Dict[str, Any]]):
+        """Callback for handling incoming messages.
+
+        Ticker messages are applied to the price book and dispatched to callbacks and
+        stream() consumers; other message types are logged.
+        """
+        try:
+            data = message if isinstance(message, dict) else json.loads(message)
+        except ValueError as e:
+            await self.on_error(f"Unparseable frame: {e}")
+            return
+        msg_type = data.get("type")
+
+        if msg_type == "ticker":
+            update = self.price_book.apply(data.get("msg", {}))
+            if update is not None:
+                await self._dispatch(update)
+        elif msg_type == "subscribed":
+            print("Subscribed:", data.get("msg"))
+        elif msg_type == "error":
+            await self.on_error(data.get("msg"))
+
+    async def _dispatch(self, update: Dict[str, Any]):
+        """Sends a market update to every callback and stream consumer.
+
+        A failing callback is logged and skipped so it cannot drop the connection.
+        """
+        for callback in self._callbacks:
+            try:
+                result = callback(update)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                await self.on_error(f"Callback {getattr(callback, '__name__', callback)!r} failed: {e!r}")
+        for queue in self._queues:
+            queue.put_nowait(update)
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        """Async iterator over market updates.
+
+        Starts the connection unless one is already running (including while it is
+        handshaking or backing off), and yields each updated market state until stop()
+        is called. The connection started for stream() consumers is closed when the
+        last of them leaves.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues.append(queue)
+        if not self._running and (self._connect_task is None or self._connect_task.done()):
+            self._connect_task = asyncio.ensure_future(self.connect())
+        try:
+            while True:
+                update = await queue.get()
+                if update is None:
+                    break
+                yield update
+        finally:
+            self._queues.remove(queue)
+            connect_task = self._connect_task
+            if not self._queues and connect_task is not None and not connect_task.done():
+                await self.stop()
+                await connect_task
+
+    async def replay(self, frames: Iterable[Union[str, Dict[str, Any]]], delay: float = 0.0) -> int:
+        """Feeds recorded frames through on_message without a network connection.
+
+        Args:
+            frames (iterable): Raw JSON frames (or parsed dicts) in the order received.
+            delay (float): Optional pause between frames, in seconds.
+
+        Returns:
+            int: Number of frames replayed.
+        """
+        count = 0
+        for frame in frames:
+            if isinstance(frame, str) and not frame.strip():
+                continue
+            await self.on_message(frame)
+            count += 1
+            if delay:
+                await asyncio.sleep(delay)
+        return count
+
+    async def replay_file(self, path: str, delay: float = 0.0) -> int:
+        """Replays frames recorded one per line (see record_path)."""
+        with open(path) as f:
+            return await self.replay(f.readlines(), delay)
 
     async def on_error(self, error):
         """Callback for handling errors."""
@@ -291,4 +532,4 @@ class KalshiWebSocketClient(KalshiBaseClient):
 
     async def on_close(self, close_status_code, close_msg):
         """Callback when WebSocket connection is closed."""
-        print("WebSocket connection closed with code:", close_status_code, "and message:", close_msg)
\ No newline at end of file
+        print("WebSocket connection closed with code:", close_status_code, "and message:", close_msg)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Test script for the streamed Kalshi ticker price book, replay and reconnect loop
+"""
+
+import sys
+import os
+import json
+import asyncio
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+import git_clients
+from git_clients import KalshiWebSocketClient, TickerPriceBook
+
+TICKER = "KXNFLGAME-25SEP07BUFKC-KC"
+
+# Frames as recorded from the ticker channel: a full snapshot, then partial/delta updates
+FIRST_CONNECTION = [
+    {"type": "subscribed", "id": 1, "msg": {"channel": "ticker", "sid": 1}},
+    {"type": "ticker", "sid": 1, "msg": {"market_ticker": TICKER, "price": 55, "yes_bid": 54, "yes_ask": 56,
+                                         "volume": 1000, "open_interest": 400, "ts": 1757282400}},
+    {"type": "ticker", "sid": 1, "msg": {"market_ticker": TICKER, "yes_ask": 57, "volume_delta": 25,
+                                         "ts": 1757282401}},
+    # Absolute volume with its delta: the delta is already included and must not be added again
+    {"type": "ticker", "sid": 1, "msg": {"market_ticker": TICKER, "volume": 1040, "volume_delta": 15,
+                                         "ts": 1757282402}},
+]
+SECOND_CONNECTION = [
+    {"type": "subscribed", "id": 2, "msg": {"channel": "ticker", "sid": 1}},
+    {"type": "ticker", "sid": 1, "msg": {"market_ticker": TICKER, "yes_bid": 55, "volume_delta": 10,
+                                         "open_interest_delta": -5, "ts": 1757282410}},
+]
+EXPECTED = {"market_ticker": TICKER, "price": 55, "yes_bid": 55, "yes_ask": 57, "no_bid": 43,
+            "volume": 1050, "open_interest": 395, "ts": 1757282410}
+
+class _WebSocketError(Exception):
+    pass
+
+class _InvalidStatus(_WebSocketError):
+    pass
+
+class _Closed(_WebSocketError):
+    def __init__(self, code=None, reason=None):
+        super().__init__(code, reason)
+        self.code = code
+        self.reason = reason
+
+class _FakeSocket:
+    """Plays one connection's frames, then drops or idles until the client closes it"""
+
+    def __init__(self, frames, drop: bool):
+        self.frames = [json.dumps(frame) for frame in frames]
+        self.drop = drop
+        self.sent = []
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        self.closed = True
+
+    def __aiter__(self):
+        return self._frames()
+
+    async def _frames(self):
+        for frame in self.frames:
+            if self.closed:
+                return
+            yield frame
+        if self.drop:
+            raise _Closed(1006, "connection dropped")
+        # An idle connection stays open until the client closes it
+        while not self.closed:
+            await asyncio.sleep(0.01)
+
+def _fake_websockets(attempts):
+    """websockets stand-in that opens each attempt in turn; an exception instance fails that handshake"""
+    attempts = iter(attempts)
+
+    def connect(*args, **kwargs):
+        attempt = next(attempts)
+        if isinstance(attempt, Exception):
+            raise attempt
+        return attempt
+
+    return SimpleNamespace(connect=connect, ConnectionClosed=_Closed, WebSocketException=_WebSocketError)
+
+def _make_client(**kwargs) -> KalshiWebSocketClient:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return KalshiWebSocketClient("test-key", key, market_tickers=[TICKER], reconnect_delay=0, **kwargs)
+
+def _frames_file(frames) -> str:
+    recorded = tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False)
+    recorded.write("\n".join(json.dumps(frame) for frame in frames) + "\n")
+    recorded.close()
+    return recorded.name
+
+def test_book_merges_snapshot_and_deltas():
+    """Partial updates keep earlier fields; a delta next to its absolute value is not double counted"""
+    book = TickerPriceBook()
+    for frame in FIRST_CONNECTION + SECOND_CONNECTION:
+        if frame["type"] == "ticker":
+            book.apply(frame["msg"])
+
+    assert book.get(TICKER) == EXPECTED
+    assert book.updates_applied == 4
+    assert book.apply({"yes_bid": 10}) is None
+
+def test_replay_file_rebuilds_book():
+    """Replaying recorded frames without a network gives the same book and callbacks"""
+    path = _frames_file(FIRST_CONNECTION + SECOND_CONNECTION)
+    try:
+        client = _make_client()
+        updates = []
+        client.add_callback(updates.append)
+        replayed = asyncio.run(client.replay_file(path))
+    finally:
+        os.unlink(path)
+
+    assert replayed == 6
+    assert client.price_book.snapshot() == {TICKER: EXPECTED}
+    assert [update["volume"] for update in updates] == [1000, 1025, 1040, 1050]
+
+def test_reconnect_resubscribes_and_isolates_callback_errors():
+    """A dropped socket reconnects and resubscribes; a failing callback does not drop it"""
+    sockets = [_FakeSocket(FIRST_CONNECTION, drop=True), _FakeSocket(SECOND_CONNECTION, drop=False)]
+    record = tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False)
+    record.close()
+    client = _make_client(record_path=record.name)
+    updates = []
+
+    def broken_callback(update):
+        raise RuntimeError("bug in consumer")
+
+    async def stop_when_caught_up(update):
+        updates.append(update)
+        if update["ts"] == EXPECTED["ts"]:
+            await client.stop()
+
+    client.add_callback(broken_callback)
+    client.add_callback(stop_when_caught_up)
+    fake_websockets = _fake_websockets(sockets)
+    try:
+        with patch.object(git_clients, "websockets", fake_websockets):
+            asyncio.run(asyncio.wait_for(client.connect(), timeout=5))
+
+        # Every ticker frame reached the consumer despite the broken callback before it
+        assert client.connection_count == 2
+        assert len(updates) == 4
+        assert client.price_book.get(TICKER) == EXPECTED
+        for socket in sockets:
+            assert socket.sent == [{"id": socket.sent[0]["id"], "cmd": "subscribe",
+                                    "params": {"channels": ["ticker"], "market_tickers": [TICKER]}}]
+
+        # The recorded frames replay into the same book
+        replayed = _make_client()
+        assert asyncio.run(replayed.replay_file(record.name)) == 6
+        assert replayed.price_book.snapshot() == client.price_book.snapshot()
+    finally:
+        os.unlink(record.name)
+
+def test_rejected_handshake_backs_off_and_retries():
+    """A 429/5xx handshake rejection is retried instead of ending the feed"""
+    sockets = [_InvalidStatus("server rejected WebSocket connection: HTTP 429"),
+               _FakeSocket(FIRST_CONNECTION + SECOND_CONNECTION[1:], drop=False)]
+    client = _make_client()
+    errors = []
+
+    async def record_error(error):
+        errors.append(error)
+
+    async def stop_when_caught_up(update):
+        if update["ts"] == EXPECTED["ts"]:
+            await client.stop()
+
+    client.on_error = record_error
+    client.add_callback(stop_when_caught_up)
+    with patch.object(git_clients, "websockets", _fake_websockets(sockets)):
+        asyncio.run(asyncio.wait_for(client.connect(), timeout=5))
+
+    assert client.connection_count == 1
+    assert isinstance(errors[0], _InvalidStatus)
+    assert client.price_book.get(TICKER) == EXPECTED
+
+def test_streams_share_one_connection():
+    """Concurrent stream() consumers reuse one connection; one leaving does not end the others"""
+    socket = _FakeSocket(FIRST_CONNECTION + SECOND_CONNECTION[1:], drop=False)
+    client = _make_client()
+    started = []
+    connect = client.connect
+
+    async def counting_connect():
+        started.append(True)
+        await connect()
+
+    client.connect = counting_connect
+
+    async def consume(limit):
+        updates = []
+        async for update in client.stream():
+            updates.append(update)
+            if len(updates) == limit:
+                break
+        return updates
+
+    async def run():
+        # The connection is still handshaking when both consumers attach
+        return await asyncio.gather(consume(1), consume(4))
+
+    with patch.object(git_clients, "websockets", _fake_websockets([socket])):
+        first, second = asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+    assert len(started) == 1 and client.connection_count == 1
+    assert len(first) == 1
+    assert [update["volume"] for update in second] == [1000, 1025, 1040, 1050]
+    assert socket.closed and client._queues == []
+
+if __name__ == "__main__":
+    print("Testing Kalshi Ticker Stream")
+    print("=" * 50)
+    test_book_merges_snapshot_and_deltas()
+    print("PASS Book merges snapshot and delta updates")
+    test_replay_file_rebuilds_book()
+    print("PASS Replaying recorded frames rebuilds the book")
+    test_reconnect_resubscribes_and_isolates_callback_errors()
+    print("PASS Reconnect resubscribes and callback errors stay isolated")
+    test_rejected_handshake_backs_off_and_retries()
+    print("PASS Rejected handshake backs off and retries")
+    test_streams_share_one_connection()
+    print("PASS Streams share one connection")
@@ -12,6 +12,8 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.timestamp_utils import simplify_timestamp, simplify_date, parse_game_time_safe, format_display_time
+from utils.ticker_parser import ticker_date
+from utils.title_parser import get_title_parser
 from config.sports_config import get_sport_config, get_available_sports, SPORTS_CONFIG
 import time
 
@@ -24,6 +26,7 @@ class KalshiClientUpdated:
         self.base_url = self.production_url  # Start with production
         self.credentials = self._load_credentials(credentials_file)
         self.session_token = None
+        self.title_parser = get_title_parser()
         
     def _load_credentials(self, creds_file: str) -> Dict:
         """Load Kalshi credentials from file"""
@@ -312,6 +315,7 @@ class KalshiClientUpdated:
         
         normalized_games = []
         live_games_filtered = 0
+        unparseable_titles = 0
         
         for market in raw_data.get('data', []):
             try:
@@ -323,7 +327,7 @@ class KalshiClientUpdated:
                 # Extract team info from title
                 teams = self._extract_teams_from_title(title, sport)
                 if not teams:
-                    print(f"Could not extract teams from market: {title}")
+                    unparseable_titles += 1
                     continue
                 
                 home_team, away_team = teams
@@ -415,127 +419,31 @@ class KalshiClientUpdated:
                 print(f"Error normalizing Kalshi market {market.get('ticker', 'unknown')}: {e}")
                 continue
         
+        if unparseable_titles > 0:
+            print(f"Could not extract teams from {unparseable_titles} Kalshi market titles")
         if live_games_filtered > 0:
             print(f"Filtered out {live_games_filtered} live/starting games from Kalshi")
         print(f"Successfully normalized {len(normalized_games)} future games from Kalshi")
         return normalized_games
     
     def _extract_date_from_ticker(self, ticker: str) -> tuple:
-        """Extract game date from Kalshi ticker format: KXMLBGAME-25AUG21HOUBAL-HOU"""
-        if not ticker or '-' not in ticker:
+        """Extract game date from Kalshi ticker format: KXMLBGAME-25AUG21HOUBAL-HOU (year from the ticker)"""
+        game_date = ticker_date(ticker)
+        if not game_date:
             return None, None
         
-        try:
-            parts = ticker.split('-')
-            if len(parts) < 2:
-                return None, None
-            
-            # Extract date part: look for pattern like 25AUG21
-            # Format appears to be: [GAME_ID][MONTH][DAY] not [DAY][MONTH][YEAR]
-            # So 25AUG21 = Game 25, August 21st
-            
-            # Find the month abbreviation in the string
-            month_map = {
-                'JAN': '01', 'FEB': '02', 'MAR': '03', 'APR': '04',
-                'MAY': '05', 'JUN': '06', 'JUL': '07', 'AUG': '08',
-                'SEP': '09', 'OCT': '10', 'NOV': '11', 'DEC': '12'
-            }
-            
-            month_str = None
-            month = None
-            for month_abbr, month_num in month_map.items():
-                if month_abbr in parts[1]:
-                    month_str = month_abbr
-                    month = month_num
-                    break
-            
-            if not month_str:
-                return None, None
-            
-            # Extract day: everything after the month abbreviation
-            month_pos = parts[1].find(month_str)
-            day_part = parts[1][month_pos + 3:]  # After month abbreviation
-            
-            # Extract just the digits for the day
-            day = ""
-            for char in day_part:
-                if char.isdigit():
-                    day += char
-                else:
-                    break
-            
-            if not day or len(day) > 2:
-                return None, None
-            
-            day = day.zfill(2)  # Pad with zero if needed
-            
-            # Use current year (2025)
-            full_year = "2025"
-            game_date = f"{full_year}-{month}-{day}"
-            
-            # Validate the date
-            from datetime import datetime
-            datetime.strptime(game_date, '%Y-%m-%d')
-            
-            # Estimate game time (most games are in evening)
-            # This is a rough estimate - real time would need different logic
-            estimated_time = "19:00"  # 7 PM default
-            
-            return game_date, estimated_time
-            
-        except Exception as e:
-            print(f"Error parsing ticker date '{ticker}': {e}")
-            return None, None
+        # Estimate game time (most games are in evening)
+        # This is a rough estimate - real time would need different logic
+        estimated_time = "19:00"  # 7 PM default
+        return game_date, estimated_time
     
     def _is_future_game(self, game_time_str: str, min_buffer_minutes: int = 15) -> bool:
         """Check if game is in the future with minimum buffer using safe parsing"""
         return parse_game_time_safe(game_time_str, min_buffer_minutes)
     
     def _extract_teams_from_title(self, title: str, sport: str = 'unknown') -> Optional[tuple]:
-        """Extract team names from Kalshi market title for any sport"""
-        import re
-        
-        # Pattern for "X at Y Winner?" format (most common for Kalshi)
-        at_winner_pattern = r'(.+?) at (.+?) Winner\?'
-        match = re.search(at_winner_pattern, title, re.IGNORECASE)
-        if match:
-            away_team = match.group(1).strip()
-            home_team = match.group(2).strip()
-            return (home_team, away_team)  # (home, away)
-        
-        # Pattern for "X vs Y Winner?" format
-        vs_winner_pattern = r'(.+?) vs (.+?) Winner\?'
-        match = re.search(vs_winner_pattern, title, re.IGNORECASE)
-        if match:
-            team1 = match.group(1).strip()
-            team2 = match.group(2).strip()
-            return (team2, team1)  # Assume second is home
-        
-        # Pattern for "Will X beat Y" format
-        beat_pattern = r'Will (.+?) beat (.+?)(?: on| \?|$)'
-        match = re.search(beat_pattern, title, re.IGNORECASE)
-        if match:
-            team1 = match.group(1).strip()
-            team2 = match.group(2).strip()
-            return (team2, team1)  # (home, away) - team being beaten is home
-        
-        # Pattern for "X vs Y" format  
-        vs_pattern = r'(.+?) vs (.+?)(?: |$|\?)'
-        match = re.search(vs_pattern, title, re.IGNORECASE)
-        if match:
-            team1 = match.group(1).strip()
-            team2 = match.group(2).strip()
-            return (team2, team1)  # Assume second team is home
-            
-        # Pattern for "X at Y" format
-        at_pattern = r'(.+?) at (.+?)(?: |$|\?)'
-        match = re.search(at_pattern, title, re.IGNORECASE)
-        if match:
-            away_team = match.group(1).strip()
-            home_team = match.group(2).strip()
-            return (home_team, away_team)  # (home, away)
-        
-        return None
+        """Extract (home, away) team names from Kalshi market title for any sport (memoized per title)"""
+        return self.title_parser.kalshi_teams(title)
     
     def _kalshi_price_to_odds(self, price: float, kalshi_cents: int = 0, fee: float = 0.03) -> Dict:
         """Convert Kalshi percentage price to odds object"""
@@ -3,11 +3,15 @@ Slim Game Viewer - Fixed version that properly handles Kalshi market structure
 Shows all available games from both platforms with their odds
 """
 
-import requests
 import os
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional
 import argparse
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.http_transport import get_shared_transport
+from utils.ticker_parser import parse_ticker
 
 class SlimPinnacleClient:
     """Minimal Pinnacle client for fetching odds"""
@@ -25,6 +29,7 @@ class SlimPinnacleClient:
                 self.api_key = content
         
         self.base_url = "https://api.the-odds-api.com/v4"
+        self.http = get_shared_transport()
         self.leagues = {
             'mlb': 'baseball_mlb',
             'nfl': 'americanfootball_nfl',
@@ -49,7 +54,7 @@ class SlimPinnacleClient:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -91,6 +96,7 @@ class SlimKalshiClient:
     
     def __init__(self):
         self.base_url = "https://api.elections.kalshi.com/trade-api/v2"
+        self.http = get_shared_transport()
         self.leagues = {
             'mlb': 'KXMLBGAME',
             'nfl': 'KXNFLGAME',
@@ -123,7 +129,7 @@ class SlimKalshiClient:
                 params['cursor'] = cursor
             
             try:
-                response = requests.get(url, params=params, timeout=30)
+                response = self.http.get(url, params=params)
                 if response.status_code != 200:
                     break
                     
@@ -170,19 +176,9 @@ class SlimKalshiClient:
         return games
     
     def _extract_game_id(self, ticker):
-        """Extract game ID from ticker (e.g., KXMLBGAME-25AUG26BOSBAL-BOS)"""
-        try:
-            parts = ticker.split('-')
-            if len(parts) >= 2:
-                # Get the date+teams part
-                date_teams = parts[1]
-                # Extract teams part (last 6 chars typically)
-                if len(date_teams) >= 6:
-                    teams_part = date_teams[-6:]
-                    return teams_part
-        except:
-            pass
-        return None
+        """Extract game ID from ticker (e.g., KXMLBGAME-25AUG26BOSBAL-BOS -> KXMLBGAME-25AUG26BOSBAL)"""
+        info = parse_ticker(ticker)
+        return info.event_ticker if info else None
     
     def _parse_game_from_markets(self, markets, league):
         """Parse game information from market pair"""
@@ -229,10 +225,9 @@ class SlimKalshiClient:
                         odds = 100 * ((1/prob) - 1)
                     odds = int(odds)
                     
-                    # Match based on ticker ending (last part after last dash)
-                    ticker_parts = ticker.split('-')
-                    if len(ticker_parts) >= 3:
-                        team_code = ticker_parts[-1]
+                    # Match based on the ticker's side code
+                    info = parse_ticker(ticker)
+                    if info and info.side:
                         # First market is usually for first team
                         if markets.index(market) == 0:
                             team1_odds = odds
@@ -315,6 +310,7 @@ def view_all_games(leagues=None):
         print(f"  {key}: {platform_counts[key]} games")
     
     print(f"\nTotal games found: {len(all_games)}")
+    get_shared_transport().print_stats()
     print("="*120)
 
 if __name__ == "__main__":
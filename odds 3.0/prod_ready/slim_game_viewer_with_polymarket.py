@@ -3,11 +3,16 @@ Slim Game Viewer with Polymarket - All three platforms
 Shows all available games from Pinnacle, Kalshi, and Polymarket
 """
 
-import requests
 import os
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional
 import argparse
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.http_transport import get_shared_transport
+from utils.ticker_parser import parse_ticker
+from utils.title_parser import get_title_parser
 
 class SlimPinnacleClient:
     """Minimal Pinnacle client for fetching odds"""
@@ -25,6 +30,7 @@ class SlimPinnacleClient:
                 self.api_key = content
         
         self.base_url = "https://api.the-odds-api.com/v4"
+        self.http = get_shared_transport()
         self.leagues = {
             'mlb': 'baseball_mlb',
             'nfl': 'americanfootball_nfl',
@@ -49,7 +55,7 @@ class SlimPinnacleClient:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -91,6 +97,7 @@ class SlimKalshiClient:
     
     def __init__(self):
         self.base_url = "https://api.elections.kalshi.com/trade-api/v2"
+        self.http = get_shared_transport()
         self.leagues = {
             'mlb': 'KXMLBGAME',
             'nfl': 'KXNFLGAME',
@@ -123,7 +130,7 @@ class SlimKalshiClient:
                 params['cursor'] = cursor
             
             try:
-                response = requests.get(url, params=params, timeout=30)
+                response = self.http.get(url, params=params)
                 if response.status_code != 200:
                     break
                     
@@ -170,19 +177,9 @@ class SlimKalshiClient:
         return games
     
     def _extract_game_id(self, ticker):
-        """Extract game ID from ticker (e.g., KXMLBGAME-25AUG26BOSBAL-BOS)"""
-        try:
-            parts = ticker.split('-')
-            if len(parts) >= 2:
-                # Get the date+teams part
-                date_teams = parts[1]
-                # Extract teams part (last 6 chars typically)
-                if len(date_teams) >= 6:
-                    teams_part = date_teams[-6:]
-                    return teams_part
-        except:
-            pass
-        return None
+        """Extract game ID from ticker (e.g., KXMLBGAME-25AUG26BOSBAL-BOS -> KXMLBGAME-25AUG26BOSBAL)"""
+        info = parse_ticker(ticker)
+        return info.event_ticker if info else None
     
     def _parse_game_from_markets(self, markets, league):
         """Parse game information from market pair"""
@@ -229,10 +226,9 @@ class SlimKalshiClient:
                         odds = 100 * ((1/prob) - 1)
                     odds = int(odds)
                     
-                    # Match based on ticker ending (last part after last dash)
-                    ticker_parts = ticker.split('-')
-                    if len(ticker_parts) >= 3:
-                        team_code = ticker_parts[-1]
+                    # Match based on the ticker's side code
+                    info = parse_ticker(ticker)
+                    if info and info.side:
                         # First market is usually for first team
                         if markets.index(market) == 0:
                             team1_odds = odds
@@ -283,12 +279,14 @@ class SlimPolymarketClient:
     def __init__(self, api_key=None, api_secret=None, passphrase=None):
         self.clob_url = "https://clob.polymarket.com"
         self.gamma_url = "https://gamma-api.polymarket.com"
+        self.http = get_shared_transport()
         
         # API credentials (currently None - will enable live data when provided)
         self.api_key = api_key
         self.api_secret = api_secret
         self.passphrase = passphrase
         self.authenticated = bool(api_key and api_secret and passphrase)
+        self.title_parser = get_title_parser()
         
         # Polymarket doesn't have strict league categories like others
         self.sports_keywords = {
@@ -325,12 +323,12 @@ class SlimPolymarketClient:
                 
                 if source_name == "CLOB":
                     params = {'limit': 1000}
-                    response = requests.get(url, params=params, timeout=15)
+                    response = self.http.get(url, params=params)
                     if response.status_code == 200:
                         data = response.json()
                         markets = data.get('data', [])
                 else:  # Gamma API
-                    response = requests.get(url, timeout=15)
+                    response = self.http.get(url)
                     if response.status_code == 200:
                         markets = response.json()
                         if not isinstance(markets, list):
@@ -450,28 +448,8 @@ class SlimPolymarketClient:
             return None
     
     def _extract_teams_from_question(self, question):
-        """Extract team names from question text"""
-        team1, team2 = None, None
-        
-        if ' vs ' in question:
-            parts = question.split(' vs ')
-            if len(parts) >= 2:
-                team1 = parts[0].strip()
-                team2 = parts[1].split('(')[0].strip()  # Remove date/time info
-        elif ' vs. ' in question:
-            parts = question.split(' vs. ')
-            if len(parts) >= 2:
-                team1 = parts[0].strip()
-                team2 = parts[1].strip()
-        elif ': ' in question and ' vs ' in question:
-            game_part = question.split(': ', 1)[1]
-            if ' vs ' in game_part:
-                parts = game_part.split(' vs ')
-                if len(parts) >= 2:
-                    team1 = parts[0].strip()
-                    team2 = parts[1].strip()
-        
-        return team1, team2
+        """Extract team names from question text (precompiled, memoized per question)"""
+        return self.title_parser.question_teams(question)
 
     def _parse_sports_market(self, market, league, api_type="clob"):
         """Parse a sports market into game format"""
@@ -482,28 +460,8 @@ class SlimPolymarketClient:
             if len(tokens) != 2:  # Most sports markets should have 2 outcomes
                 return None
             
-            # Extract teams from question
-            team1, team2 = None, None
-            
-            # Common patterns in Polymarket sports questions
-            if ' vs ' in question:
-                parts = question.split(' vs ')
-                if len(parts) >= 2:
-                    team1 = parts[0].strip()
-                    team2 = parts[1].split('(')[0].strip()  # Remove date/time info
-            elif ' vs. ' in question:
-                parts = question.split(' vs. ')
-                if len(parts) >= 2:
-                    team1 = parts[0].strip()
-                    team2 = parts[1].split('(')[0].strip()
-            elif ': ' in question and ' vs ' in question:
-                # Format like "NFL: Team1 vs Team2"
-                game_part = question.split(': ', 1)[1]
-                if ' vs ' in game_part:
-                    parts = game_part.split(' vs ')
-                    if len(parts) >= 2:
-                        team1 = parts[0].strip()
-                        team2 = parts[1].strip()
+            # Extract teams from question ("[NFL: ]Team1 vs Team2 (date)")
+            team1, team2 = self._extract_teams_from_question(question)
             
             if not team1 or not team2:
                 # Try to extract from token names
@@ -524,7 +482,7 @@ class SlimPolymarketClient:
                         # Try to get current price for this token
                         price_url = f"{self.clob_url}/midpoint"
                         price_params = {'token_id': token_id}
-                        price_response = requests.get(price_url, params=price_params, timeout=5)
+                        price_response = self.http.get(price_url, params=price_params, timeout=5)
                         
                         if price_response.status_code == 200:
                             price_data = price_response.json()
@@ -622,6 +580,7 @@ def view_all_games(leagues=None):
         print(f"  {key}: {platform_counts[key]} games")
     
     print(f"\nTotal games found: {len(all_games)}")
+    get_shared_transport().print_stats()
     print("="*140)
 
 if __name__ == "__main__":
@@ -0,0 +1,186 @@
+"""
+Pooled HTTP Transport - Shared keep-alive sessions for all API clients
+Per-host connection pools, gzip negotiation, per-host timeouts and reuse stats
+"""
+
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Default per-host timeouts (seconds); anything not listed uses default_timeout
+DEFAULT_HOST_TIMEOUTS = {
+    'api.the-odds-api.com': 30,
+    'api.elections.kalshi.com': 30,
+    'demo-api.kalshi.co': 30,
+    'clob.polymarket.com': 15,
+    'gamma-api.polymarket.com': 15,
+}
+
+
+class _ConnectionStats:
+    """Thread-safe per-host counters for requests and newly opened connections"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.new_connections: Dict[str, int] = {}
+
+    def record_request(self, host: str):
+        with self._lock:
+            self.requests[host] = self.requests.get(host, 0) + 1
+
+    def record_new_connection(self, host: str):
+        with self._lock:
+            self.new_connections[host] = self.new_connections.get(host, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            hosts = set(self.requests) | set(self.new_connections)
+            stats = {}
+            for host in sorted(hosts):
+                request_count = self.requests.get(host, 0)
+                opened = self.new_connections.get(host, 0)
+                reused = max(0, request_count - opened)
+                stats[host] = {
+                    'requests': request_count,
+                    'new_connections': opened,
+                    'reused_connections': reused,
+                    'reuse_rate': reused / request_count if request_count else 0.0
+                }
+            return stats
+
+    def reset(self):
+        with self._lock:
+            self.requests.clear()
+            self.new_connections.clear()
+
+
+def _counting_pool_class(base_class, stats: _ConnectionStats):
+    """Build a urllib3 pool class that reports requests and fresh connections to stats"""
+
+    class CountingPool(base_class):
+        def _new_conn(self):
+            stats.record_new_connection(self.host)
+            return super()._new_conn()
+
+        def urlopen(self, method, url, *args, **kwargs):
+            stats.record_request(self.host)
+            return super().urlopen(method, url, *args, **kwargs)
+
+    CountingPool.__name__ = f"Counting{base_class.__name__}"
+    return CountingPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter whose per-host pools feed a shared _ConnectionStats"""
+
+    def __init__(self, stats: _ConnectionStats, **kwargs):
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _counting_pool_class(HTTPConnectionPool, self._stats),
+            'https': _counting_pool_class(HTTPSConnectionPool, self._stats),
+        }
+
+
+class HttpTransport:
+    """Keep-alive HTTP transport shared by Pinnacle, Kalshi and the slim viewers"""
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 20,
+                 default_timeout: float = 30, host_timeouts: Optional[Dict[str, float]] = None):
+        """
+        Initialize the transport
+
+        Args:
+            pool_connections: Number of per-host pools to keep cached
+            pool_maxsize: Max idle keep-alive connections kept per host
+            default_timeout: Timeout (seconds) for hosts without an explicit entry
+            host_timeouts: Optional {host: timeout} overrides
+        """
+        self.default_timeout = default_timeout
+        self.host_timeouts = dict(DEFAULT_HOST_TIMEOUTS)
+        if host_timeouts:
+            self.host_timeouts.update(host_timeouts)
+
+        self._stats = _ConnectionStats()
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+
+        adapter = _CountingAdapter(self._stats, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def set_host_timeout(self, host: str, timeout: float):
+        """Set the timeout used for requests to a specific host"""
+        self.host_timeouts[host] = timeout
+
+    def _timeout_for(self, url: str) -> float:
+        """Resolve the timeout for a URL from the per-host table"""
+        host = urlsplit(url).hostname or ''
+        return self.host_timeouts.get(host, self.default_timeout)
+
+    def request(self, method: str, url: str, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """Send a request over the pooled session"""
+        if timeout is None:
+            timeout = self._timeout_for(url)
+        return self.session.request(method, url, timeout=timeout, **kwargs)
+
+    def get(self, url: str, params: Optional[Dict] = None, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """GET over the pooled session"""
+        return self.request('GET', url, params=params, timeout=timeout, **kwargs)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-host request counts, new vs reused connections and reuse rate"""
+        return self._stats.snapshot()
+
+    def reset_stats(self):
+        """Clear connection reuse counters"""
+        self._stats.reset()
+
+    def print_stats(self):
+        """Print connection reuse summary per host"""
+        stats = self.get_stats()
+        if not stats:
+            print("HTTP transport: no requests sent yet")
+            return
+        print("HTTP transport connection reuse:")
+        for host, host_stats in stats.items():
+            print(f"  {host}: {host_stats['requests']} requests, "
+                  f"{host_stats['new_connections']} new connections, "
+                  f"{host_stats['reuse_rate']:.0%} reused")
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+
+_shared_transport = None
+_shared_lock = threading.Lock()
+
+def get_shared_transport() -> HttpTransport:
+    """Get the process-wide transport shared by every client"""
+    global _shared_transport
+    if _shared_transport is None:
+        with _shared_lock:
+            if _shared_transport is None:
+                _shared_transport = HttpTransport()
+    return _shared_transport
+
+def configure_shared_transport(**kwargs) -> HttpTransport:
+    """Replace the shared transport with one built from the given pool/timeout settings"""
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is not None:
+            _shared_transport.close()
+        _shared_transport = HttpTransport(**kwargs)
+    return _shared_transport
@@ -0,0 +1,138 @@
+"""
+Market Title Parser - Precompiled, memoized team extraction from Kalshi titles and Polymarket questions
+Titles rarely change between polls, so each distinct string is parsed once; failures are counted, not printed
+"""
+
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# The five Kalshi title formats in priority order, as one alternation so each title is scanned once
+_KALSHI_TITLE = re.compile(
+    r'(?P<at_winner_away>.+?) at (?P<at_winner_home>.+?) Winner\?'
+    r'|(?P<vs_winner_1>.+?) vs (?P<vs_winner_2>.+?) Winner\?'
+    r'|Will (?P<beat_1>.+?) beat (?P<beat_2>.+?)(?: on| \?|$)'
+    r'|(?P<vs_1>.+?) vs (?P<vs_2>.+?)(?: |$|\?)'
+    r'|(?P<at_away>.+?) at (?P<at_home>.+?)(?: |$|\?)',
+    re.IGNORECASE
+)
+
+# Last group of each alternative -> (home group, away group)
+_KALSHI_SIDES = {
+    'at_winner_home': ('at_winner_home', 'at_winner_away'),
+    'vs_winner_2': ('vs_winner_2', 'vs_winner_1'),   # Assume second is home
+    'beat_2': ('beat_2', 'beat_1'),                  # Team being beaten is home
+    'vs_2': ('vs_2', 'vs_1'),                        # Assume second team is home
+    'at_home': ('at_home', 'at_away'),
+}
+
+# "[League: ]Team1 vs[.] Team2[ (date/time)]"
+_MATCHUP_QUESTION = re.compile(
+    r'^(?:[^:]*: )?(?P<team1>.+?) vs\.? (?P<team2>.+?)\s*(?:\(.*| vs\.? .*)?$'
+)
+
+DEFAULT_MEMO_SIZE = 8192
+
+@lru_cache(maxsize=DEFAULT_MEMO_SIZE)
+def _parse_kalshi_title(title: str) -> Optional[Tuple[str, str]]:
+    match = _KALSHI_TITLE.search(title)
+    if not match:
+        return None
+    home_group, away_group = _KALSHI_SIDES[match.lastgroup]
+    return (match.group(home_group).strip(), match.group(away_group).strip())
+
+@lru_cache(maxsize=DEFAULT_MEMO_SIZE)
+def _parse_matchup_question(question: str) -> Tuple[Optional[str], Optional[str]]:
+    match = _MATCHUP_QUESTION.match(question)
+    if not match:
+        return None, None
+    return match.group('team1').strip(), match.group('team2').strip()
+
+class TeamNameScanner:
+    """Finds known team names in free text with one compiled alternation (longest names first)"""
+
+    def __init__(self, name_to_code: Dict[str, str], memo_size: int = DEFAULT_MEMO_SIZE):
+        """
+        Compile the scanner
+
+        Args:
+            name_to_code: Team name/alias -> code (matched case-insensitively on word boundaries)
+            memo_size: Distinct texts remembered by scan()
+        """
+        self._codes = {name.lower(): code for name, code in name_to_code.items()}
+        names = sorted(self._codes, key=len, reverse=True)
+        self._pattern = re.compile(r'\b(?:' + '|'.join(re.escape(name) for name in names) + r')\b',
+                                   re.IGNORECASE)
+        self.scan = lru_cache(maxsize=memo_size)(self._scan)
+
+    def _scan(self, text: str) -> Tuple[str, ...]:
+        """Distinct team codes in order of first appearance"""
+        codes = []
+        for match in self._pattern.finditer(text):
+            code = self._codes[match.group(0).lower()]
+            if code not in codes:
+                codes.append(code)
+        return tuple(codes)
+
+class TitleParser:
+    """Shared front end over the memoized parsers, counting parsed/failed titles per source"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.parsed: Dict[str, int] = {}
+        self.failures: Dict[str, int] = {}
+
+    def _count(self, source: str, ok: bool):
+        counts = self.parsed if ok else self.failures
+        with self._lock:
+            counts[source] = counts.get(source, 0) + 1
+
+    def kalshi_teams(self, title: str) -> Optional[Tuple[str, str]]:
+        """(home, away) from a Kalshi market title, or None"""
+        teams = _parse_kalshi_title(title) if title else None
+        self._count('kalshi', teams is not None)
+        return teams
+
+    def question_teams(self, question: str, source: str = 'polymarket') -> Tuple[Optional[str], Optional[str]]:
+        """(team1, team2) from a 'Team1 vs Team2' style question, (None, None) if it has no matchup"""
+        teams = _parse_matchup_question(question) if question else (None, None)
+        self._count(source, teams[0] is not None)
+        return teams
+
+    def scan_teams(self, scanner: TeamNameScanner, text: str, source: str = 'polymarket') -> Tuple[str, ...]:
+        """Team codes a scanner finds in text (a failure unless at least two teams are named)"""
+        codes = scanner.scan(text) if text else ()
+        self._count(source, len(codes) >= 2)
+        return codes
+
+    def stats(self) -> Dict:
+        """Parsed/failed counts per source plus memo hit rates"""
+        with self._lock:
+            parsed = dict(self.parsed)
+            failures = dict(self.failures)
+        return {
+            'parsed': parsed,
+            'failures': failures,
+            'kalshi_memo': _parse_kalshi_title.cache_info()._asdict(),
+            'question_memo': _parse_matchup_question.cache_info()._asdict()
+        }
+
+    def reset(self):
+        """Zero the counters (memoized parses are kept)"""
+        with self._lock:
+            self.parsed.clear()
+            self.failures.clear()
+
+
+_shared_parser = None
+_shared_lock = threading.Lock()
+
+def get_title_parser() -> TitleParser:
+    """Get the process-wide title parser shared by every client"""
+    global _shared_parser
+    if _shared_parser is None:
+        with _shared_lock:
+            if _shared_parser is None:
+                _shared_parser = TitleParser()
+    return _shared_parser
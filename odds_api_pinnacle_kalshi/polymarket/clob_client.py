@@ -8,11 +8,25 @@ from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 import json
 import re
+import sys
+import numpy as np
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'prod_ready'))
+
+from utils.title_parser import TeamNameScanner, get_title_parser
+from core.depth_pricing import OrderBookFetcher, vwap_fill
+from core.odds_converter import OddsConverter
 
 class PolymarketCLOBClient:
     """Polymarket CLOB client for sports betting markets"""
     
-    def __init__(self):
+    def __init__(self, stake: float = 100.0, max_book_workers: int = 8, book_cache_ttl_seconds: float = 5.0):
+        """
+        Args:
+            stake: Dollars each side's executable (volume-weighted) price is computed for
+            max_book_workers: Order books fetched in parallel
+            book_cache_ttl_seconds: Reuse a fetched order book for this long
+        """
         # Initialize CLOB client (no auth needed for public data)
         self.client = ClobClient(
             host="https://clob.polymarket.com",
@@ -54,6 +68,12 @@ class PolymarketCLOBClient:
             'Seahawks': 'SEA', 'Seattle': 'SEA',
             'Rams': 'LAR', 'LA Rams': 'LAR'
         }
+        # One compiled pass over each question instead of a substring check per alias
+        self.team_scanner = TeamNameScanner(self.nfl_teams)
+        self.title_parser = get_title_parser()
+        self.stake = stake
+        self.book_fetcher = OrderBookFetcher(self.client.get_book, max_workers=max_book_workers,
+                                             cache_ttl_seconds=book_cache_ttl_seconds)
 
     def _normalize_team_name(self, team_name: str) -> str:
         """Normalize team names to abbreviations"""
@@ -63,13 +83,8 @@ class PolymarketCLOBClient:
         return team_name
 
     def _extract_teams_from_question(self, question: str) -> tuple:
-        """Extract team names from market question"""
-        found_teams = []
-        
-        for team_name, abbrev in self.nfl_teams.items():
-            if team_name.lower() in question.lower():
-                if abbrev not in found_teams:
-                    found_teams.append(abbrev)
+        """Extract team abbreviations from market question, in the order they are named (memoized)"""
+        found_teams = self.title_parser.scan_teams(self.team_scanner, question)
         
         if len(found_teams) >= 2:
             return (found_teams[0], found_teams[1])
@@ -102,19 +117,11 @@ class PolymarketCLOBClient:
         
         return has_teams and has_winner_keyword
 
-    def _price_to_american_odds(self, price: float) -> int:
-        """Convert decimal price to American odds"""
-        if price <= 0 or price >= 1:
-            return 0
-        
-        if price >= 0.5:
-            # Favorite
-            american_odds = -int((price / (1 - price)) * 100)
-        else:
-            # Underdog
-            american_odds = int(((1 - price) / price) * 100)
-        
-        return american_odds
+    def _prices_to_american_odds(self, prices: List[float]) -> List[int]:
+        """Convert decimal prices to American odds in one batch (0 for prices outside 0-1)"""
+        prices = np.asarray(prices, dtype=np.float64)
+        american = OddsConverter.prices_to_american_batch(prices)
+        return np.where((prices > 0) & (prices < 1), american, 0).tolist()
 
     def get_nfl_markets(self) -> List[Dict]:
         """Get all NFL game markets"""
@@ -159,6 +166,7 @@ class PolymarketCLOBClient:
         markets = self.get_nfl_markets()
         games = []
         
+        candidates = []
         for market in markets:
             # Skip closed markets if removing live games
             if remove_live_games and market.get('closed', False):
@@ -174,24 +182,26 @@ class PolymarketCLOBClient:
             if len(tokens) < 2:
                 continue
             
-            # Determine favorite and underdog
-            token1 = tokens[0]
-            token2 = tokens[1]
+            candidates.append((market, teams, tokens[0], tokens[1]))
+        
+        # Every candidate's order books in one concurrent, briefly cached batch
+        books = self.book_fetcher.fetch_books(
+            token['token_id'] for _, _, token1, token2 in candidates for token in (token1, token2)
+        )
+        
+        # (game, odds field, price) for every quote, converted together after the loop
+        pending_prices = []
+        for market, teams, token1, token2 in candidates:
+            book1 = books.get(token1['token_id'])
+            book2 = books.get(token2['token_id'])
             
-            # Get current prices from order book
-            try:
-                # Get order book for each token
-                book1 = self.client.get_book(token1['token_id'])
-                book2 = self.client.get_book(token2['token_id'])
-                
-                # Use mid price if available
-                price1 = self._get_mid_price(book1)
-                price2 = self._get_mid_price(book2)
-                
-                if price1 is None or price2 is None:
-                    continue
-                
-            except:
+            # Use mid price if available
+            price1 = self._get_mid_price(book1) if book1 is not None else None
+            price2 = self._get_mid_price(book2) if book2 is not None else None
+            fill1 = self._get_fill_price(book1) if book1 is not None else None
+            fill2 = self._get_fill_price(book2) if book2 is not None else None
+            
+            if price1 is None or price2 is None:
                 # Fall back to last trade price if available
                 price1 = float(token1.get('price', 0))
                 price2 = float(token2.get('price', 0))
@@ -205,15 +215,13 @@ class PolymarketCLOBClient:
                 dog = teams[1]
                 fav_price = price1
                 dog_price = price2
+                fav_fill, dog_fill = fill1, fill2
             else:
                 favorite = teams[1]
                 dog = teams[0]
                 fav_price = price2
                 dog_price = price1
-            
-            # Convert to American odds
-            fav_odds = self._price_to_american_odds(fav_price)
-            dog_odds = self._price_to_american_odds(dog_price)
+                fav_fill, dog_fill = fill2, fill1
             
             # Parse date
             end_date_str = market.get('end_date_iso', '')
@@ -232,41 +240,77 @@ class PolymarketCLOBClient:
             game = {
                 'favorite': favorite,
                 'dog': dog,
-                'fav_odds': fav_odds,
-                'dog_odds': dog_odds,
+                'fav_odds': None,
+                'dog_odds': None,
                 'game_date': game_date,
                 'game_time': game_time,
                 'league': 'nfl',
                 'status': 'active' if not market.get('closed', False) else 'closed',
                 'volume': float(market.get('volume', 0)),
                 'market_id': market.get('condition_id', ''),
+                # Executable prices for self.stake walked through the asks (None when nothing is offered)
+                'stake': self.stake,
+                'fav_fill_odds': None,
+                'dog_fill_odds': None,
+                'fav_fillable': round(fav_fill[1], 2) if fav_fill else 0.0,
+                'dog_fillable': round(dog_fill[1], 2) if dog_fill else 0.0,
                 'question': market.get('question', '')
             }
             
             games.append(game)
+            pending_prices.extend([(game, 'fav_odds', fav_price), (game, 'dog_odds', dog_price)])
+            if fav_fill:
+                pending_prices.append((game, 'fav_fill_odds', fav_fill[0]))
+            if dog_fill:
+                pending_prices.append((game, 'dog_fill_odds', dog_fill[0]))
+        
+        # Convert to American odds
+        american_odds = self._prices_to_american_odds([price for _, _, price in pending_prices])
+        for (game, field, _), odds in zip(pending_prices, american_odds):
+            game[field] = odds
         
         # Sort by date
         games.sort(key=lambda x: x['game_date'])
         
         return games
 
-    def _get_mid_price(self, order_book: Dict) -> Optional[float]:
+    @staticmethod
+    def _book_levels(order_book, side: str) -> List[tuple]:
+        """(price, size) levels for 'bids' or 'asks', from a dict or an OrderBookSummary"""
+        levels = order_book.get(side) if isinstance(order_book, dict) else getattr(order_book, side, None)
+        parsed = []
+        for level in levels or []:
+            price = level['price'] if isinstance(level, dict) else level.price
+            size = level['size'] if isinstance(level, dict) else level.size
+            parsed.append((float(price), float(size)))
+        return parsed
+
+    def _get_mid_price(self, order_book) -> Optional[float]:
         """Calculate mid price from order book"""
         try:
-            bids = order_book.get('bids', [])
-            asks = order_book.get('asks', [])
+            bids = self._book_levels(order_book, 'bids')
+            asks = self._book_levels(order_book, 'asks')
             
             if not bids or not asks:
                 return None
             
-            best_bid = float(bids[0]['price'])
-            best_ask = float(asks[0]['price'])
+            best_bid = max(price for price, _ in bids)
+            best_ask = min(price for price, _ in asks)
             
             return (best_bid + best_ask) / 2
             
         except:
             return None
 
+    def _get_fill_price(self, order_book) -> Optional[tuple]:
+        """(volume-weighted ask price, dollars filled) for buying self.stake of this outcome"""
+        try:
+            asks = sorted(self._book_levels(order_book, 'asks'))
+            price, filled = vwap_fill(asks, self.stake)
+            return (price, filled) if price is not None else None
+        except:
+            return None
+
     def print_games_table(self, games: List[Dict]):
         """Print games in formatted table"""
         if not games:
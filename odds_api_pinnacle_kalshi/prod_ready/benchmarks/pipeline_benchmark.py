@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark - Stage timings and peak memory on synthetic slates
+Times MispricingSystem's normalize/align/detect stages per sport and writes machine-readable JSON
+
+Usage:
+    python benchmarks/pipeline_benchmark.py                          # 10 to 100k markets
+    python benchmarks/pipeline_benchmark.py --sizes 100,1000 --repeat 5
+    python benchmarks/pipeline_benchmark.py --baseline debug/benchmark_baseline.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.slate_generator import SlateGenerator, DEFAULT_SPORT_MIX
+from core.pinnacle_client import PinnacleClient
+from core.kalshi_client import KalshiClientUpdated as KalshiClient
+from core.data_aligner import GameMatcher, MispricingDetector
+from config.sports_config import get_sport_config
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+STAGES = ('normalize_pinnacle', 'normalize_kalshi', 'align_games', 'detect_opportunities')
+
+def _measure(stage: Callable, repeat: int, track_memory: bool) -> Tuple[object, Dict]:
+    """Run a stage repeat times (output silenced) and return its last result plus timings"""
+    durations = []
+    result = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = stage()
+            durations.append(time.perf_counter() - start)
+
+    stats = {'seconds_min': min(durations), 'seconds_median': statistics.median(durations)}
+    if track_memory:
+        # Separate traced run so tracing overhead never skews the timings
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            stage()
+        stats['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, stats
+
+class PipelineBenchmark:
+    """Runs each pipeline stage the way MispricingSystem does, on generated payloads"""
+
+    def __init__(self, generator: Optional[SlateGenerator] = None, time_buffer_minutes: int = 15):
+        """
+        Initialize the benchmark
+
+        Args:
+            generator: Slate generator (defaults to seed 0)
+            time_buffer_minutes: Live-game buffer passed to the normalizers
+        """
+        self.generator = generator or SlateGenerator()
+        self.time_buffer_minutes = time_buffer_minutes
+        # Normalization needs no credentials
+        self.pinnacle_client = PinnacleClient(None)
+        self.kalshi_client = KalshiClient(None)
+
+    def run_sport(self, sport: str, payloads: Dict[str, Dict], repeat: int = 3,
+                  track_memory: bool = True) -> Dict:
+        """
+        Benchmark one sport's slate
+
+        Args:
+            sport: Sport key
+            payloads: {'pinnacle': raw, 'kalshi': raw} from SlateGenerator
+            repeat: Timed runs per stage
+            track_memory: Also record each stage's peak traced allocation
+
+        Returns:
+            Counts and per-stage stats for the sport
+        """
+        sport_config = get_sport_config(sport)
+        # Same per-sport tools MispricingSystem._get_sport_tools builds
+        game_matcher = GameMatcher(time_threshold_hours=sport_config.time_threshold_hours)
+        detector = MispricingDetector(min_edge_threshold=sport_config.min_edge_threshold,
+                                      min_confidence=sport_config.match_confidence_threshold)
+        as_of = self.generator.as_of
+
+        stages = {}
+        pinnacle_games, stages['normalize_pinnacle'] = _measure(
+            lambda: self.pinnacle_client.normalize_pinnacle_data(payloads['pinnacle'], self.time_buffer_minutes, as_of=as_of),
+            repeat, track_memory)
+        kalshi_games, stages['normalize_kalshi'] = _measure(
+            lambda: self.kalshi_client.normalize_kalshi_data(payloads['kalshi'], self.time_buffer_minutes, as_of=as_of),
+            repeat, track_memory)
+        aligned_games, stages['align_games'] = _measure(
+            lambda: game_matcher.align_games(pinnacle_games, kalshi_games), repeat, track_memory)
+        opportunities, stages['detect_opportunities'] = _measure(
+            lambda: detector.detect_opportunities(aligned_games), repeat, track_memory)
+
+        self.pinnacle_client.raw_payloads.clear()
+        self.kalshi_client.raw_payloads.clear()
+        return {
+            'sport': sport,
+            'pinnacle_events': len(payloads['pinnacle']['data']),
+            'kalshi_markets': len(payloads['kalshi']['data']),
+            'pinnacle_games': len(pinnacle_games),
+            'kalshi_games': len(kalshi_games),
+            'aligned_games': len(aligned_games),
+            'opportunities': len(opportunities),
+            'stages': stages
+        }
+
+    def run(self, sizes: Sequence[int], sport_mix: Optional[Dict[str, float]] = None, repeat: int = 3,
+            track_memory: bool = True) -> Dict:
+        """
+        Benchmark every slate size
+
+        Args:
+            sizes: Slate sizes in Kalshi markets
+            sport_mix: {sport: weight} split of each slate
+            repeat: Timed runs per stage
+            track_memory: Also record peak traced allocation per stage
+
+        Returns:
+            Report with environment, settings and one entry per size
+        """
+        sport_mix = sport_mix or DEFAULT_SPORT_MIX
+        report = {
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'environment': {
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'machine': platform.machine()
+            },
+            'settings': {
+                'seed': self.generator.seed,
+                'sport_mix': sport_mix,
+                'repeat': repeat,
+                'track_memory': track_memory,
+                'time_buffer_minutes': self.time_buffer_minutes
+            },
+            'results': []
+        }
+
+        for size in sizes:
+            slate = self.generator.generate(size, sport_mix)
+            sports = [self.run_sport(sport, payloads, repeat, track_memory) for sport, payloads in slate.items()]
+            totals = {
+                stage: {
+                    'seconds_min': sum(s['stages'][stage]['seconds_min'] for s in sports),
+                    'seconds_median': sum(s['stages'][stage]['seconds_median'] for s in sports)
+                }
+                for stage in STAGES
+            }
+            if track_memory:
+                for stage in STAGES:
+                    totals[stage]['peak_bytes'] = max(s['stages'][stage]['peak_bytes'] for s in sports)
+            report['results'].append({
+                'size': size,
+                'kalshi_markets': sum(s['kalshi_markets'] for s in sports),
+                'aligned_games': sum(s['aligned_games'] for s in sports),
+                'opportunities': sum(s['opportunities'] for s in sports),
+                'stages': totals,
+                'total_seconds_min': sum(t['seconds_min'] for t in totals.values()),
+                'sports': sports
+            })
+        return report
+
+def compare_reports(report: Dict, baseline: Dict, tolerance: float = 0.2) -> List[Dict]:
+    """
+    Find stages slower (or heavier) than a baseline report
+
+    Args:
+        report: Current report from PipelineBenchmark.run
+        baseline: Earlier report with the same sizes
+        tolerance: Allowed fractional increase before a stage counts as a regression
+
+    Returns:
+        One entry per regressed (size, stage, metric)
+    """
+    baseline_by_size = {result['size']: result for result in baseline.get('results', [])}
+    regressions = []
+    for result in report['results']:
+        previous = baseline_by_size.get(result['size'])
+        if previous is None:
+            continue
+        for stage, stats in result['stages'].items():
+            for metric in ('seconds_min', 'peak_bytes'):
+                old = previous['stages'].get(stage, {}).get(metric)
+                new = stats.get(metric)
+                if old and new is not None and new > old * (1 + tolerance):
+                    regressions.append({'size': result['size'], 'stage': stage, 'metric': metric,
+                                        'baseline': old, 'current': new, 'ratio': new / old})
+    return regressions
+
+def parse_sport_mix(spec: str) -> Dict[str, float]:
+    """Parse 'mlb=0.5,nfl=0.5' (or 'mlb,nfl' for an even split)"""
+    mix = {}
+    for part in spec.split(','):
+        sport, _, weight = part.strip().partition('=')
+        if sport:
+            mix[sport.lower()] = float(weight) if weight else 1.0
+    return mix
+
+def main():
+    """Benchmark command line interface"""
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    default_output = os.path.join(project_root, 'debug', 'benchmark_results.json')
+
+    parser = argparse.ArgumentParser(description='Benchmark the normalize/align/detect pipeline on synthetic slates')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='Slate sizes in Kalshi markets (default: 10,100,1000,10000,100000)')
+    parser.add_argument('--sports', default=','.join(f"{s}={w}" for s, w in DEFAULT_SPORT_MIX.items()),
+                        help='Sport mix as sport=weight pairs (default: mlb=0.4,nfl=0.2,nba=0.2,nhl=0.2)')
+    parser.add_argument('--seed', type=int, default=0, help='Generator seed (default: 0)')
+    parser.add_argument('--repeat', '-r', type=int, default=3, help='Timed runs per stage (default: 3)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the traced peak-memory runs')
+    parser.add_argument('--output', '-o', default=default_output, help=f'Results JSON (default: {default_output})')
+    parser.add_argument('--baseline', help='Earlier results JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed slowdown vs baseline before failing (default: 0.2 = 20%%)')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    benchmark = PipelineBenchmark(SlateGenerator(seed=args.seed))
+
+    print("PIPELINE BENCHMARK")
+    print("=" * 60)
+    report = benchmark.run(sizes, parse_sport_mix(args.sports), args.repeat, not args.no_memory)
+
+    print(f"{'Markets':>8} {'Aligned':>8} {'Opps':>6} " + " ".join(f"{stage[:16]:>17}" for stage in STAGES))
+    for result in report['results']:
+        timings = " ".join(f"{result['stages'][stage]['seconds_min'] * 1000:>15.1f}ms" for stage in STAGES)
+        print(f"{result['kalshi_markets']:>8} {result['aligned_games']:>8} {result['opportunities']:>6} {timings}")
+
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_reports(report, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\nREGRESSIONS vs {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression['size']:>8} markets  {regression['stage']:<22} {regression['metric']:<12} "
+                      f"x{regression['ratio']:.2f}")
+            return 1
+        print(f"\nNo regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""
+Synthetic Slate Generator - Deterministic Pinnacle/Kalshi payloads for benchmarks
+Builds Odds API events and Kalshi markets in the live formats, sized from a handful to 100k markets
+"""
+
+import math
+import random
+import sys
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.sports_config import get_sport_config
+
+DEFAULT_SPORT_MIX = {'mlb': 0.4, 'nfl': 0.2, 'nba': 0.2, 'nhl': 0.2}
+
+# Kalshi lists one market per team for every game
+MARKETS_PER_GAME = 2
+
+def _american(probability: float) -> int:
+    """American odds for a (vigged) probability"""
+    if probability >= 0.5:
+        return -int(round(probability / (1 - probability) * 100))
+    return int(round((1 - probability) / probability * 100))
+
+class SlateGenerator:
+    """Seeded generator of one or more sports' raw API responses"""
+
+    def __init__(self, seed: int = 0, start_date: str = '2025-06-01', pinnacle_coverage: float = 0.9,
+                 mispricing_rate: float = 0.1, nickname_rate: float = 0.2):
+        """
+        Initialize the generator
+
+        Args:
+            seed: Random seed; the same seed and arguments always produce the same payloads
+            start_date: First slate day (games are spread across the remaining days of that year,
+                        since Kalshi tickers carry no year)
+            pinnacle_coverage: Fraction of games that also have a Pinnacle event
+            mispricing_rate: Fraction of games where Kalshi is 3-10 points off Pinnacle
+            nickname_rate: Fraction of Kalshi titles using team nicknames instead of full names
+        """
+        self.seed = seed
+        self.start_date = date.fromisoformat(start_date)
+        self.pinnacle_coverage = pinnacle_coverage
+        self.mispricing_rate = mispricing_rate
+        self.nickname_rate = nickname_rate
+
+    @property
+    def as_of(self) -> datetime:
+        """Reference time at which every generated game is still upcoming"""
+        return datetime.combine(self.start_date - timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
+
+    def generate(self, n_markets: int, sport_mix: Optional[Dict[str, float]] = None) -> Dict[str, Dict]:
+        """
+        Generate a slate split across sports
+
+        Args:
+            n_markets: Total Kalshi markets (two per game)
+            sport_mix: {sport: weight} (defaults to DEFAULT_SPORT_MIX)
+
+        Returns:
+            {sport: {'pinnacle': raw get_sports_odds response, 'kalshi': raw search_sports_markets response}}
+        """
+        sport_mix = sport_mix or DEFAULT_SPORT_MIX
+        total_weight = sum(sport_mix.values())
+        n_games = max(1, math.ceil(n_markets / MARKETS_PER_GAME))
+
+        slate = {}
+        allocated = 0
+        sports = sorted(sport_mix)
+        for i, sport in enumerate(sports):
+            if i == len(sports) - 1:
+                games = n_games - allocated
+            else:
+                games = round(n_games * sport_mix[sport] / total_weight)
+            allocated += games
+            if games > 0:
+                slate[sport] = self.generate_sport(sport, games)
+        return slate
+
+    def generate_sport(self, sport: str, n_games: int) -> Dict[str, Dict]:
+        """
+        Generate one sport's Pinnacle and Kalshi responses
+
+        Args:
+            sport: Sport key from SPORTS_CONFIG
+            n_games: Games to schedule
+
+        Returns:
+            {'pinnacle': raw response, 'kalshi': raw response}
+        """
+        sport_config = get_sport_config(sport)
+        if not sport_config or len(sport_config.team_aliases) < 2:
+            raise ValueError(f"Sport {sport} has no team list to generate games from")
+
+        rng = random.Random(f"{self.seed}:{sport}")
+        teams = sorted(sport_config.team_aliases.items())
+        games_per_day = len(teams) // 2
+        days = (date(self.start_date.year, 12, 31) - self.start_date).days + 1
+        series_ticker = sport_config.kalshi_tickers[0] if sport_config.kalshi_tickers else f"KX{sport.upper()}GAME"
+        captured_at = self.as_of.isoformat()
+
+        events = []
+        markets = []
+        day_teams = []
+        for game_index in range(n_games):
+            slot = game_index % games_per_day
+            if slot == 0:
+                day_teams = teams[:]
+                rng.shuffle(day_teams)
+            day_number = game_index // games_per_day
+            game_day = self.start_date + timedelta(days=day_number % days)
+            game_number = day_number // days + 1  # > 1 once the season window is full
+
+            (away_code, away_names), (home_code, home_names) = day_teams[2 * slot], day_teams[2 * slot + 1]
+            start = datetime.combine(game_day, datetime.min.time(), tzinfo=timezone.utc) + timedelta(
+                hours=rng.choice((17, 19, 23, 24)), minutes=rng.choice((0, 5, 10, 35, 40))
+            )
+            commence_time = start.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+            home_probability = rng.uniform(0.3, 0.7)
+            if rng.random() < self.pinnacle_coverage:
+                vig = rng.uniform(0.0025, 0.0075)
+                events.append(self._pinnacle_event(rng, sport_config.pinnacle_key, sport_config.name,
+                                                   home_names[0], away_names[0], commence_time,
+                                                   home_probability + vig, 1 - home_probability + vig))
+
+            kalshi_probability = home_probability
+            if rng.random() < self.mispricing_rate:
+                kalshi_probability += rng.choice((-1, 1)) * rng.uniform(0.03, 0.10)
+            kalshi_probability = min(0.97, max(0.03, kalshi_probability))
+
+            use_nicknames = rng.random() < self.nickname_rate and len(home_names) > 1 and len(away_names) > 1
+            home_title = home_names[1] if use_nicknames else home_names[0]
+            away_title = away_names[1] if use_nicknames else away_names[0]
+            event_ticker = (f"{series_ticker}-{game_day.strftime('%y%b%d').upper()}"
+                            f"{away_code}{home_code}" + (f"G{game_number}" if game_number > 1 else ''))
+            close_time = (start + timedelta(days=14)).strftime('%Y-%m-%dT%H:%M:%SZ')
+            for yes_code, yes_title, yes_probability in ((home_code, home_title, kalshi_probability),
+                                                         (away_code, away_title, 1 - kalshi_probability)):
+                markets.append(self._kalshi_market(rng, sport, event_ticker, yes_code, yes_title,
+                                                   home_title, away_title, yes_probability, close_time))
+
+        rng.shuffle(markets)
+        return {
+            'pinnacle': {
+                'success': True,
+                'data': events,
+                'sport_type': sport,
+                'timestamp': captured_at,
+                'from_cache': False
+            },
+            'kalshi': {
+                'success': True,
+                'data': markets,
+                'total_markets': len(markets),
+                'sport_type': sport,
+                'timestamp': captured_at
+            }
+        }
+
+    def _pinnacle_event(self, rng: random.Random, sport_key: str, sport_title: str, home_team: str,
+                        away_team: str, commence_time: str, home_probability: float,
+                        away_probability: float) -> Dict:
+        """One Odds API event with a Pinnacle h2h market"""
+        return {
+            'id': '%032x' % rng.getrandbits(128),
+            'sport_key': sport_key,
+            'sport_title': sport_title,
+            'commence_time': commence_time,
+            'home_team': home_team,
+            'away_team': away_team,
+            'bookmakers': [{
+                'key': 'pinnacle',
+                'title': 'Pinnacle',
+                'last_update': commence_time,
+                'markets': [{
+                    'key': 'h2h',
+                    'last_update': commence_time,
+                    'outcomes': [
+                        {'name': away_team, 'price': _american(away_probability)},
+                        {'name': home_team, 'price': _american(home_probability)}
+                    ]
+                }]
+            }]
+        }
+
+    def _kalshi_market(self, rng: random.Random, sport: str, event_ticker: str, yes_code: str,
+                       yes_title: str, home_title: str, away_title: str, yes_probability: float,
+                       close_time: str) -> Dict:
+        """One Kalshi binary market on a team winning"""
+        yes_bid = max(1, min(98, int(yes_probability * 100)))
+        no_bid = max(1, min(98, int((1 - yes_probability) * 100)))
+        return {
+            'ticker': f"{event_ticker}-{yes_code}",
+            'event_ticker': event_ticker,
+            'market_type': 'binary',
+            'title': f"{away_title} at {home_title} Winner?",
+            'yes_sub_title': yes_title,
+            'no_sub_title': yes_title,
+            'status': 'active',
+            'close_time': close_time,
+            'expiration_time': close_time,
+            'yes_bid': yes_bid,
+            'yes_ask': yes_bid + 2,
+            'no_bid': no_bid,
+            'no_ask': no_bid + 2,
+            'last_price': yes_bid + 1,
+            'volume': rng.randint(0, 250000),
+            'open_interest': rng.randint(0, 100000),
+            'detected_sport': sport
+        }
@@ -0,0 +1,291 @@
+"""
+Backtest Engine - Offline replay of recorded Pinnacle/Kalshi snapshots
+Sweeps edge/confidence grids across processes and scores opportunities against settled outcomes
+"""
+
+import contextlib
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import product
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.pinnacle_client import PinnacleClient
+from core.kalshi_client import KalshiClientUpdated as KalshiClient
+from core.data_aligner import GameMatcher, MispricingDetector
+from utils.tick_store import canonical_game_key
+from config.sports_config import get_sport_config
+
+# Upper bounds of the edge histogram buckets reported per configuration
+EDGE_BUCKETS = (0.02, 0.05, 0.10, 0.20, 1.0)
+
+def snapshot_files(file_path: str) -> List[str]:
+    """A snapshot file plus its rotated backups (file.N / file.N.gz), oldest first"""
+    backups = []
+    index = 1
+    while True:
+        found = [name for name in (f"{file_path}.{index}", f"{file_path}.{index}.gz") if os.path.exists(name)]
+        if not found:
+            break
+        backups.append(found[0])
+        index += 1
+    files = list(reversed(backups))
+    if os.path.exists(file_path):
+        files.append(file_path)
+    return files
+
+def load_snapshots(paths: Iterable[str], sport: Optional[str] = None) -> List[Dict]:
+    """
+    Read recorded snapshots (MispricingSystem 'record_snapshots') in capture order
+
+    Args:
+        paths: Snapshot NDJSON files; rotated backups of each are picked up automatically
+        sport: Only keep snapshots for this sport
+
+    Returns:
+        Snapshot records sorted by captured_at
+    """
+    snapshots = []
+    for path in paths:
+        for file_path in snapshot_files(path):
+            opener = gzip.open if file_path.endswith('.gz') else open
+            with opener(file_path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if record.get('record_type') != 'snapshot':
+                        continue
+                    if sport and record.get('sport') != sport.lower():
+                        continue
+                    snapshots.append(record)
+    snapshots.sort(key=lambda record: record['captured_at'])
+    return snapshots
+
+def load_outcomes(file_path: str) -> Dict[str, str]:
+    """
+    Read settled results keyed by canonical game key ('MLB:2025-08-21:BOS@NYY')
+
+    Args:
+        file_path: JSON object {game_key: 'home' | 'away'} or CSV with game_key,winner columns
+
+    Returns:
+        Dictionary of game_key -> winning side
+    """
+    if file_path.endswith('.csv'):
+        with open(file_path, newline='') as f:
+            outcomes = {row['game_key']: row['winner'] for row in csv.DictReader(f)}
+    else:
+        with open(file_path) as f:
+            outcomes = json.load(f)
+    return {game_key: winner.strip().lower() for game_key, winner in outcomes.items()}
+
+def parameter_grid(min_edges: Sequence[float], confidence_thresholds: Sequence[float]) -> List[Dict]:
+    """Every (min_edge_threshold, match_confidence_threshold) combination"""
+    return [
+        {'min_edge_threshold': edge, 'match_confidence_threshold': confidence}
+        for confidence, edge in product(confidence_thresholds, min_edges)
+    ]
+
+def _parse_time(timestamp: str) -> datetime:
+    parsed = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def _select_bet(opportunity: Dict) -> Optional[Dict]:
+    """Side Kalshi prices furthest below Pinnacle, bought at the Kalshi price (None if neither is cheaper)"""
+    pinnacle = opportunity['pinnacle_odds']
+    kalshi = opportunity['kalshi_odds']
+    best = None
+    for side in ('home', 'away'):
+        kalshi_odds = kalshi[f'{side}_odds']
+        cents = kalshi_odds.get('kalshi_cents')
+        price = cents / 100 if cents else kalshi_odds['implied_probability']
+        gap = pinnacle[f'{side}_odds']['implied_probability'] - price
+        if gap > 0 and 0 < price < 1 and (best is None or gap > best['gap']):
+            best = {'side': side, 'price': price, 'gap': gap}
+    return best
+
+def _evaluate_confidence(frames: List[Dict], outcomes: Dict[str, str], confidence: float,
+                         min_edges: Sequence[float], stake: float) -> List[Dict]:
+    """
+    Score every min_edge for one match confidence threshold
+
+    Games are aligned once per frame at this confidence; the detector runs once at the
+    lowest edge and higher edges are the subsets whose max_edge clears them. Each game is
+    bet at most once per configuration, at the first frame where it qualifies.
+    """
+    floor_edge = min(min_edges)
+    matchers = {}
+    detector = MispricingDetector(min_edge_threshold=floor_edge, min_confidence=confidence)
+
+    # (max_edge, game_key, bet) for every opportunity at the floor edge, in frame order
+    found = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for frame in frames:
+            sport = frame['sport']
+            if sport not in matchers:
+                sport_config = get_sport_config(sport)
+                matchers[sport] = GameMatcher(
+                    time_threshold_hours=sport_config.time_threshold_hours if sport_config else 96.0,
+                    confidence_threshold=confidence
+                )
+            aligned_games = matchers[sport].align_games(frame['pinnacle_games'], frame['kalshi_games'])
+            for opportunity in detector.detect_opportunities(aligned_games):
+                game = opportunity['pinnacle_odds']
+                game_key = canonical_game_key(game['sport'], game.get('game_date'), game['home_team'], game['away_team'])
+                found.append((opportunity['discrepancy']['max_edge'], game_key, _select_bet(opportunity)))
+
+    edges = np.array([max_edge for max_edge, _, _ in found], dtype=np.float64)
+    results = []
+    for min_edge in min_edges:
+        selected = np.flatnonzero(edges >= min_edge)
+        selected_edges = edges[selected]
+
+        bets = {}
+        for i in selected.tolist():
+            _, game_key, bet = found[i]
+            if bet is not None and game_key not in bets:
+                bets[game_key] = bet
+
+        settled = wins = 0
+        pnl = 0.0
+        for game_key, bet in bets.items():
+            winner = outcomes.get(game_key)
+            if winner not in ('home', 'away'):
+                continue
+            settled += 1
+            if winner == bet['side']:
+                wins += 1
+                pnl += stake * (1 - bet['price']) / bet['price']
+            else:
+                pnl -= stake
+
+        results.append({
+            'min_edge_threshold': min_edge,
+            'match_confidence_threshold': confidence,
+            'opportunities': int(selected.size),
+            'unique_games': len({found[i][1] for i in selected.tolist()}),
+            'edge_distribution': {
+                'mean': float(selected_edges.mean()) if selected.size else 0.0,
+                'median': float(np.median(selected_edges)) if selected.size else 0.0,
+                'p90': float(np.percentile(selected_edges, 90)) if selected.size else 0.0,
+                'max': float(selected_edges.max()) if selected.size else 0.0,
+                'histogram': dict(zip(
+                    [f"<{bound:.0%}" for bound in EDGE_BUCKETS],
+                    np.histogram(selected_edges, bins=(0.0,) + EDGE_BUCKETS)[0].tolist()
+                ))
+            },
+            'bets_placed': len(bets),
+            'bets_settled': settled,
+            'wins': wins,
+            'pnl': pnl,
+            'roi': pnl / (settled * stake) if settled else 0.0
+        })
+    return results
+
+# Per-process copies of the prepared frames, set once by the pool initializer
+_worker_frames: List[Dict] = []
+_worker_outcomes: Dict[str, str] = {}
+
+def _init_worker(frames: List[Dict], outcomes: Dict[str, str]):
+    global _worker_frames, _worker_outcomes
+    _worker_frames = frames
+    _worker_outcomes = outcomes
+
+def _run_worker_task(confidence: float, min_edges: Sequence[float], stake: float) -> List[Dict]:
+    return _evaluate_confidence(_worker_frames, _worker_outcomes, confidence, min_edges, stake)
+
+class BacktestEngine:
+    """Replays snapshots through normalize -> align_games -> detect_opportunities for many thresholds"""
+
+    def __init__(self, snapshots: List[Dict], outcomes: Optional[Dict[str, str]] = None,
+                 time_buffer_minutes: int = 15, stake: float = 1.0):
+        """
+        Initialize the engine
+
+        Args:
+            snapshots: Records from load_snapshots (each with sport, captured_at, pinnacle, kalshi)
+            outcomes: Settled winners by canonical game key (P&L is zero without them)
+            time_buffer_minutes: Live-game filter applied relative to each snapshot's capture time
+            stake: Units staked per bet
+        """
+        self.snapshots = snapshots
+        self.outcomes = outcomes or {}
+        self.time_buffer_minutes = time_buffer_minutes
+        self.stake = stake
+        self.frames: Optional[List[Dict]] = None
+
+        # Normalization needs no credentials
+        self.pinnacle_client = PinnacleClient(None)
+        self.kalshi_client = KalshiClient(None)
+
+    def prepare(self) -> List[Dict]:
+        """
+        Normalize every snapshot once (normalization does not depend on the swept thresholds)
+
+        Returns:
+            Frames of {'sport', 'captured_at', 'pinnacle_games', 'kalshi_games'}
+        """
+        if self.frames is not None:
+            return self.frames
+
+        frames = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for snapshot in self.snapshots:
+                as_of = _parse_time(snapshot['captured_at'])
+                frames.append({
+                    'sport': snapshot['sport'],
+                    'captured_at': snapshot['captured_at'],
+                    'pinnacle_games': self.pinnacle_client.normalize_pinnacle_data(
+                        snapshot['pinnacle'], self.time_buffer_minutes, as_of=as_of),
+                    'kalshi_games': self.kalshi_client.normalize_kalshi_data(
+                        snapshot['kalshi'], self.time_buffer_minutes, as_of=as_of)
+                })
+        # Raw payloads are not needed once normalized
+        self.pinnacle_client.raw_payloads.clear()
+        self.kalshi_client.raw_payloads.clear()
+        self.frames = frames
+        return frames
+
+    def run_sweep(self, min_edges: Sequence[float], confidence_thresholds: Sequence[float],
+                  workers: Optional[int] = None) -> List[Dict]:
+        """
+        Evaluate every threshold combination
+
+        Args:
+            min_edges: MispricingDetector min_edge_threshold values
+            confidence_thresholds: Match confidence thresholds (matcher and detector)
+            workers: Worker processes (defaults to CPU count; 1 runs in-process)
+
+        Returns:
+            One result per combination, best P&L first
+        """
+        frames = self.prepare()
+        min_edges = sorted(set(min_edges))
+        confidence_thresholds = sorted(set(confidence_thresholds))
+        workers = min(workers or os.cpu_count() or 1, len(confidence_thresholds))
+
+        results = []
+        if workers <= 1:
+            for confidence in confidence_thresholds:
+                results.extend(_evaluate_confidence(frames, self.outcomes, confidence, min_edges, self.stake))
+        else:
+            # Frames go to each worker once; tasks carry only thresholds
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(frames, self.outcomes)) as pool:
+                futures = [pool.submit(_run_worker_task, confidence, min_edges, self.stake)
+                           for confidence in confidence_thresholds]
+                for future in futures:
+                    results.extend(future.result())
+
+        results.sort(key=lambda result: (result['pnl'], result['opportunities']), reverse=True)
+        return results
@@ -5,163 +5,62 @@ Production-ready module for aligning Pinnacle and Kalshi data
 
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 import re
-from difflib import SequenceMatcher
+import numpy as np
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.sports_config import get_sport_config, SPORTS_CONFIG
+from config.sports_config import get_sport_config
+from utils.team_resolver import get_team_resolver
+from utils.console import console
+from utils.timestamp_utils import parse_epoch
+
+@lru_cache(maxsize=4096)
+def _date_window(game_date: str, window_days: int) -> Optional[Tuple[Optional[str], ...]]:
+    """Dates within window_days of game_date plus None (cached: a slate has few distinct dates)"""
+    try:
+        center = datetime.strptime(game_date, '%Y-%m-%d')
+    except ValueError:
+        return None
+    dates = tuple(
+        (center + timedelta(days=offset)).strftime('%Y-%m-%d')
+        for offset in range(-window_days, window_days + 1)
+    )
+    # Games without a parsed date can still match on teams
+    return dates + (None,)
+
+def game_start_epoch(game: Dict) -> Optional[int]:
+    """Exact start in epoch seconds: the record's game_epoch, else a full ISO game_time (cached parse)"""
+    game_epoch = game.get('game_epoch')
+    if game_epoch is not None:
+        return game_epoch
+    game_time = game.get('game_time')
+    # 'HH:MM' display times and 'Unknown' carry no date, so there is nothing to compare
+    if game_time and 'T' in game_time:
+        return parse_epoch(game_time)
+    return None
 
 class GameMatcher:
     """Class for matching games between Pinnacle and Kalshi platforms across all sports"""
     
-    # Legacy comprehensive team aliases - now loaded dynamically from sports_config
-    # Kept for backward compatibility but will be replaced by sport-specific configs
-    LEGACY_TEAM_ALIASES = {
-        # MLB Teams
-        'LAA': ['Los Angeles Angels', 'Angels', 'LA Angels'],
-        'HOU': ['Houston Astros', 'Astros'], 
-        'OAK': ['Oakland Athletics', 'Athletics', 'A\'s'],
-        'TOR': ['Toronto Blue Jays', 'Blue Jays', 'Jays'],
-        'ATL': ['Atlanta Braves', 'Braves'],
-        'MIL': ['Milwaukee Brewers', 'Brewers'],
-        'STL': ['St. Louis Cardinals', 'Cardinals'],
-        'CHC': ['Chicago Cubs', 'Cubs'],
-        'ARI': ['Arizona Diamondbacks', 'Diamondbacks', 'D-backs'],
-        'COL': ['Colorado Rockies', 'Rockies'],
-        'LAD': ['Los Angeles Dodgers', 'Dodgers'],
-        'SD': ['San Diego Padres', 'Padres'],
-        'SF': ['San Francisco Giants', 'Giants'],
-        'MIA': ['Miami Marlins', 'Marlins'],
-        'NYM': ['New York Mets', 'Mets'],
-        'PHI': ['Philadelphia Phillies', 'Phillies'],
-        'PIT': ['Pittsburgh Pirates', 'Pirates'],
-        'WSH': ['Washington Nationals', 'Nationals'],
-        'CWS': ['Chicago White Sox', 'White Sox'],
-        'CLE': ['Cleveland Guardians', 'Guardians'],
-        'DET': ['Detroit Tigers', 'Tigers'],
-        'KC': ['Kansas City Royals', 'Royals'],
-        'MIN': ['Minnesota Twins', 'Twins', 'Minnesota'],
-        'NYY': ['New York Yankees', 'Yankees'],
-        'BAL': ['Baltimore Orioles', 'Orioles'],
-        'BOS': ['Boston Red Sox', 'Red Sox'],
-        'TB': ['Tampa Bay Rays', 'Rays'],
-        'TEX': ['Texas Rangers', 'Rangers'],
-        'SEA': ['Seattle Mariners', 'Mariners'],
-        
-        # NFL Teams
-        'ARI': ['Arizona Cardinals', 'Cardinals'],
-        'ATL': ['Atlanta Falcons', 'Falcons'],
-        'BAL': ['Baltimore Ravens', 'Ravens'],
-        'BUF': ['Buffalo Bills', 'Bills'],
-        'CAR': ['Carolina Panthers', 'Panthers'],
-        'CHI': ['Chicago Bears', 'Bears'],
-        'CIN': ['Cincinnati Bengals', 'Bengals'],
-        'CLE': ['Cleveland Browns', 'Browns'],
-        'DAL': ['Dallas Cowboys', 'Cowboys'],
-        'DEN': ['Denver Broncos', 'Broncos'],
-        'DET': ['Detroit Lions', 'Lions'],
-        'GB': ['Green Bay Packers', 'Packers'],
-        'HOU': ['Houston Texans', 'Texans'],
-        'IND': ['Indianapolis Colts', 'Colts'],
-        'JAX': ['Jacksonville Jaguars', 'Jaguars'],
-        'KC': ['Kansas City Chiefs', 'Chiefs'],
-        'LV': ['Las Vegas Raiders', 'Raiders'],
-        'LAC': ['Los Angeles Chargers', 'Chargers'],
-        'LAR': ['Los Angeles Rams', 'Rams'],
-        'MIA': ['Miami Dolphins', 'Dolphins'],
-        'MIN': ['Minnesota Vikings', 'Vikings'],
-        'NE': ['New England Patriots', 'Patriots'],
-        'NO': ['New Orleans Saints', 'Saints'],
-        'NYG': ['New York Giants', 'Giants'],
-        'NYJ': ['New York Jets', 'Jets'],
-        'PHI': ['Philadelphia Eagles', 'Eagles'],
-        'PIT': ['Pittsburgh Steelers', 'Steelers'],
-        'SF': ['San Francisco 49ers', '49ers', 'Niners'],
-        'SEA': ['Seattle Seahawks', 'Seahawks'],
-        'TB': ['Tampa Bay Buccaneers', 'Buccaneers', 'Bucs'],
-        'TEN': ['Tennessee Titans', 'Titans'],
-        'WAS': ['Washington Commanders', 'Commanders'],
-        
-        # NBA Teams
-        'ATL': ['Atlanta Hawks', 'Hawks'],
-        'BOS': ['Boston Celtics', 'Celtics'],
-        'BKN': ['Brooklyn Nets', 'Nets'],
-        'CHA': ['Charlotte Hornets', 'Hornets'],
-        'CHI': ['Chicago Bulls', 'Bulls'],
-        'CLE': ['Cleveland Cavaliers', 'Cavaliers', 'Cavs'],
-        'DAL': ['Dallas Mavericks', 'Mavericks', 'Mavs'],
-        'DEN': ['Denver Nuggets', 'Nuggets'],
-        'DET': ['Detroit Pistons', 'Pistons'],
-        'GSW': ['Golden State Warriors', 'Warriors'],
-        'HOU': ['Houston Rockets', 'Rockets'],
-        'IND': ['Indiana Pacers', 'Pacers'],
-        'LAC': ['Los Angeles Clippers', 'Clippers'],
-        'LAL': ['Los Angeles Lakers', 'Lakers'],
-        'MEM': ['Memphis Grizzlies', 'Grizzlies'],
-        'MIA': ['Miami Heat', 'Heat'],
-        'MIL': ['Milwaukee Bucks', 'Bucks'],
-        'MIN': ['Minnesota Timberwolves', 'Timberwolves', 'Wolves'],
-        'NOP': ['New Orleans Pelicans', 'Pelicans'],
-        'NYK': ['New York Knicks', 'Knicks'],
-        'OKC': ['Oklahoma City Thunder', 'Thunder'],
-        'ORL': ['Orlando Magic', 'Magic'],
-        'PHI': ['Philadelphia 76ers', '76ers', 'Sixers'],
-        'PHX': ['Phoenix Suns', 'Suns'],
-        'POR': ['Portland Trail Blazers', 'Trail Blazers', 'Blazers'],
-        'SAC': ['Sacramento Kings', 'Kings'],
-        'SAS': ['San Antonio Spurs', 'Spurs'],
-        'TOR': ['Toronto Raptors', 'Raptors'],
-        'UTA': ['Utah Jazz', 'Jazz'],
-        'WAS': ['Washington Wizards', 'Wizards'],
-        
-        # NHL Teams
-        'ANA': ['Anaheim Ducks', 'Ducks'],
-        'ARI': ['Arizona Coyotes', 'Coyotes'],
-        'BOS': ['Boston Bruins', 'Bruins'],
-        'BUF': ['Buffalo Sabres', 'Sabres'],
-        'CGY': ['Calgary Flames', 'Flames'],
-        'CAR': ['Carolina Hurricanes', 'Hurricanes'],
-        'CHI': ['Chicago Blackhawks', 'Blackhawks'],
-        'COL': ['Colorado Avalanche', 'Avalanche'],
-        'CBJ': ['Columbus Blue Jackets', 'Blue Jackets'],
-        'DAL': ['Dallas Stars', 'Stars'],
-        'DET': ['Detroit Red Wings', 'Red Wings'],
-        'EDM': ['Edmonton Oilers', 'Oilers'],
-        'FLA': ['Florida Panthers', 'Panthers'],
-        'LAK': ['Los Angeles Kings', 'Kings'],
-        'MIN': ['Minnesota Wild', 'Wild'],
-        'MTL': ['Montreal Canadiens', 'Canadiens', 'Habs'],
-        'NSH': ['Nashville Predators', 'Predators'],
-        'NJD': ['New Jersey Devils', 'Devils'],
-        'NYI': ['New York Islanders', 'Islanders'],
-        'NYR': ['New York Rangers', 'Rangers'],
-        'OTT': ['Ottawa Senators', 'Senators'],
-        'PHI': ['Philadelphia Flyers', 'Flyers'],
-        'PIT': ['Pittsburgh Penguins', 'Penguins'],
-        'SJS': ['San Jose Sharks', 'Sharks'],
-        'SEA': ['Seattle Kraken', 'Kraken'],
-        'STL': ['St. Louis Blues', 'Blues'],
-        'TBL': ['Tampa Bay Lightning', 'Lightning'],
-        'TOR': ['Toronto Maple Leafs', 'Maple Leafs', 'Leafs'],
-        'VAN': ['Vancouver Canucks', 'Canucks'],
-        'VGK': ['Vegas Golden Knights', 'Golden Knights'],
-        'WSH': ['Washington Capitals', 'Capitals', 'Caps'],
-        'WPG': ['Winnipeg Jets', 'Jets']
-    }
-    
-    def __init__(self, time_threshold_hours: float = 96.0):
+    def __init__(self, time_threshold_hours: float = 96.0, confidence_threshold: Optional[float] = None):
         """
         Initialize GameMatcher
         
         Args:
             time_threshold_hours: Maximum time difference for matching games (hours)
+            confidence_threshold: Minimum match confidence for every sport (defaults to each
+                                  sport's match_confidence_threshold)
         """
         self.time_threshold = timedelta(hours=time_threshold_hours)
+        # Matching math runs on integer epoch seconds
+        self.time_threshold_seconds = int(time_threshold_hours * 3600)
+        self.confidence_threshold = confidence_threshold
         
-        # Combine all sport team aliases for comprehensive matching
-        self.TEAM_ALIASES = self._build_combined_team_aliases()
+        # Shared compiled alias maps (same resolver the clients normalize with)
+        self.team_resolver = get_team_resolver()
     
     def align_games(self, pinnacle_games: List[Dict], kalshi_games: List[Dict]) -> List[Dict]:
         """
@@ -176,13 +75,17 @@ class GameMatcher:
         """
         aligned_games = []
         used_kalshi_indices = set()
+        candidate_index = self._build_candidate_index(kalshi_games)
         
         for pinnacle_game in pinnacle_games:
-            best_match = self._find_best_match(pinnacle_game, kalshi_games, used_kalshi_indices)
+            candidates = self._get_candidate_indices(pinnacle_game, candidate_index, len(kalshi_games))
+            best_match = self._find_best_match(pinnacle_game, kalshi_games, used_kalshi_indices, candidates)
             
             if best_match is not None:
                 kalshi_game, kalshi_index, confidence = best_match
                 used_kalshi_indices.add(kalshi_index)
+                time_difference = self._calculate_time_difference(pinnacle_game, kalshi_game)
+                team_match_score = self._calculate_team_similarity(pinnacle_game, kalshi_game)
                 
                 aligned_game = {
                     'match_id': f"match_{len(aligned_games) + 1}",
@@ -190,28 +93,97 @@ class GameMatcher:
                     'kalshi_data': kalshi_game,
                     'match_confidence': confidence,
                     'alignment_metadata': {
-                        'matched_on': self._get_match_criteria(pinnacle_game, kalshi_game),
-                        'time_difference': self._calculate_time_difference(pinnacle_game, kalshi_game),
-                        'team_match_score': self._calculate_team_similarity(pinnacle_game, kalshi_game),
+                        'matched_on': self._get_match_criteria(pinnacle_game, kalshi_game,
+                                                               team_match_score, time_difference),
+                        'time_difference': time_difference,
+                        'team_match_score': team_match_score,
                         'aligned_at': datetime.now(timezone.utc).isoformat()
                     }
                 }
                 
                 aligned_games.append(aligned_game)
         
-        print(f"Aligned {len(aligned_games)} games out of {len(pinnacle_games)} Pinnacle games")
+        console(f"Aligned {len(aligned_games)} games out of {len(pinnacle_games)} Pinnacle games")
         return aligned_games
     
+    def _build_candidate_index(self, kalshi_games: List[Dict]) -> Dict[Tuple[str, Optional[str]], Dict[Optional[str], List[int]]]:
+        """
+        Bucket Kalshi games by (sport, canonical team code) and game date
+        
+        Teams that don't resolve to a code go in the (sport, None) bucket, which every
+        Pinnacle game also checks so fuzzy name matches are still scored.
+        """
+        index = {}
+        for i, kalshi_game in enumerate(kalshi_games):
+            sport = kalshi_game.get('sport', '').upper()
+            game_date = kalshi_game.get('game_date')
+            team_keys = {
+                self._canonical_team_code(kalshi_game.get(side, ''), sport)
+                for side in ('home_team', 'away_team')
+            }
+            for team_key in team_keys:
+                index.setdefault((sport, team_key), {}).setdefault(game_date, []).append(i)
+        return index
+    
+    def _get_candidate_indices(self, pinnacle_game: Dict, candidate_index: Dict,
+                               kalshi_count: int) -> List[int]:
+        """Get Kalshi indices sharing a (sport, team, date window) bucket with a Pinnacle game"""
+        sport = pinnacle_game.get('sport', '').upper()
+        team_codes = [
+            self._canonical_team_code(pinnacle_game.get(side, ''), sport)
+            for side in ('home_team', 'away_team')
+        ]
+        
+        # Unresolved Pinnacle team names can only be matched fuzzily - score everything
+        if None in team_codes:
+            return list(range(kalshi_count))
+        
+        # Kalshi games without a sport are compatible with any sport
+        if sport:
+            sports = [sport, '']
+        else:
+            sports = list({key[0] for key in candidate_index})
+        
+        dates = self._get_date_window(pinnacle_game.get('game_date'))
+        
+        candidates = set()
+        for candidate_sport in sports:
+            for team_key in team_codes + [None]:
+                date_buckets = candidate_index.get((candidate_sport, team_key))
+                if not date_buckets:
+                    continue
+                if dates is None:
+                    for indices in date_buckets.values():
+                        candidates.update(indices)
+                else:
+                    for game_date in dates:
+                        candidates.update(date_buckets.get(game_date, ()))
+        
+        # Sorted so ties resolve to the earliest Kalshi game, as with a full scan
+        return sorted(candidates)
+    
+    def _get_date_window(self, game_date: Optional[str]) -> Optional[List[Optional[str]]]:
+        """Get dates within the time threshold of a game date (None means any date)"""
+        if not game_date:
+            return None
+        window_days = -(-self.time_threshold_seconds // 86400)  # ceil
+        dates = _date_window(game_date, window_days)
+        return list(dates) if dates is not None else None
+    
     def _find_best_match(self, pinnacle_game: Dict, kalshi_games: List[Dict], 
-                        used_indices: set) -> Optional[Tuple[Dict, int, float]]:
-        """Find the best matching Kalshi game for a Pinnacle game"""
+                        used_indices: set, candidate_indices: Optional[List[int]] = None) -> Optional[Tuple[Dict, int, float]]:
+        """Find the best matching Kalshi game for a Pinnacle game among the candidates"""
         best_match = None
         best_confidence = 0.0
         best_index = -1
         
-        for i, kalshi_game in enumerate(kalshi_games):
+        if candidate_indices is None:
+            candidate_indices = range(len(kalshi_games))
+        
+        for i in candidate_indices:
             if i in used_indices:
                 continue
+            kalshi_game = kalshi_games[i]
                 
             confidence = self._calculate_match_confidence(pinnacle_game, kalshi_game)
             
@@ -263,13 +235,15 @@ class GameMatcher:
            (pinnacle_home == kalshi_away and pinnacle_away == kalshi_home):
             return 1.0
         
+        sport = pinnacle_game.get('sport') or kalshi_game.get('sport') or ''
+        
         # Check aliases and variations
-        home_similarity = self._get_team_similarity(pinnacle_home, kalshi_home)
-        away_similarity = self._get_team_similarity(pinnacle_away, kalshi_away)
+        home_similarity = self._get_team_similarity(pinnacle_home, kalshi_home, sport)
+        away_similarity = self._get_team_similarity(pinnacle_away, kalshi_away, sport)
         
         # Check reversed matchup
-        home_similarity_rev = self._get_team_similarity(pinnacle_home, kalshi_away)
-        away_similarity_rev = self._get_team_similarity(pinnacle_away, kalshi_home)
+        home_similarity_rev = self._get_team_similarity(pinnacle_home, kalshi_away, sport)
+        away_similarity_rev = self._get_team_similarity(pinnacle_away, kalshi_home, sport)
         
         # Take the better of the two arrangements
         direct_score = (home_similarity + away_similarity) / 2
@@ -277,23 +251,22 @@ class GameMatcher:
         
         return max(direct_score, reversed_score)
     
-    def _build_combined_team_aliases(self) -> Dict[str, List[str]]:
-        """Build combined team aliases from all sports configurations"""
-        combined_aliases = {}
-        
-        # Add all sport-specific team aliases
-        for sport_config in SPORTS_CONFIG.values():
-            combined_aliases.update(sport_config.team_aliases)
-        
-        # Add legacy aliases for any teams not covered
-        for team, aliases in self.LEGACY_TEAM_ALIASES.items():
-            if team not in combined_aliases:
-                combined_aliases[team] = aliases
-        
-        return combined_aliases
+    def _canonical_team_code(self, team_name: str, sport: str = '') -> Optional[str]:
+        """Resolve a team name to its canonical code, or None if it has no alias entry"""
+        if self.team_resolver.has_sport(sport):
+            return self.team_resolver.resolve(team_name, sport)
+        
+        # Without a sport, only names that map to a single code are trusted
+        codes = self.team_resolver.codes_for(team_name)
+        if len(codes) == 1:
+            return next(iter(codes))
+        return None
     
     def _get_sport_threshold(self, pinnacle_game: Dict, kalshi_game: Dict) -> float:
         """Get sport-specific confidence threshold"""
+        if self.confidence_threshold is not None:
+            return self.confidence_threshold
+        
         # Try to determine sport from game data
         sport_key = None
         
@@ -312,19 +285,17 @@ class GameMatcher:
         # Default threshold if sport not found
         return 0.4
     
-    def _get_team_similarity(self, team1: str, team2: str) -> float:
+    def _get_team_similarity(self, team1: str, team2: str, sport: str = '') -> float:
         """Calculate similarity between two team names using dynamic sport configs"""
         if team1 == team2:
             return 1.0
         
-        # Check aliases from combined team mappings
-        for standard_name, aliases in self.TEAM_ALIASES.items():
-            if (team1 == standard_name or team1 in [alias.upper() for alias in aliases]) and \
-               (team2 == standard_name or team2 in [alias.upper() for alias in aliases]):
-                return 1.0
+        # Alias lookups through the compiled resolver
+        if self.team_resolver.same_team(team1, team2, sport):
+            return 1.0
         
-        # String similarity as fallback
-        return SequenceMatcher(None, team1, team2).ratio()
+        # String similarity as fallback, cached per name pair
+        return self.team_resolver.similarity(team1, team2)
     
     def _calculate_time_similarity(self, pinnacle_game: Dict, kalshi_game: Dict) -> float:
         """Calculate time proximity similarity score"""
@@ -334,13 +305,13 @@ class GameMatcher:
             return 0.5  # Neutral score if no time data
         
         # Perfect match within 15 minutes
-        if time_diff < timedelta(minutes=15):
+        if time_diff < 900:
             return 1.0
         
         # Good match within threshold
-        if time_diff < self.time_threshold:
+        if time_diff < self.time_threshold_seconds:
             # Decay score based on time difference
-            ratio = time_diff.total_seconds() / self.time_threshold.total_seconds()
+            ratio = time_diff / self.time_threshold_seconds
             return max(0.0, 1.0 - ratio)
         
         return 0.0
@@ -355,37 +326,35 @@ class GameMatcher:
         
         return 1.0 if pinnacle_date == kalshi_date else 0.0
     
-    def _calculate_time_difference(self, pinnacle_game: Dict, kalshi_game: Dict) -> Optional[timedelta]:
-        """Calculate time difference between two games"""
-        pinnacle_time = pinnacle_game.get('game_time')
-        kalshi_time = kalshi_game.get('game_time')
+    def _calculate_time_difference(self, pinnacle_game: Dict, kalshi_game: Dict) -> Optional[int]:
+        """Calculate time difference between two games in seconds (None unless both start times are known)"""
+        pinnacle_epoch = game_start_epoch(pinnacle_game)
+        kalshi_epoch = game_start_epoch(kalshi_game)
         
-        if not pinnacle_time or not kalshi_time:
-            return None
-        
-        try:
-            pinnacle_dt = datetime.fromisoformat(pinnacle_time.replace('Z', '+00:00'))
-            kalshi_dt = datetime.fromisoformat(kalshi_time.replace('Z', '+00:00'))
-            return abs(pinnacle_dt - kalshi_dt)
-        except:
+        if pinnacle_epoch is None or kalshi_epoch is None:
             return None
+        return abs(pinnacle_epoch - kalshi_epoch)
     
-    def _get_match_criteria(self, pinnacle_game: Dict, kalshi_game: Dict) -> List[str]:
-        """Get list of criteria used for matching"""
+    def _get_match_criteria(self, pinnacle_game: Dict, kalshi_game: Dict,
+                            team_similarity: Optional[float] = None,
+                            time_diff: Optional[int] = None) -> List[str]:
+        """Get list of criteria used for matching (reusing scores already computed by the caller)"""
         criteria = []
         
         # Check what matched
         if pinnacle_game.get('game_date') == kalshi_game.get('game_date'):
             criteria.append('date_match')
         
-        team_similarity = self._calculate_team_similarity(pinnacle_game, kalshi_game)
+        if team_similarity is None:
+            team_similarity = self._calculate_team_similarity(pinnacle_game, kalshi_game)
         if team_similarity >= 0.9:
             criteria.append('team_exact_match')
         elif team_similarity >= 0.7:
             criteria.append('team_fuzzy_match')
         
-        time_diff = self._calculate_time_difference(pinnacle_game, kalshi_game)
-        if time_diff and time_diff < timedelta(hours=1):
+        if time_diff is None:
+            time_diff = self._calculate_time_difference(pinnacle_game, kalshi_game)
+        if time_diff and time_diff < 3600:
             criteria.append('time_proximity')
         
         return criteria
@@ -415,21 +384,30 @@ class MispricingDetector:
         Returns:
             List of mispricing opportunities
         """
-        opportunities = []
-        
-        for game in aligned_games:
-            if game.get('match_confidence', 0) < self.min_confidence:
-                continue
-                
-            opportunity = self._analyze_game_for_mispricing(game)
-            if opportunity:
-                opportunities.append(opportunity)
-        
-        print(f"Found {len(opportunities)} mispricing opportunities")
+        candidates = [game for game in aligned_games if game.get('match_confidence', 0) >= self.min_confidence]
+        
+        # Screen every candidate's edges in one vectorized pass
+        probabilities = np.array([
+            (game['pinnacle_data']['home_odds']['implied_probability'],
+             game['pinnacle_data']['away_odds']['implied_probability'],
+             game['kalshi_data']['home_odds']['implied_probability'],
+             game['kalshi_data']['away_odds']['implied_probability'])
+            for game in candidates
+        ], dtype=np.float64).reshape(-1, 4)
+        home_edges = np.abs(probabilities[:, 0] - probabilities[:, 2])
+        away_edges = np.abs(probabilities[:, 1] - probabilities[:, 3])
+        passing = np.flatnonzero(np.maximum(home_edges, away_edges) >= self.min_edge)
+        
+        opportunities = [
+            self._analyze_game_for_mispricing(candidates[i], home_edges[i].item(), away_edges[i].item())
+            for i in passing.tolist()
+        ]
+        
+        console(f"Found {len(opportunities)} mispricing opportunities")
         return opportunities
     
-    def _analyze_game_for_mispricing(self, aligned_game: Dict) -> Optional[Dict]:
-        """Analyze a single aligned game for mispricing"""
+    def _analyze_game_for_mispricing(self, aligned_game: Dict, home_edge: float, away_edge: float) -> Dict:
+        """Build the opportunity record for an aligned game whose edge passed screening"""
         pinnacle_data = aligned_game['pinnacle_data']
         kalshi_data = aligned_game['kalshi_data']
         
@@ -439,15 +417,8 @@ class MispricingDetector:
         k_home_prob = kalshi_data['home_odds']['implied_probability']
         k_away_prob = kalshi_data['away_odds']['implied_probability']
         
-        # Calculate edges
-        home_edge = abs(p_home_prob - k_home_prob)
-        away_edge = abs(p_away_prob - k_away_prob)
-        
         max_edge = max(home_edge, away_edge)
         
-        if max_edge < self.min_edge:
-            return None
-        
         # Determine best opportunity
         if home_edge > away_edge:
             best_side = 'home'
@@ -470,8 +441,8 @@ class MispricingDetector:
             'pinnacle_odds': pinnacle_data,
             'kalshi_odds': kalshi_data,
             'discrepancy': {
-                'home_team_diff': abs(p_home_prob - k_home_prob),
-                'away_team_diff': abs(p_away_prob - k_away_prob),
+                'home_team_diff': home_edge,
+                'away_team_diff': away_edge,
                 'max_edge': max_edge,
                 'recommended_side': best_side
             },
@@ -483,6 +454,18 @@ class MispricingDetector:
             'timestamp': datetime.now(timezone.utc).isoformat()
         }
         
+        # Kalshi prices came from the order book for a stake (core/depth_pricing.py); a side the
+        # book cannot fill keeps its top-of-book price and is flagged here
+        depth = (kalshi_data.get('metadata') or {}).get('depth')
+        if depth:
+            opportunity['execution'] = {
+                'stake': depth['stake'],
+                'fill_price': depth[f'{best_side}_fill_price'],
+                'fillable_stake': depth[f'{best_side}_fillable'],
+                'fully_fillable': depth[f'{best_side}_fully_fillable'],
+                'top_of_book_probability': depth[f'top_of_book_{best_side}_probability']
+            }
+        
         return opportunity
     
     def _calculate_expected_value(self, true_prob: float, market_prob: float) -> float:
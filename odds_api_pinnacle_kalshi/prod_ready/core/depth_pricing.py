@@ -0,0 +1,238 @@
+"""
+Depth-Aware Pricing - Executable Kalshi prices for a stake from concurrently fetched order books
+Aligned games are repriced at the volume-weighted fill price before mispricing detection
+"""
+
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.odds_converter import OddsConverter
+from core.game_record import OddsQuote
+from utils.console import console
+
+def vwap_fill(levels: Iterable[Tuple[float, float]], stake: float) -> Tuple[Optional[float], float]:
+    """
+    Walk ask levels until stake dollars are spent
+
+    Args:
+        levels: (price per contract 0.0-1.0, contracts available), best price first
+        stake: Dollars to spend
+
+    Returns:
+        (volume-weighted price per contract or None when nothing is offered, dollars actually filled)
+    """
+    remaining = stake
+    contracts = 0.0
+    for price, size in levels:
+        if remaining <= 0:
+            break
+        if price <= 0 or size <= 0:
+            continue
+        take = min(size, remaining / price)
+        contracts += take
+        remaining -= take * price
+    filled = stake - remaining
+    if contracts <= 0:
+        return None, 0.0
+    return filled / contracts, filled
+
+def kalshi_ask_levels(bid_levels: Optional[Sequence[Sequence[float]]]) -> List[Tuple[float, float]]:
+    """
+    Asks for one side from the opposite side's bids (a NO bid at p cents is a YES ask at 100 - p)
+
+    Args:
+        bid_levels: Kalshi orderbook [[price_cents, contracts], ...] in ascending price order
+
+    Returns:
+        (price 0.0-1.0, contracts) with the cheapest ask first
+    """
+    if not bid_levels:
+        return []
+    return [((100 - price) / 100.0, float(size)) for price, size in reversed(bid_levels)]
+
+class OrderBookCache:
+    """Briefly cached order books keyed by market/token id"""
+
+    def __init__(self, ttl_seconds: float = 5.0):
+        self.ttl_seconds = ttl_seconds
+        self._books: Dict[Hashable, Tuple[float, Optional[Dict]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, now: Optional[float] = None) -> Tuple[bool, Optional[Dict]]:
+        """(found, book) for a key fetched within the TTL"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._books.get(key)
+            if entry is not None and now - entry[0] < self.ttl_seconds:
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Hashable, book: Optional[Dict], now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._books[key] = (now, book)
+            # Drop anything expired so the cache stays the size of the live candidate set
+            if len(self._books) > 1024:
+                self._books = {k: v for k, v in self._books.items() if now - v[0] < self.ttl_seconds}
+
+class OrderBookFetcher:
+    """Fetches many order books concurrently on a bounded pool, through the TTL cache"""
+
+    def __init__(self, fetch_book: Callable[[Hashable], Optional[Dict]], max_workers: int = 8,
+                 cache_ttl_seconds: float = 5.0):
+        """
+        Args:
+            fetch_book: Returns one market's order book (None when unavailable)
+            max_workers: Upper bound on books fetched in parallel
+            cache_ttl_seconds: Reuse a fetched book for this long
+        """
+        self.fetch_book = fetch_book
+        self.max_workers = max(1, max_workers)
+        self.cache = OrderBookCache(cache_ttl_seconds)
+
+    def fetch_books(self, keys: Iterable[Hashable]) -> Dict[Hashable, Optional[Dict]]:
+        """Order books for every distinct key (cached books are not refetched)"""
+        books = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            found, book = self.cache.get(key)
+            if found:
+                books[key] = book
+            else:
+                missing.append(key)
+        if not missing:
+            return books
+
+        worker_count = min(self.max_workers, len(missing))
+        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix='orderbook') as executor:
+            futures = {executor.submit(self.fetch_book, key): key for key in missing}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    book = future.result()
+                except Exception as e:
+                    console(f"Error fetching order book {key}: {e}")
+                    book = None
+                self.cache.put(key, book)
+                books[key] = book
+        return books
+
+class DepthPricer:
+    """Reprices the Kalshi side of aligned games at the executable price for a stake"""
+
+    def __init__(self, kalshi_client, stake: float = 100.0, depth: int = 20, max_workers: int = 8,
+                 cache_ttl_seconds: float = 5.0):
+        """
+        Args:
+            kalshi_client: Client exposing get_orderbook(ticker, depth)
+            stake: Dollars to fill on each side
+            depth: Price levels requested per side
+            max_workers: Upper bound on order books fetched in parallel
+            cache_ttl_seconds: Reuse a fetched book for this long (polling cycles inside it share it)
+        """
+        self.stake = stake
+        self.depth = depth
+        self.fetcher = OrderBookFetcher(lambda ticker: kalshi_client.get_orderbook(ticker, depth),
+                                        max_workers=max_workers, cache_ttl_seconds=cache_ttl_seconds)
+
+    def reprice_aligned_games(self, aligned_games: List[Dict]) -> List[Dict]:
+        """
+        Swap each aligned game's Kalshi odds for stake-sized fill prices
+
+        Games whose book is unavailable, or cannot fill the whole stake on a side, keep the
+        top-of-book quote for that side and are marked not fully fillable in metadata['depth']
+        (a partial fill's average price would show an edge that cannot be taken at size).
+        Kalshi records are copied, never mutated, so snapshot stores keep their top-of-book games.
+
+        Returns:
+            New aligned game list (same order) with kalshi_data repriced and metadata['depth'] set
+        """
+        tickers = [self._ticker(aligned['kalshi_data']) for aligned in aligned_games]
+        books = self.fetcher.fetch_books(ticker for ticker in tickers if ticker)
+
+        repriced = []
+        books_found = 0
+        home_prices = []
+        away_prices = []
+        for aligned, ticker in zip(aligned_games, tickers):
+            kalshi_game = aligned['kalshi_data']
+            book = books.get(ticker) if ticker else None
+            if not book:
+                repriced.append(aligned)
+                continue
+            books_found += 1
+
+            yes_asks = kalshi_ask_levels(book.get('no'))
+            no_asks = kalshi_ask_levels(book.get('yes'))
+            metadata = kalshi_game.get('metadata') or {}
+            yes_is_home = metadata.get('kalshi_yes_side', 'away') == 'home'
+            home_asks, away_asks = (yes_asks, no_asks) if yes_is_home else (no_asks, yes_asks)
+            home_price, home_filled = vwap_fill(home_asks, self.stake)
+            away_price, away_filled = vwap_fill(away_asks, self.stake)
+            home_full = self._fills_stake(home_filled)
+            away_full = self._fills_stake(away_filled)
+
+            game_copy = copy.copy(kalshi_game)
+            game_copy['metadata'] = dict(metadata, depth={
+                'stake': self.stake,
+                'home_fill_price': home_price,
+                'away_fill_price': away_price,
+                'home_fillable': round(home_filled, 2),
+                'away_fillable': round(away_filled, 2),
+                'home_fully_fillable': home_full,
+                'away_fully_fillable': away_full,
+                'top_of_book_home_probability': kalshi_game['home_odds']['implied_probability'],
+                'top_of_book_away_probability': kalshi_game['away_odds']['implied_probability']
+            })
+            repriced.append(dict(aligned, kalshi_data=game_copy))
+            if home_full:
+                home_prices.append((game_copy, home_price))
+            if away_full:
+                away_prices.append((game_copy, away_price))
+
+        self._apply_prices(home_prices, 'home_odds')
+        self._apply_prices(away_prices, 'away_odds')
+
+        if books_found:
+            thin_sides = 2 * books_found - len(home_prices) - len(away_prices)
+            console(f"  Repriced {books_found} Kalshi games at ${self.stake:,.0f} depth "
+                    f"({thin_sides} sides too thin to fill, kept at top of book)")
+        return repriced
+
+    def _fills_stake(self, filled: float) -> bool:
+        """Whether a side's book covers the whole stake (to the cent)"""
+        return filled >= self.stake - 0.005
+
+    def _apply_prices(self, game_prices: List[Tuple[Dict, Optional[float]]], side: str):
+        """Convert every filled price for one side in a single vectorized pass"""
+        priced = [(game, price) for game, price in game_prices if price is not None and 0 < price < 1]
+        if not priced:
+            return
+        converted = OddsConverter.convert_batch(prices=[price for _, price in priced])
+        for i, (game, price) in enumerate(priced):
+            game[side] = OddsQuote(
+                american=int(converted['american'][i]),
+                decimal=float(converted['decimal'][i]),
+                implied_probability=float(converted['implied_probability'][i]),
+                kalshi_cents=int(round(price * 100))
+            )
+
+    @staticmethod
+    def _ticker(kalshi_game: Dict) -> Optional[str]:
+        """Market ticker behind a normalized Kalshi game (game_id is 'kalshi_<ticker>')"""
+        game_id = kalshi_game.get('game_id') or ''
+        return game_id[len('kalshi_'):] if game_id.startswith('kalshi_') else None
+
+    def get_stats(self) -> Dict:
+        cache = self.fetcher.cache
+        return {'stake': self.stake, 'book_cache_hits': cache.hits, 'book_cache_misses': cache.misses}
@@ -0,0 +1,130 @@
+"""
+Compact Game Records - Slotted normalized games and odds for matching and detection
+Raw API payloads live in a bounded side table keyed by game_id instead of inside each record
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Dict, Optional
+
+class _SlottedRecord(Mapping):
+    """Read-mostly record with __slots__ storage that still supports dict-style access"""
+
+    __slots__ = ()
+    # Slots left out of keys()/to_dict() while they hold None
+    _OPTIONAL = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            value = getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+        if value is None and key in self._OPTIONAL:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self):
+        for key in self.__slots__:
+            if key in self._OPTIONAL and getattr(self, key) is None:
+                continue
+            yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict:
+        """Plain (JSON-serializable) dict copy, recursing into nested records"""
+        return {key: value.to_dict() if isinstance(value, _SlottedRecord) else value for key, value in self.items()}
+
+class OddsQuote(_SlottedRecord):
+    """One side's price in every format"""
+
+    __slots__ = ('american', 'decimal', 'implied_probability', 'vig_free_probability', 'kalshi_cents')
+    _OPTIONAL = ('vig_free_probability', 'kalshi_cents')
+
+    def __init__(self, american: int, decimal: float, implied_probability: float,
+                 vig_free_probability: Optional[float] = None, kalshi_cents: Optional[int] = None):
+        self.american = american
+        self.decimal = decimal
+        self.implied_probability = implied_probability
+        self.vig_free_probability = vig_free_probability
+        self.kalshi_cents = kalshi_cents
+
+class GameRecord(_SlottedRecord):
+    """Normalized game holding only the fields the matcher, detector and displays use"""
+
+    __slots__ = ('game_id', 'game_date', 'game_time', 'game_time_display', 'sport',
+                 'home_team', 'away_team', 'source', 'home_odds', 'away_odds', 'metadata', 'game_epoch')
+    _OPTIONAL = ('game_epoch',)
+
+    def __init__(self, game_id: str, game_date: Optional[str], game_time: Optional[str],
+                 game_time_display: str, sport: str, home_team: str, away_team: str, source: str,
+                 home_odds: Optional[OddsQuote] = None, away_odds: Optional[OddsQuote] = None,
+                 metadata: Optional[Dict] = None, game_epoch: Optional[int] = None):
+        self.game_id = game_id
+        self.game_date = game_date
+        self.game_time = game_time
+        self.game_time_display = game_time_display
+        self.sport = sport
+        self.home_team = home_team
+        self.away_team = away_team
+        self.source = source
+        self.home_odds = home_odds
+        self.away_odds = away_odds
+        # Small scalar fields only (timestamps, bookmaker, parsed prices); raw payloads go to RawPayloadStore
+        self.metadata = metadata if metadata is not None else {}
+        # Exact start in epoch seconds, parsed once at ingestion (None when the source only gives a date)
+        self.game_epoch = game_epoch
+
+class RawPayloadStore:
+    """Bounded side table of raw API payloads keyed by normalized game_id (safe across sport threads)"""
+
+    def __init__(self, max_entries: int = 5000):
+        """
+        Initialize the store
+
+        Args:
+            max_entries: Oldest payloads are evicted beyond this many games
+        """
+        self.max_entries = max_entries
+        self._payloads: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._payloads
+
+    def put(self, game_id: str, payload: Dict):
+        """Store (or refresh) the raw payload behind a game"""
+        with self._lock:
+            self._payloads[game_id] = payload
+            self._payloads.move_to_end(game_id)
+            while len(self._payloads) > self.max_entries:
+                self._payloads.popitem(last=False)
+
+    def get(self, game_id: str) -> Optional[Dict]:
+        """Get the raw payload for a game, if still held"""
+        with self._lock:
+            return self._payloads.get(game_id)
+
+    def clear(self):
+        """Drop every stored payload"""
+        with self._lock:
+            self._payloads.clear()
+
+def json_default(obj: Any) -> Any:
+    """json.dump default hook: records become dicts, anything else falls back to str"""
+    if isinstance(obj, _SlottedRecord):
+        return obj.to_dict()
+    return str(obj)
@@ -6,24 +6,49 @@ Development version for testing and validation
 import requests
 import json
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.timestamp_utils import simplify_timestamp, simplify_date, parse_game_time_safe, format_display_time
+from utils.timestamp_utils import (simplify_timestamp, simplify_date, parse_game_time_safe, format_display_time,
+                                   parse_epoch, is_future_epoch, to_epoch)
+from utils.http_transport import HttpTransport, get_shared_transport
+from utils.team_resolver import get_team_resolver
+from utils.ticker_parser import ticker_date
+from utils.title_parser import get_title_parser
+from utils.metrics import get_metrics
+from utils.console import console
+from core.odds_converter import OddsConverter
+from core.game_record import GameRecord, OddsQuote, RawPayloadStore
 from config.sports_config import get_sport_config, get_available_sports, SPORTS_CONFIG
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 class KalshiClientUpdated:
-    def __init__(self, credentials_file: str):
-        """Initialize Kalshi client with new API endpoints"""
+    def __init__(self, credentials_file: Optional[str], max_concurrent_series: int = 8,
+                 http_transport: Optional[HttpTransport] = None):
+        """Initialize Kalshi client with new API endpoints
+        
+        Args:
+            credentials_file: Path to the Kalshi credentials file (None for offline normalization only)
+            max_concurrent_series: Upper bound on series tickers fetched in parallel
+            http_transport: Pooled transport to use (defaults to the shared one)
+        """
         # Try production endpoint first since demo may not have MLB markets
         self.production_url = "https://api.elections.kalshi.com/trade-api/v2"
         self.demo_url = "https://demo-api.kalshi.co/trade-api/v2"
         self.base_url = self.production_url  # Start with production
-        self.credentials = self._load_credentials(credentials_file)
+        self.credentials = self._load_credentials(credentials_file) if credentials_file else {}
         self.session_token = None
+        self.http = http_transport or get_shared_transport()
+        self.team_resolver = get_team_resolver()
+        self.title_parser = get_title_parser()
+        self.raw_payloads = RawPayloadStore()  # game_id -> raw Kalshi market
+        self.metrics = get_metrics()
+        self.max_concurrent_series = max(1, max_concurrent_series)
+        self.series_page_limit = 1000  # Max markets per page allowed by the API
+        self.series_max_pages = 25  # Safety limit, same as full pagination
         
     def _load_credentials(self, creds_file: str) -> Dict:
         """Load Kalshi credentials from file"""
@@ -51,14 +76,14 @@ class KalshiClientUpdated:
             url = f"{base_url}/markets"
             
             try:
-                print(f"Fetching Kalshi markets from {source_name} API...")
-                response = requests.get(url, timeout=30)
+                console(f"Fetching Kalshi markets from {source_name} API...")
+                response = self.http.get(url)
                 response.raise_for_status()
                 
                 data = response.json()
                 markets = data.get('markets', [])
                 
-                print(f"Successfully fetched {len(markets)} markets from Kalshi {source_name}")
+                console(f"Successfully fetched {len(markets)} markets from Kalshi {source_name}")
                 
                 # If we found markets, use this endpoint
                 if len(markets) > 0:
@@ -94,39 +119,52 @@ class KalshiClientUpdated:
         return sport_patterns
     
     
-    def search_sports_markets(self, sport_type: str = 'all') -> Dict:
-        """Search for sports markets using efficient series_ticker method"""
-        print(f"Fetching Kalshi markets for {sport_type} sports...")
+    def search_sports_markets(self, sport_type: str = 'all', concurrent: bool = True) -> Dict:
+        """
+        Search for sports markets using efficient series_ticker method
         
-        sports_markets = []
+        Args:
+            sport_type: Sport key from SPORTS_CONFIG or 'all'
+            concurrent: Fetch all series tickers in parallel on a bounded pool
+        
+        Returns:
+            Dictionary with merged markets and per-sport breakdown
+        """
+        console(f"Fetching Kalshi markets for {sport_type} sports...")
+        
+        sport_patterns = self._get_sport_patterns_from_config()
         
         if sport_type == 'all':
             # Get all sports markets using series_ticker for each sport
-            sport_patterns = self._get_sport_patterns_from_config()
-            
-            for sport, patterns in sport_patterns.items():
-                for ticker_pattern in patterns['tickers']:
-                    sport_markets = self._get_markets_by_series_ticker(ticker_pattern)
-                    for market in sport_markets:
-                        market['detected_sport'] = sport
-                        sports_markets.append(market)
-        else:
+            series_jobs = [
+                (sport, ticker_pattern)
+                for sport, patterns in sport_patterns.items()
+                for ticker_pattern in patterns['tickers']
+            ]
+        elif sport_type in sport_patterns:
             # Get markets for specific sport using series_ticker
-            sport_patterns = self._get_sport_patterns_from_config()
-            
-            if sport_type in sport_patterns:
-                sport_config = sport_patterns[sport_type]
-                
-                for ticker_pattern in sport_config['tickers']:
-                    sport_markets = self._get_markets_by_series_ticker(ticker_pattern)
-                    for market in sport_markets:
-                        market['detected_sport'] = sport_type
-                        sports_markets.append(market)
-            else:
-                # Fallback to old method for unknown sports
-                return self._search_sports_markets_fallback(sport_type)
+            series_jobs = [(sport_type, ticker_pattern) for ticker_pattern in sport_patterns[sport_type]['tickers']]
+        else:
+            # Fallback to old method for unknown sports
+            return self._search_sports_markets_fallback(sport_type)
         
-        print(f"Found {len(sports_markets)} {sport_type} sports markets")
+        fetch_start = time.time()
+        if concurrent and len(series_jobs) > 1:
+            sports_markets, incomplete_series = self._fetch_series_concurrently(series_jobs)
+        else:
+            sports_markets = []
+            incomplete_series = []
+            for sport, ticker_pattern in series_jobs:
+                series_markets, complete = self._fetch_series_markets(ticker_pattern)
+                if not complete:
+                    incomplete_series.append(ticker_pattern)
+                for market in series_markets:
+                    market['detected_sport'] = sport
+                    sports_markets.append(market)
+        fetch_duration = time.time() - fetch_start
+        
+        console(f"Found {len(sports_markets)} {sport_type} sports markets "
+                f"({len(series_jobs)} series in {fetch_duration:.2f}s)")
         
         # Group by sport for summary
         sport_counts = {}
@@ -135,40 +173,127 @@ class KalshiClientUpdated:
             sport_counts[sport] = sport_counts.get(sport, 0) + 1
         
         if sport_counts:
-            print("Sport breakdown:")
+            console("Sport breakdown:")
             for sport, count in sorted(sport_counts.items()):
-                print(f"  {sport}: {count} markets")
+                console(f"  {sport}: {count} markets")
         
         return {
             'success': True,
             'data': sports_markets,
             'total_found': len(sports_markets),
             'sport_breakdown': sport_counts,
+            'series_fetched': len(series_jobs),
+            'incomplete_series': sorted(incomplete_series),
+            'fetch_duration_seconds': round(fetch_duration, 3),
             'timestamp': datetime.now(timezone.utc).isoformat(),
             'source': 'kalshi_sports_search'
         }
     
+    def _fetch_series_concurrently(self, series_jobs: List[tuple]) -> Tuple[List[Dict], List[str]]:
+        """Fetch (sport, series_ticker) jobs in parallel; returns merged markets and the series left incomplete"""
+        sports_markets = []
+        incomplete_series = []
+        worker_count = min(self.max_concurrent_series, len(series_jobs))
+        
+        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix='kalshi-series') as executor:
+            futures = {
+                executor.submit(self._fetch_series_markets, ticker_pattern): (sport, ticker_pattern)
+                for sport, ticker_pattern in series_jobs
+            }
+            
+            for future in as_completed(futures):
+                sport, ticker_pattern = futures[future]
+                try:
+                    series_markets, complete = future.result()
+                except Exception as e:
+                    # _fetch_series_markets already swallows request errors
+                    print(f"Error fetching markets for series {ticker_pattern}: {e}")
+                    incomplete_series.append(ticker_pattern)
+                    continue
+                
+                if not complete:
+                    incomplete_series.append(ticker_pattern)
+                for market in series_markets:
+                    market['detected_sport'] = sport
+                sports_markets.extend(series_markets)
+        
+        return sports_markets, incomplete_series
+    
     def _get_markets_by_series_ticker(self, series_ticker: str) -> List[Dict]:
-        """Get all markets for a specific series ticker (e.g., KXNFLGAME)"""
+        """Get all markets for a specific series ticker (e.g., KXNFLGAME), following cursor pagination"""
+        return self._fetch_series_markets(series_ticker)[0]
+    
+    def _fetch_series_markets(self, series_ticker: str) -> Tuple[List[Dict], bool]:
+        """
+        Fetch every page of a series ticker
+        
+        Returns:
+            (markets, complete) - complete is False when a page request failed or the
+            page safety limit was hit, so markets holds only the pages fetched before that
+        """
+        url = f"{self.base_url}/markets"
+        all_markets = []
+        cursor = None
+        page = 1
+        
+        while True:
+            try:
+                params = {'series_ticker': series_ticker, 'limit': self.series_page_limit}
+                if cursor:
+                    params['cursor'] = cursor
+                
+                response = self.http.get(url, params=params)
+                response.raise_for_status()
+                
+                data = response.json()
+                markets = data.get('markets', [])
+                new_cursor = data.get('cursor', '')
+                
+                all_markets.extend(markets)
+                
+                if not new_cursor or new_cursor == cursor or len(markets) == 0:
+                    break
+                
+                cursor = new_cursor
+                page += 1
+                
+                if page > self.series_max_pages:  # Safety limit
+                    print(f"WARNING Series {series_ticker} stopped at the {self.series_max_pages}-page limit "
+                          f"with {len(all_markets)} markets")
+                    return all_markets, False
+                
+            except Exception as e:
+                print(f"Error fetching markets for series {series_ticker} (page {page}): {e}")
+                if all_markets:
+                    print(f"WARNING Series {series_ticker} is incomplete: keeping {len(all_markets)} markets "
+                          f"from pages 1-{page - 1}")
+                return all_markets, False
+        
+        return all_markets, True
+    
+    def get_orderbook(self, ticker: str, depth: int = 20) -> Optional[Dict]:
+        """
+        Get a market's resting bids on both sides
+        
+        Args:
+            ticker: Market ticker (e.g., KXMLBGAME-25AUG21HOUBAL-HOU)
+            depth: Price levels per side
+        
+        Returns:
+            {'yes': [[price_cents, contracts], ...], 'no': [...]} in ascending price order, or None on error
+        """
         try:
-            url = f"{self.base_url}/markets"
-            params = {'series_ticker': series_ticker}
-            
-            response = requests.get(url, params=params, timeout=30)
+            response = self.http.get(f"{self.base_url}/markets/{ticker}/orderbook", params={'depth': depth})
             response.raise_for_status()
-            
-            data = response.json()
-            markets = data.get('markets', [])
-            
-            return markets
-            
+            orderbook = response.json().get('orderbook') or {}
+            return {'yes': orderbook.get('yes') or [], 'no': orderbook.get('no') or []}
         except Exception as e:
-            print(f"Error fetching markets for series {series_ticker}: {e}")
-            return []
+            console(f"Error fetching Kalshi order book {ticker}: {e}")
+            return None
     
     def _search_sports_markets_fallback(self, sport_type: str) -> Dict:
         """Fallback method using old search approach"""
-        print(f"Using fallback search for {sport_type}...")
+        console(f"Using fallback search for {sport_type}...")
         
         # Get all markets using pagination
         all_markets = self._get_all_markets_paginated()
@@ -177,7 +302,7 @@ class KalshiClientUpdated:
             return all_markets
         
         all_markets_data = all_markets.get('data', [])
-        print(f"Searching through {len(all_markets_data)} total markets...")
+        console(f"Searching through {len(all_markets_data)} total markets...")
         
         sports_markets = []
         sport_patterns = self._get_sport_patterns_from_config()
@@ -229,7 +354,7 @@ class KalshiClientUpdated:
                 if cursor:
                     params['cursor'] = cursor
                 
-                response = requests.get(url, params=params, timeout=60)
+                response = self.http.get(url, params=params, timeout=60)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -305,13 +430,22 @@ class KalshiClientUpdated:
             'timestamp': markets_data.get('timestamp')
         }
     
-    def normalize_kalshi_data(self, raw_data: Dict, min_time_buffer_minutes: int = 15) -> List[Dict]:
-        """Convert Kalshi API response to normalized schema for all sports, filtering out live games"""
+    def normalize_kalshi_data(self, raw_data: Dict, min_time_buffer_minutes: int = 15,
+                              as_of: Optional[datetime] = None) -> List[Dict]:
+        """Convert Kalshi API response to normalized schema for all sports, filtering out live games
+        (relative to as_of when replaying a recorded response, otherwise now)"""
         if not raw_data.get('success'):
             return []
         
         normalized_games = []
+        home_sides = []  # (price, cents) per normalized game
+        away_sides = []
         live_games_filtered = 0
+        now_epoch = to_epoch(as_of)
+        # Per-sport counts, recorded once per batch
+        unparseable_titles = {}
+        skipped_markets = {}
+        live_by_sport = {}
         
         for market in raw_data.get('data', []):
             try:
@@ -323,7 +457,7 @@ class KalshiClientUpdated:
                 # Extract team info from title
                 teams = self._extract_teams_from_title(title, sport)
                 if not teams:
-                    print(f"Could not extract teams from market: {title}")
+                    unparseable_titles[sport] = unparseable_titles.get(sport, 0) + 1
                     continue
                 
                 home_team, away_team = teams
@@ -344,19 +478,15 @@ class KalshiClientUpdated:
                 # Determine which team the "YES" market refers to
                 yes_team = market.get('yes_sub_title', '').strip()
                 
-                # Convert Kalshi prices to odds and assign correctly
+                # Assign Kalshi prices to sides; odds are converted per batch below
                 if yes_team and yes_team.lower() in home_team.lower():
                     # YES market is for home team
-                    home_odds = self._kalshi_price_to_odds(yes_price, yes_bid)
-                    away_odds = self._kalshi_price_to_odds(no_price, no_bid)
-                elif yes_team and yes_team.lower() in away_team.lower():
-                    # YES market is for away team
-                    home_odds = self._kalshi_price_to_odds(no_price, no_bid)
-                    away_odds = self._kalshi_price_to_odds(yes_price, yes_bid)
+                    yes_side = 'home'
+                    home_side, away_side = (yes_price, yes_bid), (no_price, no_bid)
                 else:
-                    # Fallback: assume YES is for away team (common pattern)
-                    home_odds = self._kalshi_price_to_odds(no_price, no_bid)
-                    away_odds = self._kalshi_price_to_odds(yes_price, yes_bid)
+                    # YES market is for away team, or fallback: assume YES is for away team (common pattern)
+                    yes_side = 'away'
+                    home_side, away_side = (no_price, no_bid), (yes_price, yes_bid)
                 
                 # Extract game date from ticker (e.g., KXMLBGAME-25AUG21HOUBAL-HOU)
                 game_date, game_time_estimate = self._extract_date_from_ticker(market_id)
@@ -375,8 +505,10 @@ class KalshiClientUpdated:
                     filter_time = event_date
                 
                 # Skip games that have already started or are starting soon
-                if not self._is_future_game(filter_time, min_time_buffer_minutes):
+                filter_epoch = parse_epoch(filter_time)
+                if not is_future_epoch(filter_epoch, min_time_buffer_minutes, now_epoch):
                     live_games_filtered += 1
+                    live_by_sport[sport] = live_by_sport.get(sport, 0) + 1
                     continue
                 
                 # Use extracted date from ticker, estimated time for display
@@ -385,352 +517,100 @@ class KalshiClientUpdated:
                 else:
                     display_time = format_display_time(event_date) if event_date else "Unknown"
                 
-                normalized_game = {
-                    "game_id": f"kalshi_{market_id}",
-                    "game_date": game_date,
-                    "game_time": game_time_estimate or "Unknown",
-                    "game_time_display": display_time,
-                    "sport": sport.upper(),
-                    "home_team": self._standardize_team_name(home_team, sport),
-                    "away_team": self._standardize_team_name(away_team, sport),
-                    "source": "kalshi",
-                    "home_odds": home_odds,
-                    "away_odds": away_odds,
-                    "metadata": {
+                normalized_game = GameRecord(
+                    game_id=f"kalshi_{market_id}",
+                    game_date=game_date,
+                    game_time=game_time_estimate or "Unknown",
+                    game_time_display=display_time,
+                    sport=sport.upper(),
+                    home_team=self._standardize_team_name(home_team, sport),
+                    away_team=self._standardize_team_name(away_team, sport),
+                    source="kalshi",
+                    metadata={
                         "last_updated": raw_data.get('timestamp'),
                         "bookmaker": "kalshi",
                         "market_type": "prediction_market",
-                        "raw_data": market,
                         "kalshi_yes_price": yes_price,
                         "kalshi_no_price": no_price,
+                        "kalshi_yes_side": yes_side,
                         "original_title": title,
                         "original_close_time": event_date,
-                        "ticker_parsed_date": game_date
+                        "ticker_parsed_date": game_date,
+                        "filter_epoch": filter_epoch
                     }
-                }
+                )
                 
                 normalized_games.append(normalized_game)
+                self.raw_payloads.put(normalized_game.game_id, market)
+                home_sides.append(home_side)
+                away_sides.append(away_side)
                 
             except Exception as e:
-                print(f"Error normalizing Kalshi market {market.get('ticker', 'unknown')}: {e}")
+                console(f"Error normalizing Kalshi market {market.get('ticker', 'unknown')}: {e}")
+                sport = market.get('detected_sport', 'unknown')
+                skipped_markets[sport] = skipped_markets.get(sport, 0) + 1
                 continue
         
+        # Convert every market's prices in one vectorized pass
+        paired_odds = OddsConverter.create_paired_odds_objects(
+            OddsConverter.convert_batch(prices=[price for price, _ in home_sides]),
+            OddsConverter.convert_batch(prices=[price for price, _ in away_sides]),
+            factory=OddsQuote
+        )
+        for normalized_game, (home_odds, away_odds), (_, home_cents), (_, away_cents) in zip(
+                normalized_games, paired_odds, home_sides, away_sides):
+            home_odds.kalshi_cents = home_cents
+            away_odds.kalshi_cents = away_cents
+            normalized_game.home_odds = home_odds
+            normalized_game.away_odds = away_odds
+        
+        normalized_by_sport = {}
+        for normalized_game in normalized_games:
+            sport = normalized_game.sport.lower()
+            normalized_by_sport[sport] = normalized_by_sport.get(sport, 0) + 1
+        for sport, count in normalized_by_sport.items():
+            self.metrics.inc('games_normalized_total', count, platform='kalshi', sport=sport)
+        for sport, count in unparseable_titles.items():
+            self.metrics.inc('kalshi_unparseable_titles_total', count, sport=sport)
+        for sport, count in skipped_markets.items():
+            self.metrics.inc('normalize_errors_total', count, platform='kalshi', sport=sport)
+        for sport, count in live_by_sport.items():
+            self.metrics.inc('games_filtered_live_total', count, platform='kalshi', sport=sport)
+        
+        if unparseable_titles:
+            console(f"Could not extract teams from {sum(unparseable_titles.values())} Kalshi market titles")
         if live_games_filtered > 0:
-            print(f"Filtered out {live_games_filtered} live/starting games from Kalshi")
-        print(f"Successfully normalized {len(normalized_games)} future games from Kalshi")
+            console(f"Filtered out {live_games_filtered} live/starting games from Kalshi")
+        console(f"Successfully normalized {len(normalized_games)} future games from Kalshi")
         return normalized_games
     
     def _extract_date_from_ticker(self, ticker: str) -> tuple:
-        """Extract game date from Kalshi ticker format: KXMLBGAME-25AUG21HOUBAL-HOU"""
-        if not ticker or '-' not in ticker:
+        """Extract game date from Kalshi ticker format: KXMLBGAME-25AUG21HOUBAL-HOU (year from the ticker)"""
+        game_date = ticker_date(ticker)
+        if not game_date:
             return None, None
         
-        try:
-            parts = ticker.split('-')
-            if len(parts) < 2:
-                return None, None
-            
-            # Extract date part: look for pattern like 25AUG21
-            # Format appears to be: [GAME_ID][MONTH][DAY] not [DAY][MONTH][YEAR]
-            # So 25AUG21 = Game 25, August 21st
-            
-            # Find the month abbreviation in the string
-            month_map = {
-                'JAN': '01', 'FEB': '02', 'MAR': '03', 'APR': '04',
-                'MAY': '05', 'JUN': '06', 'JUL': '07', 'AUG': '08',
-                'SEP': '09', 'OCT': '10', 'NOV': '11', 'DEC': '12'
-            }
-            
-            month_str = None
-            month = None
-            for month_abbr, month_num in month_map.items():
-                if month_abbr in parts[1]:
-                    month_str = month_abbr
-                    month = month_num
-                    break
-            
-            if not month_str:
-                return None, None
-            
-            # Extract day: everything after the month abbreviation
-            month_pos = parts[1].find(month_str)
-            day_part = parts[1][month_pos + 3:]  # After month abbreviation
-            
-            # Extract just the digits for the day
-            day = ""
-            for char in day_part:
-                if char.isdigit():
-                    day += char
-                else:
-                    break
-            
-            if not day or len(day) > 2:
-                return None, None
-            
-            day = day.zfill(2)  # Pad with zero if needed
-            
-            # Use current year (2025)
-            full_year = "2025"
-            game_date = f"{full_year}-{month}-{day}"
-            
-            # Validate the date
-            from datetime import datetime
-            datetime.strptime(game_date, '%Y-%m-%d')
-            
-            # Estimate game time (most games are in evening)
-            # This is a rough estimate - real time would need different logic
-            estimated_time = "19:00"  # 7 PM default
-            
-            return game_date, estimated_time
-            
-        except Exception as e:
-            print(f"Error parsing ticker date '{ticker}': {e}")
-            return None, None
+        # Estimate game time (most games are in evening)
+        # This is a rough estimate - real time would need different logic
+        estimated_time = "19:00"  # 7 PM default
+        return game_date, estimated_time
+    
+    def get_raw_payload(self, game_id: str) -> Optional[Dict]:
+        """Get the raw Kalshi market behind a normalized game"""
+        return self.raw_payloads.get(game_id)
     
-    def _is_future_game(self, game_time_str: str, min_buffer_minutes: int = 15) -> bool:
+    def _is_future_game(self, game_time_str: str, min_buffer_minutes: int = 15,
+                        as_of: Optional[datetime] = None) -> bool:
         """Check if game is in the future with minimum buffer using safe parsing"""
-        return parse_game_time_safe(game_time_str, min_buffer_minutes)
+        return parse_game_time_safe(game_time_str, min_buffer_minutes, as_of)
     
     def _extract_teams_from_title(self, title: str, sport: str = 'unknown') -> Optional[tuple]:
-        """Extract team names from Kalshi market title for any sport"""
-        import re
-        
-        # Pattern for "X at Y Winner?" format (most common for Kalshi)
-        at_winner_pattern = r'(.+?) at (.+?) Winner\?'
-        match = re.search(at_winner_pattern, title, re.IGNORECASE)
-        if match:
-            away_team = match.group(1).strip()
-            home_team = match.group(2).strip()
-            return (home_team, away_team)  # (home, away)
-        
-        # Pattern for "X vs Y Winner?" format
-        vs_winner_pattern = r'(.+?) vs (.+?) Winner\?'
-        match = re.search(vs_winner_pattern, title, re.IGNORECASE)
-        if match:
-            team1 = match.group(1).strip()
-            team2 = match.group(2).strip()
-            return (team2, team1)  # Assume second is home
-        
-        # Pattern for "Will X beat Y" format
-        beat_pattern = r'Will (.+?) beat (.+?)(?: on| \?|$)'
-        match = re.search(beat_pattern, title, re.IGNORECASE)
-        if match:
-            team1 = match.group(1).strip()
-            team2 = match.group(2).strip()
-            return (team2, team1)  # (home, away) - team being beaten is home
-        
-        # Pattern for "X vs Y" format  
-        vs_pattern = r'(.+?) vs (.+?)(?: |$|\?)'
-        match = re.search(vs_pattern, title, re.IGNORECASE)
-        if match:
-            team1 = match.group(1).strip()
-            team2 = match.group(2).strip()
-            return (team2, team1)  # Assume second team is home
-            
-        # Pattern for "X at Y" format
-        at_pattern = r'(.+?) at (.+?)(?: |$|\?)'
-        match = re.search(at_pattern, title, re.IGNORECASE)
-        if match:
-            away_team = match.group(1).strip()
-            home_team = match.group(2).strip()
-            return (home_team, away_team)  # (home, away)
-        
-        return None
-    
-    def _kalshi_price_to_odds(self, price: float, kalshi_cents: int = 0, fee: float = 0.03) -> Dict:
-        """Convert Kalshi percentage price to odds object"""
-        if price <= 0 or price >= 1:
-            price = 0.5
-        
-        # For demonstration, let's not apply fees since these are mock markets
-        adjusted_price = price  # price * (1 - fee) for real markets
-        
-        # Convert to American odds
-        if adjusted_price >= 0.5:
-            american_odds = int(-100 * adjusted_price / (1 - adjusted_price))
-        else:
-            american_odds = int(100 * (1 - adjusted_price) / adjusted_price)
-        
-        # Calculate decimal odds and implied probability
-        decimal_odds = self._american_to_decimal(american_odds)
-        implied_prob = self._decimal_to_probability(decimal_odds)
-        
-        return {
-            "american": american_odds,
-            "decimal": decimal_odds,
-            "implied_probability": implied_prob,
-            "kalshi_cents": kalshi_cents
-        }
-    
-    def _american_to_decimal(self, american_odds: int) -> float:
-        """Convert American odds to decimal odds"""
-        if american_odds > 0:
-            return (american_odds / 100) + 1
-        else:
-            return (100 / abs(american_odds)) + 1
-    
-    def _decimal_to_probability(self, decimal_odds: float) -> float:
-        """Convert decimal odds to implied probability"""
-        return 1 / decimal_odds
+        """Extract (home, away) team names from Kalshi market title for any sport (memoized per title)"""
+        return self.title_parser.kalshi_teams(title)
     
     def _standardize_team_name(self, team_name: str, sport: str = 'unknown') -> str:
         """Standardize team names for consistent matching across all sports"""
-        team_name = team_name.strip()
-        
-        # MLB team mappings
-        mlb_mappings = {
-            "Los Angeles Angels": "LAA", "Angels": "LAA",
-            "Houston Astros": "HOU", "Astros": "HOU",
-            "Oakland Athletics": "OAK", "Athletics": "OAK", "A's": "OAK",
-            "Toronto Blue Jays": "TOR", "Blue Jays": "TOR", "Jays": "TOR",
-            "Atlanta Braves": "ATL", "Braves": "ATL",
-            "Milwaukee Brewers": "MIL", "Brewers": "MIL",
-            "St. Louis Cardinals": "STL", "Cardinals": "STL",
-            "Chicago Cubs": "CHC", "Cubs": "CHC",
-            "Arizona Diamondbacks": "ARI", "Diamondbacks": "ARI", "D-backs": "ARI",
-            "Colorado Rockies": "COL", "Rockies": "COL",
-            "Los Angeles Dodgers": "LAD", "Dodgers": "LAD",
-            "San Diego Padres": "SD", "Padres": "SD",
-            "San Francisco Giants": "SF", "Giants": "SF",
-            "Miami Marlins": "MIA", "Marlins": "MIA",
-            "New York Mets": "NYM", "Mets": "NYM",
-            "Philadelphia Phillies": "PHI", "Phillies": "PHI",
-            "Pittsburgh Pirates": "PIT", "Pirates": "PIT",
-            "Washington Nationals": "WSH", "Nationals": "WSH",
-            "Chicago White Sox": "CWS", "White Sox": "CWS",
-            "Cleveland Guardians": "CLE", "Guardians": "CLE",
-            "Detroit Tigers": "DET", "Tigers": "DET",
-            "Kansas City Royals": "KC", "Royals": "KC",
-            "Minnesota Twins": "MIN", "Twins": "MIN", "Minnesota": "MIN",
-            "New York Yankees": "NYY", "Yankees": "NYY",
-            "Baltimore Orioles": "BAL", "Orioles": "BAL",
-            "Boston Red Sox": "BOS", "Red Sox": "BOS",
-            "Tampa Bay Rays": "TB", "Rays": "TB",
-            "Texas Rangers": "TEX", "Rangers": "TEX",
-            "Seattle Mariners": "SEA", "Mariners": "SEA"
-        }
-        
-        # NFL team mappings
-        nfl_mappings = {
-            "Arizona Cardinals": "ARI", "Cardinals": "ARI",
-            "Atlanta Falcons": "ATL", "Falcons": "ATL",
-            "Baltimore Ravens": "BAL", "Ravens": "BAL",
-            "Buffalo Bills": "BUF", "Bills": "BUF",
-            "Carolina Panthers": "CAR", "Panthers": "CAR",
-            "Chicago Bears": "CHI", "Bears": "CHI",
-            "Cincinnati Bengals": "CIN", "Bengals": "CIN",
-            "Cleveland Browns": "CLE", "Browns": "CLE",
-            "Dallas Cowboys": "DAL", "Cowboys": "DAL",
-            "Denver Broncos": "DEN", "Broncos": "DEN",
-            "Detroit Lions": "DET", "Lions": "DET",
-            "Green Bay Packers": "GB", "Packers": "GB",
-            "Houston Texans": "HOU", "Texans": "HOU",
-            "Indianapolis Colts": "IND", "Colts": "IND",
-            "Jacksonville Jaguars": "JAX", "Jaguars": "JAX",
-            "Kansas City Chiefs": "KC", "Chiefs": "KC",
-            "Las Vegas Raiders": "LV", "Raiders": "LV",
-            "Los Angeles Chargers": "LAC", "Chargers": "LAC",
-            "Los Angeles Rams": "LAR", "Rams": "LAR",
-            "Miami Dolphins": "MIA", "Dolphins": "MIA",
-            "Minnesota Vikings": "MIN", "Vikings": "MIN",
-            "New England Patriots": "NE", "Patriots": "NE",
-            "New Orleans Saints": "NO", "Saints": "NO",
-            "New York Giants": "NYG", "Giants": "NYG",
-            "New York Jets": "NYJ", "Jets": "NYJ",
-            "Philadelphia Eagles": "PHI", "Eagles": "PHI",
-            "Pittsburgh Steelers": "PIT", "Steelers": "PIT",
-            "San Francisco 49ers": "SF", "49ers": "SF", "Niners": "SF",
-            "Seattle Seahawks": "SEA", "Seahawks": "SEA",
-            "Tampa Bay Buccaneers": "TB", "Buccaneers": "TB", "Bucs": "TB",
-            "Tennessee Titans": "TEN", "Titans": "TEN",
-            "Washington Commanders": "WAS", "Commanders": "WAS"
-        }
-        
-        # NBA team mappings
-        nba_mappings = {
-            "Atlanta Hawks": "ATL", "Hawks": "ATL",
-            "Boston Celtics": "BOS", "Celtics": "BOS",
-            "Brooklyn Nets": "BKN", "Nets": "BKN",
-            "Charlotte Hornets": "CHA", "Hornets": "CHA",
-            "Chicago Bulls": "CHI", "Bulls": "CHI",
-            "Cleveland Cavaliers": "CLE", "Cavaliers": "CLE", "Cavs": "CLE",
-            "Dallas Mavericks": "DAL", "Mavericks": "DAL", "Mavs": "DAL",
-            "Denver Nuggets": "DEN", "Nuggets": "DEN",
-            "Detroit Pistons": "DET", "Pistons": "DET",
-            "Golden State Warriors": "GSW", "Warriors": "GSW",
-            "Houston Rockets": "HOU", "Rockets": "HOU",
-            "Indiana Pacers": "IND", "Pacers": "IND",
-            "Los Angeles Clippers": "LAC", "Clippers": "LAC",
-            "Los Angeles Lakers": "LAL", "Lakers": "LAL",
-            "Memphis Grizzlies": "MEM", "Grizzlies": "MEM",
-            "Miami Heat": "MIA", "Heat": "MIA",
-            "Milwaukee Bucks": "MIL", "Bucks": "MIL",
-            "Minnesota Timberwolves": "MIN", "Timberwolves": "MIN", "Wolves": "MIN",
-            "New Orleans Pelicans": "NOP", "Pelicans": "NOP",
-            "New York Knicks": "NYK", "Knicks": "NYK",
-            "Oklahoma City Thunder": "OKC", "Thunder": "OKC",
-            "Orlando Magic": "ORL", "Magic": "ORL",
-            "Philadelphia 76ers": "PHI", "76ers": "PHI", "Sixers": "PHI",
-            "Phoenix Suns": "PHX", "Suns": "PHX",
-            "Portland Trail Blazers": "POR", "Trail Blazers": "POR", "Blazers": "POR",
-            "Sacramento Kings": "SAC", "Kings": "SAC",
-            "San Antonio Spurs": "SAS", "Spurs": "SAS",
-            "Toronto Raptors": "TOR", "Raptors": "TOR",
-            "Utah Jazz": "UTA", "Jazz": "UTA",
-            "Washington Wizards": "WAS", "Wizards": "WAS"
-        }
-        
-        # NHL team mappings  
-        nhl_mappings = {
-            "Anaheim Ducks": "ANA", "Ducks": "ANA",
-            "Arizona Coyotes": "ARI", "Coyotes": "ARI",
-            "Boston Bruins": "BOS", "Bruins": "BOS",
-            "Buffalo Sabres": "BUF", "Sabres": "BUF",
-            "Calgary Flames": "CGY", "Flames": "CGY",
-            "Carolina Hurricanes": "CAR", "Hurricanes": "CAR",
-            "Chicago Blackhawks": "CHI", "Blackhawks": "CHI",
-            "Colorado Avalanche": "COL", "Avalanche": "COL",
-            "Columbus Blue Jackets": "CBJ", "Blue Jackets": "CBJ",
-            "Dallas Stars": "DAL", "Stars": "DAL",
-            "Detroit Red Wings": "DET", "Red Wings": "DET",
-            "Edmonton Oilers": "EDM", "Oilers": "EDM",
-            "Florida Panthers": "FLA", "Panthers": "FLA",
-            "Los Angeles Kings": "LAK", "Kings": "LAK",
-            "Minnesota Wild": "MIN", "Wild": "MIN",
-            "Montreal Canadiens": "MTL", "Canadiens": "MTL", "Habs": "MTL",
-            "Nashville Predators": "NSH", "Predators": "NSH",
-            "New Jersey Devils": "NJD", "Devils": "NJD",
-            "New York Islanders": "NYI", "Islanders": "NYI",
-            "New York Rangers": "NYR", "Rangers": "NYR",
-            "Ottawa Senators": "OTT", "Senators": "OTT",
-            "Philadelphia Flyers": "PHI", "Flyers": "PHI",
-            "Pittsburgh Penguins": "PIT", "Penguins": "PIT",
-            "San Jose Sharks": "SJS", "Sharks": "SJS",
-            "Seattle Kraken": "SEA", "Kraken": "SEA",
-            "St. Louis Blues": "STL", "Blues": "STL",
-            "Tampa Bay Lightning": "TBL", "Lightning": "TBL",
-            "Toronto Maple Leafs": "TOR", "Maple Leafs": "TOR", "Leafs": "TOR",
-            "Vancouver Canucks": "VAN", "Canucks": "VAN",
-            "Vegas Golden Knights": "VGK", "Golden Knights": "VGK",
-            "Washington Capitals": "WSH", "Capitals": "WSH", "Caps": "WSH",
-            "Winnipeg Jets": "WPG", "Jets": "WPG"
-        }
-        
-        # Select appropriate mapping based on sport
-        if sport == 'mlb':
-            return mlb_mappings.get(team_name, team_name)
-        elif sport == 'nfl':
-            return nfl_mappings.get(team_name, team_name)
-        elif sport == 'nba':
-            return nba_mappings.get(team_name, team_name)
-        elif sport == 'nhl':
-            return nhl_mappings.get(team_name, team_name)
-        else:
-            # Try all mappings if sport unknown
-            for mapping in [mlb_mappings, nfl_mappings, nba_mappings, nhl_mappings]:
-                if team_name in mapping:
-                    return mapping[team_name]
-            return team_name
+        return self.team_resolver.standardize(team_name, sport)
 
 # Test function for development
 def test_updated_kalshi_client():
@@ -0,0 +1,125 @@
+"""
+Kalshi Tick Feed - Streams Kalshi ticker updates into a running MispricingDaemon
+Runs the kalshi/prod_ready WebSocket client on a background event loop and hands every
+update for a polled sport to MispricingDaemon.apply_kalshi_tick
+"""
+
+import asyncio
+import threading
+from typing import Dict, List, Optional
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.sports_config import get_sport_config
+
+# kalshi/prod_ready/python holds the authenticated WebSocket client (needs cryptography + websockets)
+KALSHI_WS_CLIENT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    'kalshi', 'prod_ready', 'python'
+)
+
+class KalshiTickFeed:
+    """Background WebSocket feed that re-evaluates only the daemon game each tick touches"""
+
+    def __init__(self, daemon, client):
+        """
+        Initialize the feed
+
+        Args:
+            daemon: MispricingDaemon receiving the ticks
+            client: KalshiWebSocketClient (or anything with add_callback/connect/stop)
+        """
+        self.daemon = daemon
+        self.client = client
+        self.ticks_received = 0
+        self.ticks_applied = 0
+        # Kalshi tickers start with their series ticker, e.g. KXMLBGAME-25AUG21HOUBAL-HOU
+        self._series_prefixes = {
+            sport: tuple(f"{series}-" for series in get_sport_config(sport).kalshi_tickers)
+            for sport in daemon.sports
+        }
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self.client.add_callback(self.handle_update)
+
+    @classmethod
+    def from_credentials(cls, daemon, credentials: Dict[str, str], credentials_dir: str = '',
+                         environment: str = 'prod') -> 'KalshiTickFeed':
+        """
+        Build the feed from a Kalshi credentials file's PROD_/DEMO_ KEYID and KEYFILE entries
+
+        Args:
+            daemon: MispricingDaemon receiving the ticks
+            credentials: Parsed credentials (KalshiClientUpdated.credentials)
+            credentials_dir: Directory relative KEYFILE paths are resolved against
+            environment: 'prod' or 'demo'
+
+        Raises:
+            ValueError: If the key id or key file is missing
+            ImportError: If the WebSocket client's dependencies are not installed
+        """
+        prefix = 'DEMO' if environment == 'demo' else 'PROD'
+        key_id = credentials.get(f'{prefix}_KEYID')
+        key_file = credentials.get(f'{prefix}_KEYFILE')
+        if not key_id or not key_file:
+            raise ValueError(f"Kalshi credentials need {prefix}_KEYID and {prefix}_KEYFILE for streaming")
+        if not os.path.isabs(key_file):
+            key_file = os.path.join(credentials_dir, key_file)
+
+        if KALSHI_WS_CLIENT_DIR not in sys.path:
+            sys.path.append(KALSHI_WS_CLIENT_DIR)
+        from cryptography.hazmat.primitives import serialization
+        from git_clients import Environment, KalshiWebSocketClient
+
+        with open(key_file, 'rb') as f:
+            private_key = serialization.load_pem_private_key(f.read(), password=None)
+        client = KalshiWebSocketClient(
+            key_id, private_key,
+            environment=Environment.DEMO if environment == 'demo' else Environment.PROD
+        )
+        return cls(daemon, client)
+
+    def sport_for_ticker(self, ticker: str) -> Optional[str]:
+        """Polled sport whose Kalshi series the ticker belongs to"""
+        for sport, prefixes in self._series_prefixes.items():
+            if ticker.startswith(prefixes):
+                return sport
+        return None
+
+    def handle_update(self, update: Dict) -> List[Dict]:
+        """Price book callback: route one market update to the daemon"""
+        self.ticks_received += 1
+        sport = self.sport_for_ticker(update.get('market_ticker') or '')
+        if sport is None:
+            return []
+        self.ticks_applied += 1
+        return self.daemon.apply_kalshi_tick(sport, update)
+
+    def start(self):
+        """Connect on a background thread; the daemon keeps polling on the caller's thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        started = threading.Event()
+
+        async def run():
+            self._loop = asyncio.get_running_loop()
+            started.set()
+            await self.client.connect()
+
+        self._thread = threading.Thread(target=asyncio.run, args=(run(),), name='kalshi-tick-feed', daemon=True)
+        self._thread.start()
+        started.wait(timeout=5)
+
+    def stop(self, timeout: float = 5.0):
+        """Close the WebSocket and wait for the feed thread to exit"""
+        if self._thread is None:
+            return
+        if self._loop is not None and self._loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self.client.stop(), self._loop)
+            try:
+                future.result(timeout=timeout)
+            except Exception as e:
+                print(f"Error stopping Kalshi tick feed: {e}")
+        self._thread.join(timeout=timeout)
+        self._thread = None
@@ -3,8 +3,9 @@ Main Integration System - Mispricing Detection Between Pinnacle and Kalshi
 Production-ready orchestration module for complete system operation
 """
 
-import json
-from datetime import datetime, timezone, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 import pytz
 from typing import Dict, List, Optional
 import sys
@@ -12,10 +13,18 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.timestamp_utils import format_display_time
+from utils.odds_api_scheduler import OddsApiScheduler
 from core.pinnacle_client import PinnacleClient
 from core.kalshi_client import KalshiClientUpdated as KalshiClient
 from core.odds_converter import OddsConverter
 from core.data_aligner import GameMatcher, MispricingDetector
+from core.market_snapshot import KalshiSnapshotStore
+from core.depth_pricing import DepthPricer
+from core.game_record import json_default
+from utils.results_writer import ResultsStreamWriter
+from utils.tick_store import OddsTickStore, canonical_game_key
+from utils.metrics import get_metrics, start_metrics_server
+from utils.console import console, set_console_output
 from config.sports_config import get_sport_config, get_available_sports, get_supported_sports_display
 
 class MispricingSystem:
@@ -33,21 +42,69 @@ class MispricingSystem:
         if config:
             self.config.update(config)
         self.central_tz = pytz.timezone('America/Chicago')
+        set_console_output(self.config.get('console_output', True))
         
         # Initialize clients
-        self.pinnacle_client = PinnacleClient(self.config['pinnacle_api_key_file'])
+        self.odds_scheduler = OddsApiScheduler(
+            default_ttl=self.config['odds_api_cache_ttl_seconds'],
+            daily_budget=self.config['odds_api_daily_budget']
+        )
+        self.pinnacle_client = PinnacleClient(self.config['pinnacle_api_key_file'], scheduler=self.odds_scheduler)
         self.kalshi_client = KalshiClient(self.config['kalshi_credentials_file'])
         
-        # Initialize analysis tools with default values
-        # These will be updated per-sport in run_analysis
-        self.game_matcher = GameMatcher(time_threshold_hours=6.0)
-        self.mispricing_detector = MispricingDetector(
-            min_edge_threshold=0.03,
-            min_confidence=0.4
-        )
+        # Analysis tools - each sport gets its own matcher/detector from its SportConfig
+        # so sports never share mutable thresholds and can be analyzed concurrently
+        self.sport_tools: Dict[str, tuple] = {}
+        
+        # Per-sport Kalshi snapshots for incremental (delta-only) refresh
+        self.kalshi_snapshots: Dict[str, KalshiSnapshotStore] = {}
         
         # Results storage
         self.last_run_results = {}
+        
+        # Stages stream compact NDJSON records here as they complete
+        self.results_writer = None
+        if self.config.get('save_results_to_file'):
+            self.results_writer = ResultsStreamWriter(
+                self.config['results_file_path'],
+                max_bytes=self.config.get('results_max_bytes'),
+                backup_count=self.config.get('results_backup_count', 5),
+                compress=self.config.get('results_compress_rotated', False),
+                default=json_default
+            )
+        self._results_session_started = False
+        
+        # Append-only quote history for line-movement analysis
+        self.tick_store = OddsTickStore(self.config['tick_store_path']) if self.config.get('record_ticks') else None
+        
+        # Raw API responses for offline replay (core/backtest.py)
+        self.snapshot_writer = None
+        if self.config.get('record_snapshots'):
+            self.snapshot_writer = ResultsStreamWriter(
+                self.config['snapshot_file_path'],
+                max_bytes=self.config.get('results_max_bytes'),
+                backup_count=self.config.get('results_backup_count', 5),
+                compress=self.config.get('results_compress_rotated', False),
+                default=json_default
+            )
+        
+        # Stake-sized executable Kalshi prices from concurrently fetched order books
+        self.depth_pricer = None
+        if self.config.get('depth_pricing'):
+            self.depth_pricer = DepthPricer(
+                self.kalshi_client,
+                stake=self.config['depth_stake_dollars'],
+                depth=self.config['depth_levels'],
+                max_workers=self.config['depth_max_workers'],
+                cache_ttl_seconds=self.config['depth_book_cache_ttl_seconds']
+            )
+        
+        # Stage timings and counters (Prometheus endpoint and/or JSON file)
+        self.metrics = get_metrics()
+        self.metrics.register_collector('odds_api_scheduler', self._collect_client_gauges)
+        self.metrics_server = None
+        if self.config.get('metrics_port') is not None:
+            self.metrics_server = start_metrics_server(self.metrics, self.config['metrics_port'])
     
     def _convert_to_central_time(self, utc_timestamp: str) -> str:
         """Convert UTC timestamp to Central Time with simplified format"""
@@ -81,8 +138,29 @@ class MispricingSystem:
             'min_time_buffer_minutes': 15,  # Minimum minutes before game starts
             'exclude_live_games': True,  # Never analyze games that have started
             'max_opportunities_to_report': 10,
-            'save_results_to_file': True,
-            'results_file_path': os.path.join(project_root, 'debug', 'latest_results.json')
+            'incremental_kalshi_refresh': False,  # Only re-normalize Kalshi markets that changed since last run
+            'parallel_multi_sport': True,  # Overlap fetches and analysis across sports
+            'multi_sport_workers': 4,  # Worker threads for per-sport normalize/align/detect
+            'daemon_poll_interval_seconds': 30,  # Default per-sport cadence for the polling daemon
+            'odds_api_cache_ttl_seconds': 20,  # Reuse identical Odds API responses for this long
+            'odds_api_daily_budget': None,  # Odds API requests per day (None = remaining quota / days left in month)
+            'save_results_to_file': True,  # Stream run records to results_file_path as NDJSON
+            'results_file_path': os.path.join(project_root, 'debug', 'results.ndjson'),
+            'results_max_bytes': 50 * 1024 * 1024,  # Rotate the results file at this size
+            'results_backup_count': 5,  # Rotated results files to keep
+            'results_compress_rotated': True,  # Gzip rotated results files
+            'record_ticks': False,  # Append every fetched quote to the SQLite tick store
+            'tick_store_path': os.path.join(project_root, 'debug', 'odds_ticks.sqlite'),
+            'record_snapshots': False,  # Keep raw Pinnacle/Kalshi responses for offline backtests
+            'snapshot_file_path': os.path.join(project_root, 'debug', 'snapshots.ndjson'),
+            'depth_pricing': False,  # Price Kalshi at the fill price for depth_stake_dollars instead of top-of-book
+            'depth_stake_dollars': 100.0,  # Stake each side must fill when depth pricing is on
+            'depth_levels': 20,  # Order book levels requested per side
+            'depth_book_cache_ttl_seconds': 5.0,  # Reuse a fetched order book for this long
+            'depth_max_workers': 8,  # Order books fetched in parallel
+            'console_output': True,  # Print per-stage progress (False keeps the hot path quiet)
+            'metrics_file_path': None,  # Write a JSON metrics snapshot here after every run
+            'metrics_port': None  # Serve Prometheus /metrics on this port
         }
     
     def run_analysis(self, sport_type: str = 'mlb') -> Dict:
@@ -104,20 +182,62 @@ class MispricingSystem:
                 'timestamp': datetime.now(timezone.utc).isoformat()
             }
         
-        # Update analysis tools with sport-specific settings
-        self.game_matcher.time_threshold = timedelta(hours=sport_config.time_threshold_hours)
-        self.mispricing_detector.min_edge = sport_config.min_edge_threshold
-        self.mispricing_detector.min_confidence = sport_config.match_confidence_threshold
-        
-        print(f"Starting Pinnacle-Kalshi {sport_config.name} Mispricing Analysis")
+        console(f"Starting Pinnacle-Kalshi {sport_config.name} Mispricing Analysis")
         if self.config.get('exclude_live_games', True):
             buffer_mins = self.config.get('min_time_buffer_minutes', 15)
-            print(f"Note: Excluding live games (minimum {buffer_mins} minutes before start)")
-        print(f"Sport Config: Edge>={sport_config.min_edge_threshold:.1%}, Confidence>={sport_config.match_confidence_threshold:.1%}")
-        print("=" * 60)
+            console(f"Note: Excluding live games (minimum {buffer_mins} minutes before start)")
+        console(f"Sport Config: Edge>={sport_config.min_edge_threshold:.1%}, Confidence>={sport_config.match_confidence_threshold:.1%}")
+        console("=" * 60)
+        
+        self._start_results_session()
+        results = self._run_sport_pipeline(
+            sport_type,
+            lambda: self.pinnacle_client.get_sports_odds(sport_type),
+            lambda: self.kalshi_client.search_sports_markets(sport_type)
+        )
+        
+        # Store results
+        self.last_run_results = results
+        
+        return results
+    
+    def _get_sport_tools(self, sport_type: str) -> tuple:
+        """Get the (GameMatcher, MispricingDetector) pair configured for a sport"""
+        sport_type = sport_type.lower()
+        tools = self.sport_tools.get(sport_type)
+        if tools is None:
+            sport_config = get_sport_config(sport_type)
+            tools = (
+                GameMatcher(time_threshold_hours=sport_config.time_threshold_hours),
+                MispricingDetector(
+                    min_edge_threshold=sport_config.min_edge_threshold,
+                    min_confidence=sport_config.match_confidence_threshold
+                )
+            )
+            self.sport_tools[sport_type] = tools
+        return tools
+    
+    def _run_sport_pipeline(self, sport_type: str, fetch_pinnacle, fetch_kalshi,
+                            stage_seconds: Optional[Dict] = None) -> Dict:
+        """
+        Normalize, align and detect for one sport
+        
+        Args:
+            sport_type: Sport key (must exist in SPORTS_CONFIG)
+            fetch_pinnacle: Callable returning the raw Pinnacle response
+            fetch_kalshi: Callable returning the raw Kalshi response
+            stage_seconds: Stage timings already taken (fetches run and timed on the I/O pool)
+        
+        Returns:
+            Analysis results dictionary for the sport
+        """
+        game_matcher, mispricing_detector = self._get_sport_tools(sport_type)
+        stage_seconds = {} if stage_seconds is None else stage_seconds
         
         analysis_start = datetime.now(timezone.utc)
+        run_id = f"{sport_type}_{analysis_start.strftime('%Y%m%dT%H%M%S%f')}"
         results = {
+            'run_id': run_id,
             'timestamp': analysis_start.isoformat(),
             'status': 'running',
             'pinnacle_data': {},
@@ -130,56 +250,98 @@ class MispricingSystem:
         
         try:
             # Step 1: Fetch Pinnacle data
-            print(f"Step 1: Fetching Pinnacle {sport_type.upper()} odds...")
-            pinnacle_raw = self.pinnacle_client.get_sports_odds(sport_type)
+            console(f"Step 1: Fetching Pinnacle {sport_type.upper()} odds...")
+            pinnacle_raw = self._fetch_stage(sport_type, 'fetch_pinnacle', stage_seconds, fetch_pinnacle)
+            self.metrics.inc('markets_fetched_total', len(pinnacle_raw.get('data') or []),
+                             platform='pinnacle', sport=sport_type)
             
             if not pinnacle_raw.get('success'):
                 raise Exception(f"Pinnacle data fetch failed: {pinnacle_raw.get('error')}")
             
             # Apply time filtering if configured
             time_buffer = self.config.get('min_time_buffer_minutes', 15)
-            pinnacle_games = self.pinnacle_client.normalize_pinnacle_data(pinnacle_raw, time_buffer)
+            pinnacle_games = self._timed_stage(sport_type, 'normalize_pinnacle', stage_seconds,
+                                               self.pinnacle_client.normalize_pinnacle_data, pinnacle_raw, time_buffer)
+            self.record_ticks('pinnacle', pinnacle_games, pinnacle_raw.get('timestamp'))
             results['pinnacle_data'] = {
                 'success': True,
                 'games_count': len(pinnacle_games),
                 'raw_games_count': len(pinnacle_raw.get('data', [])),
                 'fetch_timestamp': pinnacle_raw.get('timestamp')
             }
-            print(f"  SUCCESS: Fetched {len(pinnacle_games)} Pinnacle {sport_type.upper()} games")
+            console(f"  SUCCESS: Fetched {len(pinnacle_games)} Pinnacle {sport_type.upper()} games")
             
             # Step 2: Fetch Kalshi sports markets
-            print(f"Step 2: Fetching Kalshi {sport_type.upper()} markets...")
-            print(f"  Searching for {sport_type} sports markets on Kalshi...")
+            console(f"Step 2: Fetching Kalshi {sport_type.upper()} markets...")
+            console(f"  Searching for {sport_type} sports markets on Kalshi...")
             
-            kalshi_raw = self.kalshi_client.search_sports_markets(sport_type)
-            kalshi_games = self.kalshi_client.normalize_kalshi_data(kalshi_raw, time_buffer)
+            kalshi_raw = self._fetch_stage(sport_type, 'fetch_kalshi', stage_seconds, fetch_kalshi)
+            self.metrics.inc('markets_fetched_total', len(kalshi_raw.get('data') or []),
+                             platform='kalshi', sport=sport_type)
+            kalshi_delta = None
+            if self.config.get('incremental_kalshi_refresh'):
+                # Only markets whose prices/status/close time moved are re-normalized; the whole tracked
+                # set is still aligned so Pinnacle moves against unchanged markets are detected
+                snapshot_store = self.kalshi_snapshots.setdefault(sport_type, KalshiSnapshotStore())
+                kalshi_delta = self._timed_stage(sport_type, 'normalize_kalshi', stage_seconds,
+                                                 snapshot_store.refresh, kalshi_raw, self.kalshi_client, time_buffer)
+                kalshi_games = snapshot_store.get_all_games()
+                self.record_ticks('kalshi', kalshi_delta['changed'], kalshi_raw.get('timestamp'))
+            else:
+                kalshi_games = self._timed_stage(sport_type, 'normalize_kalshi', stage_seconds,
+                                                 self.kalshi_client.normalize_kalshi_data, kalshi_raw, time_buffer)
+                self.record_ticks('kalshi', kalshi_games, kalshi_raw.get('timestamp'))
             
             if len(kalshi_games) == 0:
-                print(f"  No {sport_type.upper()} markets found on Kalshi")
-                print(f"  Note: Kalshi may not have individual {sport_type.upper()} games available today")
+                console(f"  No {sport_type.upper()} markets found on Kalshi")
+                console(f"  Note: Kalshi may not have individual {sport_type.upper()} games available today")
             else:
-                print(f"  Found {len(kalshi_games)} real {sport_type.upper()} markets on Kalshi")
+                console(f"  Found {len(kalshi_games)} real {sport_type.upper()} markets on Kalshi")
             
             if not kalshi_raw.get('success'):
                 raise Exception(f"Kalshi data fetch failed: {kalshi_raw.get('error')}")
             
+            self.record_snapshot(sport_type, pinnacle_raw, kalshi_raw)
+            
             results['kalshi_data'] = {
                 'success': True,
                 'games_count': len(kalshi_games),
                 'data_source': 'real' if len(kalshi_games) > 0 else 'none',
                 'fetch_timestamp': kalshi_raw.get('timestamp')
             }
-            print(f"  SUCCESS: Fetched {len(kalshi_games)} Kalshi {sport_type.upper()} games")
+            if kalshi_delta is not None:
+                results['kalshi_data']['delta'] = {
+                    'changed_count': len(kalshi_delta['changed']),
+                    'unchanged_count': kalshi_delta['unchanged_count'],
+                    'removed_tickers': kalshi_delta['removed'],
+                    'expired_tickers': kalshi_delta['expired'],
+                    'total_tracked': kalshi_delta['total_tracked']
+                }
+            console(f"  SUCCESS: Fetched {len(kalshi_games)} Kalshi {sport_type.upper()} games")
             
             # Step 3: Align games between platforms
-            print("Step 3: Aligning games between platforms...")
-            aligned_games = self.game_matcher.align_games(pinnacle_games, kalshi_games)
+            console("Step 3: Aligning games between platforms...")
+            aligned_games = self._timed_stage(sport_type, 'align', stage_seconds,
+                                              game_matcher.align_games, pinnacle_games, kalshi_games)
+            self.metrics.inc('games_aligned_total', len(aligned_games), sport=sport_type)
             results['aligned_games'] = aligned_games
-            print(f"  SUCCESS: Aligned {len(aligned_games)} games")
+            self._stream_results(run_id, sport_type, 'aligned_game', [
+                self._compact_aligned_game(aligned_game) for aligned_game in aligned_games
+            ])
+            console(f"  SUCCESS: Aligned {len(aligned_games)} games")
+            
+            if self.depth_pricer is not None and aligned_games:
+                # Only matched markets are candidates, so only their books are fetched
+                console(f"Step 3b: Pricing Kalshi depth for ${self.depth_pricer.stake:,.0f}...")
+                aligned_games = self._timed_stage(sport_type, 'depth', stage_seconds,
+                                                  self.depth_pricer.reprice_aligned_games, aligned_games)
+                results['aligned_games'] = aligned_games
             
             # Step 4: Detect mispricing opportunities
-            print("Step 4: Detecting mispricing opportunities...")
-            opportunities = self.mispricing_detector.detect_opportunities(aligned_games)
+            console("Step 4: Detecting mispricing opportunities...")
+            opportunities = self._timed_stage(sport_type, 'detect', stage_seconds,
+                                              mispricing_detector.detect_opportunities, aligned_games)
+            self.metrics.inc('opportunities_detected_total', len(opportunities), sport=sport_type)
             
             # Sort opportunities by edge size
             opportunities.sort(
@@ -193,7 +355,10 @@ class MispricingSystem:
                 opportunities = opportunities[:max_opportunities]
             
             results['opportunities'] = opportunities
-            print(f"  SUCCESS: Found {len(opportunities)} opportunities")
+            self._stream_results(run_id, sport_type, 'opportunity', [
+                self._compact_opportunity(opportunity) for opportunity in opportunities
+            ])
+            console(f"  SUCCESS: Found {len(opportunities)} opportunities")
             
             # Step 5: Generate summary
             analysis_end = datetime.now(timezone.utc)
@@ -211,7 +376,7 @@ class MispricingSystem:
             }
             
             results['status'] = 'completed'
-            print(f"\nAnalysis completed in {duration:.1f} seconds")
+            console(f"\nAnalysis completed in {duration:.1f} seconds")
             
         except Exception as e:
             results['status'] = 'failed'
@@ -221,24 +386,172 @@ class MispricingSystem:
             })
             print(f"\nAnalysis failed: {e}")
         
-        # Store results
-        self.last_run_results = results
-        
-        # Save to file if configured
-        if self.config.get('save_results_to_file'):
-            self._save_results_to_file(results)
+        results['summary']['stage_seconds'] = {stage: round(seconds, 4) for stage, seconds in stage_seconds.items()}
+        self.metrics.inc('pipeline_runs_total', sport=sport_type, status=results['status'])
+        self.write_metrics()
         
+        summary = {key: value for key, value in results['summary'].items() if key != 'system_config'}
+        self._stream_results(run_id, sport_type, 'run_completed', [
+            {'status': results['status'], 'summary': summary, 'errors': results['errors']}
+        ])
         return results
     
-    def _save_results_to_file(self, results: Dict):
-        """Save analysis results to JSON file"""
+    def _timed_stage(self, sport_type: str, stage: str, stage_seconds: Dict, func, *args):
+        """Call one pipeline stage, recording its wall time in stage_seconds and the stage histogram"""
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            stage_seconds[stage] = elapsed
+            self.metrics.observe('pipeline_stage_seconds', elapsed, sport=sport_type, stage=stage)
+    
+    def _fetch_stage(self, sport_type: str, stage: str, stage_seconds: Dict, fetch):
+        """Call a fetch, timing it here unless it already ran (and was timed) on the I/O pool"""
+        if stage in stage_seconds:
+            return fetch()
+        return self._timed_stage(sport_type, stage, stage_seconds, fetch)
+    
+    def _collect_client_gauges(self):
+        """Odds API quota/cache and HTTP connection reuse, sampled at export time"""
+        scheduler_stats = self.odds_scheduler.get_stats()
+        lookups = scheduler_stats.get('cache_hits', 0) + scheduler_stats.get('upstream_requests', 0)
+        yield 'odds_api_cache_hits', {}, scheduler_stats.get('cache_hits', 0)
+        yield 'odds_api_upstream_requests', {}, scheduler_stats.get('upstream_requests', 0)
+        yield 'odds_api_cache_hit_rate', {}, scheduler_stats.get('cache_hits', 0) / lookups if lookups else None
+        yield 'odds_api_requests_remaining', {}, scheduler_stats.get('requests_remaining')
+        for host, host_stats in self.pinnacle_client.http.get_stats().items():
+            yield 'http_connection_reuse_rate', {'host': host}, host_stats['reuse_rate']
+    
+    def write_metrics(self):
+        """Replace metrics_file_path with the current metrics snapshot (no-op when unset)"""
+        file_path = self.config.get('metrics_file_path')
+        if not file_path:
+            return
+        try:
+            self.metrics.write_json(file_path)
+        except Exception as e:
+            print(f"Failed to write metrics: {e}")
+    
+    def record_ticks(self, platform: str, games: List[Dict], timestamp: Optional[str] = None) -> int:
+        """
+        Append both sides of each normalized game to the tick store in one batch
+        
+        Args:
+            platform: 'pinnacle' or 'kalshi'
+            games: Normalized games from the platform's client
+            timestamp: Fetch time (defaults to now)
+        
+        Returns:
+            Number of ticks written (0 when tick recording is off)
+        """
+        if self.tick_store is None or not games:
+            return 0
+        
+        ts = timestamp or datetime.now(timezone.utc).isoformat()
+        ticks = []
+        for game in games:
+            game_key = canonical_game_key(game['sport'], game.get('game_date'), game['home_team'], game['away_team'])
+            for side in ('home', 'away'):
+                odds = game[f'{side}_odds']
+                cents = odds.get('kalshi_cents')
+                ticks.append({
+                    'platform': platform,
+                    'sport': game['sport'],
+                    'game_key': game_key,
+                    'side': side,
+                    'ts': ts,
+                    'american': odds.get('american'),
+                    'implied_probability': odds.get('implied_probability'),
+                    'price': cents / 100 if cents else None,
+                    'source_id': game['game_id']
+                })
+        try:
+            return self.tick_store.append_ticks(ticks)
+        except Exception as e:
+            print(f"Failed to record {platform} ticks: {e}")
+            return 0
+    
+    def record_snapshot(self, sport_type: str, pinnacle_raw: Dict, kalshi_raw: Dict):
+        """
+        Append one fetch cycle's raw responses for later replay
+        
+        Args:
+            sport_type: Sport the responses were fetched for
+            pinnacle_raw: Raw get_sports_odds response
+            kalshi_raw: Raw search_sports_markets response
+        """
+        if self.snapshot_writer is None:
+            return
         try:
-            file_path = self.config.get('results_file_path', '../debug/latest_results.json')
-            with open(file_path, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
-            print(f"Results saved to: {file_path}")
+            self.snapshot_writer.write({
+                'record_type': 'snapshot',
+                'sport': sport_type.lower(),
+                'captured_at': pinnacle_raw.get('timestamp') or datetime.now(timezone.utc).isoformat(),
+                'pinnacle': pinnacle_raw,
+                'kalshi': kalshi_raw
+            })
         except Exception as e:
-            print(f"Failed to save results: {e}")
+            print(f"Failed to record {sport_type} snapshot: {e}")
+    
+    def _start_results_session(self):
+        """Write the session record (system config) once, before any run records"""
+        if self.results_writer is None or self._results_session_started:
+            return
+        self._results_session_started = True
+        self.results_writer.write({
+            'record_type': 'session_started',
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'system_config': self.config
+        })
+    
+    def _stream_results(self, run_id: str, sport_type: str, record_type: str, payloads: List[Dict]):
+        """Append one NDJSON record per payload, tagged with the run and sport"""
+        if self.results_writer is None:
+            return
+        try:
+            timestamp = datetime.now(timezone.utc).isoformat()
+            for payload in payloads:
+                record = {'record_type': record_type, 'run_id': run_id, 'sport': sport_type.upper(), 'timestamp': timestamp}
+                record.update(payload)
+                self.results_writer.write(record)
+        except Exception as e:
+            print(f"Failed to write {record_type} results: {e}")
+    
+    def _compact_game(self, game: Dict) -> Dict:
+        """Fields needed to identify and price one side of a match"""
+        return {
+            'game_id': game['game_id'],
+            'home_team': game['home_team'],
+            'away_team': game['away_team'],
+            'game_time_display': game.get('game_time_display'),
+            'home_odds': game['home_odds'],
+            'away_odds': game['away_odds']
+        }
+    
+    def _compact_aligned_game(self, aligned_game: Dict) -> Dict:
+        """Aligned pair without raw payloads"""
+        return {
+            'match_id': aligned_game['match_id'],
+            'match_confidence': aligned_game['match_confidence'],
+            'pinnacle': self._compact_game(aligned_game['pinnacle_data']),
+            'kalshi': self._compact_game(aligned_game['kalshi_data']),
+            'matched_on': aligned_game.get('alignment_metadata', {}).get('matched_on', [])
+        }
+    
+    def _compact_opportunity(self, opportunity: Dict) -> Dict:
+        """Opportunity referencing its aligned pair by id instead of embedding it"""
+        pinnacle = opportunity['pinnacle_odds']
+        return {
+            'opportunity_id': opportunity['opportunity_id'],
+            'match_id': opportunity['game_data']['match_id'],
+            'matchup': f"{pinnacle['away_team']} @ {pinnacle['home_team']}",
+            'pinnacle_game_id': pinnacle['game_id'],
+            'kalshi_game_id': opportunity['kalshi_odds']['game_id'],
+            'discrepancy': opportunity['discrepancy'],
+            'profit_analysis': opportunity['profit_analysis'],
+            'execution': opportunity.get('execution')
+        }
     
     def print_opportunities_summary(self, max_display: int = 5):
         """Print a formatted summary of the best opportunities"""
@@ -293,17 +606,31 @@ class MispricingSystem:
             'clients_initialized': {
                 'pinnacle': self.pinnacle_client is not None,
                 'kalshi': self.kalshi_client is not None
-            }
+            },
+            'http_connection_reuse': self.pinnacle_client.http.get_stats()
         }
     
-    def run_multi_sport_analysis(self, sports_list: List[str] = None) -> Dict:
-        """Run analysis across multiple sports"""
+    def run_multi_sport_analysis(self, sports_list: List[str] = None, parallel: Optional[bool] = None) -> Dict:
+        """
+        Run analysis across multiple sports
+        
+        Args:
+            sports_list: Sports to analyze (defaults to all configured sports)
+            parallel: Overlap all sports' fetches and analysis (defaults to config 'parallel_multi_sport')
+        
+        Returns:
+            Dictionary with per-sport results, combined summary and top opportunities
+        """
         if sports_list is None:
             sports_list = get_available_sports()
+        if parallel is None:
+            parallel = self.config.get('parallel_multi_sport', True)
         
-        print(f"Starting Multi-Sport Analysis: {', '.join(s.upper() for s in sports_list)}")
+        mode = 'parallel' if parallel else 'sequential'
+        print(f"Starting Multi-Sport Analysis ({mode}): {', '.join(s.upper() for s in sports_list)}")
         print("="*70)
         
+        multi_start = time.perf_counter()
         multi_results = {
             'timestamp': datetime.now(timezone.utc).isoformat(),
             'sports_analyzed': sports_list,
@@ -316,11 +643,20 @@ class MispricingSystem:
             }
         }
         
+        self._start_results_session()
+        if parallel:
+            sport_results_by_sport = self._run_sports_parallel(sports_list)
+        else:
+            sport_results_by_sport = {}
+            for sport in sports_list:
+                console(f"\n{'='*20} ANALYZING {sport.upper()} {'='*20}")
+                sport_results_by_sport[sport] = self.run_analysis(sport)
+        
         all_opportunities = []
         
+        # Merge in the requested sport order so output is stable regardless of completion order
         for sport in sports_list:
-            print(f"\n{'='*20} ANALYZING {sport.upper()} {'='*20}")
-            sport_results = self.run_analysis(sport)
+            sport_results = sport_results_by_sport[sport]
             multi_results['individual_results'][sport] = sport_results
             
             if sport_results.get('opportunities'):
@@ -336,6 +672,9 @@ class MispricingSystem:
             multi_results['combined_summary']['best_overall_edge'] = all_opportunities[0]['discrepancy']['max_edge']
             multi_results['top_opportunities'] = all_opportunities[:10]  # Top 10 across all sports
         
+        multi_results['combined_summary']['analysis_mode'] = mode
+        multi_results['combined_summary']['analysis_duration_seconds'] = round(time.perf_counter() - multi_start, 2)
+        
         # Print combined summary
         print(f"\n{'='*70}")
         print("MULTI-SPORT ANALYSIS SUMMARY")
@@ -347,9 +686,79 @@ class MispricingSystem:
         print(f"Sports with Opportunities: {', '.join(summary['sports_with_opportunities'])}")
         if summary['best_overall_edge'] > 0:
             print(f"Best Overall Edge: {summary['best_overall_edge']:.1%}")
+        print(f"Total Duration ({mode}): {summary['analysis_duration_seconds']:.1f} seconds")
         
         return multi_results
     
+    def _run_sports_parallel(self, sports_list: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch every sport's Pinnacle and Kalshi data at once, then analyze each sport
+        on a worker pool as soon as both of its fetches finish
+        """
+        sport_results = {}
+        
+        valid_sports = []
+        for sport in sports_list:
+            if get_sport_config(sport):
+                valid_sports.append(sport)
+            else:
+                sport_results[sport] = {
+                    'status': 'failed',
+                    'error': f'Unsupported sport: {sport}. Available: {get_supported_sports_display()}',
+                    'timestamp': datetime.now(timezone.utc).isoformat()
+                }
+        
+        if not valid_sports:
+            return sport_results
+        
+        io_workers = 2 * len(valid_sports)
+        cpu_workers = max(1, min(len(valid_sports), self.config.get('multi_sport_workers', 4)))
+        
+        with ThreadPoolExecutor(max_workers=io_workers) as io_pool, \
+             ThreadPoolExecutor(max_workers=cpu_workers) as cpu_pool:
+            # Stage 1: overlap all network I/O
+            fetch_futures = {}
+            pending_fetches = {}
+            stage_seconds_by_sport = {sport: {} for sport in valid_sports}
+            for sport in valid_sports:
+                # Timed inside the pool task so fetch stages measure the request, not the wait
+                stage_seconds = stage_seconds_by_sport[sport]
+                pinnacle_future = io_pool.submit(self._timed_stage, sport, 'fetch_pinnacle', stage_seconds,
+                                                 self.pinnacle_client.get_sports_odds, sport)
+                kalshi_future = io_pool.submit(self._timed_stage, sport, 'fetch_kalshi', stage_seconds,
+                                               self.kalshi_client.search_sports_markets, sport)
+                fetch_futures[pinnacle_future] = sport
+                fetch_futures[kalshi_future] = sport
+                pending_fetches[sport] = (pinnacle_future, kalshi_future)
+            
+            # Stage 2: normalize/align/detect per sport once its data has arrived
+            analysis_futures = {}
+            fetches_remaining = {sport: 2 for sport in valid_sports}
+            for future in as_completed(fetch_futures):
+                sport = fetch_futures[future]
+                fetches_remaining[sport] -= 1
+                if fetches_remaining[sport] == 0:
+                    console(f"  {sport.upper()}: data fetched, analyzing...")
+                    pinnacle_future, kalshi_future = pending_fetches[sport]
+                    analysis_future = cpu_pool.submit(
+                        self._run_sport_pipeline, sport, pinnacle_future.result, kalshi_future.result,
+                        stage_seconds_by_sport[sport]
+                    )
+                    analysis_futures[analysis_future] = sport
+            
+            for future in as_completed(analysis_futures):
+                sport = analysis_futures[future]
+                results = future.result()
+                sport_results[sport] = results
+                
+                # Same bookkeeping as run_analysis (records were already streamed by the pipeline)
+                self.last_run_results = results
+                
+                console(f"  {sport.upper()}: {results['status']} "
+                        f"({len(results.get('opportunities', []))} opportunities)")
+        
+        return sport_results
+    
     def get_easy_data_summary(self, sport_type: str = 'mlb') -> Dict:
         """Get easy-to-read summary of available data for a sport"""
         print(f"\nGETTING DATA SUMMARY FOR {sport_type.upper()}")
@@ -0,0 +1,188 @@
+"""
+Kalshi Market Snapshot Store - Incremental refresh between analysis cycles
+Tracks each market's last-seen price fields so only changed markets get re-normalized
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.timestamp_utils import parse_epoch, is_future_epoch
+from utils.console import console
+
+class KalshiSnapshotStore:
+    """Snapshot of Kalshi markets keyed by ticker, emitting only the delta on refresh"""
+
+    # Fields that decide whether a market needs to be re-normalized
+    TRACKED_FIELDS = ('yes_bid', 'no_bid', 'status', 'close_time')
+
+    def __init__(self):
+        """Initialize an empty snapshot store"""
+        # ticker -> {'fingerprint', 'market': raw market, 'game': normalized game or None, 'filter_epoch', 'last_seen'}
+        self._snapshots: Dict[str, Dict] = {}
+        self.refresh_count = 0
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def _fingerprint(self, market: Dict) -> tuple:
+        """Build the comparison key for a raw market"""
+        return tuple(market.get(field) for field in self.TRACKED_FIELDS)
+
+    def _filter_epoch_for(self, game: Dict) -> Optional[int]:
+        """Epoch seconds used for live-game filtering, same rule as normalize_kalshi_data"""
+        metadata = game.get('metadata', {})
+        if metadata.get('filter_epoch') is not None:
+            return metadata['filter_epoch']
+        game_date = game.get('game_date')
+        game_time = game.get('game_time')
+        if game_date and game_time and game_time != 'Unknown':
+            return parse_epoch(f"{game_date}T{game_time}:00Z")
+        return parse_epoch(metadata.get('original_close_time'))
+
+    def refresh(self, raw_data: Dict, kalshi_client, min_time_buffer_minutes: int = 15) -> Dict:
+        """
+        Apply a fresh Kalshi fetch and normalize only markets that changed
+
+        Args:
+            raw_data: Result of KalshiClientUpdated.search_sports_markets
+            kalshi_client: Client used to normalize the changed markets
+            min_time_buffer_minutes: Live-game buffer passed through to normalization
+
+        Returns:
+            Dictionary with changed games, removed/expired tickers and counts
+        """
+        if not raw_data.get('success'):
+            return {
+                'changed': [],
+                'removed': [],
+                'expired': [],
+                'unchanged_count': len(self._snapshots),
+                'total_tracked': len(self._snapshots)
+            }
+
+        seen_at = raw_data.get('timestamp') or datetime.now(timezone.utc).isoformat()
+        changed_markets = []
+        changed_fingerprints = {}
+        markets_by_ticker = {}
+        seen_tickers = set()
+
+        for market in raw_data.get('data', []):
+            ticker = market.get('ticker')
+            if not ticker:
+                continue
+            seen_tickers.add(ticker)
+
+            fingerprint = self._fingerprint(market)
+            snapshot = self._snapshots.get(ticker)
+            if snapshot is not None and snapshot['fingerprint'] == fingerprint:
+                snapshot['last_seen'] = seen_at
+                continue
+
+            changed_markets.append(market)
+            changed_fingerprints[ticker] = fingerprint
+            markets_by_ticker[ticker] = market
+
+        # Markets no longer returned by the API (settled, closed or delisted); a series whose
+        # pagination failed partway proves nothing about its missing markets, so keep those
+        incomplete_prefixes = tuple(f"{series}-" for series in raw_data.get('incomplete_series', []))
+        removed = [ticker for ticker in self._snapshots
+                   if ticker not in seen_tickers and not ticker.startswith(incomplete_prefixes)]
+        for ticker in removed:
+            del self._snapshots[ticker]
+
+        # Unchanged markets whose game has since started drop out of the tracked set
+        expired = []
+        now_epoch = time.time()
+        for ticker, snapshot in self._snapshots.items():
+            if ticker in changed_fingerprints or snapshot['game'] is None:
+                continue
+            if not is_future_epoch(snapshot['filter_epoch'], min_time_buffer_minutes, now_epoch):
+                snapshot['game'] = None
+                expired.append(ticker)
+
+        # Re-normalize only the delta
+        changed_games = []
+        if changed_markets:
+            delta_raw = {'success': True, 'data': changed_markets, 'timestamp': seen_at}
+            normalized = kalshi_client.normalize_kalshi_data(delta_raw, min_time_buffer_minutes)
+            games_by_ticker = {game['game_id'][len('kalshi_'):]: game for game in normalized}
+
+            for ticker, fingerprint in changed_fingerprints.items():
+                game = games_by_ticker.get(ticker)
+                # Record unparseable/live markets too so they are not retried until they change
+                self._snapshots[ticker] = {
+                    'fingerprint': fingerprint,
+                    'market': markets_by_ticker[ticker],
+                    'game': game,
+                    'filter_epoch': self._filter_epoch_for(game) if game else None,
+                    'last_seen': seen_at
+                }
+                if game is not None:
+                    changed_games.append(game)
+
+        self.refresh_count += 1
+        unchanged_count = len(seen_tickers) - len(changed_fingerprints)
+        console(f"Kalshi snapshot refresh #{self.refresh_count}: {len(changed_games)} changed, "
+                f"{unchanged_count} unchanged, {len(removed)} removed, {len(expired)} expired")
+
+        return {
+            'changed': changed_games,
+            'removed': removed,
+            'expired': expired,
+            'unchanged_count': unchanged_count,
+            'total_tracked': len(self._snapshots)
+        }
+
+    def update_market(self, market_update: Dict, kalshi_client, min_time_buffer_minutes: int = 15) -> Optional[Dict]:
+        """
+        Merge a streamed price update into one tracked market and re-normalize it if it changed
+        
+        Args:
+            market_update: Dict with 'ticker' plus any of the tracked fields (yes_bid, no_bid, ...)
+            kalshi_client: Client used to normalize the market
+            min_time_buffer_minutes: Live-game buffer passed through to normalization
+        
+        Returns:
+            The re-normalized game, or None if the market is untracked or unchanged
+        """
+        ticker = market_update.get('ticker')
+        snapshot = self._snapshots.get(ticker)
+        if snapshot is None or snapshot['game'] is None:
+            return None
+        
+        raw_market = dict(snapshot['market'])
+        raw_market.update({field: value for field, value in market_update.items() if field in self.TRACKED_FIELDS})
+        fingerprint = self._fingerprint(raw_market)
+        if fingerprint == snapshot['fingerprint']:
+            return None
+        
+        seen_at = datetime.now(timezone.utc).isoformat()
+        normalized = kalshi_client.normalize_kalshi_data(
+            {'success': True, 'data': [raw_market], 'timestamp': seen_at}, min_time_buffer_minutes
+        )
+        game = normalized[0] if normalized else None
+        snapshot.update({
+            'fingerprint': fingerprint,
+            'market': raw_market,
+            'game': game,
+            'filter_epoch': self._filter_epoch_for(game) if game else None,
+            'last_seen': seen_at
+        })
+        return game
+    
+    def get_all_games(self) -> List[Dict]:
+        """Get every currently valid normalized game held in the store"""
+        return [snapshot['game'] for snapshot in self._snapshots.values() if snapshot['game'] is not None]
+
+    def get_game(self, ticker: str) -> Optional[Dict]:
+        """Get the last normalized game for a ticker"""
+        snapshot = self._snapshots.get(ticker)
+        return snapshot['game'] if snapshot else None
+
+    def reset(self):
+        """Forget all snapshots so the next refresh re-normalizes everything"""
+        self._snapshots.clear()
@@ -1,10 +1,16 @@
 """
 Odds Conversion Utilities
 Production-ready module for converting between different odds formats
+
+Pipeline code converts whole slates through the *_batch methods. Scalar converters left
+outside this module on purpose: kalshi_converter's fee-adjusted cents lookup table (its
+values differ from the price formula) and the page-scraping Polymarket clients
+(polymarket/client.py, final_client.py), which convert one game per rate-limited request.
 """
 
-from typing import Dict, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 import math
+import numpy as np
 
 class OddsConverter:
     """Utility class for converting between different odds formats"""
@@ -163,6 +169,96 @@ class OddsConverter:
             "implied_probability": probability
         }
     
+    @staticmethod
+    def prices_to_american_batch(prices: Sequence[float]) -> np.ndarray:
+        """
+        Convert prediction-market prices to American odds in one pass
+        
+        Same rule as the Kalshi client: prices outside (0, 1) are treated as 0.5,
+        and odds are truncated toward zero.
+        
+        Args:
+            prices: Prices as probabilities (0.0-1.0, e.g., 0.45 for 45 cents)
+            
+        Returns:
+            Integer array of American odds
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        prices = np.where((prices <= 0) | (prices >= 1), 0.5, prices)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            american = np.where(prices >= 0.5,
+                                -100 * prices / (1 - prices),
+                                100 * (1 - prices) / prices)
+        return np.trunc(american).astype(np.int64)
+    
+    @staticmethod
+    def convert_batch(american_odds: Optional[Sequence[int]] = None,
+                      prices: Optional[Sequence[float]] = None) -> Dict[str, np.ndarray]:
+        """
+        Convert a batch of American odds or market prices to every format at once
+        
+        Args:
+            american_odds: American odds (e.g., [+150, -110])
+            prices: Prediction-market prices (0.0-1.0); used when american_odds is None
+            
+        Returns:
+            Dictionary of equal-length arrays: american, decimal, implied_probability
+        """
+        if american_odds is None:
+            american = OddsConverter.prices_to_american_batch(prices if prices is not None else [])
+        else:
+            american = np.asarray(american_odds, dtype=np.int64)
+        
+        with np.errstate(divide='ignore'):
+            decimal = np.where(american > 0, american / 100 + 1, 100 / np.abs(american) + 1)
+        
+        return {
+            "american": american,
+            "decimal": decimal,
+            "implied_probability": 1 / decimal
+        }
+    
+    @staticmethod
+    def vig_free_batch(home_probabilities: Sequence[float], away_probabilities: Sequence[float]) -> tuple:
+        """
+        Remove the bookmaker margin from paired implied probabilities
+        
+        Args:
+            home_probabilities: Home-side implied probabilities
+            away_probabilities: Away-side implied probabilities
+            
+        Returns:
+            Tuple of (home, away) arrays that sum to 1.0 per pair
+        """
+        home = np.asarray(home_probabilities, dtype=np.float64)
+        away = np.asarray(away_probabilities, dtype=np.float64)
+        total = home + away
+        return home / total, away / total
+    
+    @staticmethod
+    def create_paired_odds_objects(home: Dict[str, np.ndarray], away: Dict[str, np.ndarray],
+                                   factory: Callable[..., Any] = dict) -> List[tuple]:
+        """
+        Build (home_odds, away_odds) objects for a batch, including vig-free probabilities
+        
+        Args:
+            home: convert_batch result for the home sides
+            away: convert_batch result for the away sides
+            factory: Called with the odds fields as keyword arguments (dict or a record type)
+            
+        Returns:
+            List of (home_odds, away_odds) objects with native Python numbers
+        """
+        home_fair, away_fair = OddsConverter.vig_free_batch(home["implied_probability"], away["implied_probability"])
+        home_columns = zip(home["american"].tolist(), home["decimal"].tolist(),
+                           home["implied_probability"].tolist(), home_fair.tolist())
+        away_columns = zip(away["american"].tolist(), away["decimal"].tolist(),
+                           away["implied_probability"].tolist(), away_fair.tolist())
+        
+        return [(factory(american=h[0], decimal=h[1], implied_probability=h[2], vig_free_probability=h[3]),
+                 factory(american=a[0], decimal=a[1], implied_probability=a[2], vig_free_probability=a[3]))
+                for h, a in zip(home_columns, away_columns)]
+    
     @staticmethod
     def validate_conversion_examples() -> bool:
         """
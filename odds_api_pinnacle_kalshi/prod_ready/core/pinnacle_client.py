@@ -12,7 +12,15 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.timestamp_utils import simplify_timestamp, simplify_date, parse_game_time_safe, format_display_time
+from utils.timestamp_utils import (simplify_timestamp, simplify_date, parse_game_time_safe, format_display_time,
+                                   parse_epoch, is_future_epoch, to_epoch)
+from utils.http_transport import HttpTransport, get_shared_transport
+from utils.team_resolver import get_team_resolver
+from utils.odds_api_scheduler import OddsApiScheduler, get_shared_scheduler, estimate_request_cost
+from utils.metrics import get_metrics
+from utils.console import console
+from core.odds_converter import OddsConverter
+from core.game_record import GameRecord, OddsQuote, RawPayloadStore
 from config.sports_config import get_sport_config, get_available_sports
 
 class PinnacleClient:
@@ -27,10 +35,16 @@ class PinnacleClient:
                 sport_map[sport_key] = config.pinnacle_key
         return sport_map
     
-    def __init__(self, api_key_file: str):
-        """Initialize Pinnacle client with OddsAPI key"""
+    def __init__(self, api_key_file: Optional[str], http_transport: Optional[HttpTransport] = None,
+                 scheduler: Optional[OddsApiScheduler] = None):
+        """Initialize Pinnacle client with OddsAPI key (None for offline normalization only)"""
         self.base_url = "https://api.the-odds-api.com/v4"
-        self.api_key = self._load_api_key(api_key_file)
+        self.api_key = self._load_api_key(api_key_file) if api_key_file else None
+        self.http = http_transport or get_shared_transport()
+        self.scheduler = scheduler or get_shared_scheduler()
+        self.team_resolver = get_team_resolver()
+        self.raw_payloads = RawPayloadStore()  # game_id -> raw Odds API event
+        self.metrics = get_metrics()
         self.bookmaker = "pinnacle"
         self.market = "h2h"  # Head-to-head (moneyline)
         self.region = "us"
@@ -70,19 +84,25 @@ class PinnacleClient:
         }
         
         try:
-            print(f"Fetching Pinnacle {sport_type.upper()} odds...")
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            print(f"Successfully fetched {len(data)} {sport_type.upper()} games from Pinnacle")
+            console(f"Fetching Pinnacle {sport_type.upper()} odds...")
+            data, from_cache, fetched_at = self.scheduler.get_json_entry(
+                url, params, self._request_key(sport_type), self.http.get,
+                request_cost=self._request_cost()
+            )
+            # Cached data can be up to the budget-stretched poll interval old; report when it was quoted
+            data_age = max(0.0, time.time() - fetched_at)
+            source = f"cache ({data_age:.0f}s old)" if from_cache else "Pinnacle"
+            console(f"Successfully fetched {len(data)} {sport_type.upper()} games from {source}")
             
             return {
                 'success': True,
                 'data': data,
                 'sport_type': sport_type,
-                'timestamp': datetime.now(timezone.utc).isoformat(),
-                'source': 'pinnacle_odds_api'
+                'timestamp': datetime.fromtimestamp(fetched_at, timezone.utc).isoformat(),
+                'source': 'pinnacle_odds_api',
+                'from_cache': from_cache,
+                'data_age_seconds': round(data_age, 1),
+                'quota': self.scheduler.get_stats()
             }
             
         except requests.exceptions.RequestException as e:
@@ -94,6 +114,18 @@ class PinnacleClient:
                 'timestamp': datetime.now(timezone.utc).isoformat()
             }
     
+    def _request_key(self, sport_type: str) -> tuple:
+        """Cache key shared by equivalent odds requests"""
+        return (sport_type, self.market, self.bookmaker, self.region)
+    
+    def _request_cost(self) -> int:
+        """Estimated quota cost of one odds request"""
+        return estimate_request_cost(self.market, self.region, self.bookmaker)
+    
+    def get_poll_interval(self, sport_type: str) -> float:
+        """Minimum seconds between odds fetches for a sport that keeps within the daily quota budget"""
+        return self.scheduler.poll_interval(self._request_key(sport_type), self._request_cost())
+    
     def get_mlb_odds(self) -> Dict:
         """Legacy method - fetch MLB odds"""
         return self.get_sports_odds('mlb')
@@ -159,15 +191,20 @@ class PinnacleClient:
             'timestamp': odds_data.get('timestamp')
         }
     
-    def normalize_pinnacle_data(self, raw_data: Dict, min_time_buffer_minutes: int = 15) -> List[Dict]:
-        """Convert Pinnacle API response to normalized schema, filtering out live games"""
+    def normalize_pinnacle_data(self, raw_data: Dict, min_time_buffer_minutes: int = 15,
+                                as_of: Optional[datetime] = None) -> List[Dict]:
+        """Convert Pinnacle API response to normalized schema, filtering out live games
+        (relative to as_of when replaying a recorded response, otherwise now)"""
         if not raw_data.get('success'):
             return []
         
         sport_type = raw_data.get('sport_type', 'unknown').upper()
         normalized_games = []
-        now = datetime.now(timezone.utc)
+        home_prices = []
+        away_prices = []
+        now_epoch = to_epoch(as_of)
         live_games_filtered = 0
+        skipped_games = 0
         
         for game in raw_data.get('data', []):
             try:
@@ -176,9 +213,10 @@ class PinnacleClient:
                 home_team = game.get('home_team')
                 away_team = game.get('away_team')
                 game_time = game.get('commence_time')
+                game_epoch = parse_epoch(game_time)
                 
                 # Skip games that have already started or are starting soon
-                if not self._is_future_game(game_time, min_time_buffer_minutes):
+                if not is_future_epoch(game_epoch, min_time_buffer_minutes, now_epoch):
                     live_games_filtered += 1
                     continue
                 
@@ -190,7 +228,8 @@ class PinnacleClient:
                         break
                 
                 if not pinnacle_data:
-                    print(f"No Pinnacle data found for game: {home_team} vs {away_team}")
+                    console(f"No Pinnacle data found for game: {home_team} vs {away_team}")
+                    skipped_games += 1
                     continue
                 
                 # Extract moneyline odds
@@ -201,168 +240,89 @@ class PinnacleClient:
                         break
                 
                 if not h2h_market or len(h2h_market.get('outcomes', [])) < 2:
-                    print(f"No valid moneyline market for: {home_team} vs {away_team}")
+                    console(f"No valid moneyline market for: {home_team} vs {away_team}")
+                    skipped_games += 1
                     continue
                 
                 # Map outcomes to home/away
-                home_odds = None
-                away_odds = None
+                home_american = None
+                away_american = None
                 
                 for outcome in h2h_market['outcomes']:
                     team_name = outcome.get('name')
                     american_odds = outcome.get('price')
                     
                     if team_name == home_team:
-                        home_odds = self._create_odds_object(american_odds)
+                        home_american = american_odds
                     elif team_name == away_team:
-                        away_odds = self._create_odds_object(american_odds)
+                        away_american = american_odds
                 
-                if not home_odds or not away_odds:
-                    print(f"Missing odds for game: {home_team} vs {away_team}")
+                if not home_american or not away_american:
+                    console(f"Missing odds for game: {home_team} vs {away_team}")
+                    skipped_games += 1
                     continue
                 
-                # Create normalized game object with simplified timestamps
-                normalized_game = {
-                    "game_id": game_id,
-                    "game_date": simplify_date(game_time),
-                    "game_time": simplify_timestamp(game_time),
-                    "game_time_display": format_display_time(game_time),
-                    "sport": sport_type,
-                    "home_team": self._standardize_team_name(home_team, sport_type.lower()),
-                    "away_team": self._standardize_team_name(away_team, sport_type.lower()),
-                    "source": "pinnacle",
-                    "home_odds": home_odds,
-                    "away_odds": away_odds,
-                    "metadata": {
+                # Create normalized game record with simplified timestamps; odds are filled in per batch below
+                normalized_game = GameRecord(
+                    game_id=game_id,
+                    game_date=simplify_date(game_time),
+                    game_time=simplify_timestamp(game_time),
+                    game_time_display=format_display_time(game_time),
+                    sport=sport_type,
+                    home_team=self._standardize_team_name(home_team, sport_type.lower()),
+                    away_team=self._standardize_team_name(away_team, sport_type.lower()),
+                    source="pinnacle",
+                    game_epoch=game_epoch,
+                    metadata={
                         "last_updated": raw_data.get('timestamp'),
                         "bookmaker": "pinnacle",
                         "market_type": "moneyline",
-                        "raw_data": game,
                         "original_game_time": game_time
                     }
-                }
+                )
                 
                 normalized_games.append(normalized_game)
+                self.raw_payloads.put(game_id, game)
+                home_prices.append(int(home_american))
+                away_prices.append(int(away_american))
                 
             except Exception as e:
-                print(f"Error normalizing game data: {e}")
+                console(f"Error normalizing game data: {e}")
+                skipped_games += 1
                 continue
         
+        # Convert every game's moneyline in one vectorized pass
+        paired_odds = OddsConverter.create_paired_odds_objects(
+            OddsConverter.convert_batch(american_odds=home_prices),
+            OddsConverter.convert_batch(american_odds=away_prices),
+            factory=OddsQuote
+        )
+        for normalized_game, (home_odds, away_odds) in zip(normalized_games, paired_odds):
+            normalized_game.home_odds = home_odds
+            normalized_game.away_odds = away_odds
+        
+        sport_label = sport_type.lower()
+        self.metrics.inc('games_normalized_total', len(normalized_games), platform='pinnacle', sport=sport_label)
+        self.metrics.inc('games_filtered_live_total', live_games_filtered, platform='pinnacle', sport=sport_label)
+        self.metrics.inc('normalize_errors_total', skipped_games, platform='pinnacle', sport=sport_label)
+        
         if live_games_filtered > 0:
-            print(f"Filtered out {live_games_filtered} live/starting games from Pinnacle")
-        print(f"Successfully normalized {len(normalized_games)} future games from Pinnacle")
+            console(f"Filtered out {live_games_filtered} live/starting games from Pinnacle")
+        console(f"Successfully normalized {len(normalized_games)} future games from Pinnacle")
         return normalized_games
     
-    def _is_future_game(self, game_time_str: str, min_buffer_minutes: int = 15) -> bool:
-        """Check if game is in the future with minimum buffer using safe parsing"""
-        return parse_game_time_safe(game_time_str, min_buffer_minutes)
-    
-    def _create_odds_object(self, american_odds: int) -> Dict:
-        """Convert American odds to full odds object"""
-        decimal_odds = self._american_to_decimal(american_odds)
-        implied_prob = self._decimal_to_probability(decimal_odds)
-        
-        return {
-            "american": american_odds,
-            "decimal": decimal_odds,
-            "implied_probability": implied_prob
-        }
-    
-    def _american_to_decimal(self, american_odds: int) -> float:
-        """Convert American odds to decimal odds"""
-        if american_odds > 0:
-            return (american_odds / 100) + 1
-        else:
-            return (100 / abs(american_odds)) + 1
+    def get_raw_payload(self, game_id: str) -> Optional[Dict]:
+        """Get the raw Odds API event behind a normalized game"""
+        return self.raw_payloads.get(game_id)
     
-    def _decimal_to_probability(self, decimal_odds: float) -> float:
-        """Convert decimal odds to implied probability"""
-        return 1 / decimal_odds
+    def _is_future_game(self, game_time_str: str, min_buffer_minutes: int = 15,
+                        as_of: Optional[datetime] = None) -> bool:
+        """Check if game is in the future with minimum buffer using safe parsing"""
+        return parse_game_time_safe(game_time_str, min_buffer_minutes, as_of)
     
     def _standardize_team_name(self, team_name: str, sport: str = 'unknown') -> str:
         """Standardize team names for consistent matching across all sports"""
-        team_name = team_name.strip()
-        
-        # MLB team mappings
-        mlb_mappings = {
-            "Los Angeles Angels": "LAA", "Angels": "LAA",
-            "Houston Astros": "HOU", "Astros": "HOU",
-            "Oakland Athletics": "OAK", "Athletics": "OAK", "A's": "OAK",
-            "Toronto Blue Jays": "TOR", "Blue Jays": "TOR",
-            "Atlanta Braves": "ATL", "Braves": "ATL",
-            "Milwaukee Brewers": "MIL", "Brewers": "MIL",
-            "St. Louis Cardinals": "STL", "Cardinals": "STL",
-            "Chicago Cubs": "CHC", "Cubs": "CHC",
-            "Arizona Diamondbacks": "ARI", "Diamondbacks": "ARI",
-            "Colorado Rockies": "COL", "Rockies": "COL",
-            "Los Angeles Dodgers": "LAD", "Dodgers": "LAD",
-            "San Diego Padres": "SD", "Padres": "SD",
-            "San Francisco Giants": "SF", "Giants": "SF",
-            "Miami Marlins": "MIA", "Marlins": "MIA",
-            "New York Mets": "NYM", "Mets": "NYM",
-            "Philadelphia Phillies": "PHI", "Phillies": "PHI",
-            "Pittsburgh Pirates": "PIT", "Pirates": "PIT",
-            "Washington Nationals": "WSH", "Nationals": "WSH",
-            "Chicago White Sox": "CWS", "White Sox": "CWS",
-            "Cleveland Guardians": "CLE", "Guardians": "CLE",
-            "Detroit Tigers": "DET", "Tigers": "DET",
-            "Kansas City Royals": "KC", "Royals": "KC",
-            "Minnesota Twins": "MIN", "Twins": "MIN",
-            "New York Yankees": "NYY", "Yankees": "NYY",
-            "Baltimore Orioles": "BAL", "Orioles": "BAL",
-            "Boston Red Sox": "BOS", "Red Sox": "BOS",
-            "Tampa Bay Rays": "TB", "Rays": "TB",
-            "Texas Rangers": "TEX", "Rangers": "TEX",
-            "Seattle Mariners": "SEA", "Mariners": "SEA"
-        }
-        
-        # NFL team mappings  
-        nfl_mappings = {
-            "Arizona Cardinals": "ARI", "Cardinals": "ARI",
-            "Atlanta Falcons": "ATL", "Falcons": "ATL",
-            "Baltimore Ravens": "BAL", "Ravens": "BAL",
-            "Buffalo Bills": "BUF", "Bills": "BUF",
-            "Carolina Panthers": "CAR", "Panthers": "CAR",
-            "Chicago Bears": "CHI", "Bears": "CHI",
-            "Cincinnati Bengals": "CIN", "Bengals": "CIN",
-            "Cleveland Browns": "CLE", "Browns": "CLE",
-            "Dallas Cowboys": "DAL", "Cowboys": "DAL",
-            "Denver Broncos": "DEN", "Broncos": "DEN",
-            "Detroit Lions": "DET", "Lions": "DET",
-            "Green Bay Packers": "GB", "Packers": "GB",
-            "Houston Texans": "HOU", "Texans": "HOU",
-            "Indianapolis Colts": "IND", "Colts": "IND",
-            "Jacksonville Jaguars": "JAX", "Jaguars": "JAX",
-            "Kansas City Chiefs": "KC", "Chiefs": "KC",
-            "Las Vegas Raiders": "LV", "Raiders": "LV",
-            "Los Angeles Chargers": "LAC", "Chargers": "LAC",
-            "Los Angeles Rams": "LAR", "Rams": "LAR",
-            "Miami Dolphins": "MIA", "Dolphins": "MIA",
-            "Minnesota Vikings": "MIN", "Vikings": "MIN",
-            "New England Patriots": "NE", "Patriots": "NE",
-            "New Orleans Saints": "NO", "Saints": "NO",
-            "New York Giants": "NYG", "Giants": "NYG",
-            "New York Jets": "NYJ", "Jets": "NYJ",
-            "Philadelphia Eagles": "PHI", "Eagles": "PHI",
-            "Pittsburgh Steelers": "PIT", "Steelers": "PIT",
-            "San Francisco 49ers": "SF", "49ers": "SF",
-            "Seattle Seahawks": "SEA", "Seahawks": "SEA",
-            "Tampa Bay Buccaneers": "TB", "Buccaneers": "TB",
-            "Tennessee Titans": "TEN", "Titans": "TEN",
-            "Washington Commanders": "WAS", "Commanders": "WAS"
-        }
-        
-        # Select appropriate mapping based on sport
-        if sport == 'mlb':
-            return mlb_mappings.get(team_name, team_name)
-        elif sport == 'nfl':
-            return nfl_mappings.get(team_name, team_name)
-        else:
-            # Try all mappings if sport unknown
-            for mapping in [mlb_mappings, nfl_mappings]:
-                if team_name in mapping:
-                    return mapping[team_name]
-            return team_name
+        return self.team_resolver.standardize(team_name, sport)
 
 # Test function for development
 def test_pinnacle_client():
@@ -380,7 +340,7 @@ def test_pinnacle_client():
         print(f"\n=== NORMALIZED GAMES: {len(normalized_games)} ===")
         
         if normalized_games:
-            print(json.dumps(normalized_games[0], indent=2))
+            print(json.dumps(normalized_games[0].to_dict(), indent=2))
         
         return normalized_games
         
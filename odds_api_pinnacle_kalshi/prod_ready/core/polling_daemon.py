@@ -0,0 +1,376 @@
+"""
+Polling Daemon - Continuous mispricing detection with warm clients
+Polls each sport on its own cadence and emits only new, changed or closed opportunities
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.main_system import MispricingSystem
+from core.market_snapshot import KalshiSnapshotStore
+from utils.results_writer import ResultsStreamWriter
+from utils.console import console
+from config.sports_config import get_sport_config, get_current_season_sports
+
+class _SportState:
+    """Everything carried from one polling cycle of a sport to the next"""
+
+    def __init__(self):
+        self.kalshi_store = KalshiSnapshotStore()
+        self.pinnacle_fingerprints: Dict[str, tuple] = {}
+        self.pairs: Dict[str, Dict] = {}  # pinnacle game_id -> aligned game
+        self.pinnacle_id_by_kalshi: Dict[str, str] = {}  # kalshi game_id -> pinnacle game_id
+        self.opportunities: Dict[Tuple[str, str], Dict] = {}  # (pinnacle id, kalshi id) -> opportunity
+        self.cycles = 0
+        self.last_cycle_at: Optional[str] = None
+
+class MispricingDaemon:
+    """Long-running poller that keeps clients and per-sport state warm between cycles"""
+
+    # Edge movement below this is not reported as a change
+    EDGE_CHANGE_THRESHOLD = 0.0005
+
+    def __init__(self, system: Optional[MispricingSystem] = None, sports: Optional[List[str]] = None,
+                 poll_intervals: Optional[Dict[str, float]] = None, default_interval: Optional[float] = None,
+                 output_path: Optional[str] = None):
+        """
+        Initialize the daemon
+
+        Args:
+            system: Initialized MispricingSystem whose clients are reused every cycle
+            sports: Sports to poll (defaults to sports currently in season)
+            poll_intervals: Optional {sport: seconds} cadence overrides
+            default_interval: Cadence for sports without an override (defaults to config)
+            output_path: NDJSON file to append events to (prints events when None)
+        """
+        self.system = system or MispricingSystem({'save_results_to_file': False})
+        self.sports = [s for s in (sports or get_current_season_sports()) if get_sport_config(s)]
+
+        default_interval = default_interval or self.system.config.get('daemon_poll_interval_seconds', 30)
+        poll_intervals = poll_intervals or {}
+        self.poll_intervals = {sport: poll_intervals.get(sport, default_interval) for sport in self.sports}
+
+        self.output_path = output_path
+        self.event_writer = ResultsStreamWriter(
+            output_path,
+            max_bytes=self.system.config.get('results_max_bytes'),
+            backup_count=self.system.config.get('results_backup_count', 5),
+            compress=self.system.config.get('results_compress_rotated', False)
+        ) if output_path else None
+        self.states = {sport: _SportState() for sport in self.sports}
+        self.events_emitted = 0
+
+        self._stop_event = threading.Event()
+        self._fetch_pool = ThreadPoolExecutor(max_workers=2)
+        # Serializes cycle processing with streamed Kalshi ticks (apply_kalshi_tick runs on the feed thread)
+        self._state_lock = threading.Lock()
+
+    def _odds_fingerprint(self, game: Dict) -> tuple:
+        """Comparison key for a normalized game's prices"""
+        return (
+            game.get('home_odds', {}).get('american'),
+            game.get('away_odds', {}).get('american'),
+            game.get('game_date'),
+            game.get('game_time')
+        )
+
+    def run_cycle(self, sport: str) -> List[Dict]:
+        """
+        Run one polling cycle for a sport, reusing the previous cycle's state
+
+        Args:
+            sport: Sport key to poll
+
+        Returns:
+            List of emitted events (new/changed/closed opportunities)
+        """
+        # Fetch both platforms at once over the warm connections (ticks keep flowing meanwhile)
+        pinnacle_future = self._fetch_pool.submit(self.system.pinnacle_client.get_sports_odds, sport)
+        kalshi_future = self._fetch_pool.submit(self.system.kalshi_client.search_sports_markets, sport)
+        pinnacle_raw = pinnacle_future.result()
+        kalshi_raw = kalshi_future.result()
+
+        if not pinnacle_raw.get('success') or not kalshi_raw.get('success'):
+            error = pinnacle_raw.get('error') if not pinnacle_raw.get('success') else kalshi_raw.get('error')
+            print(f"[{sport.upper()}] Fetch failed, keeping previous state: {error}")
+            return []
+        self.system.record_snapshot(sport, pinnacle_raw, kalshi_raw)
+
+        with self._state_lock:
+            return self._process_cycle(sport, pinnacle_raw, kalshi_raw)
+
+    def _process_cycle(self, sport: str, pinnacle_raw: Dict, kalshi_raw: Dict) -> List[Dict]:
+        """Diff a successful fetch against the sport's state and emit events (caller holds _state_lock)"""
+        state = self.states[sport]
+        game_matcher, mispricing_detector = self.system._get_sport_tools(sport)
+        time_buffer = self.system.config.get('min_time_buffer_minutes', 15)
+        timed_stage = self.system._timed_stage
+        stage_seconds = {}
+
+        # Kalshi: only changed markets are re-normalized
+        kalshi_delta = timed_stage(sport, 'normalize_kalshi', stage_seconds,
+                                   state.kalshi_store.refresh, kalshi_raw, self.system.kalshi_client, time_buffer)
+        changed_kalshi_ids = {game['game_id'] for game in kalshi_delta['changed']}
+        self.system.record_ticks('kalshi', kalshi_delta['changed'], kalshi_raw.get('timestamp'))
+        kalshi_by_id = {game['game_id']: game for game in state.kalshi_store.get_all_games()}
+
+        # Pinnacle: a single request per sport, so normalize it all and diff the prices
+        pinnacle_games = timed_stage(sport, 'normalize_pinnacle', stage_seconds,
+                                     self.system.pinnacle_client.normalize_pinnacle_data, pinnacle_raw, time_buffer)
+        pinnacle_by_id = {game['game_id']: game for game in pinnacle_games}
+        fingerprints = {game_id: self._odds_fingerprint(game) for game_id, game in pinnacle_by_id.items()}
+        changed_pinnacle_ids = {
+            game_id for game_id, fingerprint in fingerprints.items()
+            if state.pinnacle_fingerprints.get(game_id) != fingerprint
+        }
+        state.pinnacle_fingerprints = fingerprints
+        self.system.record_ticks('pinnacle', [pinnacle_by_id[game_id] for game_id in changed_pinnacle_ids],
+                                 pinnacle_raw.get('timestamp'))
+
+        # Keep last cycle's pairings while both games are still listed, refreshed with current data
+        aligned = {}
+        for pinnacle_id, previous in state.pairs.items():
+            kalshi_id = previous['kalshi_data']['game_id']
+            if pinnacle_id in pinnacle_by_id and kalshi_id in kalshi_by_id:
+                aligned[pinnacle_id] = dict(
+                    previous,
+                    pinnacle_data=pinnacle_by_id[pinnacle_id],
+                    kalshi_data=kalshi_by_id[kalshi_id]
+                )
+
+        # Only games without a pairing go through the matcher
+        new_pair_ids = set()
+        paired_kalshi_ids = {pair['kalshi_data']['game_id'] for pair in aligned.values()}
+        unpaired_pinnacle = [game for game_id, game in pinnacle_by_id.items() if game_id not in aligned]
+        unpaired_kalshi = [game for game_id, game in kalshi_by_id.items() if game_id not in paired_kalshi_ids]
+        if unpaired_pinnacle and unpaired_kalshi:
+            for pair in timed_stage(sport, 'align', stage_seconds,
+                                    game_matcher.align_games, unpaired_pinnacle, unpaired_kalshi):
+                pinnacle_id = pair['pinnacle_data']['game_id']
+                aligned[pinnacle_id] = pair
+                new_pair_ids.add(pinnacle_id)
+
+        for pinnacle_id, pair in aligned.items():
+            # Stable ids so the same matchup keeps the same opportunity_id across cycles
+            pair['match_id'] = f"{pinnacle_id}__{pair['kalshi_data']['game_id']}"
+        state.pairs = aligned
+        state.pinnacle_id_by_kalshi = {pair['kalshi_data']['game_id']: pinnacle_id for pinnacle_id, pair in aligned.items()}
+
+        # Re-detect only pairs where a price moved or the pairing is new
+        opportunities = {}
+        dirty_pairs = []
+        for pinnacle_id, pair in aligned.items():
+            key = (pinnacle_id, pair['kalshi_data']['game_id'])
+            if pinnacle_id in new_pair_ids or pinnacle_id in changed_pinnacle_ids or key[1] in changed_kalshi_ids:
+                dirty_pairs.append(pair)
+            elif key in state.opportunities:
+                opportunities[key] = state.opportunities[key]
+
+        if dirty_pairs:
+            dirty_pairs = self._price_depth(sport, dirty_pairs, stage_seconds)
+            for opportunity in timed_stage(sport, 'detect', stage_seconds,
+                                           mispricing_detector.detect_opportunities, dirty_pairs):
+                pair = opportunity['game_data']
+                opportunities[(pair['pinnacle_data']['game_id'], pair['kalshi_data']['game_id'])] = opportunity
+
+        events = self._diff_opportunities(sport, state.opportunities, opportunities)
+        state.opportunities = opportunities
+        state.cycles += 1
+        state.last_cycle_at = datetime.now(timezone.utc).isoformat()
+
+        console(f"[{sport.upper()}] cycle {state.cycles}: {len(pinnacle_by_id)} Pinnacle / {len(kalshi_by_id)} Kalshi games, "
+                f"{len(aligned)} aligned ({len(new_pair_ids)} new), {len(dirty_pairs)} re-checked, "
+                f"{len(opportunities)} open opportunities, {len(events)} events")
+        self.system.metrics.inc('pipeline_runs_total', sport=sport, status='daemon_cycle')
+        self.system.write_metrics()
+
+        self._emit(events)
+        return events
+
+    def apply_kalshi_tick(self, sport: str, update: Dict) -> List[Dict]:
+        """
+        Re-evaluate only the aligned game affected by a streamed Kalshi ticker update
+        
+        Safe to call from the Kalshi feed thread while run() is polling: ticks and cycle
+        processing take turns on the same lock.
+        
+        Args:
+            sport: Sport the market belongs to
+            update: Market state from the Kalshi WebSocket price book
+                    (market_ticker plus yes_bid / no_bid in cents)
+        
+        Returns:
+            List of emitted events for the affected game
+        """
+        state = self.states.get(sport)
+        if state is None:
+            return []
+        
+        with self._state_lock:
+            return self._apply_kalshi_tick(sport, state, update)
+    
+    def _apply_kalshi_tick(self, sport: str, state: _SportState, update: Dict) -> List[Dict]:
+        """Body of apply_kalshi_tick (caller holds _state_lock)"""
+        market_update = {'ticker': update.get('market_ticker') or update.get('ticker')}
+        for field in KalshiSnapshotStore.TRACKED_FIELDS:
+            if field in update:
+                market_update[field] = update[field]
+        
+        time_buffer = self.system.config.get('min_time_buffer_minutes', 15)
+        game = state.kalshi_store.update_market(market_update, self.system.kalshi_client, time_buffer)
+        if game is None:
+            return []
+        self.system.record_ticks('kalshi', [game])
+        
+        pinnacle_id = state.pinnacle_id_by_kalshi.get(game['game_id'])
+        if pinnacle_id is None:
+            return []
+        
+        pair = dict(state.pairs[pinnacle_id], kalshi_data=game)
+        state.pairs[pinnacle_id] = pair
+        key = (pinnacle_id, game['game_id'])
+        
+        _, mispricing_detector = self.system._get_sport_tools(sport)
+        detected = mispricing_detector.detect_opportunities(self._price_depth(sport, [pair], {}))
+        
+        previous = {key: state.opportunities[key]} if key in state.opportunities else {}
+        current = {key: detected[0]} if detected else {}
+        events = self._diff_opportunities(sport, previous, current)
+        
+        state.opportunities.pop(key, None)
+        state.opportunities.update(current)
+        self._emit(events)
+        return events
+    
+    def _price_depth(self, sport: str, pairs: List[Dict], stage_seconds: Dict) -> List[Dict]:
+        """Reprice pairs about to be detected at the depth stake's fill prices (when depth pricing is on)"""
+        if self.system.depth_pricer is None:
+            return pairs
+        return self.system._timed_stage(sport, 'depth', stage_seconds,
+                                        self.system.depth_pricer.reprice_aligned_games, pairs)
+    
+    def _diff_opportunities(self, sport: str, previous: Dict, current: Dict) -> List[Dict]:
+        """Build events for opportunities that appeared, moved or disappeared"""
+        events = []
+        for key, opportunity in current.items():
+            before = previous.get(key)
+            if before is None:
+                events.append(self._build_event('new', sport, opportunity))
+            elif before is not opportunity and self._opportunity_changed(before, opportunity):
+                events.append(self._build_event('changed', sport, opportunity, before))
+        for key in previous.keys() - current.keys():
+            events.append(self._build_event('closed', sport, previous[key]))
+        return events
+
+    def _opportunity_changed(self, before: Dict, after: Dict) -> bool:
+        """Check whether an opportunity moved enough to report"""
+        if before['discrepancy']['recommended_side'] != after['discrepancy']['recommended_side']:
+            return True
+        edge_move = abs(before['discrepancy']['max_edge'] - after['discrepancy']['max_edge'])
+        return edge_move >= self.EDGE_CHANGE_THRESHOLD
+
+    def _build_event(self, event_type: str, sport: str, opportunity: Dict, previous: Optional[Dict] = None) -> Dict:
+        """Compact, JSON-serializable event for an opportunity"""
+        pinnacle = opportunity['pinnacle_odds']
+        kalshi = opportunity['kalshi_odds']
+        event = {
+            'event': event_type,
+            'sport': sport.upper(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'opportunity_id': opportunity['opportunity_id'],
+            'matchup': f"{pinnacle['away_team']} @ {pinnacle['home_team']}",
+            'game_time': pinnacle.get('game_time_display', pinnacle.get('game_time')),
+            'max_edge': round(opportunity['discrepancy']['max_edge'], 4),
+            'recommended_side': opportunity['discrepancy']['recommended_side'],
+            'expected_value': round(opportunity['profit_analysis']['expected_value'], 4),
+            'kelly_fraction': round(opportunity['profit_analysis']['kelly_fraction'], 4),
+            'pinnacle_american': {
+                'home': pinnacle['home_odds'].get('american'),
+                'away': pinnacle['away_odds'].get('american')
+            },
+            'kalshi_american': {
+                'home': kalshi['home_odds'].get('american'),
+                'away': kalshi['away_odds'].get('american')
+            }
+        }
+        execution = opportunity.get('execution')
+        if execution is not None:
+            event['fillable_stake'] = execution['fillable_stake']
+            event['fully_fillable'] = execution['fully_fillable']
+        if previous is not None:
+            event['previous_edge'] = round(previous['discrepancy']['max_edge'], 4)
+        return event
+
+    def _emit(self, events: List[Dict]):
+        """Append events as NDJSON to the output file, or print them"""
+        if not events:
+            return
+        self.events_emitted += len(events)
+
+        if self.event_writer:
+            self.event_writer.write_many(events)
+            return
+
+        for event in events:
+            line = f"  {event['event'].upper():7s} {event['sport']} {event['matchup']}: edge {event['max_edge']:.1%} on {event['recommended_side']}"
+            if 'previous_edge' in event:
+                line += f" (was {event['previous_edge']:.1%})"
+            print(line)
+
+    def _next_interval(self, sport: str) -> float:
+        """Configured cadence, stretched when the Odds API daily budget cannot sustain it"""
+        budget_interval = self.system.pinnacle_client.get_poll_interval(sport)
+        return max(self.poll_intervals[sport], budget_interval)
+
+    def run(self, max_cycles: Optional[int] = None):
+        """
+        Poll until stopped
+
+        Args:
+            max_cycles: Stop after this many scheduling passes (runs forever when None)
+        """
+        print(f"Starting mispricing daemon for: {', '.join(s.upper() for s in self.sports)}")
+        for sport, interval in self.poll_intervals.items():
+            print(f"  {sport.upper()}: every {interval}s")
+        if self.output_path:
+            print(f"  Events -> {self.output_path}")
+
+        next_due = {sport: 0.0 for sport in self.sports}
+        passes = 0
+        try:
+            while not self._stop_event.is_set() and self.sports:
+                now = time.monotonic()
+                for sport in self.sports:
+                    if next_due[sport] > now:
+                        continue
+                    try:
+                        self.run_cycle(sport)
+                    except Exception as e:
+                        print(f"[{sport.upper()}] cycle failed: {e}")
+                    next_due[sport] = time.monotonic() + self._next_interval(sport)
+
+                passes += 1
+                if max_cycles is not None and passes >= max_cycles:
+                    break
+                self._stop_event.wait(max(0.0, min(next_due.values()) - time.monotonic()))
+        except KeyboardInterrupt:
+            print("\nDaemon interrupted by user")
+        finally:
+            print(f"Daemon stopped after {passes} passes, {self.events_emitted} events emitted")
+
+    def stop(self):
+        """Ask a running daemon to exit after the current cycle"""
+        self._stop_event.set()
+
+    def close(self):
+        """Stop polling and release the fetch workers"""
+        self.stop()
+        self._fetch_pool.shutdown(wait=True)
+        if self.event_writer:
+            self.event_writer.close()
@@ -9,6 +9,8 @@ Usage:
     python run_analysis.py                  # Run MLB analysis (default)
     python run_analysis.py --sport nfl      # Run NFL analysis  
     python run_analysis.py --all-sports     # Run analysis on all available sports
+    python run_analysis.py --daemon         # Keep polling and report opportunity changes
+    python run_analysis.py --daemon --stream-kalshi  # ...and re-check a game on every Kalshi tick
     python run_analysis.py --help           # Show all options
 """
 
@@ -21,7 +23,10 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from core.main_system import MispricingSystem
+from core.polling_daemon import MispricingDaemon
+from core.kalshi_stream import KalshiTickFeed
 from config.sports_config import get_available_sports, get_current_season_sports, get_supported_sports_display
+from utils.console import console, set_console_output
 
 def main():
     """Main analysis function with clean command line interface"""
@@ -35,6 +40,8 @@ Examples:
   python run_analysis.py --sport nba        # NBA analysis
   python run_analysis.py --all-sports       # All available sports
   python run_analysis.py --current-season   # Only sports currently in season
+  python run_analysis.py --daemon -c -i 15  # Poll in-season sports every 15 seconds
+  python run_analysis.py --daemon --stream-kalshi  # Also apply Kalshi ticks between polls
 
 Available Sports: {get_supported_sports_display()}
 """
@@ -71,6 +78,70 @@ Available Sports: {get_supported_sports_display()}
         help='Minimum edge percentage (e.g., 0.02 for 2%%). Uses sport default if not specified.'
     )
     
+    parser.add_argument(
+        '--sequential',
+        action='store_true',
+        help='Analyze sports one at a time instead of in parallel (multi-sport runs only)'
+    )
+    
+    parser.add_argument(
+        '--daemon', '-d',
+        action='store_true',
+        help='Keep polling and emit only new/changed/closed opportunities'
+    )
+    
+    parser.add_argument(
+        '--interval', '-i',
+        type=float,
+        help='Daemon polling interval in seconds per sport (default: 30)'
+    )
+    
+    parser.add_argument(
+        '--stream-kalshi',
+        action='store_true',
+        help='With --daemon: stream Kalshi ticker updates over WebSocket and re-check the affected game on each tick'
+    )
+    
+    parser.add_argument(
+        '--events-file',
+        help='Append daemon events as JSON lines to this file instead of printing them'
+    )
+    
+    parser.add_argument(
+        '--record-ticks',
+        action='store_true',
+        help='Append every fetched quote to the SQLite tick store (debug/odds_ticks.sqlite)'
+    )
+    
+    parser.add_argument(
+        '--record-snapshots',
+        action='store_true',
+        help='Keep raw API responses for offline backtests (debug/snapshots.ndjson)'
+    )
+    
+    parser.add_argument(
+        '--depth-stake',
+        type=float,
+        help='Price Kalshi at the order-book fill price for this many dollars instead of top-of-book'
+    )
+    
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Suppress per-stage progress output (reports and errors still print)'
+    )
+    
+    parser.add_argument(
+        '--metrics-file',
+        help='Write a JSON metrics snapshot (stage timings, counters) to this file after every run'
+    )
+    
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        help='Serve Prometheus metrics on http://127.0.0.1:PORT/metrics'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -79,11 +150,12 @@ Available Sports: {get_supported_sports_display()}
     
     args = parser.parse_args()
     
-    # Print header
-    print("PINNACLE-KALSHI MISPRICING DETECTION SYSTEM")
-    print("=" * 60)
-    print(f"Analysis started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
+    # Print header (progress output, silenced by --quiet)
+    set_console_output(not args.quiet)
+    console("PINNACLE-KALSHI MISPRICING DETECTION SYSTEM")
+    console("=" * 60)
+    console(f"Analysis started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    console()
     
     try:
         # Initialize system
@@ -92,6 +164,19 @@ Available Sports: {get_supported_sports_display()}
             config['max_opportunities_to_report'] = args.max_opportunities
         if not args.verbose:
             config['save_results_to_file'] = False
+        if args.record_ticks:
+            config['record_ticks'] = True
+        if args.record_snapshots:
+            config['record_snapshots'] = True
+        if args.depth_stake is not None:
+            config['depth_pricing'] = True
+            config['depth_stake_dollars'] = args.depth_stake
+        if args.quiet:
+            config['console_output'] = False
+        if args.metrics_file:
+            config['metrics_file_path'] = args.metrics_file
+        if args.metrics_port is not None:
+            config['metrics_port'] = args.metrics_port
         
         system = MispricingSystem(config)
         
@@ -103,20 +188,47 @@ Available Sports: {get_supported_sports_display()}
         # Determine which sports to analyze
         if args.all_sports:
             sports_to_analyze = get_available_sports()
-            print(f"Running analysis on all sports: {', '.join(s.upper() for s in sports_to_analyze)}")
+            console(f"Running analysis on all sports: {', '.join(s.upper() for s in sports_to_analyze)}")
         elif args.current_season:
             sports_to_analyze = get_current_season_sports()
-            print(f"Running analysis on current season sports: {', '.join(s.upper() for s in sports_to_analyze)}")
+            console(f"Running analysis on current season sports: {', '.join(s.upper() for s in sports_to_analyze)}")
         else:
             sports_to_analyze = [args.sport]
-            print(f"Running analysis on: {args.sport.upper()}")
+            console(f"Running analysis on: {args.sport.upper()}")
+        
+        console()
         
-        print()
+        if args.daemon:
+            daemon = MispricingDaemon(
+                system,
+                sports=sports_to_analyze,
+                default_interval=args.interval,
+                output_path=args.events_file
+            )
+            feed = None
+            if args.stream_kalshi:
+                try:
+                    feed = KalshiTickFeed.from_credentials(
+                        daemon, system.kalshi_client.credentials,
+                        os.path.dirname(system.config['kalshi_credentials_file'])
+                    )
+                    feed.start()
+                    console("Streaming Kalshi ticks into the daemon")
+                except (ValueError, ImportError, OSError) as e:
+                    print(f"WARNING Kalshi streaming unavailable, polling only: {e}")
+                    feed = None
+            try:
+                daemon.run()
+            finally:
+                if feed is not None:
+                    feed.stop()
+                daemon.close()
+            return
         
         # Run analysis
         if len(sports_to_analyze) > 1:
             # Multi-sport analysis
-            results = system.run_multi_sport_analysis(sports_to_analyze)
+            results = system.run_multi_sport_analysis(sports_to_analyze, parallel=not args.sequential)
             
             # Display combined results
             if results.get('top_opportunities'):
@@ -173,7 +285,7 @@ Available Sports: {get_supported_sports_display()}
                 print(f"Analysis Duration: {summary.get('analysis_duration_seconds', 0):.1f}s")
         
         if args.verbose and results.get('status') == 'completed':
-            print(f"\nResults saved to: {system.config.get('results_file_path', 'output/latest_results.json')}")
+            print(f"\nResults saved to: {system.config.get('results_file_path')}")
         
         print("\nSUCCESS Analysis complete!")
         
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+BACKTEST SCRIPT - Tune detection thresholds on recorded snapshots
+
+Replays snapshots saved with `run_analysis.py --record-snapshots` through the real
+normalize -> align -> detect path for a grid of thresholds, in parallel.
+
+Usage:
+    python run_backtest.py --outcomes results.json
+    python run_backtest.py --sport nfl --min-edges 0.01:0.10:0.005 --confidences 0.4,0.5,0.6
+    python run_backtest.py --help           # Show all options
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+
+# Add path for organized imports
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.backtest import BacktestEngine, load_snapshots, load_outcomes, parameter_grid
+
+def parse_values(spec: str) -> list:
+    """Parse 'a,b,c' or an inclusive 'start:stop:step' range into floats"""
+    if ':' in spec:
+        start, stop, step = (float(part) for part in spec.split(':'))
+        count = int(round((stop - start) / step)) + 1
+        return [round(start + i * step, 10) for i in range(count)]
+    return [float(value) for value in spec.split(',') if value.strip()]
+
+def main():
+    """Backtest command line interface"""
+    # Same default location MispricingSystem records snapshots to
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    default_snapshots = os.path.join(project_root, 'debug', 'snapshots.ndjson')
+
+    parser = argparse.ArgumentParser(
+        description='Replay recorded snapshots to tune mispricing thresholds',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--snapshots', nargs='+', default=[default_snapshots],
+                        help=f'Snapshot NDJSON files (default: {default_snapshots})')
+    parser.add_argument('--outcomes', help='Settled winners: JSON {game_key: home|away} or CSV game_key,winner')
+    parser.add_argument('--sport', '-s', help='Only replay snapshots for this sport')
+    parser.add_argument('--min-edges', default='0.01:0.10:0.005',
+                        help='Edge thresholds as a,b,c or start:stop:step (default: 0.01:0.10:0.005)')
+    parser.add_argument('--confidences', default='0.3:0.8:0.05',
+                        help='Match confidence thresholds (default: 0.3:0.8:0.05)')
+    parser.add_argument('--time-buffer', type=int, default=15,
+                        help='Minutes before start a game stops being tradable (default: 15)')
+    parser.add_argument('--stake', type=float, default=1.0, help='Units staked per bet (default: 1)')
+    parser.add_argument('--workers', '-w', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--top', type=int, default=10, help='Configurations to display (default: 10)')
+    parser.add_argument('--output', '-o', help='Write every configuration result to this JSON file')
+    args = parser.parse_args()
+
+    print("PINNACLE-KALSHI THRESHOLD BACKTEST")
+    print("=" * 60)
+
+    snapshots = load_snapshots(args.snapshots, args.sport)
+    if not snapshots:
+        print(f"No snapshots found in: {', '.join(args.snapshots)}")
+        print("Record some with: python run_analysis.py --record-snapshots")
+        return 1
+    outcomes = load_outcomes(args.outcomes) if args.outcomes else {}
+    min_edges = parse_values(args.min_edges)
+    confidences = parse_values(args.confidences)
+
+    print(f"Snapshots: {len(snapshots)} ({snapshots[0]['captured_at']} to {snapshots[-1]['captured_at']})")
+    print(f"Settled outcomes: {len(outcomes)}")
+    print(f"Configurations: {len(parameter_grid(min_edges, confidences))} "
+          f"({len(min_edges)} edges x {len(confidences)} confidences)")
+    print()
+
+    start = time.time()
+    engine = BacktestEngine(snapshots, outcomes, time_buffer_minutes=args.time_buffer, stake=args.stake)
+    engine.prepare()
+    prepared = time.time()
+    results = engine.run_sweep(min_edges, confidences, workers=args.workers)
+    finished = time.time()
+
+    print(f"Normalized in {prepared - start:.1f}s, swept in {finished - prepared:.1f}s")
+    print()
+    print(f"TOP {min(args.top, len(results))} CONFIGURATIONS (by P&L):")
+    print("=" * 60)
+    print(f"{'Edge':>6} {'Conf':>6} {'Opps':>6} {'Games':>6} {'Bets':>5} {'Wins':>5} {'P&L':>9} {'ROI':>8} {'Med edge':>9}")
+    for result in results[:args.top]:
+        print(f"{result['min_edge_threshold']:>6.1%} {result['match_confidence_threshold']:>6.0%} "
+              f"{result['opportunities']:>6} {result['unique_games']:>6} {result['bets_settled']:>5} "
+              f"{result['wins']:>5} {result['pnl']:>9.2f} {result['roi']:>8.1%} "
+              f"{result['edge_distribution']['median']:>9.1%}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nAll results written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
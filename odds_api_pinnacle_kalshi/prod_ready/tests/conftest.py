@@ -0,0 +1,18 @@
+"""
+Shared pytest fixtures for the prod_ready test suite
+"""
+
+import os
+import pytest
+
+def write_credentials(directory) -> str:
+    """Write a dummy credentials file into directory and return its path"""
+    path = os.path.join(str(directory), 'credentials.txt')
+    with open(path, 'w') as f:
+        f.write("API_KEY_ID=test\n")
+    return path
+
+@pytest.fixture
+def credentials_file(tmp_path) -> str:
+    """Dummy Pinnacle/Kalshi credentials file, removed with the test's tmp_path"""
+    return write_credentials(tmp_path)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for the offline replay and threshold backtest engine
+"""
+
+import sys
+import os
+import json
+import pathlib
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.backtest import BacktestEngine, load_snapshots, load_outcomes, parameter_grid
+from core.main_system import MispricingSystem
+from tests.conftest import write_credentials
+
+GAME_KEY = 'MLB:2025-09-15:BOS@NYY'
+
+def _pinnacle_raw(captured_at):
+    return {'success': True, 'sport_type': 'mlb', 'timestamp': captured_at, 'data': [{
+        'id': 'evt1', 'home_team': 'New York Yankees', 'away_team': 'Boston Red Sox',
+        'commence_time': '2025-09-15T23:05:00Z',
+        'bookmakers': [{'key': 'pinnacle', 'markets': [{'key': 'h2h', 'outcomes': [
+            {'name': 'New York Yankees', 'price': -150},
+            {'name': 'Boston Red Sox', 'price': 130}
+        ]}]}]
+    }]}
+
+def _kalshi_raw(captured_at, home_cents):
+    return {'success': True, 'timestamp': captured_at, 'data': [{
+        'ticker': 'KXMLBGAME-BOSNYY-NYY', 'title': 'Boston Red Sox at New York Yankees Winner?',
+        'detected_sport': 'mlb', 'yes_bid': home_cents, 'no_bid': 98 - home_cents,
+        'yes_sub_title': 'New York Yankees', 'close_time': '2025-09-15T23:05:00Z'
+    }]}
+
+def _record_snapshots(path, credentials_file):
+    """Two fetch cycles written through MispricingSystem.record_snapshot"""
+    system = MispricingSystem({
+        'pinnacle_api_key_file': credentials_file,
+        'kalshi_credentials_file': credentials_file,
+        'save_results_to_file': False,
+        'record_snapshots': True,
+        'snapshot_file_path': path
+    })
+    # Written out of order on purpose: loading sorts by capture time
+    system.record_snapshot('mlb', _pinnacle_raw('2025-09-15T12:10:00Z'), _kalshi_raw('2025-09-15T12:10:00Z', 55))
+    system.record_snapshot('mlb', _pinnacle_raw('2025-09-15T12:00:00Z'), _kalshi_raw('2025-09-15T12:00:00Z', 50))
+    system.snapshot_writer.close()
+
+def test_snapshots_round_trip(credentials_file, tmp_path):
+    """Recorded snapshots load back in capture order, filtered by sport"""
+    path = os.path.join(tmp_path, 'snapshots.ndjson')
+    _record_snapshots(path, credentials_file)
+
+    snapshots = load_snapshots([path])
+    assert [s['captured_at'] for s in snapshots] == ['2025-09-15T12:00:00Z', '2025-09-15T12:10:00Z']
+    assert snapshots[0]['kalshi']['data'][0]['yes_bid'] == 50
+    assert load_snapshots([path], sport='nfl') == []
+
+def test_replay_uses_capture_time(credentials_file, tmp_path):
+    """Games that have started by now are still tradable as of the snapshot"""
+    path = os.path.join(tmp_path, 'snapshots.ndjson')
+    _record_snapshots(path, credentials_file)
+    frames = BacktestEngine(load_snapshots([path])).prepare()
+
+    assert len(frames) == 2
+    assert len(frames[0]['pinnacle_games']) == 1 and len(frames[0]['kalshi_games']) == 1
+    assert frames[0]['kalshi_games'][0]['home_odds']['kalshi_cents'] == 50
+
+def test_sweep_reports_settled_pnl(credentials_file, tmp_path):
+    """Each configuration reports opportunities, edges and P&L; a game is bet once"""
+    path = os.path.join(tmp_path, 'snapshots.ndjson')
+    _record_snapshots(path, credentials_file)
+    outcomes_path = os.path.join(tmp_path, 'outcomes.json')
+    with open(outcomes_path, 'w') as f:
+        json.dump({GAME_KEY: 'home'}, f)
+
+    engine = BacktestEngine(load_snapshots([path]), load_outcomes(outcomes_path))
+    results = engine.run_sweep([0.03, 0.08, 0.12], [0.4], workers=1)
+    by_edge = {r['min_edge_threshold']: r for r in results}
+    assert len(results) == len(parameter_grid([0.03, 0.08, 0.12], [0.4]))
+
+    # Home edge is 10% in the first snapshot and 5% in the second
+    low = by_edge[0.03]
+    assert low['opportunities'] == 2 and low['unique_games'] == 1
+    assert abs(low['edge_distribution']['max'] - 0.10) < 1e-9
+    # Bet home once at the first qualifying price (50c): win pays 1 unit
+    assert low['bets_settled'] == 1 and low['wins'] == 1
+    assert abs(low['pnl'] - 1.0) < 1e-9
+
+    assert by_edge[0.08]['opportunities'] == 1
+    assert by_edge[0.12]['opportunities'] == 0 and by_edge[0.12]['pnl'] == 0
+    assert results[0]['pnl'] == 1.0
+
+def test_parallel_sweep_matches_in_process(credentials_file, tmp_path):
+    """Worker processes produce the same results as an in-process sweep"""
+    path = os.path.join(tmp_path, 'snapshots.ndjson')
+    _record_snapshots(path, credentials_file)
+    engine = BacktestEngine(load_snapshots([path]), {GAME_KEY: 'away'})
+
+    sequential = engine.run_sweep([0.02, 0.06], [0.3, 0.5, 0.99], workers=1)
+    parallel = engine.run_sweep([0.02, 0.06], [0.3, 0.5, 0.99], workers=2)
+    key = lambda r: (r['min_edge_threshold'], r['match_confidence_threshold'])
+    assert sorted(sequential, key=key) == sorted(parallel, key=key)
+    # No matches clear a 99% confidence bar
+    assert all(r['opportunities'] == 0 for r in parallel if r['match_confidence_threshold'] == 0.99)
+
+if __name__ == "__main__":
+    scratch = tempfile.TemporaryDirectory()
+    credentials_file = write_credentials(scratch.name)
+    print("BACKTEST TEST")
+    print("=" * 50)
+    test_snapshots_round_trip(credentials_file, pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Snapshots round trip")
+    test_replay_uses_capture_time(credentials_file, pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Replay uses capture time")
+    test_sweep_reports_settled_pnl(credentials_file, pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Sweep reports settled P&L")
+    test_parallel_sweep_matches_in_process(credentials_file, pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Parallel sweep matches in-process")
+    scratch.cleanup()
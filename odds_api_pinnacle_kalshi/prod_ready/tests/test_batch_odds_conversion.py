@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test script for the vectorized odds conversion kernel
+"""
+
+import sys
+import os
+import json
+import tempfile
+from datetime import datetime, timezone, timedelta
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.odds_converter import OddsConverter
+from core.pinnacle_client import PinnacleClient
+from core.kalshi_client import KalshiClientUpdated
+from core.data_aligner import MispricingDetector
+from tests.conftest import write_credentials
+
+def scalar_price_to_american(price):
+    """Reference per-side rule the Kalshi client used before batching"""
+    if price <= 0 or price >= 1:
+        price = 0.5
+    if price >= 0.5:
+        return int(-100 * price / (1 - price))
+    return int(100 * (1 - price) / price)
+
+def test_batch_matches_scalar_conversions():
+    """Batch results equal the scalar OddsConverter results exactly"""
+    american = [150, -110, 100, -200, 2500, -10000]
+    batch = OddsConverter.convert_batch(american_odds=american)
+    for i, odds in enumerate(american):
+        decimal = OddsConverter.american_to_decimal(odds)
+        assert batch['american'][i] == odds
+        assert batch['decimal'][i] == decimal
+        assert batch['implied_probability'][i] == OddsConverter.decimal_to_probability(decimal)
+
+    prices = [0.01, 0.3, 0.45, 0.5, 0.53, 0.99, 0.0, 1.0]
+    batch = OddsConverter.convert_batch(prices=prices)
+    assert batch['american'].tolist() == [scalar_price_to_american(p) for p in prices]
+
+def test_vig_free_probabilities():
+    """Vig-free pairs sum to one and keep the ratio of the implied probabilities"""
+    home, away = OddsConverter.convert_batch(american_odds=[-110, -150]), OddsConverter.convert_batch(american_odds=[-110, 130])
+    pairs = OddsConverter.create_paired_odds_objects(home, away)
+
+    assert abs(pairs[0][0]['vig_free_probability'] - 0.5) < 1e-12
+    for home_odds, away_odds in pairs:
+        assert abs(home_odds['vig_free_probability'] + away_odds['vig_free_probability'] - 1.0) < 1e-12
+        assert type(home_odds['american']) is int and type(home_odds['decimal']) is float
+    json.dumps(pairs)
+
+def test_clients_normalize_in_one_batch(credentials_file):
+    """Both clients emit full odds objects built by the batch kernel"""
+    start = (datetime.now(timezone.utc) + timedelta(days=2)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    pinnacle = PinnacleClient(credentials_file)
+    games = pinnacle.normalize_pinnacle_data({
+        'success': True,
+        'sport_type': 'mlb',
+        'data': [{
+            'id': 'g1', 'home_team': 'New York Yankees', 'away_team': 'Boston Red Sox', 'commence_time': start,
+            'bookmakers': [{'key': 'pinnacle', 'markets': [{'key': 'h2h', 'outcomes': [
+                {'name': 'New York Yankees', 'price': -150}, {'name': 'Boston Red Sox', 'price': 130}
+            ]}]}]
+        }]
+    })
+    assert len(games) == 1
+    assert games[0]['home_odds']['decimal'] == OddsConverter.american_to_decimal(-150)
+    assert games[0]['away_odds']['american'] == 130
+    assert 'vig_free_probability' in games[0]['home_odds']
+
+    kalshi = KalshiClientUpdated(credentials_file)
+    # Dateless ticker so live filtering uses close_time
+    ticker = "KXMLBGAME-BOSNYY-NYY"
+    games = kalshi.normalize_kalshi_data({
+        'success': True,
+        'data': [{
+            'ticker': ticker, 'title': 'Boston Red Sox vs New York Yankees Winner?', 'detected_sport': 'mlb',
+            'yes_bid': 58, 'no_bid': 40, 'yes_sub_title': 'New York Yankees', 'close_time': start
+        }]
+    })
+    assert len(games) == 1
+    home_team_is_yes = games[0]['home_odds']['kalshi_cents'] == 58
+    yes_odds = games[0]['home_odds'] if home_team_is_yes else games[0]['away_odds']
+    assert yes_odds['american'] == scalar_price_to_american(0.58)
+    assert yes_odds['kalshi_cents'] == 58
+
+def test_detector_screens_batch():
+    """Vectorized screening keeps the same opportunities and edges as per-game checks"""
+    def side(prob):
+        return {'implied_probability': prob}
+
+    def aligned(match_id, p_home, p_away, k_home, k_away, confidence=0.9):
+        return {
+            'match_id': match_id, 'match_confidence': confidence,
+            'pinnacle_data': {'home_odds': side(p_home), 'away_odds': side(p_away)},
+            'kalshi_data': {'home_odds': side(k_home), 'away_odds': side(k_away)}
+        }
+
+    detector = MispricingDetector(min_edge_threshold=0.05, min_confidence=0.4)
+    opportunities = detector.detect_opportunities([
+        aligned('big_home', 0.60, 0.42, 0.50, 0.50),
+        aligned('small', 0.52, 0.50, 0.50, 0.50),
+        aligned('low_confidence', 0.70, 0.32, 0.50, 0.50, confidence=0.1),
+        aligned('big_away', 0.40, 0.62, 0.45, 0.52)
+    ])
+
+    assert [o['opportunity_id'] for o in opportunities] == ['opp_big_home', 'opp_big_away']
+    assert opportunities[0]['discrepancy']['recommended_side'] == 'home'
+    assert opportunities[1]['discrepancy']['recommended_side'] == 'away'
+    assert opportunities[1]['discrepancy']['max_edge'] == abs(0.62 - 0.52)
+    assert detector.detect_opportunities([]) == []
+
+if __name__ == "__main__":
+    credentials_file = write_credentials(tempfile.mkdtemp())
+    print("BATCH ODDS CONVERSION TEST")
+    print("=" * 50)
+    test_batch_matches_scalar_conversions()
+    print("PASS Batch matches scalar conversions")
+    test_vig_free_probabilities()
+    print("PASS Vig-free probabilities")
+    test_clients_normalize_in_one_batch(credentials_file)
+    print("PASS Clients normalize in one batch")
+    test_detector_screens_batch()
+    print("PASS Detector screens batch")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for concurrent, paginated Kalshi series fetching
+"""
+
+import sys
+import os
+import tempfile
+from unittest.mock import patch, Mock
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.kalshi_client import KalshiClientUpdated
+from config.sports_config import SPORTS_CONFIG
+from tests.conftest import write_credentials
+
+def _make_client(credentials_file: str) -> KalshiClientUpdated:
+    """Create a client backed by a throwaway credentials file"""
+    return KalshiClientUpdated(credentials_file)
+
+def _fake_series_api(pages_per_series: int = 2):
+    """Return a requests.get replacement serving paginated markets per series"""
+    def fake_get(url, params=None, timeout=None):
+        series = params['series_ticker']
+        page = int(params.get('cursor') or 0)
+        response = Mock()
+        response.raise_for_status = Mock()
+        next_cursor = str(page + 1) if page + 1 < pages_per_series else ''
+        response.json.return_value = {
+            'markets': [{'ticker': f"{series}-P{page}-{i}"} for i in range(3)],
+            'cursor': next_cursor
+        }
+        return response
+    return fake_get
+
+def test_series_pagination_follows_cursor(credentials_file):
+    """A single series should return every page, not just the first"""
+    client = _make_client(credentials_file)
+    with patch.object(client.http, 'get', side_effect=_fake_series_api(3)):
+        markets = client._get_markets_by_series_ticker('KXMLBGAME')
+
+    assert len(markets) == 9
+    assert markets[-1]['ticker'] == 'KXMLBGAME-P2-2'
+
+def test_concurrent_all_sports_matches_sequential(credentials_file):
+    """Concurrent and sequential scans should return the same market set"""
+    client = _make_client(credentials_file)
+    with patch.object(client.http, 'get', side_effect=_fake_series_api(2)):
+        concurrent = client.search_sports_markets('all', concurrent=True)
+        sequential = client.search_sports_markets('all', concurrent=False)
+
+    series_count = sum(len(config.kalshi_tickers) for config in SPORTS_CONFIG.values())
+    assert concurrent['success']
+    assert concurrent['series_fetched'] == series_count
+    assert concurrent['total_found'] == series_count * 6
+    assert sorted(m['ticker'] for m in concurrent['data']) == sorted(m['ticker'] for m in sequential['data'])
+    assert concurrent['sport_breakdown'] == sequential['sport_breakdown']
+
+    for market in concurrent['data']:
+        expected_sport = next(
+            sport for sport, config in SPORTS_CONFIG.items()
+            if any(market['ticker'].startswith(t) for t in config.kalshi_tickers)
+        )
+        assert market['detected_sport'] == expected_sport
+
+def test_failed_series_does_not_block_others(credentials_file):
+    """One failing series should not drop markets from the others"""
+    client = _make_client(credentials_file)
+    healthy = _fake_series_api(1)
+
+    def flaky_get(url, params=None, timeout=None):
+        if params['series_ticker'] == 'KXNFLGAME':
+            raise ConnectionError("simulated drop")
+        return healthy(url, params=params, timeout=timeout)
+
+    with patch.object(client.http, 'get', side_effect=flaky_get):
+        result = client.search_sports_markets('all')
+
+    assert 'nfl' not in result['sport_breakdown']
+    assert result['sport_breakdown'].get('mlb') == 3
+    assert 'KXNFLGAME' in result['incomplete_series']
+
+def test_partial_pagination_is_flagged(credentials_file):
+    """A page failing after the first keeps earlier pages and marks the series incomplete"""
+    client = _make_client(credentials_file)
+    paged = _fake_series_api(3)
+
+    def failing_third_page(url, params=None, timeout=None):
+        if params['series_ticker'] == 'KXMLBGAME' and params.get('cursor') == '2':
+            raise ConnectionError("simulated drop")
+        return paged(url, params=params, timeout=timeout)
+
+    with patch.object(client.http, 'get', side_effect=failing_third_page):
+        markets, complete = client._fetch_series_markets('KXMLBGAME')
+        result = client.search_sports_markets('mlb')
+
+    assert len(markets) == 6 and not complete
+    assert result['incomplete_series'] == ['KXMLBGAME']
+    assert result['total_found'] == 6
+
+if __name__ == "__main__":
+    credentials_file = write_credentials(tempfile.mkdtemp())
+    print("CONCURRENT SERIES FETCH TEST")
+    print("=" * 50)
+    test_series_pagination_follows_cursor(credentials_file)
+    print("PASS Series pagination follows cursor")
+    test_concurrent_all_sports_matches_sequential(credentials_file)
+    print("PASS Concurrent scan matches sequential scan")
+    test_failed_series_does_not_block_others(credentials_file)
+    print("PASS Failed series isolated from the rest")
+    test_partial_pagination_is_flagged(credentials_file)
+    print("PASS Partial pagination flagged incomplete")
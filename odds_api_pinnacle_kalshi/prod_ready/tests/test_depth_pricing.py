@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for stake-sized Kalshi fill prices from concurrently fetched order books
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.depth_pricing import DepthPricer, OrderBookCache, OrderBookFetcher, kalshi_ask_levels, vwap_fill
+from core.odds_converter import OddsConverter
+
+def test_vwap_fill_walks_levels():
+    """Thin top levels push the fill price past the best ask"""
+    price, filled = vwap_fill([(0.50, 100), (0.60, 100)], 100)
+    # $50 buys 100 @ 0.50, the other $50 buys 83.33 @ 0.60
+    assert abs(filled - 100) < 1e-9
+    assert abs(price - 100 / (100 + 50 / 0.60)) < 1e-9
+    assert vwap_fill([(0.40, 10)], 100) == (0.40, 4.0)
+    assert vwap_fill([], 100) == (None, 0.0)
+
+def test_kalshi_asks_come_from_opposite_bids():
+    """A NO bid at 45c is a YES ask at 55c, cheapest first"""
+    assert kalshi_ask_levels([[40, 10], [45, 20]]) == [(0.55, 20.0), (0.60, 10.0)]
+    assert kalshi_ask_levels(None) == []
+
+def test_fetcher_caches_books():
+    """Books are fetched once per key inside the TTL"""
+    calls = []
+    def fetch(key):
+        calls.append(key)
+        return {'key': key}
+    fetcher = OrderBookFetcher(fetch, max_workers=4, cache_ttl_seconds=60)
+    books = fetcher.fetch_books(['A', 'B', 'A'])
+    assert books == {'A': {'key': 'A'}, 'B': {'key': 'B'}}
+    fetcher.fetch_books(['A', 'B'])
+    assert sorted(calls) == ['A', 'B']
+    assert fetcher.cache.hits == 2
+
+    cache = OrderBookCache(ttl_seconds=5)
+    cache.put('X', {'yes': []}, now=0)
+    assert cache.get('X', now=4) == (True, {'yes': []})
+    assert cache.get('X', now=6) == (False, None)
+
+class _StubKalshi:
+    def __init__(self, books):
+        self.books = books
+
+    def get_orderbook(self, ticker, depth=20):
+        return self.books.get(ticker)
+
+def _kalshi_game(ticker, home_probability):
+    home = OddsConverter.convert_batch(prices=[home_probability])
+    away = OddsConverter.convert_batch(prices=[1 - home_probability])
+    quote = lambda batch: {'american': int(batch['american'][0]), 'decimal': float(batch['decimal'][0]),
+                           'implied_probability': float(batch['implied_probability'][0])}
+    return {'game_id': f'kalshi_{ticker}', 'home_odds': quote(home), 'away_odds': quote(away),
+            'metadata': {'kalshi_yes_side': 'home'}}
+
+def test_reprice_aligned_games():
+    """Sides the book fills are repriced on copies; thin sides and games without books keep top of book"""
+    book = {'yes': [[40, 500]], 'no': [[48, 50], [50, 50]]}
+    pricer = DepthPricer(_StubKalshi({'GAME1-HOME': book}), stake=100)
+    deep = _kalshi_game('GAME1-HOME', 0.50)
+    missing = _kalshi_game('GAME2-HOME', 0.50)
+    aligned = [{'kalshi_data': deep}, {'kalshi_data': missing}]
+
+    repriced = pricer.reprice_aligned_games(aligned)
+    assert repriced[1] is aligned[1]
+    game = repriced[0]['kalshi_data']
+    depth = game['metadata']['depth']
+    # YES (home) asks: 50c x 50 then 52c x 50 -> only $51 of the $100 stake fills
+    assert depth['home_fillable'] == 51.0
+    assert abs(depth['home_fill_price'] - 0.51) < 1e-9
+    assert depth['home_fully_fillable'] is False
+    assert game['home_odds'] == deep['home_odds']
+    # NO (away) asks: 60c x 500 fills the whole stake; prices convert through whole American odds
+    assert depth['away_fillable'] == 100.0
+    assert depth['away_fully_fillable'] is True
+    assert game['away_odds']['kalshi_cents'] == 60
+    assert abs(game['away_odds']['implied_probability'] - 0.60) < 0.005
+    assert depth['top_of_book_home_probability'] == deep['home_odds']['implied_probability']
+    assert 'depth' not in deep['metadata']
+
+if __name__ == "__main__":
+    print("DEPTH PRICING TEST")
+    print("=" * 50)
+    test_vwap_fill_walks_levels()
+    print("PASS VWAP fill walks levels")
+    test_kalshi_asks_come_from_opposite_bids()
+    print("PASS Kalshi asks come from opposite bids")
+    test_fetcher_caches_books()
+    print("PASS Fetcher caches books")
+    test_reprice_aligned_games()
+    print("PASS Reprice aligned games")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for parse-once epoch timestamps in normalization and matching
+"""
+
+import sys
+import os
+from datetime import datetime, timezone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.timestamp_utils import (parse_epoch, parse_timestamp, is_future_epoch, parse_game_time_safe,
+                                   epoch_to_datetime, simplify_timestamp, format_display_time)
+from core.pinnacle_client import PinnacleClient
+from core.data_aligner import GameMatcher
+
+def test_epoch_parsing_is_cached():
+    """Z and offset forms give the same integer; repeated strings hit the cache"""
+    assert parse_epoch('2025-08-21T17:11:00Z') == 1755796260
+    assert parse_epoch('2025-08-21T12:11:00-05:00') == 1755796260
+    assert parse_epoch('2025-08-21T17:11:00') == 1755796260
+    assert parse_epoch('not a time') is None and parse_epoch(None) is None
+
+    hits = parse_timestamp.cache_info().hits
+    parse_epoch('2025-08-21T12:11:00-05:00')
+    simplify_timestamp('2025-08-21T12:11:00-05:00')
+    assert parse_timestamp.cache_info().hits > hits
+
+    # Display helpers keep the original offset; epoch_to_datetime is aware
+    assert simplify_timestamp('2025-08-21T09:15:45-05:00') == '09:15'
+    assert format_display_time('2025-08-21T17:11:00Z') == 'Aug 21, 17:11'
+    assert epoch_to_datetime(1755796260) == datetime(2025, 8, 21, 17, 11, tzinfo=timezone.utc)
+
+def test_future_checks_use_integers():
+    """Buffer checks agree between the epoch and string forms; unknown times count as live"""
+    as_of = datetime(2025, 8, 21, 16, 50, tzinfo=timezone.utc)
+    now_epoch = as_of.timestamp()
+    assert is_future_epoch(1755796260, 15, now_epoch)
+    assert not is_future_epoch(1755796260, 30, now_epoch)
+    assert not is_future_epoch(None, 0, now_epoch)
+    assert parse_game_time_safe('2025-08-21T17:11:00Z', 15, as_of)
+    assert not parse_game_time_safe('2025-08-21T17:11:00Z', 30, as_of)
+    assert not parse_game_time_safe('garbage', 0, as_of)
+
+def test_records_carry_epoch_and_matcher_uses_it():
+    """Pinnacle games get game_epoch at ingestion; time differences are integer seconds"""
+    raw = {'success': True, 'sport_type': 'mlb', 'timestamp': '2025-08-21T12:00:00Z', 'data': [{
+        'id': 'evt1', 'home_team': 'New York Yankees', 'away_team': 'Boston Red Sox',
+        'commence_time': '2025-08-21T23:05:00Z',
+        'bookmakers': [{'key': 'pinnacle', 'markets': [{'key': 'h2h', 'outcomes': [
+            {'name': 'New York Yankees', 'price': -150},
+            {'name': 'Boston Red Sox', 'price': 130}
+        ]}]}]
+    }]}
+    games = PinnacleClient(None).normalize_pinnacle_data(raw, 15, as_of=datetime(2025, 8, 21, tzinfo=timezone.utc))
+    assert games[0]['game_epoch'] == parse_epoch('2025-08-21T23:05:00Z')
+    assert games[0].to_dict()['game_epoch'] == games[0].game_epoch
+
+    matcher = GameMatcher(time_threshold_hours=6.0)
+    other = dict(games[0].to_dict(), game_epoch=games[0].game_epoch + 1800)
+    assert matcher._calculate_time_difference(games[0], other) == 1800
+    assert abs(matcher._calculate_time_similarity(games[0], other) - (1 - 1800 / 21600)) < 1e-9
+    # Kalshi games only know their date, so time stays neutral
+    date_only = dict(other, game_epoch=None, game_time='19:00')
+    assert matcher._calculate_time_difference(games[0], date_only) is None
+    assert matcher._calculate_time_similarity(games[0], date_only) == 0.5
+
+if __name__ == "__main__":
+    print("EPOCH TIMESTAMP TEST")
+    print("=" * 50)
+    test_epoch_parsing_is_cached()
+    print("PASS Epoch parsing is cached")
+    test_future_checks_use_integers()
+    print("PASS Future checks use integers")
+    test_records_carry_epoch_and_matcher_uses_it()
+    print("PASS Records carry epoch and matcher uses it")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test script for compact game records and the raw payload side table
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+from datetime import datetime, timezone, timedelta
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.game_record import GameRecord, OddsQuote, RawPayloadStore, json_default
+from core.kalshi_client import KalshiClientUpdated
+from core.data_aligner import GameMatcher, MispricingDetector
+from tests.conftest import write_credentials
+
+def _record(game_id='kalshi_T1'):
+    return GameRecord(
+        game_id=game_id, game_date='2025-08-21', game_time='19:00', game_time_display='2025-08-21 19:00',
+        sport='MLB', home_team='NYY', away_team='BOS', source='kalshi',
+        home_odds=OddsQuote(-150, 1.6666666666666667, 0.6, kalshi_cents=60),
+        away_odds=OddsQuote(130, 2.3, 0.43478260869565216),
+        metadata={'original_close_time': '2025-08-22T03:00:00Z'}
+    )
+
+def test_records_are_slotted_mappings():
+    """Records have no per-instance dict but support dict-style reads"""
+    record = _record()
+    assert not hasattr(record, '__dict__')
+    assert not hasattr(record.home_odds, '__dict__')
+
+    assert record['home_team'] == 'NYY'
+    assert record.get('missing', 'default') == 'default'
+    assert record['home_odds']['implied_probability'] == 0.6
+    assert record.get('metadata', {}).get('original_close_time') == '2025-08-22T03:00:00Z'
+
+    # Unset optional odds fields behave like absent keys
+    assert 'kalshi_cents' in record.home_odds
+    assert 'kalshi_cents' not in record.away_odds
+    assert record.away_odds.get('kalshi_cents') is None
+
+    record['home_team'] = 'NYM'
+    assert record.home_team == 'NYM'
+
+def test_records_serialize_to_plain_json():
+    """Records round-trip through json via json_default"""
+    record = _record()
+    data = json.loads(json.dumps({'games': [record]}, default=json_default))
+    assert data['games'][0]['away_odds'] == {'american': 130, 'decimal': 2.3, 'implied_probability': 0.43478260869565216}
+    assert data['games'][0]['home_odds']['kalshi_cents'] == 60
+    assert record.to_dict() == data['games'][0]
+
+def test_raw_payload_store_is_bounded():
+    """Side table keeps the newest payloads up to max_entries"""
+    store = RawPayloadStore(max_entries=2)
+    store.put('a', {'id': 'a'})
+    store.put('b', {'id': 'b'})
+    store.put('a', {'id': 'a2'})
+    store.put('c', {'id': 'c'})
+
+    assert len(store) == 2
+    assert 'b' not in store
+    assert store.get('a') == {'id': 'a2'}
+
+def test_raw_payload_store_is_thread_safe():
+    """Concurrent puts from several sport threads keep the store bounded and consistent"""
+    store = RawPayloadStore(max_entries=50)
+
+    def fill(sport):
+        for i in range(500):
+            store.put(f'{sport}_{i}', {'id': i})
+            store.get(f'{sport}_{i - 1}')
+
+    threads = [threading.Thread(target=fill, args=(sport,)) for sport in ('mlb', 'nfl', 'nba', 'nhl')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store) == 50
+    assert all(store.get(game_id) is not None for game_id in list(store._payloads))
+
+def test_kalshi_raw_markets_move_to_side_table(credentials_file):
+    """Normalized Kalshi games hold no raw market; the client keeps it by game_id"""
+    start = (datetime.now(timezone.utc) + timedelta(days=2)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    client = KalshiClientUpdated(credentials_file)
+    market = {'ticker': 'KXMLBGAME-BOSNYY-NYY', 'title': 'Boston Red Sox at New York Yankees Winner?',
+              'detected_sport': 'mlb', 'yes_bid': 58, 'no_bid': 40, 'yes_sub_title': 'New York Yankees',
+              'close_time': start}
+    games = client.normalize_kalshi_data({'success': True, 'data': [market]})
+
+    assert len(games) == 1
+    game = games[0]
+    assert isinstance(game, GameRecord)
+    assert 'raw_data' not in game.metadata
+    assert client.get_raw_payload(game.game_id) is market
+
+    # Records flow through matching and detection unchanged
+    pinnacle_game = GameRecord(
+        game_id='pinnacle_1', game_date=game.game_date, game_time=None, game_time_display='',
+        sport='MLB', home_team=game.home_team, away_team=game.away_team, source='pinnacle',
+        home_odds=OddsQuote(-200, 1.5, 0.6667), away_odds=OddsQuote(170, 2.7, 0.3704)
+    )
+    aligned = GameMatcher().align_games([pinnacle_game], games)
+    assert len(aligned) == 1 and aligned[0]['kalshi_data'] is game
+    opportunities = MispricingDetector(min_edge_threshold=0.01).detect_opportunities(aligned)
+    assert len(opportunities) == 1
+
+if __name__ == "__main__":
+    credentials_file = write_credentials(tempfile.mkdtemp())
+    print("GAME RECORD TEST")
+    print("=" * 50)
+    test_records_are_slotted_mappings()
+    print("PASS Records are slotted mappings")
+    test_records_serialize_to_plain_json()
+    print("PASS Records serialize to plain JSON")
+    test_raw_payload_store_is_bounded()
+    print("PASS Raw payload store is bounded")
+    test_raw_payload_store_is_thread_safe()
+    print("PASS Raw payload store is thread safe")
+    test_kalshi_raw_markets_move_to_side_table(credentials_file)
+    print("PASS Kalshi raw markets move to side table")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test script for the pooled keep-alive HTTP transport against a local server
+"""
+
+import sys
+import os
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from utils.http_transport import HttpTransport, endpoint_template
+from utils.metrics import MetricsRegistry
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers over HTTP/1.1 so the client can keep the connection open"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.connections_opened += 1
+
+    def do_GET(self):
+        if self.path.startswith('/slow'):
+            time.sleep(0.5)
+        body = json.dumps({'path': self.path}).encode()
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up on a slow response
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+def _start_server() -> ThreadingHTTPServer:
+    """Serve _KeepAliveHandler on a free local port"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    server.connections_opened = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def test_requests_reuse_one_connection():
+    """Sequential requests to one host open a single connection and count the rest as reused"""
+    server = _start_server()
+    transport = HttpTransport(metrics=MetricsRegistry())
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        for i in range(5):
+            response = transport.get(f"{base_url}/odds", params={'page': i})
+            assert response.json() == {'path': f"/odds?page={i}"}
+    finally:
+        transport.close()
+        server.shutdown()
+        server.server_close()
+
+    assert server.connections_opened == 1
+    assert transport.get_stats() == {'127.0.0.1': {
+        'requests': 5, 'new_connections': 1, 'reused_connections': 4, 'reuse_rate': 0.8
+    }}
+    transport.reset_stats()
+    assert transport.get_stats() == {}
+
+def test_per_host_timeouts():
+    """Timeouts come from the per-host table, fall back to the default and fail slow hosts"""
+    server = _start_server()
+    metrics = MetricsRegistry()
+    transport = HttpTransport(default_timeout=5, host_timeouts={'127.0.0.1': 0.1}, metrics=metrics)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    assert transport._timeout_for('https://clob.polymarket.com/markets') == 15
+    assert transport._timeout_for('https://api.the-odds-api.com/v4/sports') == 30
+    assert transport._timeout_for('https://unlisted.example.com/') == 5
+    transport.set_host_timeout('unlisted.example.com', 2)
+    assert transport._timeout_for('https://unlisted.example.com/') == 2
+
+    try:
+        assert transport.get(f"{base_url}/fast").status_code == 200
+        try:
+            transport.get(f"{base_url}/slow")
+            raise AssertionError("slow host should time out at its 0.1s host timeout")
+        except requests.exceptions.Timeout:
+            pass
+        # An explicit timeout still overrides the host entry
+        assert transport.get(f"{base_url}/slow", timeout=5).status_code == 200
+    finally:
+        transport.close()
+        server.shutdown()
+        server.server_close()
+
+    statuses = {sample['labels']['endpoint']: sample['labels']['status']
+                for sample in metrics.snapshot()['counters']['http_requests_total']
+                if sample['labels']['status'] == 'error'}
+    assert statuses == {'/slow': 'error'}
+
+def test_endpoint_labels_collapse_ids():
+    """Per-ticker paths share one endpoint label; callers can name the endpoint themselves"""
+    assert endpoint_template('/trade-api/v2/markets/KXMLBGAME-25AUG21HOUBAL-HOU/orderbook') == \
+        '/trade-api/v2/markets/{id}/orderbook'
+    assert endpoint_template('/v4/sports/baseball_mlb/odds') == '/v4/sports/baseball_mlb/odds'
+    assert endpoint_template('') == '/'
+
+    server = _start_server()
+    metrics = MetricsRegistry()
+    transport = HttpTransport(metrics=metrics)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        for ticker in ('KXMLBGAME-25AUG21HOUBAL-HOU', 'KXMLBGAME-25AUG21HOUBAL-BAL'):
+            transport.get(f"{base_url}/markets/{ticker}/orderbook")
+        transport.get(f"{base_url}/markets/KXNFLGAME-25SEP07BUFKC-KC", endpoint='market')
+    finally:
+        transport.close()
+        server.shutdown()
+        server.server_close()
+
+    counts = {sample['labels']['endpoint']: sample['value']
+              for sample in metrics.snapshot()['counters']['http_requests_total']}
+    assert counts == {'/markets/{id}/orderbook': 2, 'market': 1}
+
+if __name__ == "__main__":
+    print("HTTP TRANSPORT TEST")
+    print("=" * 50)
+    test_requests_reuse_one_connection()
+    print("PASS Requests reuse one keep-alive connection")
+    test_per_host_timeouts()
+    print("PASS Per-host timeouts applied")
+    test_endpoint_labels_collapse_ids()
+    print("PASS Endpoint labels collapse per-ticker paths")
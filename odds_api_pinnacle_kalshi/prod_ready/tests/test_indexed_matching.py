@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for indexed candidate generation in GameMatcher
+"""
+
+import sys
+import os
+import random
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_aligner import GameMatcher
+from config.sports_config import SPORTS_CONFIG
+
+def _game(source: str, sport: str, home: str, away: str, game_date: str, n: int) -> dict:
+    return {
+        'game_id': f"{source}_{n}",
+        'sport': sport,
+        'home_team': home,
+        'away_team': away,
+        'game_date': game_date,
+        'game_time': '19:05',
+        'home_odds': {'implied_probability': 0.5},
+        'away_odds': {'implied_probability': 0.5}
+    }
+
+def _slate(seed: int = 7):
+    """Random multi-sport slate where Kalshi uses full names and Pinnacle uses codes"""
+    rng = random.Random(seed)
+    pinnacle, kalshi = [], []
+    for sport_key in ('mlb', 'nfl', 'nba', 'nhl'):
+        config = SPORTS_CONFIG[sport_key]
+        codes = list(config.team_aliases)
+        for day in range(1, 30, 3):
+            # Each team plays at most once per date, dates outside each other's match window
+            rng.shuffle(codes)
+            game_date = f"2025-09-{day:02d}"
+            for home, away in zip(codes[0::2], codes[1::2]):
+                pinnacle.append(_game('pinnacle', config.name, home, away, game_date, len(pinnacle)))
+                if rng.random() < 0.8:
+                    # Kalshi side names the teams by alias and flips home/away
+                    k_home = rng.choice(config.team_aliases[away])
+                    k_away = rng.choice(config.team_aliases[home])
+                    kalshi.append(_game('kalshi', config.name, k_home, k_away, game_date, len(kalshi)))
+    rng.shuffle(kalshi)
+    return pinnacle, kalshi
+
+def test_alias_hits_resolve_without_fuzzy_matching():
+    """Alias pairs should score 1.0 from the hash map, never reaching SequenceMatcher"""
+    matcher = GameMatcher(time_threshold_hours=6.0)
+    with patch.object(matcher.team_resolver, 'similarity') as fuzzy:
+        assert matcher._get_team_similarity('NYY', 'NEW YORK YANKEES') == 1.0
+        assert matcher._get_team_similarity('BOSTON CELTICS', 'CELTICS', 'NBA') == 1.0
+    fuzzy.assert_not_called()
+    assert matcher._canonical_team_code('Cardinals', 'NFL') == 'ARI'
+    assert matcher._canonical_team_code('Cardinals', 'MLB') == 'STL'
+
+def test_indexed_alignment_finds_every_listed_game():
+    """Every Pinnacle game with a Kalshi listing is aligned to a game with the same teams and date"""
+    matcher = GameMatcher(time_threshold_hours=6.0)
+    pinnacle_games, kalshi_games = _slate()
+
+    aligned = matcher.align_games(pinnacle_games, kalshi_games)
+    aligned_by_pinnacle = {a['pinnacle_data']['game_id']: a['kalshi_data'] for a in aligned}
+
+    def matchup(game):
+        sport = game['sport']
+        teams = frozenset(matcher._canonical_team_code(game[side], sport) for side in ('home_team', 'away_team'))
+        return sport, teams, game['game_date']
+
+    listed = {matchup(game) for game in kalshi_games}
+    for pinnacle_game in pinnacle_games:
+        if matchup(pinnacle_game) in listed:
+            assert matchup(aligned_by_pinnacle[pinnacle_game['game_id']]) == matchup(pinnacle_game)
+
+    assert len(aligned) == len(kalshi_games)
+
+def test_candidates_limited_to_shared_buckets():
+    """Games with other teams or far-off dates are never scored"""
+    matcher = GameMatcher(time_threshold_hours=6.0)
+    pinnacle_game = _game('pinnacle', 'MLB', 'NYY', 'BOS', '2025-09-15', 0)
+    kalshi_games = [
+        _game('kalshi', 'MLB', 'Boston Red Sox', 'New York Yankees', '2025-09-15', 0),
+        _game('kalshi', 'MLB', 'Houston Astros', 'Texas Rangers', '2025-09-15', 1),
+        _game('kalshi', 'MLB', 'Yankees', 'Red Sox', '2025-09-25', 2),
+        _game('kalshi', 'NFL', 'New York Giants', 'Buffalo Bills', '2025-09-15', 3),
+    ]
+
+    index = matcher._build_candidate_index(kalshi_games)
+    assert matcher._get_candidate_indices(pinnacle_game, index, len(kalshi_games)) == [0]
+
+if __name__ == "__main__":
+    print("INDEXED MATCHING TEST")
+    print("=" * 50)
+    test_alias_hits_resolve_without_fuzzy_matching()
+    print("PASS Alias hits resolve via hash map")
+    test_indexed_alignment_finds_every_listed_game()
+    print("PASS Indexed alignment finds every listed game")
+    test_candidates_limited_to_shared_buckets()
+    print("PASS Candidates limited to shared buckets")
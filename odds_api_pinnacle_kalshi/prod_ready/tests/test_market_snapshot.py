@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental Kalshi snapshot refresh
+"""
+
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+from datetime import datetime, timezone, timedelta
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.kalshi_client import KalshiClientUpdated
+from core.market_snapshot import KalshiSnapshotStore
+from core.main_system import MispricingSystem
+from tests.conftest import write_credentials
+
+def _make_client(credentials_file: str) -> KalshiClientUpdated:
+    """Create a client backed by a throwaway credentials file"""
+    return KalshiClientUpdated(credentials_file)
+
+def _market(ticker: str, title: str, yes_bid: int, no_bid: int, hours_ahead: float = 3) -> dict:
+    """Build a raw Kalshi market whose filter time falls back to close_time"""
+    close_time = (datetime.now(timezone.utc) + timedelta(hours=hours_ahead)).isoformat()
+    return {
+        'ticker': ticker,
+        'title': title,
+        'yes_bid': yes_bid,
+        'no_bid': no_bid,
+        'status': 'active',
+        'close_time': close_time,
+        'detected_sport': 'mlb'
+    }
+
+def _raw(markets: list) -> dict:
+    return {'success': True, 'data': markets, 'timestamp': datetime.now(timezone.utc).isoformat()}
+
+def test_only_changed_markets_are_renormalized(credentials_file):
+    """Second refresh should emit just the market whose price moved"""
+    client = _make_client(credentials_file)
+    store = KalshiSnapshotStore()
+    oak = _market('KXMLBGAME-OAKMIN', 'Oakland at Minnesota Winner?', 45, 55)
+    tex = _market('KXMLBGAME-TEXSEA', 'Texas at Seattle Winner?', 60, 40)
+
+    first = store.refresh(_raw([oak, tex]), client)
+    assert len(first['changed']) == 2
+    assert len(store.get_all_games()) == 2
+
+    moved_tex = dict(tex, yes_bid=62, no_bid=38)
+    second = store.refresh(_raw([dict(oak), moved_tex]), client)
+    assert [g['game_id'] for g in second['changed']] == ['kalshi_KXMLBGAME-TEXSEA']
+    assert second['unchanged_count'] == 1
+    assert store.get_game('KXMLBGAME-TEXSEA')['metadata']['kalshi_yes_price'] == 0.62
+
+    third = store.refresh(_raw([dict(oak), dict(moved_tex)]), client)
+    assert third['changed'] == []
+    assert third['unchanged_count'] == 2
+
+def test_missing_markets_are_removed(credentials_file):
+    """Markets that disappear from the fetch are dropped from the store"""
+    client = _make_client(credentials_file)
+    store = KalshiSnapshotStore()
+    oak = _market('KXMLBGAME-OAKMIN', 'Oakland at Minnesota Winner?', 45, 55)
+    tex = _market('KXMLBGAME-TEXSEA', 'Texas at Seattle Winner?', 60, 40)
+
+    store.refresh(_raw([oak, tex]), client)
+    delta = store.refresh(_raw([oak]), client)
+
+    assert delta['removed'] == ['KXMLBGAME-TEXSEA']
+    assert store.get_game('KXMLBGAME-TEXSEA') is None
+    assert len(store) == 1
+
+    # Markets missing from a series whose pagination failed partway are kept
+    incomplete = dict(_raw([]), incomplete_series=['KXMLBGAME'])
+    assert store.refresh(incomplete, client)['removed'] == []
+    assert len(store) == 1
+
+def test_failed_fetch_keeps_snapshot(credentials_file):
+    """A failed fetch should not wipe the store"""
+    client = _make_client(credentials_file)
+    store = KalshiSnapshotStore()
+    store.refresh(_raw([_market('KXMLBGAME-OAKMIN', 'Oakland at Minnesota Winner?', 45, 55)]), client)
+
+    delta = store.refresh({'success': False, 'error': 'timeout'}, client)
+    assert delta['changed'] == [] and delta['removed'] == []
+    assert len(store.get_all_games()) == 1
+
+def test_incremental_run_aligns_unchanged_markets(credentials_file):
+    """A Pinnacle move against an unchanged Kalshi market is still detected in incremental mode"""
+    system = MispricingSystem({
+        'pinnacle_api_key_file': credentials_file,
+        'kalshi_credentials_file': credentials_file,
+        'save_results_to_file': False,
+        'incremental_kalshi_refresh': True
+    })
+
+    def game(game_id, home_prob):
+        odds = lambda p: {'american': int(round(-100 * p / (1 - p))) if p > 0.5 else int(round(100 * (1 - p) / p)),
+                          'implied_probability': p}
+        return {'game_id': game_id, 'sport': 'MLB', 'home_team': 'NYY', 'away_team': 'BOS',
+                'game_date': '2099-07-04', 'game_time': '19:05',
+                'home_odds': odds(home_prob), 'away_odds': odds(1 - home_prob)}
+
+    pinnacle_prob = {'home': 0.50}
+    market = {'ticker': 'KXMLBGAME-NYYBOS', 'yes_bid': 50, 'no_bid': 50, 'status': 'active',
+              'close_time': '2099-07-05T00:00:00Z'}
+    patches = [
+        patch.object(system.pinnacle_client, 'get_sports_odds',
+                     return_value={'success': True, 'data': [], 'timestamp': 'now'}),
+        patch.object(system.pinnacle_client, 'normalize_pinnacle_data',
+                     side_effect=lambda raw, buffer: [game('pinnacle_1', pinnacle_prob['home'])]),
+        patch.object(system.kalshi_client, 'search_sports_markets',
+                     return_value={'success': True, 'data': [market], 'timestamp': 'now'}),
+        patch.object(system.kalshi_client, 'normalize_kalshi_data',
+                     side_effect=lambda raw, buffer: [game(f"kalshi_{m['ticker']}", m['no_bid'] / 100)
+                                                      for m in raw['data']]),
+    ]
+    for p in patches:
+        p.start()
+    try:
+        first = system.run_analysis('mlb')
+        assert first['kalshi_data']['delta']['changed_count'] == 1
+        assert first['opportunities'] == []
+
+        # Kalshi is unchanged (nothing re-normalized) but Pinnacle moved enough to open an edge
+        pinnacle_prob['home'] = 0.60
+        second = system.run_analysis('mlb')
+        assert second['kalshi_data']['delta']['changed_count'] == 0
+        assert len(second['aligned_games']) == 1
+        assert len(second['opportunities']) == 1
+
+        # The opportunity stays reported while nothing moves
+        assert len(system.run_analysis('mlb')['opportunities']) == 1
+    finally:
+        for p in patches:
+            p.stop()
+
+if __name__ == "__main__":
+    credentials_file = write_credentials(tempfile.mkdtemp())
+    print("KALSHI SNAPSHOT STORE TEST")
+    print("=" * 50)
+    test_only_changed_markets_are_renormalized(credentials_file)
+    print("PASS Only changed markets re-normalized")
+    test_missing_markets_are_removed(credentials_file)
+    print("PASS Missing markets removed")
+    test_failed_fetch_keeps_snapshot(credentials_file)
+    print("PASS Failed fetch keeps snapshot")
+    test_incremental_run_aligns_unchanged_markets(credentials_file)
+    print("PASS Incremental run aligns unchanged markets")
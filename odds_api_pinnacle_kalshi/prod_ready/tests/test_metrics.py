@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script for pipeline metrics, their exporters and the console switch
+"""
+
+import sys
+import os
+import io
+import json
+import pathlib
+import tempfile
+import contextlib
+import urllib.request
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.metrics import MetricsRegistry, start_metrics_server
+from utils.console import console, set_console_output
+from core.main_system import MispricingSystem
+from tests.conftest import write_credentials
+
+def test_registry_snapshot():
+    """Counters add up per label set, histograms bucket cumulatively"""
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.inc('games_aligned_total', 3, sport='mlb')
+    registry.inc('games_aligned_total', 2, sport='mlb')
+    registry.inc('games_aligned_total', sport='nfl')
+    registry.observe('pipeline_stage_seconds', 0.05, sport='mlb', stage='align')
+    registry.observe('pipeline_stage_seconds', 0.5, sport='mlb', stage='align')
+    with registry.timer('pipeline_stage_seconds', sport='mlb', stage='detect'):
+        pass
+
+    snapshot = registry.snapshot()
+    counters = {s['labels']['sport']: s['value'] for s in snapshot['counters']['games_aligned_total']}
+    assert counters == {'mlb': 5, 'nfl': 1}
+    align = [h for h in snapshot['histograms']['pipeline_stage_seconds'] if h['labels']['stage'] == 'align'][0]
+    assert align['count'] == 2 and align['buckets'] == {'0.1': 1, '1.0': 2}
+    assert abs(align['mean'] - 0.275) < 1e-9
+
+def test_prometheus_and_json_exports(tmp_path):
+    """Text exposition has HELP/TYPE lines, +Inf buckets and collector gauges; JSON file is replaced atomically"""
+    registry = MetricsRegistry(buckets=(0.1,))
+    registry.inc('http_requests_total', host='api.example.com', endpoint='/odds', status='200')
+    registry.observe('http_request_seconds', 2.0, host='api.example.com', endpoint='/odds')
+    registry.register_collector('quota', lambda: [('odds_api_requests_remaining', {}, 420),
+                                                  ('odds_api_cache_hit_rate', {}, None)])
+
+    text = registry.to_prometheus()
+    assert '# TYPE http_requests_total counter' in text
+    assert 'http_requests_total{endpoint="/odds",host="api.example.com",status="200"} 1' in text
+    assert 'http_request_seconds_bucket{endpoint="/odds",host="api.example.com",le="0.1"} 0' in text
+    assert 'http_request_seconds_bucket{endpoint="/odds",host="api.example.com",le="+Inf"} 1' in text
+    assert 'odds_api_requests_remaining 420' in text
+    assert 'odds_api_cache_hit_rate' not in text
+
+    path = os.path.join(tmp_path, 'metrics.json')
+    registry.write_json(path)
+    with open(path) as f:
+        assert json.load(f)['gauges']['odds_api_requests_remaining'][0]['value'] == 420
+
+    server = start_metrics_server(registry, 0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert b'http_requests_total' in response.read()
+    finally:
+        server.shutdown()
+
+def test_pipeline_records_stage_timings(credentials_file, tmp_path):
+    """A run reports stage_seconds, fills the stage histogram and writes the metrics file"""
+    metrics_path = os.path.join(tmp_path, 'metrics.json')
+    system = MispricingSystem({
+        'pinnacle_api_key_file': credentials_file,
+        'kalshi_credentials_file': credentials_file,
+        'save_results_to_file': False,
+        'console_output': False,
+        'metrics_file_path': metrics_path
+    })
+    system.metrics.reset()
+
+    def game(source, home_prob):
+        return {'game_id': f"{source}_1", 'sport': 'MLB', 'home_team': 'NYY', 'away_team': 'BOS',
+                'game_date': '2025-09-15', 'game_time': '19:05',
+                'home_odds': {'american': -150, 'implied_probability': home_prob},
+                'away_odds': {'american': 130, 'implied_probability': 1 - home_prob}}
+
+    fetched = {'success': True, 'data': [{}, {}], 'timestamp': 'now'}
+    output = io.StringIO()
+    with patch.object(system.pinnacle_client, 'get_sports_odds', return_value=fetched), \
+         patch.object(system.kalshi_client, 'search_sports_markets', return_value=fetched), \
+         patch.object(system.pinnacle_client, 'normalize_pinnacle_data', return_value=[game('pinnacle', 0.60)]), \
+         patch.object(system.kalshi_client, 'normalize_kalshi_data', return_value=[game('kalshi', 0.50)]), \
+         contextlib.redirect_stdout(output):
+        results = system.run_analysis('mlb')
+    set_console_output(True)
+
+    assert results['status'] == 'completed'
+    assert 'Step 1' not in output.getvalue()
+    stages = results['summary']['stage_seconds']
+    assert set(stages) == {'fetch_pinnacle', 'normalize_pinnacle', 'fetch_kalshi', 'normalize_kalshi', 'align', 'detect'}
+
+    with open(metrics_path) as f:
+        snapshot = json.load(f)
+    timed = {h['labels']['stage'] for h in snapshot['histograms']['pipeline_stage_seconds']}
+    assert timed == set(stages)
+    fetched_counts = {s['labels']['platform']: s['value'] for s in snapshot['counters']['markets_fetched_total']}
+    assert fetched_counts == {'pinnacle': 2, 'kalshi': 2}
+    assert snapshot['counters']['games_aligned_total'][0]['value'] == 1
+    assert snapshot['counters']['pipeline_runs_total'][0]['labels'] == {'sport': 'mlb', 'status': 'completed'}
+    assert 'odds_api_upstream_requests' in snapshot['gauges']
+
+def test_console_switch():
+    """console() prints only while console output is enabled"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        set_console_output(False)
+        console("hidden")
+        set_console_output(True)
+        console("shown")
+    assert output.getvalue() == "shown\n"
+
+if __name__ == "__main__":
+    scratch = tempfile.TemporaryDirectory()
+    credentials_file = write_credentials(scratch.name)
+    print("METRICS TEST")
+    print("=" * 50)
+    test_registry_snapshot()
+    print("PASS Registry snapshot")
+    test_prometheus_and_json_exports(pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Prometheus and JSON exports")
+    test_pipeline_records_stage_timings(credentials_file, pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Pipeline records stage timings")
+    test_console_switch()
+    print("PASS Console switch")
+    scratch.cleanup()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test script for the quota-aware Odds API scheduler
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.odds_api_scheduler import OddsApiScheduler, estimate_request_cost
+from core.pinnacle_client import PinnacleClient
+from tests.conftest import write_credentials
+
+class FakeResponse:
+    """Minimal requests.Response stand-in carrying Odds API quota headers"""
+
+    def __init__(self, data, remaining=480, used=20, last=1):
+        self._data = data
+        self.headers = {
+            'x-requests-remaining': str(remaining),
+            'x-requests-used': str(used),
+            'x-requests-last': str(last)
+        }
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+def test_quota_headers_and_cost():
+    """Headers update the quota state and the per-key cost"""
+    scheduler = OddsApiScheduler(default_ttl=0)
+    fake_get = lambda url, params=None: FakeResponse([{'id': 'g1'}], remaining=480, used=20, last=3)
+
+    data, from_cache = scheduler.get_json('url', {}, ('mlb',), fake_get)
+    assert data == [{'id': 'g1'}] and not from_cache
+
+    stats = scheduler.get_stats()
+    assert stats['requests_remaining'] == 480
+    assert stats['requests_used'] == 20
+    assert stats['last_request_cost'] == 3
+    assert scheduler._request_costs[('mlb',)] == 3
+
+    assert estimate_request_cost('h2h', 'us', 'pinnacle') == 1
+    assert estimate_request_cost('h2h,spreads,totals', 'us,eu', '') == 6
+    assert estimate_request_cost('h2h,spreads', '', ','.join(f'b{i}' for i in range(28))) == 6
+
+def test_cache_hit_within_ttl():
+    """A second identical request inside the TTL does not hit the API"""
+    scheduler = OddsApiScheduler(default_ttl=60)
+    calls = []
+    def fake_get(url, params=None):
+        calls.append(url)
+        return FakeResponse([{'id': 'g1'}])
+
+    scheduler.get_json('url', {}, ('mlb',), fake_get)
+    data, from_cache = scheduler.get_json('url', {}, ('mlb',), fake_get)
+    assert from_cache and data == [{'id': 'g1'}]
+    assert len(calls) == 1
+
+    scheduler.get_json('url', {}, ('nfl',), fake_get)
+    assert len(calls) == 2
+
+    scheduler.invalidate(('mlb',))
+    scheduler.get_json('url', {}, ('mlb',), fake_get)
+    assert len(calls) == 3
+
+def test_concurrent_requests_coalesce():
+    """Callers racing on the same key share one upstream request"""
+    scheduler = OddsApiScheduler(default_ttl=60)
+    calls = []
+    def slow_get(url, params=None):
+        calls.append(url)
+        time.sleep(0.2)
+        return FakeResponse([{'id': 'g1'}])
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(scheduler.get_json('url', {}, ('mlb',), slow_get)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert sum(1 for _, from_cache in results if not from_cache) == 1
+    assert scheduler.get_stats()['coalesced'] >= 1
+
+def test_budget_stretches_poll_interval():
+    """Poll interval spreads the daily budget across active keys"""
+    scheduler = OddsApiScheduler(default_ttl=0, daily_budget=1440, min_poll_interval=1)
+    assert scheduler.poll_interval(('mlb',)) == 60
+
+    fake_get = lambda url, params=None: FakeResponse([], last=2)
+    scheduler.get_json('url', {}, ('mlb',), fake_get)
+    scheduler.get_json('url', {}, ('nfl',), fake_get)
+    # Two active keys at cost 2 -> 360 polls/day each
+    assert scheduler.poll_interval(('mlb',)) == 240
+
+    # Budget-derived freshness keeps serving the cache even with a zero TTL
+    _, from_cache = scheduler.get_json('url', {}, ('mlb',), fake_get)
+    assert from_cache
+
+    unbudgeted = OddsApiScheduler()
+    assert unbudgeted.poll_interval(('mlb',)) == 0
+
+def test_pinnacle_client_uses_scheduler(credentials_file):
+    """PinnacleClient routes fetches through its scheduler and reports cache use"""
+
+    calls = []
+    class FakeTransport:
+        def get(self, url, params=None):
+            calls.append(params)
+            return FakeResponse([{'id': 'g1'}])
+
+    scheduler = OddsApiScheduler(default_ttl=60)
+    client = PinnacleClient(credentials_file, http_transport=FakeTransport(), scheduler=scheduler)
+
+    first = client.get_sports_odds('mlb')
+    time.sleep(0.01)
+    second = client.get_sports_odds('mlb')
+    assert first['success'] and second['success']
+    assert not first['from_cache'] and second['from_cache']
+    # A cached response reports when its quotes were fetched, not when it was served
+    assert second['timestamp'] == first['timestamp']
+    assert second['data_age_seconds'] >= 0
+    assert len(calls) == 1 and calls[0]['bookmakers'] == 'pinnacle'
+    assert second['quota']['requests_remaining'] == 480
+    assert client.get_poll_interval('mlb') >= 0
+
+if __name__ == "__main__":
+    credentials_file = write_credentials(tempfile.mkdtemp())
+    print("ODDS API SCHEDULER TEST")
+    print("=" * 50)
+    test_quota_headers_and_cost()
+    print("PASS Quota headers and cost")
+    test_cache_hit_within_ttl()
+    print("PASS Cache hit within TTL")
+    test_concurrent_requests_coalesce()
+    print("PASS Concurrent requests coalesce")
+    test_budget_stretches_poll_interval()
+    print("PASS Budget stretches poll interval")
+    test_pinnacle_client_uses_scheduler(credentials_file)
+    print("PASS PinnacleClient uses scheduler")
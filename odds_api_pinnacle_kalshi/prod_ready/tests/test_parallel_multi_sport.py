@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the parallel multi-sport pipeline
+"""
+
+import sys
+import os
+import time
+import tempfile
+from datetime import timedelta
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.main_system import MispricingSystem
+from config.sports_config import SPORTS_CONFIG
+from tests.conftest import write_credentials
+
+SPORTS = ['mlb', 'nfl', 'nba', 'nhl']
+FETCH_DELAY = 0.2
+
+def _make_system(credentials_file: str) -> MispricingSystem:
+    """System with throwaway key files and no results file"""
+    return MispricingSystem({
+        'pinnacle_api_key_file': credentials_file,
+        'kalshi_credentials_file': credentials_file,
+        'save_results_to_file': False
+    })
+
+def _odds(probability: float) -> dict:
+    return {'american': -110, 'implied_probability': probability}
+
+def _game(source: str, sport: str, home: str, away: str, home_prob: float) -> dict:
+    return {
+        'game_id': f"{source}_{sport}_{home}_{away}",
+        'sport': sport.upper(),
+        'home_team': home,
+        'away_team': away,
+        'game_date': '2025-09-15',
+        'game_time': '19:05',
+        'home_odds': _odds(home_prob),
+        'away_odds': _odds(1 - home_prob)
+    }
+
+def _fake_slate(system: MispricingSystem):
+    """Slow fake fetches plus normalizers returning one mispriced game per sport"""
+    def slow_fetch(sport_type):
+        time.sleep(FETCH_DELAY)
+        return {'success': True, 'data': [], 'sport': sport_type, 'timestamp': 'now'}
+
+    def pinnacle_games(raw_data, buffer):
+        sport = raw_data['sport']
+        home, away = list(SPORTS_CONFIG[sport].team_aliases)[:2]
+        return [_game('pinnacle', sport, home, away, 0.60)]
+
+    def kalshi_games(raw_data, buffer):
+        sport = raw_data['sport']
+        home, away = list(SPORTS_CONFIG[sport].team_aliases)[:2]
+        # Larger edge for later sports so the merged ordering is checkable
+        return [_game('kalshi', sport, home, away, 0.60 - 0.05 * (SPORTS.index(sport) + 1))]
+
+    return [
+        patch.object(system.pinnacle_client, 'get_sports_odds', side_effect=slow_fetch),
+        patch.object(system.kalshi_client, 'search_sports_markets', side_effect=slow_fetch),
+        patch.object(system.pinnacle_client, 'normalize_pinnacle_data', side_effect=pinnacle_games),
+        patch.object(system.kalshi_client, 'normalize_kalshi_data', side_effect=kalshi_games),
+    ]
+
+def _run(parallel: bool, credentials_file: str):
+    system = _make_system(credentials_file)
+    patches = _fake_slate(system)
+    for p in patches:
+        p.start()
+    try:
+        start = time.perf_counter()
+        results = system.run_multi_sport_analysis(SPORTS, parallel=parallel)
+        return results, time.perf_counter() - start
+    finally:
+        for p in patches:
+            p.stop()
+
+def test_each_sport_gets_own_tools(credentials_file):
+    """Matcher/detector thresholds come from each sport's config, not shared state"""
+    system = _make_system(credentials_file)
+    for sport in SPORTS:
+        matcher, detector = system._get_sport_tools(sport)
+        config = SPORTS_CONFIG[sport]
+        assert matcher.time_threshold == timedelta(hours=config.time_threshold_hours)
+        assert detector.min_edge == config.min_edge_threshold
+        assert detector.min_confidence == config.match_confidence_threshold
+    assert system._get_sport_tools('mlb')[0] is not system._get_sport_tools('nfl')[0]
+
+def test_parallel_matches_sequential_and_overlaps_io(credentials_file):
+    """Parallel run merges to the same summary in about one sport's fetch time"""
+    parallel_results, parallel_time = _run(parallel=True, credentials_file=credentials_file)
+    sequential_results, sequential_time = _run(parallel=False, credentials_file=credentials_file)
+
+    for key in ('total_opportunities', 'total_aligned_games', 'best_overall_edge', 'sports_with_opportunities'):
+        assert parallel_results['combined_summary'][key] == sequential_results['combined_summary'][key]
+
+    parallel_top = [opp['opportunity_id'] + opp['kalshi_odds']['game_id'] for opp in parallel_results['top_opportunities']]
+    sequential_top = [opp['opportunity_id'] + opp['kalshi_odds']['game_id'] for opp in sequential_results['top_opportunities']]
+    assert parallel_top == sequential_top
+    assert parallel_results['top_opportunities'][0]['kalshi_odds']['sport'] == 'NHL'
+
+    assert all(r['status'] == 'completed' for r in parallel_results['individual_results'].values())
+    # Fetch stages are timed on the I/O pool, so they measure the request rather than the wait for it
+    for results in parallel_results['individual_results'].values():
+        stages = results['summary']['stage_seconds']
+        assert stages['fetch_pinnacle'] >= FETCH_DELAY and stages['fetch_kalshi'] >= FETCH_DELAY
+    assert sequential_time >= 2 * FETCH_DELAY * len(SPORTS)
+    assert parallel_time < sequential_time / 2
+
+if __name__ == "__main__":
+    credentials_file = write_credentials(tempfile.mkdtemp())
+    print("PARALLEL MULTI-SPORT TEST")
+    print("=" * 50)
+    test_each_sport_gets_own_tools(credentials_file)
+    print("PASS Each sport gets its own matcher/detector")
+    test_parallel_matches_sequential_and_overlaps_io(credentials_file)
+    print("PASS Parallel run matches sequential and overlaps I/O")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for the synthetic slate generator and pipeline benchmark
+"""
+
+import sys
+import os
+import re
+import copy
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.slate_generator import SlateGenerator
+from benchmarks.pipeline_benchmark import PipelineBenchmark, compare_reports, STAGES
+
+def test_generation_is_deterministic():
+    """Same seed, same payloads; a different seed changes them"""
+    first = SlateGenerator(seed=7).generate(200, {'mlb': 1, 'nba': 1})
+    second = SlateGenerator(seed=7).generate(200, {'mlb': 1, 'nba': 1})
+    other = SlateGenerator(seed=8).generate(200, {'mlb': 1, 'nba': 1})
+
+    assert first == second
+    assert first != other
+    assert sorted(first) == ['mlb', 'nba']
+    assert sum(len(sport['kalshi']['data']) for sport in first.values()) == 200
+
+def test_payloads_use_live_formats():
+    """Tickers, titles and Odds API events look like the live APIs"""
+    slate = SlateGenerator(seed=1).generate_sport('nfl', 20)
+    market = slate['kalshi']['data'][0]
+    assert re.match(r'^KXNFLGAME-25[A-Z]{3}\d{2}[A-Z]+-[A-Z]+$', market['ticker'])
+    assert market['title'].endswith(' Winner?') and ' at ' in market['title']
+    assert market['yes_sub_title'] in market['title']
+
+    event = slate['pinnacle']['data'][0]
+    assert event['bookmakers'][0]['key'] == 'pinnacle'
+    outcomes = {outcome['name'] for outcome in event['bookmakers'][0]['markets'][0]['outcomes']}
+    assert outcomes == {event['home_team'], event['away_team']}
+
+def test_generated_slate_flows_through_pipeline():
+    """Nearly every Pinnacle event normalizes and aligns; stats are recorded per stage"""
+    benchmark = PipelineBenchmark(SlateGenerator(seed=3))
+    report = benchmark.run([40, 400], {'mlb': 1, 'nhl': 1}, repeat=1, track_memory=True)
+
+    assert [result['size'] for result in report['results']] == [40, 400]
+    large = report['results'][1]
+    assert large['kalshi_markets'] == 400
+    for sport in large['sports']:
+        assert sport['pinnacle_games'] == sport['pinnacle_events']
+        assert sport['kalshi_games'] == sport['kalshi_markets']
+        assert sport['aligned_games'] >= 0.95 * sport['pinnacle_games']
+    assert 0 < large['opportunities'] < large['aligned_games']
+
+    for stage in STAGES:
+        assert large['stages'][stage]['seconds_min'] > 0
+        assert large['stages'][stage]['peak_bytes'] > 0
+
+def test_baseline_comparison_flags_regressions():
+    """Stages slower than the baseline beyond the tolerance are reported"""
+    report = PipelineBenchmark().run([20], {'mlb': 1}, repeat=1, track_memory=False)
+    baseline = copy.deepcopy(report)
+    assert compare_reports(report, baseline) == []
+
+    baseline['results'][0]['stages']['align_games']['seconds_min'] /= 2
+    regressions = compare_reports(report, baseline, tolerance=0.2)
+    assert [(r['stage'], r['metric']) for r in regressions] == [('align_games', 'seconds_min')]
+
+if __name__ == "__main__":
+    print("PIPELINE BENCHMARK TEST")
+    print("=" * 50)
+    test_generation_is_deterministic()
+    print("PASS Generation is deterministic")
+    test_payloads_use_live_formats()
+    print("PASS Payloads use live formats")
+    test_generated_slate_flows_through_pipeline()
+    print("PASS Generated slate flows through pipeline")
+    test_baseline_comparison_flags_regressions()
+    print("PASS Baseline comparison flags regressions")
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Test script for the continuous polling daemon
+"""
+
+import sys
+import os
+import json
+import asyncio
+import tempfile
+import threading
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.main_system import MispricingSystem
+from core.polling_daemon import MispricingDaemon
+from core.depth_pricing import DepthPricer
+from core.kalshi_stream import KalshiTickFeed
+from tests.conftest import write_credentials
+
+def _make_system(credentials_file: str) -> MispricingSystem:
+    return MispricingSystem({
+        'pinnacle_api_key_file': credentials_file,
+        'kalshi_credentials_file': credentials_file,
+        'save_results_to_file': False
+    })
+
+def _odds(probability: float) -> dict:
+    return {'american': int(round(-100 * probability / (1 - probability))) if probability > 0.5
+            else int(round(100 * (1 - probability) / probability)),
+            'implied_probability': probability}
+
+def _game(game_id: str, home_prob: float) -> dict:
+    return {
+        'game_id': game_id,
+        'sport': 'MLB',
+        'home_team': 'NYY',
+        'away_team': 'BOS',
+        'game_date': '2099-07-04',
+        'game_time': '19:05',
+        'home_odds': _odds(home_prob),
+        'away_odds': _odds(1 - home_prob)
+    }
+
+class _FakeMarkets:
+    """Mutable Kalshi book served to the daemon each cycle"""
+
+    def __init__(self):
+        self.home_cents = 50
+
+    def fetch(self, sport):
+        market = {'ticker': 'KXMLBGAME-NYYBOS', 'yes_bid': 100 - self.home_cents,
+                  'no_bid': self.home_cents, 'status': 'active', 'close_time': '2099-07-05T00:00:00Z'}
+        return {'success': True, 'data': [market], 'timestamp': 'now'}
+
+    def normalize(self, raw_data, buffer):
+        return [_game(f"kalshi_{m['ticker']}", m['no_bid'] / 100) for m in raw_data['data']]
+
+def _make_daemon(credentials_file: str, output_path=None):
+    system = _make_system(credentials_file)
+    markets = _FakeMarkets()
+    patches = [
+        patch.object(system.pinnacle_client, 'get_sports_odds',
+                     return_value={'success': True, 'data': [], 'timestamp': 'now'}),
+        patch.object(system.pinnacle_client, 'normalize_pinnacle_data',
+                     side_effect=lambda raw, buffer: [_game('pinnacle_1', 0.60)]),
+        patch.object(system.kalshi_client, 'search_sports_markets', side_effect=markets.fetch),
+        patch.object(system.kalshi_client, 'normalize_kalshi_data', side_effect=markets.normalize),
+    ]
+    for p in patches:
+        p.start()
+    daemon = MispricingDaemon(system, sports=['mlb'], default_interval=0.01, output_path=output_path)
+    return daemon, markets, patches
+
+def _stop(daemon, patches):
+    daemon.close()
+    for p in patches:
+        p.stop()
+
+def test_emits_only_new_changed_and_closed(credentials_file):
+    """Unchanged cycles emit nothing and skip matching/detection"""
+    daemon, markets, patches = _make_daemon(credentials_file)
+    try:
+        first = daemon.run_cycle('mlb')
+        assert [e['event'] for e in first] == ['new']
+        assert first[0]['max_edge'] == 0.1
+
+        matcher, detector = daemon.system._get_sport_tools('mlb')
+        with patch.object(matcher, 'align_games', wraps=matcher.align_games) as align, \
+             patch.object(detector, 'detect_opportunities', wraps=detector.detect_opportunities) as detect:
+            assert daemon.run_cycle('mlb') == []
+            align.assert_not_called()
+            detect.assert_not_called()
+
+        markets.home_cents = 55
+        changed = daemon.run_cycle('mlb')
+        assert [e['event'] for e in changed] == ['changed']
+        assert changed[0]['previous_edge'] == 0.1 and changed[0]['max_edge'] == 0.05
+
+        markets.home_cents = 60
+        assert [e['event'] for e in daemon.run_cycle('mlb')] == ['closed']
+        assert daemon.states['mlb'].opportunities == {}
+    finally:
+        _stop(daemon, patches)
+
+def test_kalshi_tick_reevaluates_only_affected_game(credentials_file):
+    """A streamed tick updates the matching pair without a REST poll"""
+    daemon, markets, patches = _make_daemon(credentials_file)
+    try:
+        daemon.run_cycle('mlb')
+
+        # Ticker feed reports yes_bid/yes_ask; the price book derives no_bid = 100 - yes_ask
+        tick = {'market_ticker': 'KXMLBGAME-NYYBOS', 'yes_bid': 42, 'yes_ask': 44, 'no_bid': 56}
+        with patch.object(daemon.system.kalshi_client, 'search_sports_markets') as rest_poll:
+            events = daemon.apply_kalshi_tick('mlb', tick)
+            rest_poll.assert_not_called()
+        assert [e['event'] for e in events] == ['changed']
+        assert events[0]['max_edge'] == 0.04
+
+        assert daemon.apply_kalshi_tick('mlb', tick) == []
+        assert daemon.apply_kalshi_tick('mlb', {'market_ticker': 'KXMLBGAME-OTHER', 'yes_bid': 10}) == []
+    finally:
+        _stop(daemon, patches)
+
+class _StubWebSocketClient:
+    """Stands in for KalshiWebSocketClient: connect() idles until stop()"""
+
+    def __init__(self):
+        self.callbacks = []
+        self.connected = threading.Event()
+        self._stop = None
+
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+
+    async def connect(self):
+        self._stop = asyncio.Event()
+        self.connected.set()
+        await self._stop.wait()
+
+    async def stop(self):
+        self._stop.set()
+
+def test_tick_feed_waits_for_cycle_and_routes_by_sport(credentials_file):
+    """Feed ticks reach apply_kalshi_tick only for polled sports and wait out a running cycle"""
+    daemon, markets, patches = _make_daemon(credentials_file)
+    client = _StubWebSocketClient()
+    feed = KalshiTickFeed(daemon, client)
+    try:
+        daemon.run_cycle('mlb')
+        tick = {'market_ticker': 'KXMLBGAME-NYYBOS', 'yes_bid': 42, 'yes_ask': 44, 'no_bid': 56}
+        results = []
+
+        # While a cycle holds the state lock, a tick from the feed thread waits for it
+        with daemon._state_lock:
+            worker = threading.Thread(target=lambda: results.append(client.callbacks[0](tick)))
+            worker.start()
+            worker.join(timeout=0.2)
+            assert worker.is_alive() and results == []
+        worker.join(timeout=5)
+        assert [e['event'] for e in results[0]] == ['changed']
+
+        assert feed.handle_update({'market_ticker': 'KXNFLGAME-25SEP07BUFKC-KC', 'yes_bid': 40}) == []
+        assert (feed.ticks_received, feed.ticks_applied) == (2, 1)
+
+        feed.start()
+        assert client.connected.wait(timeout=5)
+        feed.stop()
+        assert feed._thread is None
+    finally:
+        feed.stop()
+        _stop(daemon, patches)
+
+def test_depth_pricing_flags_thin_books(credentials_file):
+    """With depth pricing on, re-checked pairs are priced from the book and thin sides are flagged"""
+    daemon, markets, patches = _make_daemon(credentials_file)
+    books = {'KXMLBGAME-NYYBOS': {'yes': [[40, 10]], 'no': [[48, 10]]}}
+    try:
+        daemon.system.depth_pricer = DepthPricer(daemon.system.kalshi_client, stake=100)
+        with patch.object(daemon.system.kalshi_client, 'get_orderbook',
+                          side_effect=lambda ticker, depth=20: books.get(ticker)):
+            first = daemon.run_cycle('mlb')
+        # YES (away, the recommended side) asks 52c x 10: $5.20 of the $100 stake fills, so it stays top of book
+        assert [e['event'] for e in first] == ['new']
+        assert first[0]['max_edge'] == 0.1
+        assert first[0]['fully_fillable'] is False
+        assert first[0]['fillable_stake'] == 5.2
+        # Stored pairs keep the snapshot store's top-of-book game
+        pair = daemon.states['mlb'].pairs['pinnacle_1']
+        assert 'depth' not in (pair['kalshi_data'].get('metadata') or {})
+    finally:
+        _stop(daemon, patches)
+
+def test_run_writes_ndjson_events(credentials_file):
+    """run() polls on cadence and appends events to the output file"""
+    events_file = tempfile.NamedTemporaryFile('w', suffix='.ndjson', delete=False)
+    events_file.close()
+    daemon, markets, patches = _make_daemon(credentials_file, events_file.name)
+    try:
+        daemon.run(max_cycles=3)
+        assert daemon.states['mlb'].cycles == 3
+        with open(events_file.name) as f:
+            events = [json.loads(line) for line in f]
+        assert [e['event'] for e in events] == ['new']
+        assert events[0]['matchup'] == 'BOS @ NYY'
+    finally:
+        _stop(daemon, patches)
+
+if __name__ == "__main__":
+    credentials_file = write_credentials(tempfile.mkdtemp())
+    print("POLLING DAEMON TEST")
+    print("=" * 50)
+    test_emits_only_new_changed_and_closed(credentials_file)
+    print("PASS Only new/changed/closed opportunities emitted")
+    test_kalshi_tick_reevaluates_only_affected_game(credentials_file)
+    print("PASS Kalshi tick re-evaluates only the affected game")
+    test_tick_feed_waits_for_cycle_and_routes_by_sport(credentials_file)
+    print("PASS Tick feed waits for cycles and routes by sport")
+    test_depth_pricing_flags_thin_books(credentials_file)
+    print("PASS Depth pricing flags thin books")
+    test_run_writes_ndjson_events(credentials_file)
+    print("PASS Daemon writes NDJSON events")
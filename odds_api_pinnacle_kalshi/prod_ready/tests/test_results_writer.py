@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming NDJSON results writer
+"""
+
+import sys
+import os
+import gzip
+import json
+import pathlib
+import tempfile
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.results_writer import ResultsStreamWriter, tail_results
+from core.main_system import MispricingSystem
+from tests.conftest import write_credentials
+
+def test_records_are_compact_lines(tmp_path):
+    """Each record is one compact JSON line, flushed immediately"""
+    path = os.path.join(tmp_path, 'results.ndjson')
+    writer = ResultsStreamWriter(path)
+    writer.write({'record_type': 'opportunity', 'edge': 0.07})
+    writer.write({'record_type': 'run_completed', 'when': object()})
+
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert lines[0] == '{"record_type":"opportunity","edge":0.07}'
+    assert json.loads(lines[1])['record_type'] == 'run_completed'
+    assert writer.records_written == 2
+    writer.close()
+
+def test_rotation_and_compression(tmp_path):
+    """Full files rotate to .1.gz, .2.gz and the oldest beyond backup_count is dropped"""
+    path = os.path.join(tmp_path, 'results.ndjson')
+    writer = ResultsStreamWriter(path, max_bytes=60, backup_count=2, compress=True)
+    for i in range(12):
+        writer.write({'record_type': 'aligned_game', 'index': i})
+    writer.close()
+
+    assert os.path.exists(path + '.1.gz') and os.path.exists(path + '.2.gz')
+    assert not os.path.exists(path + '.3.gz')
+    assert os.path.getsize(path) <= 60
+
+    with gzip.open(path + '.1.gz', 'rt') as f:
+        rotated = [json.loads(line)['index'] for line in f]
+    with open(path) as f:
+        live = [json.loads(line)['index'] for line in f]
+    assert rotated and live and rotated[-1] + 1 == live[0]
+
+def test_tail_reads_incrementally(tmp_path):
+    """tail_results returns only new complete lines and restarts after rotation"""
+    path = os.path.join(tmp_path, 'results.ndjson')
+    writer = ResultsStreamWriter(path)
+    writer.write({'n': 1})
+    records, offset, inode = tail_results(path)
+    assert records == [{'n': 1}]
+
+    writer.write({'n': 2})
+    with open(path, 'a') as f:
+        f.write('{"n": 3')  # partially written line
+    records, offset, inode = tail_results(path, offset, inode)
+    assert records == [{'n': 2}]
+
+    with open(path, 'a') as f:
+        f.write('}\n')
+    records, offset, inode = tail_results(path, offset, inode)
+    assert records == [{'n': 3}]
+
+    with open(path, 'w') as f:
+        f.write('{"n":4}\n')
+    records, offset, inode = tail_results(path, offset, inode)
+    assert records == [{'n': 4}]
+    writer.close()
+
+def test_tail_detects_rotation_by_inode(tmp_path):
+    """A rotated file that already grew past the old offset is still read from the start"""
+    path = os.path.join(tmp_path, 'results.ndjson')
+    writer = ResultsStreamWriter(path, max_bytes=60)
+    writer.write_many([{'n': 1}, {'n': 2}])
+    records, offset, inode = tail_results(path)
+    assert records == [{'n': 1}, {'n': 2}]
+
+    # Rotation moves the file aside; the new file outgrows the old offset before the next poll
+    writer.write_many([{'n': n, 'pad': 'x' * 20} for n in range(3, 6)])
+    writer.close()
+    assert os.path.exists(path + '.1')
+    assert os.path.getsize(path) > offset
+
+    with open(path) as f:
+        live = [json.loads(line)['n'] for line in f]
+    records, _, new_inode = tail_results(path, offset, inode)
+    assert new_inode != inode
+    assert [record['n'] for record in records] == live
+    assert tail_results(os.path.join(os.path.dirname(path), 'missing.ndjson')) == ([], 0, None)
+
+def test_pipeline_streams_stage_records(credentials_file, tmp_path):
+    """A run streams session, aligned game, opportunity and completion records"""
+    path = os.path.join(tmp_path, 'results.ndjson')
+    system = MispricingSystem({
+        'pinnacle_api_key_file': credentials_file,
+        'kalshi_credentials_file': credentials_file,
+        'results_file_path': path
+    })
+
+    def game(source, home_prob):
+        return {'game_id': f"{source}_1", 'sport': 'MLB', 'home_team': 'NYY', 'away_team': 'BOS',
+                'game_date': '2025-09-15', 'game_time': '19:05',
+                'home_odds': {'american': -150, 'implied_probability': home_prob},
+                'away_odds': {'american': 130, 'implied_probability': 1 - home_prob},
+                'metadata': {'raw_data': {'huge': 'payload'}}}
+
+    fetched = {'success': True, 'data': [], 'timestamp': 'now'}
+    with patch.object(system.pinnacle_client, 'get_sports_odds', return_value=fetched), \
+         patch.object(system.kalshi_client, 'search_sports_markets', return_value=fetched), \
+         patch.object(system.pinnacle_client, 'normalize_pinnacle_data', return_value=[game('pinnacle', 0.60)]), \
+         patch.object(system.kalshi_client, 'normalize_kalshi_data', return_value=[game('kalshi', 0.50)]):
+        results = system.run_analysis('mlb')
+        system.run_analysis('mlb')
+    system.results_writer.close()
+
+    records, _, _ = tail_results(path)
+    types = [record['record_type'] for record in records]
+    assert types == ['session_started', 'aligned_game', 'opportunity', 'run_completed',
+                     'aligned_game', 'opportunity', 'run_completed']
+    assert records[1]['run_id'] == results['run_id']
+    assert records[1]['kalshi']['game_id'] == 'kalshi_1'
+    assert 'raw_data' not in json.dumps(records[1])
+    assert records[2]['match_id'] == records[1]['match_id']
+    assert records[3]['status'] == 'completed' and 'system_config' not in records[3]['summary']
+
+if __name__ == "__main__":
+    scratch = tempfile.TemporaryDirectory()
+    credentials_file = write_credentials(scratch.name)
+    print("RESULTS WRITER TEST")
+    print("=" * 50)
+    test_records_are_compact_lines(pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Records are compact lines")
+    test_rotation_and_compression(pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Rotation and compression")
+    test_tail_reads_incrementally(pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Tail reads incrementally")
+    test_tail_detects_rotation_by_inode(pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Tail detects rotation by inode")
+    test_pipeline_streams_stage_records(credentials_file, pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Pipeline streams stage records")
+    scratch.cleanup()
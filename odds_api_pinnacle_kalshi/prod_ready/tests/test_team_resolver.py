@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared team alias resolver
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.team_resolver import TeamAliasResolver, get_team_resolver
+from core.kalshi_client import KalshiClientUpdated
+from core.pinnacle_client import PinnacleClient
+from core.data_aligner import GameMatcher
+from tests.conftest import write_credentials
+
+def test_sport_scoped_lookups():
+    """Shared nicknames resolve per sport, unknown sports use config order"""
+    resolver = TeamAliasResolver()
+    assert resolver.resolve('Cardinals', 'mlb') == 'STL'
+    assert resolver.resolve('Cardinals', 'NFL') == 'ARI'
+    assert resolver.resolve('Cardinals') == 'STL'
+    assert resolver.resolve('Unknown Team', 'mlb') is None
+    assert resolver.standardize('  Unknown Team ', 'mlb') == 'Unknown Team'
+
+def test_case_and_punctuation_insensitive():
+    """Keys ignore case, punctuation and extra spaces"""
+    resolver = TeamAliasResolver()
+    assert resolver.resolve("A's", 'mlb') == 'OAK'
+    assert resolver.resolve('as', 'mlb') == 'OAK'
+    assert resolver.resolve('st louis  cardinals', 'mlb') == 'STL'
+    assert resolver.resolve('D-BACKS', 'mlb') == 'ARI'
+
+def test_fuzzy_results_are_cached():
+    """Fuzzy lookups for unseen strings are computed once"""
+    resolver = TeamAliasResolver()
+    assert resolver.fuzzy_resolve('New York Yankes', 'mlb') == 'NYY'
+    assert resolver.fuzzy_resolve('Nowhere City', 'mlb') is None
+    assert resolver._fuzzy_cache[('mlb', 'NEW YORK YANKES')] == 'NYY'
+    assert ('mlb', 'NOWHERE CITY') in resolver._fuzzy_cache
+
+def test_caches_are_bounded():
+    """Unseen names and pairs evict the least recently used entries beyond cache_size"""
+    resolver = TeamAliasResolver(cache_size=3)
+    for i in range(10):
+        resolver.fuzzy_resolve(f'Unknown Team {i}', 'mlb')
+        resolver.similarity(f'Team {i}', 'Team X')
+    resolver.fuzzy_resolve('Unknown Team 7', 'mlb')
+    resolver.fuzzy_resolve('Unknown Team 10', 'mlb')
+
+    assert len(resolver._fuzzy_cache) == 3
+    assert len(resolver._similarity_cache) == 3
+    assert list(resolver._fuzzy_cache) == [('mlb', 'UNKNOWN TEAM 9'), ('mlb', 'UNKNOWN TEAM 7'),
+                                           ('mlb', 'UNKNOWN TEAM 10')]
+    assert resolver.similarity('Team 9', 'Team X') == resolver._similarity_cache[('Team 9', 'Team X')]
+
+def test_clients_and_matcher_share_resolver(credentials_file):
+    """Both clients and the matcher use the same compiled instance"""
+
+    kalshi = KalshiClientUpdated(credentials_file)
+    pinnacle = PinnacleClient(credentials_file)
+    matcher = GameMatcher()
+
+    shared = get_team_resolver()
+    assert kalshi.team_resolver is shared
+    assert pinnacle.team_resolver is shared
+    assert matcher.team_resolver is shared
+    assert kalshi._standardize_team_name('Boston Celtics', 'nba') == 'BOS'
+    assert pinnacle._standardize_team_name('Boston Celtics', 'nba') == 'BOS'
+
+if __name__ == "__main__":
+    credentials_file = write_credentials(tempfile.mkdtemp())
+    print("TEAM RESOLVER TEST")
+    print("=" * 50)
+    test_sport_scoped_lookups()
+    print("PASS Sport-scoped lookups")
+    test_case_and_punctuation_insensitive()
+    print("PASS Case/punctuation-insensitive keys")
+    test_fuzzy_results_are_cached()
+    print("PASS Fuzzy results cached")
+    test_caches_are_bounded()
+    print("PASS Caches are bounded")
+    test_clients_and_matcher_share_resolver(credentials_file)
+    print("PASS Clients and matcher share resolver")
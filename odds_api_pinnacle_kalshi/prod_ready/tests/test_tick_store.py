@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the historical odds tick store
+"""
+
+import sys
+import os
+import pathlib
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.tick_store import OddsTickStore, canonical_game_key
+from core.main_system import MispricingSystem
+from tests.conftest import write_credentials
+
+GAME_KEY = canonical_game_key('MLB', '2025-09-15', 'NYY', 'BOS')
+
+def _tick(platform, side, ts, american, **extra):
+    tick = {'platform': platform, 'sport': 'MLB', 'game_key': GAME_KEY, 'side': side,
+            'ts': ts, 'american': american}
+    tick.update(extra)
+    return tick
+
+def test_batch_write_and_dedupe(tmp_path):
+    """Batches land in one write; unchanged quotes and repeated keys are skipped"""
+    store = OddsTickStore(os.path.join(tmp_path, 'ticks.sqlite'))
+    written = store.append_ticks([
+        _tick('pinnacle', 'home', '2025-09-15T12:00:00Z', -150),
+        _tick('pinnacle', 'away', '2025-09-15T12:00:00Z', 130),
+    ])
+    assert written == 2
+
+    # Same quotes a minute later are not history
+    assert store.append_ticks([_tick('pinnacle', 'home', '2025-09-15T12:01:00Z', -150)]) == 0
+    # A moved line is
+    assert store.append_ticks([_tick('pinnacle', 'home', '2025-09-15T12:02:00Z', -155)]) == 1
+    assert store.count() == 3
+    store.close()
+
+def test_collision_does_not_become_last_quote():
+    """A quote dropped on a (key, ts) collision does not suppress the next real change"""
+    store = OddsTickStore(':memory:')
+    assert store.append_ticks([_tick('pinnacle', 'home', '2025-09-15T12:00:00Z', -150)]) == 1
+    assert store.append_ticks([_tick('pinnacle', 'home', '2025-09-15T12:00:00Z', -155)]) == 0
+    assert store.append_ticks([_tick('pinnacle', 'home', '2025-09-15T12:01:00Z', -155)]) == 1
+    assert [t['american'] for t in store.query_ticks(game_key=GAME_KEY)] == [-150, -155]
+    store.close()
+
+def test_range_queries_and_latest():
+    """Ticks come back in time order by game, platform and range"""
+    store = OddsTickStore(':memory:')
+    store.append_ticks([
+        _tick('pinnacle', 'home', '2025-09-15T12:00:00Z', -150),
+        _tick('kalshi', 'home', '2025-09-15T12:00:30Z', -140, price=0.58),
+        _tick('pinnacle', 'home', '2025-09-15T12:05:00Z', -160),
+        {'platform': 'pinnacle', 'sport': 'NFL', 'game_key': 'NFL:2025-09-14:BUF@KC',
+         'side': 'home', 'ts': '2025-09-15T12:00:00Z', 'american': -110},
+    ])
+
+    pinnacle = store.query_ticks(game_key=GAME_KEY, platform='pinnacle')
+    assert [t['american'] for t in pinnacle] == [-150, -160]
+    window = store.query_ticks(game_key=GAME_KEY, start='2025-09-15T12:00:10Z', end='2025-09-15T12:05:00Z')
+    assert [t['platform'] for t in window] == ['kalshi']
+    assert window[0]['price'] == 0.58
+
+    latest = {t['platform']: t['american'] for t in store.latest_quotes(GAME_KEY)}
+    assert latest == {'kalshi': -140, 'pinnacle': -160}
+    assert store.game_keys(sport='MLB') == [GAME_KEY]
+    store.close()
+
+def test_system_records_normalized_games(credentials_file):
+    """Opt-in tick recording writes both sides of every normalized game"""
+    system = MispricingSystem({
+        'pinnacle_api_key_file': credentials_file,
+        'kalshi_credentials_file': credentials_file,
+        'save_results_to_file': False,
+        'record_ticks': True,
+        'tick_store_path': ':memory:'
+    })
+    game = {'game_id': 'kalshi_1', 'sport': 'MLB', 'home_team': 'NYY', 'away_team': 'BOS',
+            'game_date': '2025-09-15',
+            'home_odds': {'american': -138, 'implied_probability': 0.58, 'kalshi_cents': 58},
+            'away_odds': {'american': 138, 'implied_probability': 0.42, 'kalshi_cents': 42}}
+
+    assert system.record_ticks('kalshi', [game], '2025-09-15T12:00:00Z') == 2
+    ticks = system.tick_store.query_ticks(game_key=GAME_KEY)
+    assert {t['side']: t['price'] for t in ticks} == {'home': 0.58, 'away': 0.42}
+    assert ticks[0]['source_id'] == 'kalshi_1'
+
+if __name__ == "__main__":
+    scratch = tempfile.TemporaryDirectory()
+    credentials_file = write_credentials(scratch.name)
+    print("TICK STORE TEST")
+    print("=" * 50)
+    test_batch_write_and_dedupe(pathlib.Path(tempfile.mkdtemp(dir=scratch.name)))
+    print("PASS Batch write and dedupe")
+    test_collision_does_not_become_last_quote()
+    print("PASS Collisions do not become the last quote")
+    test_range_queries_and_latest()
+    print("PASS Range queries and latest quotes")
+    test_system_records_normalized_games(credentials_file)
+    print("PASS System records normalized games")
+    scratch.cleanup()
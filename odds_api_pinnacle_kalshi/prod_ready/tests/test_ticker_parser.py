@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared Kalshi ticker parser
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.ticker_parser import parse_ticker, parse_tickers, parse_ticker_map, ticker_date
+
+def test_game_ticker_formats():
+    """Inline matchup + side, event tickers and hyphenated away-home codes"""
+    info = parse_ticker('KXMLBGAME-25AUG21HOUBAL-HOU')
+    assert info.series == 'KXMLBGAME'
+    assert info.year == 2025
+    assert info.date == '2025-08-21'
+    assert info.team_codes == ('HOU', 'BAL')
+    assert info.side == 'HOU'
+    assert info.event_ticker == 'KXMLBGAME-25AUG21HOUBAL'
+    assert (info.away_code, info.home_code) == ('HOU', 'BAL')
+
+    # Uneven code lengths split on the side code
+    assert parse_ticker('KXNFLGAME-25SEP07JACNO-NO').team_codes == ('JAC', 'NO')
+    assert parse_ticker('kxnflgame-25sep04dalphi').team_codes == ('DAL', 'PHI')
+    assert parse_ticker('NFLGAME-25SEP08-DAL-PHI').team_codes == ('DAL', 'PHI')
+    split_side = parse_ticker('KXWTAMATCH-25AUG17-STAANN-STA')
+    assert (split_side.team_codes, split_side.side) == (('STA', 'ANN'), 'STA')
+
+def test_year_comes_from_ticker():
+    """No hard-coded season year"""
+    assert ticker_date('KXNBAGAME-26JAN05LALBOS-BOS') == '2026-01-05'
+    assert parse_ticker('KXNBAGAME-26JAN05LALBOS-BOS').year == 2026
+
+def test_range_market_strikes():
+    """Decimal strikes still parse, with the date and without team codes"""
+    high = parse_ticker('KXHIGHNY-25AUG17-B85.5')
+    assert (high.series, high.date, high.team_codes, high.side) == ('KXHIGHNY', '2025-08-17', (), None)
+    index = parse_ticker('KXINX-25AUG17H1600-T6399.99')
+    assert (index.series, index.date, index.team_codes, index.side) == ('KXINX', '2025-08-17', (), None)
+    assert ticker_date('KXHIGHNY-25AUG17-T86') == '2025-08-17'
+    assert parse_ticker_map(['KXHIGHNY-25AUG17-B85.5'])['KXHIGHNY-25AUG17-B85.5']['date'] == '2025-08-17'
+
+def test_unparseable_tickers():
+    """Dateless, impossible-date and non-game tickers give None"""
+    assert parse_ticker('KXMLBGAME-BOSNYY-NYY') is None
+    assert parse_ticker('KXMLBGAME-25FEB30BOSNYY-NYY') is None
+    assert parse_ticker('PRES-2028') is None
+    assert parse_ticker('') is None
+    assert ticker_date(None) is None
+
+def test_bulk_parsing_is_cached():
+    """Repeated tickers hit the LRU cache and bulk helpers keep order"""
+    tickers = ['KXMLBGAME-25AUG21HOUBAL-HOU', 'KXMLBGAME-25AUG21HOUBAL-BAL', 'PRES-2028'] * 1000
+    parse_ticker.cache_clear()
+    parsed = parse_tickers(tickers)
+    assert len(parsed) == 3000
+    assert parsed[1].side == 'BAL' and parsed[2] is None
+    assert parse_ticker.cache_info().misses == 3
+
+    embedded = parse_ticker_map(tickers)
+    assert list(embedded) == tickers[:2]
+    assert embedded['KXMLBGAME-25AUG21HOUBAL-BAL']['event_ticker'] == 'KXMLBGAME-25AUG21HOUBAL'
+
+if __name__ == "__main__":
+    print("TICKER PARSER TEST")
+    print("=" * 50)
+    test_game_ticker_formats()
+    print("PASS Game ticker formats")
+    test_year_comes_from_ticker()
+    print("PASS Year comes from ticker")
+    test_range_market_strikes()
+    print("PASS Range market strikes")
+    test_unparseable_tickers()
+    print("PASS Unparseable tickers")
+    test_bulk_parsing_is_cached()
+    print("PASS Bulk parsing is cached")
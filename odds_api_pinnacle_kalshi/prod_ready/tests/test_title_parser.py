@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared precompiled title/question parser
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.title_parser import TitleParser, TeamNameScanner, _parse_kalshi_title
+
+def test_kalshi_title_formats():
+    """Every Kalshi format keeps its (home, away) orientation and priority"""
+    parser = TitleParser()
+    assert parser.kalshi_teams('Houston at Baltimore Winner?') == ('Baltimore', 'Houston')
+    assert parser.kalshi_teams('Boston Red Sox vs New York Yankees Winner?') == ('New York Yankees', 'Boston Red Sox')
+    assert parser.kalshi_teams('Will Chiefs beat Ravens on Sunday') == ('Ravens', 'Chiefs')
+    assert parser.kalshi_teams('Lakers vs Celtics') == ('Celtics', 'Lakers')
+    assert parser.kalshi_teams('Lakers at Celtics') == ('Celtics', 'Lakers')
+    # "Will ... beat" outranks the bare "at" format
+    assert parser.kalshi_teams('Will Boston at home beat Denver') == ('Denver', 'Boston at home')
+    assert parser.kalshi_teams('Highest temperature in NYC today?') is None
+
+def test_failures_are_counted_and_titles_memoized():
+    """Failures become counters and repeated titles hit the memo"""
+    parser = TitleParser()
+    _parse_kalshi_title.cache_clear()
+    for _ in range(50):
+        parser.kalshi_teams('Houston at Baltimore Winner?')
+        parser.kalshi_teams('Fed rate decision?')
+    stats = parser.stats()
+    assert stats['parsed'] == {'kalshi': 50}
+    assert stats['failures'] == {'kalshi': 50}
+    assert stats['kalshi_memo']['misses'] == 2
+    parser.reset()
+    assert parser.stats()['failures'] == {}
+
+def test_question_matchups():
+    """League prefixes and trailing date info are dropped in one pass"""
+    parser = TitleParser()
+    assert parser.question_teams('NFL: Chiefs vs Ravens') == ('Chiefs', 'Ravens')
+    assert parser.question_teams('Chiefs vs. Ravens (Sep 7)') == ('Chiefs', 'Ravens')
+    assert parser.question_teams('Will it rain in Seattle?') == (None, None)
+    assert parser.stats()['failures'] == {'polymarket': 1}
+
+def test_team_name_scanner():
+    """Longest alias wins, word boundaries apply and codes follow question order"""
+    scanner = TeamNameScanner({'Jets': 'NYJ', 'NY Jets': 'NYJ', 'Rams': 'LAR', 'Kansas City': 'KC', 'Chiefs': 'KC'})
+    assert scanner.scan('Will the Rams beat the NY Jets?') == ('LAR', 'NYJ')
+    assert scanner.scan('Kansas City Chiefs vs Jets') == ('KC', 'NYJ')
+    assert scanner.scan('Instagrams followers') == ()
+
+if __name__ == "__main__":
+    print("TITLE PARSER TEST")
+    print("=" * 50)
+    test_kalshi_title_formats()
+    print("PASS Kalshi title formats")
+    test_failures_are_counted_and_titles_memoized()
+    print("PASS Failures are counted and titles memoized")
+    test_question_matchups()
+    print("PASS Question matchups")
+    test_team_name_scanner()
+    print("PASS Team name scanner")
@@ -0,0 +1,20 @@
+"""
+Console Output Switch - Progress messages that can be silenced in the hot path
+Per-stage and per-game chatter goes through console(); explicit reports keep using print
+"""
+
+_console_enabled = True
+
+def set_console_output(enabled: bool):
+    """Turn pipeline progress output on or off for the whole process"""
+    global _console_enabled
+    _console_enabled = bool(enabled)
+
+def console_output_enabled() -> bool:
+    """Whether pipeline progress output is currently printed"""
+    return _console_enabled
+
+def console(*args, **kwargs):
+    """print() that is a no-op while console output is disabled"""
+    if _console_enabled:
+        print(*args, **kwargs)
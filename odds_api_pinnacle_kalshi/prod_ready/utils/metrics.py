@@ -0,0 +1,258 @@
+"""
+Pipeline Metrics - In-process counters, gauges and latency histograms
+Exported as Prometheus text (optional HTTP endpoint) or a JSON snapshot file
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Latency buckets (seconds) shared by stage timers and HTTP requests
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_HELP = {
+    'pipeline_stage_seconds': 'Time spent in each analysis stage',
+    'pipeline_runs_total': 'Analysis pipeline runs by outcome',
+    'http_request_seconds': 'Upstream HTTP latency by host and endpoint',
+    'http_requests_total': 'Upstream HTTP requests by host, endpoint and status',
+    'markets_fetched_total': 'Raw games/markets returned by each platform',
+    'games_normalized_total': 'Games that survived normalization',
+    'games_filtered_live_total': 'Games dropped because they had started or were about to',
+    'normalize_errors_total': 'Raw entries skipped because they could not be normalized',
+    'kalshi_unparseable_titles_total': 'Kalshi markets whose title yielded no teams',
+    'games_aligned_total': 'Pinnacle/Kalshi pairs produced by the matcher',
+    'opportunities_detected_total': 'Opportunities above the edge threshold',
+    'odds_api_cache_hits': 'Odds API requests answered from the TTL cache',
+    'odds_api_upstream_requests': 'Odds API requests sent upstream',
+    'odds_api_cache_hit_rate': 'Share of Odds API lookups answered from the cache',
+    'odds_api_requests_remaining': 'Odds API quota left, from the last response headers',
+    'http_connection_reuse_rate': 'Share of HTTP requests that reused a pooled connection',
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+def _label_key(labels: Dict) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+def _format_labels(label_key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(label_key) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + '}'
+
+class _Histogram:
+    __slots__ = ('bounds', 'counts', 'total', 'count')
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> List[int]:
+        running, result = 0, []
+        for count in self.counts:
+            running += count
+            result.append(running)
+        return result
+
+class MetricsRegistry:
+    """Thread-safe metric store shared by the clients, matcher and pipeline"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Initialize the registry
+
+        Args:
+            buckets: Histogram upper bounds in seconds (+Inf is implied)
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        # Named callables returning (name, labels, value) gauge samples computed at export time
+        self._collectors: Dict[str, Callable[[], Iterable[Tuple[str, Dict, float]]]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add to a counter"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        """Set a gauge to its current value"""
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """Record one histogram observation (seconds for latency metrics)"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Observe the wall time of a block, even if it raises"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def register_collector(self, key: str, collector: Callable[[], Iterable[Tuple[str, Dict, float]]]):
+        """Add (or replace) a callable whose (name, labels, value) samples are exported as gauges"""
+        with self._lock:
+            self._collectors[key] = collector
+
+    def _collected_gauges(self) -> Dict[str, Dict[LabelKey, float]]:
+        with self._lock:
+            gauges = {name: dict(series) for name, series in self._gauges.items()}
+            collectors = list(self._collectors.values())
+        for collector in collectors:
+            try:
+                for name, labels, value in collector():
+                    if value is not None:
+                        gauges.setdefault(name, {})[_label_key(labels)] = value
+            except Exception:
+                continue
+        return gauges
+
+    def snapshot(self) -> Dict:
+        """JSON-serializable view of every metric"""
+        gauges = self._collected_gauges()
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {
+                name: {key: (hist.cumulative(), hist.total, hist.count) for key, hist in series.items()}
+                for name, series in self._histograms.items()
+            }
+
+        def samples(series):
+            return [{'labels': dict(key), 'value': value} for key, value in sorted(series.items())]
+
+        return {
+            'timestamp': time.time(),
+            'counters': {name: samples(series) for name, series in sorted(counters.items())},
+            'gauges': {name: samples(series) for name, series in sorted(gauges.items())},
+            'histograms': {
+                name: [
+                    {
+                        'labels': dict(key),
+                        'count': count,
+                        'sum': total,
+                        'mean': total / count if count else 0.0,
+                        'buckets': dict(zip((str(bound) for bound in self.buckets), cumulative))
+                    }
+                    for key, (cumulative, total, count) in sorted(series.items())
+                ]
+                for name, series in sorted(histograms.items())
+            }
+        }
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format"""
+        gauges = self._collected_gauges()
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# HELP {name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_format_labels(key)} {value}")
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# HELP {name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, hist in sorted(series.items()):
+                    for bound, cumulative in zip(self.buckets, hist.cumulative()):
+                        lines.append(f"{name}_bucket{_format_labels(key, ('le', repr(bound)))} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(key, ('le', '+Inf'))} {hist.count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {hist.total}")
+                    lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+        for name, series in sorted(gauges.items()):
+            lines.append(f"# HELP {name} {METRIC_HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} gauge")
+            for key, value in sorted(series.items()):
+                lines.append(f"{name}{_format_labels(key)} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, file_path: str):
+        """Atomically replace file_path with the current snapshot"""
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(temp_path, file_path)
+
+    def reset(self):
+        """Drop every recorded value (collectors stay registered)"""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+def start_metrics_server(registry: 'MetricsRegistry', port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """
+    Serve /metrics (Prometheus text) and /metrics.json from a daemon thread
+
+    Args:
+        registry: Registry to expose
+        port: TCP port (0 picks a free one; see server.server_address)
+        host: Interface to bind
+
+    Returns:
+        The running server (call shutdown() to stop it)
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] == '/metrics':
+                body, content_type = registry.to_prometheus().encode(), 'text/plain; version=0.0.4'
+            elif self.path.split('?')[0] == '/metrics.json':
+                body, content_type = json.dumps(registry.snapshot()).encode(), 'application/json'
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    return server
+
+_shared_metrics = None
+_shared_lock = threading.Lock()
+
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide registry every component records to"""
+    global _shared_metrics
+    if _shared_metrics is None:
+        with _shared_lock:
+            if _shared_metrics is None:
+                _shared_metrics = MetricsRegistry()
+    return _shared_metrics
@@ -0,0 +1,257 @@
+"""
+Odds API Request Scheduler - Quota-aware caching for the-odds-api.com
+Tracks remaining quota from response headers, caches and coalesces identical requests,
+and stretches cache lifetimes so polling stays inside a daily request budget
+"""
+
+import calendar
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+SECONDS_PER_DAY = 86400
+
+
+def estimate_request_cost(markets: str, regions: str = '', bookmakers: str = '') -> int:
+    """
+    Estimate the quota cost of an /odds request
+
+    The Odds API charges one request per market per region; when bookmakers are
+    given, every group of 10 bookmakers counts as one region.
+    """
+    market_count = max(1, len([m for m in markets.split(',') if m]))
+    if bookmakers:
+        region_count = math.ceil(len([b for b in bookmakers.split(',') if b]) / 10)
+    else:
+        region_count = len([r for r in regions.split(',') if r])
+    return market_count * max(1, region_count)
+
+
+class _InFlight:
+    """A request being fetched; identical callers wait on it instead of re-requesting"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.fetched_at: Optional[float] = None
+        self.error: Optional[BaseException] = None
+
+
+class OddsApiScheduler:
+    """Shared quota tracker and TTL response cache for Odds API clients"""
+
+    def __init__(self, default_ttl: float = 30, daily_budget: Optional[int] = None,
+                 min_poll_interval: float = 5, quota_reserve: int = 0):
+        """
+        Initialize the scheduler
+
+        Args:
+            default_ttl: Seconds a cached response stays fresh
+            daily_budget: Requests to spend per day; derived from x-requests-remaining when None
+            min_poll_interval: Floor on the budget-derived poll interval (seconds)
+            quota_reserve: Requests to keep untouched when deriving the daily budget
+        """
+        self.default_ttl = default_ttl
+        self.daily_budget = daily_budget
+        self.min_poll_interval = min_poll_interval
+        self.quota_reserve = quota_reserve
+
+        self.requests_remaining: Optional[int] = None
+        self.requests_used: Optional[int] = None
+        self.last_request_cost: Optional[int] = None
+        self.quota_updated_at: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._cache: Dict[Hashable, Tuple[float, Any, float]] = {}  # key -> (monotonic, data, epoch fetched_at)
+        self._in_flight: Dict[Hashable, _InFlight] = {}
+        self._request_costs: Dict[Hashable, int] = {}
+        self._active_keys: Dict[Hashable, float] = {}  # key -> last upstream fetch (monotonic)
+        self._counters = {'upstream_requests': 0, 'cache_hits': 0, 'coalesced': 0, 'errors': 0}
+
+    def update_quota(self, headers: Dict[str, str], cache_key: Optional[Hashable] = None):
+        """Record quota headers from an Odds API response"""
+        def header_int(name):
+            value = headers.get(name)
+            try:
+                return int(float(value)) if value is not None else None
+            except (TypeError, ValueError):
+                return None
+
+        remaining = header_int('x-requests-remaining')
+        used = header_int('x-requests-used')
+        last = header_int('x-requests-last')
+        with self._lock:
+            if remaining is not None:
+                self.requests_remaining = remaining
+            if used is not None:
+                self.requests_used = used
+            if last is not None:
+                self.last_request_cost = last
+                if cache_key is not None:
+                    self._request_costs[cache_key] = last
+            self.quota_updated_at = datetime.now(timezone.utc).isoformat()
+
+    def effective_daily_budget(self) -> Optional[float]:
+        """Requests available per day: configured, or remaining quota spread over the rest of the month"""
+        if self.daily_budget is not None:
+            return float(self.daily_budget)
+        if self.requests_remaining is None:
+            return None
+        now = datetime.now(timezone.utc)
+        days_in_month = calendar.monthrange(now.year, now.month)[1]
+        days_left = days_in_month - now.day + 1
+        return max(0.0, self.requests_remaining - self.quota_reserve) / days_left
+
+    def poll_interval(self, cache_key: Hashable, request_cost: int = 1) -> float:
+        """
+        Minimum seconds between upstream fetches of a key so all active keys fit the daily budget
+
+        Args:
+            cache_key: Request key (sport, markets, bookmakers, ...)
+            request_cost: Estimated quota cost if the API has not reported one yet
+
+        Returns:
+            Seconds between polls (0 when no budget is known)
+        """
+        budget = self.effective_daily_budget()
+        if budget is None:
+            return 0.0
+        if budget <= 0:
+            return float(SECONDS_PER_DAY)
+
+        now = time.monotonic()
+        with self._lock:
+            cost = self._request_costs.get(cache_key, request_cost)
+            # Keys polled in the last day share the budget evenly
+            active = {key for key, fetched in self._active_keys.items() if now - fetched < SECONDS_PER_DAY}
+            active.add(cache_key)
+
+        polls_per_day = budget / (cost * len(active))
+        return max(self.min_poll_interval, SECONDS_PER_DAY / polls_per_day)
+
+    def get_json(self, url: str, params: Dict, cache_key: Hashable,
+                 http_get: Callable[..., Any], ttl: Optional[float] = None,
+                 request_cost: int = 1) -> Tuple[Any, bool]:
+        """
+        GET and decode JSON through the cache (see get_json_entry)
+
+        Returns:
+            Tuple of (decoded JSON, served_from_cache)
+        """
+        data, from_cache, _ = self.get_json_entry(url, params, cache_key, http_get, ttl, request_cost)
+        return data, from_cache
+
+    def get_json_entry(self, url: str, params: Dict, cache_key: Hashable,
+                       http_get: Callable[..., Any], ttl: Optional[float] = None,
+                       request_cost: int = 1) -> Tuple[Any, bool, float]:
+        """
+        GET and decode JSON through the cache, with the time the data was actually fetched
+
+        Cached data is served while younger than max(ttl, poll_interval(cache_key)).
+        Concurrent calls for the same key share one upstream request.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            cache_key: Key identifying equivalent requests
+            http_get: Callable performing the GET (e.g. requests.get or HttpTransport.get)
+            ttl: Freshness override in seconds (defaults to default_ttl)
+            request_cost: Estimated quota cost used before the API reports x-requests-last
+
+        Returns:
+            Tuple of (decoded JSON, served_from_cache, epoch seconds of the upstream fetch)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        max_age = max(ttl, self.poll_interval(cache_key, request_cost))
+
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < max_age:
+                self._counters['cache_hits'] += 1
+                return cached[1], True, cached[2]
+
+            in_flight = self._in_flight.get(cache_key)
+            owner = in_flight is None
+            if owner:
+                in_flight = _InFlight()
+                self._in_flight[cache_key] = in_flight
+            else:
+                self._counters['coalesced'] += 1
+
+        if not owner:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.result, True, in_flight.fetched_at
+
+        try:
+            response = http_get(url, params=params)
+            response.raise_for_status()
+            self.update_quota(response.headers, cache_key)
+            data = response.json()
+            fetched_at = time.time()
+            with self._lock:
+                now = time.monotonic()
+                self._cache[cache_key] = (now, data, fetched_at)
+                self._active_keys[cache_key] = now
+                self._counters['upstream_requests'] += 1
+            in_flight.result = data
+            in_flight.fetched_at = fetched_at
+            return data, False, fetched_at
+        except BaseException as e:
+            with self._lock:
+                self._counters['errors'] += 1
+            in_flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(cache_key, None)
+            in_flight.done.set()
+
+    def invalidate(self, cache_key: Optional[Hashable] = None):
+        """Drop one cached response, or all of them"""
+        with self._lock:
+            if cache_key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(cache_key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Quota state, daily budget and cache counters"""
+        budget = self.effective_daily_budget()
+        with self._lock:
+            stats = dict(self._counters)
+            stats.update({
+                'requests_remaining': self.requests_remaining,
+                'requests_used': self.requests_used,
+                'last_request_cost': self.last_request_cost,
+                'quota_updated_at': self.quota_updated_at,
+                'daily_budget': round(budget, 1) if budget is not None else None,
+                'cached_keys': len(self._cache)
+            })
+        return stats
+
+
+_shared_scheduler = None
+_shared_lock = threading.Lock()
+
+def get_shared_scheduler() -> OddsApiScheduler:
+    """Get the process-wide scheduler shared by every Odds API client"""
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        with _shared_lock:
+            if _shared_scheduler is None:
+                _shared_scheduler = OddsApiScheduler()
+    return _shared_scheduler
+
+def configure_shared_scheduler(**settings) -> OddsApiScheduler:
+    """Apply TTL/budget settings to the shared scheduler, keeping its quota state and cache"""
+    scheduler = get_shared_scheduler()
+    with scheduler._lock:
+        for name, value in settings.items():
+            if not hasattr(scheduler, name):
+                raise TypeError(f"Unknown scheduler setting: {name}")
+            setattr(scheduler, name, value)
+    return scheduler
@@ -0,0 +1,130 @@
+"""
+Streaming Results Writer - Append-only NDJSON output for analysis runs
+One compact JSON record per line, size-based rotation with optional gzip of rotated files
+"""
+
+import gzip
+import json
+import os
+import shutil
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+class ResultsStreamWriter:
+    """Thread-safe NDJSON appender that rotates the file once it reaches max_bytes"""
+
+    def __init__(self, file_path: str, max_bytes: Optional[int] = None, backup_count: int = 5,
+                 compress: bool = False, default: Callable[[Any], Any] = str):
+        """
+        Initialize the writer
+
+        Args:
+            file_path: NDJSON file to append to
+            max_bytes: Rotate before a write would grow the file past this size (never when None)
+            backup_count: Rotated files to keep as file_path.1 ... file_path.N
+            compress: Gzip rotated files (file_path.1.gz, ...)
+            default: json.dumps fallback for values that are not JSON-native
+        """
+        self.file_path = file_path
+        self.max_bytes = max_bytes
+        self.backup_count = max(0, backup_count)
+        self.compress = compress
+        self.default = default
+        self.records_written = 0
+
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _open(self):
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.file_path, 'a', encoding='utf-8')
+
+    def _backup_name(self, index: int) -> str:
+        return f"{self.file_path}.{index}" + ('.gz' if self.compress else '')
+
+    def _rotate(self):
+        """Shift file_path.N-1 -> file_path.N ... and move the live file to file_path.1"""
+        self._file.close()
+        self._file = None
+
+        if self.backup_count > 0:
+            oldest = self._backup_name(self.backup_count)
+            if os.path.exists(oldest):
+                os.remove(oldest)
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self._backup_name(index)
+                if os.path.exists(source):
+                    os.replace(source, self._backup_name(index + 1))
+
+            if self.compress:
+                with open(self.file_path, 'rb') as src, gzip.open(self._backup_name(1), 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                os.remove(self.file_path)
+            else:
+                os.replace(self.file_path, self._backup_name(1))
+        else:
+            os.remove(self.file_path)
+
+        self._open()
+
+    def write(self, record: Dict):
+        """Append one record as a single compact JSON line and flush it for tailing readers"""
+        line = json.dumps(record, separators=(',', ':'), default=self.default) + '\n'
+        data_size = len(line.encode('utf-8'))
+
+        with self._lock:
+            if self._file is None:
+                self._open()
+            if self.max_bytes and self._file.tell() > 0 and self._file.tell() + data_size > self.max_bytes:
+                self._rotate()
+            self._file.write(line)
+            self._file.flush()
+            self.records_written += 1
+
+    def write_many(self, records: List[Dict]):
+        """Append several records in order"""
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        """Close the underlying file (the next write reopens it)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+def tail_results(file_path: str, offset: int = 0,
+                 inode: Optional[int] = None) -> Tuple[List[Dict], int, Optional[int]]:
+    """
+    Read records appended since a byte offset
+
+    Args:
+        file_path: NDJSON file written by ResultsStreamWriter
+        offset: Offset returned by the previous call (0 reads from the start)
+        inode: Inode returned by the previous call (None on the first call)
+
+    Returns:
+        Tuple of (new records, offset and inode to pass next time). A partially written
+        last line is left for the next call; a rotated file (new inode, or shorter than
+        offset when truncated in place) is read from the start.
+    """
+    try:
+        f = open(file_path, 'rb')
+    except FileNotFoundError:
+        return [], 0, None
+
+    records = []
+    with f:
+        stat = os.fstat(f.fileno())
+        if (inode is not None and stat.st_ino != inode) or stat.st_size < offset:
+            offset = 0
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            offset += len(line)
+            if line.strip():
+                records.append(json.loads(line))
+    return records, offset, stat.st_ino
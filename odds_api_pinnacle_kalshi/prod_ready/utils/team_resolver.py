@@ -0,0 +1,160 @@
+"""
+Team Alias Resolver - Compiled team name lookups shared by all clients and matchers
+Built once from sports_config with sport-scoped, case/punctuation-insensitive keys
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from difflib import SequenceMatcher, get_close_matches
+from typing import Dict, FrozenSet, Optional, Tuple
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.sports_config import SPORTS_CONFIG
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+_MISSING = object()
+
+def normalize_team_key(team_name: str) -> str:
+    """Lookup key for a team name: uppercase, punctuation stripped, single spaces"""
+    key = _PUNCTUATION.sub('', team_name.upper())
+    return _WHITESPACE.sub(' ', key).strip()
+
+class TeamAliasResolver:
+    """Precompiled alias -> team code maps for every sport in SPORTS_CONFIG"""
+
+    def __init__(self, sports_config: Optional[Dict] = None, fuzzy_cutoff: float = 0.85,
+                 cache_size: int = 4096):
+        """
+        Compile the alias maps
+
+        Args:
+            sports_config: Sport key -> SportConfig mapping (defaults to SPORTS_CONFIG)
+            fuzzy_cutoff: Minimum similarity for fuzzy_resolve to accept a match
+            cache_size: Most recent fuzzy lookups and similarity pairs kept (LRU) per cache
+        """
+        sports_config = sports_config if sports_config is not None else SPORTS_CONFIG
+        self.fuzzy_cutoff = fuzzy_cutoff
+
+        # sport key (lowercase) and display name (uppercase) -> {normalized alias: code}
+        self._sport_maps: Dict[str, Dict[str, str]] = {}
+        # normalized alias -> first code in SPORTS_CONFIG order (used when sport is unknown)
+        self._any_sport_map: Dict[str, str] = {}
+        # normalized alias -> every code it names across sports
+        self._codes_by_key: Dict[str, FrozenSet[str]] = {}
+
+        codes_by_key = {}
+        for sport_key, sport_config in sports_config.items():
+            sport_map = {}
+            for code, aliases in sport_config.team_aliases.items():
+                for name in [code] + list(aliases):
+                    key = normalize_team_key(name)
+                    sport_map.setdefault(key, code)
+                    self._any_sport_map.setdefault(key, code)
+                    codes_by_key.setdefault(key, set()).add(code)
+            self._sport_maps[sport_key.lower()] = sport_map
+            self._sport_maps.setdefault(sport_config.name.lower(), sport_map)
+        self._codes_by_key = {key: frozenset(codes) for key, codes in codes_by_key.items()}
+
+        self._lock = threading.Lock()
+        self.cache_size = cache_size
+        self._fuzzy_cache: "OrderedDict[Tuple[str, str], Optional[str]]" = OrderedDict()
+        self._similarity_cache: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+
+    def _cache_get(self, cache: OrderedDict, key: Tuple[str, str], default=None):
+        """Look up a cached value and mark it most recently used"""
+        with self._lock:
+            if key not in cache:
+                return default
+            cache.move_to_end(key)
+            return cache[key]
+
+    def _cache_put(self, cache: OrderedDict, key: Tuple[str, str], value):
+        """Cache a value, evicting the least recently used entries beyond cache_size"""
+        with self._lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+    def has_sport(self, sport: Optional[str]) -> bool:
+        """Check whether a sport key or name has compiled aliases"""
+        return bool(sport) and sport.lower() in self._sport_maps
+
+    def resolve(self, team_name: str, sport: Optional[str] = None) -> Optional[str]:
+        """
+        Resolve a team name to its code
+
+        Args:
+            team_name: Any alias, full name or code (case and punctuation ignored)
+            sport: Sport key or name; unknown sports search all sports in config order
+
+        Returns:
+            Team code, or None if the name has no alias entry
+        """
+        if not team_name:
+            return None
+        key = normalize_team_key(team_name)
+        if self.has_sport(sport):
+            return self._sport_maps[sport.lower()].get(key)
+        return self._any_sport_map.get(key)
+
+    def standardize(self, team_name: str, sport: Optional[str] = None) -> str:
+        """Get the team code for a name, or the stripped name if it has no alias entry"""
+        team_name = team_name.strip()
+        return self.resolve(team_name, sport) or team_name
+
+    def codes_for(self, team_name: str) -> FrozenSet[str]:
+        """Every team code a name refers to across all sports"""
+        return self._codes_by_key.get(normalize_team_key(team_name), frozenset())
+
+    def same_team(self, team1: str, team2: str, sport: Optional[str] = None) -> bool:
+        """Check whether two names refer to the same team (sport-scoped when sport is known)"""
+        if self.has_sport(sport):
+            code1 = self.resolve(team1, sport)
+            return code1 is not None and code1 == self.resolve(team2, sport)
+        codes1 = self.codes_for(team1)
+        return bool(codes1) and not codes1.isdisjoint(self.codes_for(team2))
+
+    def fuzzy_resolve(self, team_name: str, sport: Optional[str] = None) -> Optional[str]:
+        """Resolve a name exactly, else by closest alias above fuzzy_cutoff (LRU-cached per name)"""
+        code = self.resolve(team_name, sport)
+        if code is not None:
+            return code
+
+        scope = sport.lower() if self.has_sport(sport) else ''
+        cache_key = (scope, normalize_team_key(team_name))
+        cached = self._cache_get(self._fuzzy_cache, cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        alias_map = self._sport_maps[scope] if scope else self._any_sport_map
+        matches = get_close_matches(cache_key[1], alias_map.keys(), n=1, cutoff=self.fuzzy_cutoff)
+        code = alias_map[matches[0]] if matches else None
+        self._cache_put(self._fuzzy_cache, cache_key, code)
+        return code
+
+    def similarity(self, team1: str, team2: str) -> float:
+        """SequenceMatcher ratio between two names, cached per pair (LRU)"""
+        cache_key = (team1, team2)
+        score = self._cache_get(self._similarity_cache, cache_key)
+        if score is None:
+            score = SequenceMatcher(None, team1, team2).ratio()
+            self._cache_put(self._similarity_cache, cache_key, score)
+        return score
+
+
+_shared_resolver = None
+_shared_lock = threading.Lock()
+
+def get_team_resolver() -> TeamAliasResolver:
+    """Get the process-wide resolver shared by every client and matcher"""
+    global _shared_resolver
+    if _shared_resolver is None:
+        with _shared_lock:
+            if _shared_resolver is None:
+                _shared_resolver = TeamAliasResolver()
+    return _shared_resolver
@@ -1,11 +1,92 @@
 """
 Timestamp Utilities for Simplified Time Handling
-Converts complex timestamps to simple HH:MM format
+Converts complex timestamps to simple HH:MM format, or once to epoch seconds for time math
 """
 
-from datetime import datetime, timezone
-from typing import Optional
+import time
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Optional, Union
 
+# Game times repeat across markets, polls and sports; parsed values are reused from these caches
+TIMESTAMP_CACHE_SIZE = 16384
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """
+    Parse an ISO timestamp ('Z' or offset suffix) once, keeping its original offset
+    
+    Args:
+        timestamp_str: Timestamp string in any ISO format
+        
+    Returns:
+        Parsed datetime (naive if the string had no offset) or None if parsing fails
+    """
+    if not timestamp_str:
+        return None
+    try:
+        if timestamp_str.endswith('Z'):
+            timestamp_str = timestamp_str[:-1] + '+00:00'
+        return datetime.fromisoformat(timestamp_str)
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_epoch(timestamp_str: str) -> Optional[int]:
+    """
+    Convert an ISO timestamp to integer epoch seconds (strings without an offset are UTC)
+    
+    Examples:
+        2025-08-21T17:11:00Z -> 1755796260
+        2025-08-21T12:11:00-05:00 -> 1755796260
+    
+    Args:
+        timestamp_str: Timestamp string in any ISO format
+        
+    Returns:
+        Epoch seconds or None if parsing fails
+    """
+    dt = parse_timestamp(timestamp_str)
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+def to_epoch(moment: Optional[Union[datetime, float, int]] = None) -> float:
+    """Epoch seconds for a datetime (naive means UTC), a number passed through, or now when None"""
+    if moment is None:
+        return time.time()
+    if isinstance(moment, datetime):
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return moment.timestamp()
+    return moment
+
+def epoch_to_datetime(epoch_seconds: int, tz: Optional[tzinfo] = None) -> datetime:
+    """Timezone-aware datetime for display (UTC unless tz is given)"""
+    return datetime.fromtimestamp(epoch_seconds, tz or timezone.utc)
+
+def is_future_epoch(game_epoch: Optional[int], min_buffer_minutes: int = 15,
+                    now_epoch: Optional[float] = None) -> bool:
+    """
+    Check if a game starts more than min_buffer_minutes after now, in integer seconds
+    
+    Args:
+        game_epoch: Game start in epoch seconds (None is treated as live for safety)
+        min_buffer_minutes: Minimum minutes before game starts
+        now_epoch: Reference epoch seconds (defaults to the current time)
+        
+    Returns:
+        True if game is far enough in the future, False otherwise
+    """
+    if game_epoch is None:
+        return False
+    if now_epoch is None:
+        now_epoch = time.time()
+    return game_epoch - now_epoch > min_buffer_minutes * 60
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
 def simplify_timestamp(timestamp_str: str) -> Optional[str]:
     """
     Convert any timestamp format to simple HH:MM format
@@ -24,35 +105,28 @@ def simplify_timestamp(timestamp_str: str) -> Optional[str]:
     if not timestamp_str:
         return None
     
-    try:
-        # Handle common timestamp formats
-        if timestamp_str.endswith('Z'):
-            timestamp_str = timestamp_str[:-1] + '+00:00'
-        
-        # Parse the datetime
-        dt = datetime.fromisoformat(timestamp_str)
-        
+    dt = parse_timestamp(timestamp_str)
+    if dt is not None:
         # Convert to simple HH:MM format
         return dt.strftime('%H:%M')
-        
+    # If parsing fails, try to extract time manually
+    try:
+        # Look for pattern like "T19:27" in the string
+        if 'T' in timestamp_str:
+            time_part = timestamp_str.split('T')[1]
+            if ':' in time_part:
+                # Extract HH:MM
+                time_components = time_part.split(':')
+                if len(time_components) >= 2:
+                    hour = time_components[0].zfill(2)
+                    minute = time_components[1].zfill(2)
+                    return f"{hour}:{minute}"
     except Exception:
-        # If parsing fails, try to extract time manually
-        try:
-            # Look for pattern like "T19:27" in the string
-            if 'T' in timestamp_str:
-                time_part = timestamp_str.split('T')[1]
-                if ':' in time_part:
-                    # Extract HH:MM
-                    time_components = time_part.split(':')
-                    if len(time_components) >= 2:
-                        hour = time_components[0].zfill(2)
-                        minute = time_components[1].zfill(2)
-                        return f"{hour}:{minute}"
-        except Exception:
-            pass
-        
-        return None
+        pass
+    
+    return None
 
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
 def simplify_date(timestamp_str: str) -> Optional[str]:
     """
     Extract simple date (YYYY-MM-DD) from timestamp
@@ -66,32 +140,25 @@ def simplify_date(timestamp_str: str) -> Optional[str]:
     if not timestamp_str:
         return None
     
-    try:
-        # Handle common timestamp formats
-        if timestamp_str.endswith('Z'):
-            timestamp_str = timestamp_str[:-1] + '+00:00'
-        
-        # Parse the datetime
-        dt = datetime.fromisoformat(timestamp_str)
-        
+    dt = parse_timestamp(timestamp_str)
+    if dt is not None:
         # Convert to simple YYYY-MM-DD format
         return dt.strftime('%Y-%m-%d')
-        
+    # If parsing fails, try to extract date manually
+    try:
+        # Look for pattern like "2025-08-20T" in the string
+        if 'T' in timestamp_str:
+            date_part = timestamp_str.split('T')[0]
+            # Validate it looks like a date
+            if len(date_part) == 10 and date_part.count('-') == 2:
+                return date_part
     except Exception:
-        # If parsing fails, try to extract date manually
-        try:
-            # Look for pattern like "2025-08-20T" in the string
-            if 'T' in timestamp_str:
-                date_part = timestamp_str.split('T')[0]
-                # Validate it looks like a date
-                if len(date_part) == 10 and date_part.count('-') == 2:
-                    return date_part
-        except Exception:
-            pass
-        
-        return None
+        pass
+    
+    return None
 
-def parse_game_time_safe(timestamp_str: str, min_buffer_minutes: int = 15) -> bool:
+def parse_game_time_safe(timestamp_str: str, min_buffer_minutes: int = 15,
+                         now: Optional[datetime] = None) -> bool:
     """
     Safely check if a game is in the future with minimum buffer
     Uses simplified parsing to avoid timezone issues
@@ -99,34 +166,15 @@ def parse_game_time_safe(timestamp_str: str, min_buffer_minutes: int = 15) -> bo
     Args:
         timestamp_str: Game time string
         min_buffer_minutes: Minimum minutes before game starts
+        now: Reference time (defaults to the current UTC time; replays pass the capture time)
         
     Returns:
         True if game is far enough in the future, False otherwise
     """
-    if not timestamp_str:
-        return False
-    
-    try:
-        # Handle common timestamp formats
-        clean_timestamp = timestamp_str
-        if clean_timestamp.endswith('Z'):
-            clean_timestamp = clean_timestamp[:-1] + '+00:00'
-        
-        # Parse the datetime
-        game_time = datetime.fromisoformat(clean_timestamp)
-        if game_time.tzinfo is None:
-            game_time = game_time.replace(tzinfo=timezone.utc)
-        
-        # Check if game is at least min_buffer_minutes in the future
-        now = datetime.now(timezone.utc)
-        time_until_game = game_time - now
-        
-        return time_until_game.total_seconds() > (min_buffer_minutes * 60)
-        
-    except Exception:
-        # If parsing fails, assume it's live for safety
-        return False
+    # Unparseable times come back as None and are treated as live for safety
+    return is_future_epoch(parse_epoch(timestamp_str), min_buffer_minutes, to_epoch(now))
 
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
 def format_display_time(timestamp_str: str) -> str:
     """
     Format timestamp for user display - simple and clean
@@ -140,34 +188,26 @@ def format_display_time(timestamp_str: str) -> str:
     if not timestamp_str:
         return "Unknown time"
     
-    try:
-        # Handle common timestamp formats
-        if timestamp_str.endswith('Z'):
-            timestamp_str = timestamp_str[:-1] + '+00:00'
-        
-        # Parse the datetime
-        dt = datetime.fromisoformat(timestamp_str)
-        
+    dt = parse_timestamp(timestamp_str)
+    if dt is not None:
         # Format for display: "Aug 21, 19:27"
         return dt.strftime('%b %d, %H:%M')
-        
-    except Exception:
-        # Extract what we can manually
-        simple_time = simplify_timestamp(timestamp_str)
-        simple_date = simplify_date(timestamp_str)
-        
-        if simple_date and simple_time:
-            try:
-                # Try to make date prettier
-                date_obj = datetime.strptime(simple_date, '%Y-%m-%d')
-                pretty_date = date_obj.strftime('%b %d')
-                return f"{pretty_date}, {simple_time}"
-            except:
-                return f"{simple_date} {simple_time}"
-        elif simple_time:
-            return simple_time
-        else:
-            return timestamp_str
+    # Extract what we can manually
+    simple_time = simplify_timestamp(timestamp_str)
+    simple_date = simplify_date(timestamp_str)
+    
+    if simple_date and simple_time:
+        try:
+            # Try to make date prettier
+            date_obj = datetime.strptime(simple_date, '%Y-%m-%d')
+            pretty_date = date_obj.strftime('%b %d')
+            return f"{pretty_date}, {simple_time}"
+        except:
+            return f"{simple_date} {simple_time}"
+    elif simple_time:
+        return simple_time
+    else:
+        return timestamp_str
 
 # Test the functions
 if __name__ == "__main__":
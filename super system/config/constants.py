@@ -36,4 +36,29 @@ PROVIDER_SPORT_MAPPING = {
         Sport.MLB: "MLB",
         Sport.NHL: "NHL"
     }
+}
+
+# Standard team codes -> full names (every provider's spelling is resolved to these codes)
+NFL_TEAMS = {
+    'ARI': 'Arizona Cardinals', 'ATL': 'Atlanta Falcons', 'BAL': 'Baltimore Ravens',
+    'BUF': 'Buffalo Bills', 'CAR': 'Carolina Panthers', 'CHI': 'Chicago Bears',
+    'CIN': 'Cincinnati Bengals', 'CLE': 'Cleveland Browns', 'DAL': 'Dallas Cowboys',
+    'DEN': 'Denver Broncos', 'DET': 'Detroit Lions', 'GB': 'Green Bay Packers',
+    'HOU': 'Houston Texans', 'IND': 'Indianapolis Colts', 'JAX': 'Jacksonville Jaguars',
+    'KC': 'Kansas City Chiefs', 'LV': 'Las Vegas Raiders', 'LAC': 'Los Angeles Chargers',
+    'LAR': 'Los Angeles Rams', 'MIA': 'Miami Dolphins', 'MIN': 'Minnesota Vikings',
+    'NE': 'New England Patriots', 'NO': 'New Orleans Saints', 'NYG': 'New York Giants',
+    'NYJ': 'New York Jets', 'PHI': 'Philadelphia Eagles', 'PIT': 'Pittsburgh Steelers',
+    'SF': 'San Francisco 49ers', 'SEA': 'Seattle Seahawks', 'TB': 'Tampa Bay Buccaneers',
+    'TEN': 'Tennessee Titans', 'WAS': 'Washington Commanders'
+}
+
+# Alternate codes providers use for the same teams
+NFL_TEAM_ALIASES = {
+    'JAC': 'JAX', 'WSH': 'WAS', 'LA': 'LAR', 'KAN': 'KC', 'NWE': 'NE', 'NOR': 'NO',
+    'SFO': 'SF', 'TAM': 'TB', 'GNB': 'GB', 'LVR': 'LV', 'OAK': 'LV'
+}
+
+TEAM_CODES = {
+    Sport.NFL: (NFL_TEAMS, NFL_TEAM_ALIASES)
 }
\ No newline at end of file
@@ -38,16 +38,28 @@ POLYMARKET_API_BASE_URL = "https://api.polymarket.com"
 # Database settings (if needed)
 DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///sports_analytics.db')
 
+# Odds tick history (SQLite file), kept apart from the DATABASE_URL database
+TICK_STORE_PATH = os.getenv('TICK_STORE_PATH', 'odds_ticks.db')
+
 # Logging configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
 # Cache settings
 CACHE_TTL_SECONDS = int(os.getenv('CACHE_TTL_SECONDS', '300'))  # 5 minutes default
+CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '256'))  # (provider, sport, date) fetches kept
+
+# Providers are fetched concurrently; one slower than this is dropped from that aggregation
+PROVIDER_TIMEOUT_SECONDS = float(os.getenv('PROVIDER_TIMEOUT_SECONDS', '20'))
 
 # Rate limiting
 REQUESTS_PER_MINUTE = int(os.getenv('REQUESTS_PER_MINUTE', '60'))
 
+# Odds API quota: responses are reused for the TTL, and polling is stretched to fit the daily
+# budget (defaults to remaining monthly quota spread over the days left in the month)
+ODDS_API_CACHE_TTL_SECONDS = int(os.getenv('ODDS_API_CACHE_TTL_SECONDS', '60'))
+ODDS_API_DAILY_REQUEST_BUDGET = int(os.getenv('ODDS_API_DAILY_REQUEST_BUDGET')) if os.getenv('ODDS_API_DAILY_REQUEST_BUDGET') else None
+
 # UI settings
 UI_HOST = os.getenv('UI_HOST', '0.0.0.0')
 UI_PORT = int(os.getenv('UI_PORT', '5000'))
@@ -1,18 +1,36 @@
 from typing import List, Dict, Optional
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
 import logging
+import time
+
+import numpy as np
 
 from config.constants import Sport, BetType, Provider
+from config.settings import PROVIDER_TIMEOUT_SECONDS
 from models import Game, Odds
+from utils.tick_store import OddsTickStore, canonical_game_key
+from utils.game_index import GameKeyIndex, get_team_registry
 from .base import DataProvider
+from .arbitrage import ArbitrageScanner, american_to_probability
 
 class MarketDataAggregator:
     """Central aggregator for all market data sources"""
     
-    def __init__(self, providers: Optional[List[Provider]] = None):
+    def __init__(self, providers: Optional[List[Provider]] = None, tick_store: Optional[OddsTickStore] = None,
+                 provider_timeout_seconds: Optional[float] = None):
         self.providers = providers or [Provider.ODDS_API, Provider.KALSHI, Provider.POLYMARKET]
         self.clients = {}
+        self.tick_store = tick_store  # Every fetched quote is appended here when set
+        # Default per-provider timeout (a client's fetch_timeout_seconds overrides it)
+        self.provider_timeout_seconds = (PROVIDER_TIMEOUT_SECONDS if provider_timeout_seconds is None
+                                         else provider_timeout_seconds)
+        self.last_fetch_stats: Dict[Provider, Dict] = {}  # Per-provider outcome of the last get_all_games
+        # One worker pool for the aggregator's lifetime; a provider has at most one fetch in it
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers = 0
+        self._in_flight: Dict[Provider, Future] = {}
         self.logger = self._setup_logger()
         
         # Initialize clients as they become available
@@ -59,10 +77,34 @@ class MarketDataAggregator:
         self.clients[provider] = client
         self.logger.info(f"Manually added {provider.value} client")
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Worker pool with a thread per client, rebuilt only when clients outgrow it"""
+        if self._executor is None or self._executor_workers < len(self.clients):
+            if self._executor is not None:
+                # Fetches still running on the old pool finish there; _in_flight keeps tracking them
+                self._executor.shutdown(wait=False)
+            self._executor_workers = len(self.clients)
+            self._executor = ThreadPoolExecutor(max_workers=self._executor_workers, thread_name_prefix='provider')
+        return self._executor
+    
+    def close(self):
+        """Shut down the provider worker pool without waiting on stalled providers"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._executor_workers = 0
+        self._in_flight = {}
+    
     def get_all_games(self, sport: Sport, date: Optional[datetime] = None) -> List[Game]:
         """
         Fetch and aggregate games from all providers
         Returns deduplicated list of games with odds from all sources
+        
+        Providers are fetched concurrently, so aggregation takes as long as the slowest provider
+        rather than the sum. A provider still running after its timeout is skipped for this
+        aggregation, and is not fetched again until that call returns. Results are merged once every
+        provider has answered or timed out, in client order, so the merged games do not depend on
+        which provider finished first.
         """
         if not self.clients:
             self.logger.warning("No clients available")
@@ -70,45 +112,60 @@ class MarketDataAggregator:
         
         self.logger.info(f"Aggregating {sport.value} games from {len(self.clients)} providers")
         
-        # Use a dictionary to deduplicate games by their hash
-        all_games = {}
+        # Deduplicate games by canonical matchup (same matchup within 12h counts as one game)
+        all_games = GameKeyIndex()
+        fetched: Dict[Provider, List[Game]] = {}
+        self.last_fetch_stats = {}
         
+        started = time.monotonic()
+        executor = self._get_executor()
+        pending = {}
         for provider, client in self.clients.items():
-            try:
-                self.logger.info(f"Fetching from {provider.value}")
-                provider_games = client.get_games(sport.value, date)
-                self.logger.info(f"Retrieved {len(provider_games)} games from {provider.value}")
-                
-                for game in provider_games:
-                    # Use game hash for deduplication
-                    game_key = hash(game)
-                    
-                    if game_key in all_games:
-                        # Merge with existing game
-                        existing_game = all_games[game_key]
-                        
-                        # Merge provider IDs
-                        for p, pid in game.provider_ids.items():
-                            existing_game.add_provider_id(p, pid)
-                        
-                        # Merge odds
-                        for odds_key, odds in game.odds.items():
-                            existing_game.add_odds(odds_key, odds)
-                        
-                        # Update metadata if missing
-                        if not existing_game.venue and game.venue:
-                            existing_game.venue = game.venue
-                        if not existing_game.status and game.status:
-                            existing_game.status = game.status
-                            
-                        self.logger.debug(f"Merged game: {game}")
-                    else:
-                        all_games[game_key] = game
-                        self.logger.debug(f"Added new game: {game}")
-                        
-            except Exception as e:
-                self.logger.error(f"Error fetching from {provider.value}: {e}")
+            previous = self._in_flight.get(provider)
+            if previous is not None and not previous.done():
+                self.logger.warning(f"{provider.value} is still answering an earlier fetch; skipping it this time")
+                self.last_fetch_stats[provider] = {'status': 'in_flight', 'seconds': 0.0, 'games': 0}
                 continue
+            self.logger.info(f"Fetching from {provider.value}")
+            future = executor.submit(client.get_games, sport.value, date)
+            self._in_flight[provider] = future
+            pending[future] = (provider, started + self._provider_timeout(client))
+        
+        while pending:
+            next_deadline = min(deadline for _, deadline in pending.values())
+            done, _ = wait(pending, timeout=max(0.0, next_deadline - time.monotonic()),
+                           return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                provider, _ = pending.pop(future)
+                elapsed = time.monotonic() - started
+                try:
+                    provider_games = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error fetching from {provider.value}: {e}")
+                    self.last_fetch_stats[provider] = {'status': 'error', 'seconds': elapsed, 'games': 0}
+                    continue
+                
+                self.logger.info(f"Retrieved {len(provider_games)} games from {provider.value} "
+                                 f"in {elapsed:.2f}s")
+                self.last_fetch_stats[provider] = {'status': 'ok', 'seconds': elapsed,
+                                                   'games': len(provider_games)}
+                self._record_ticks(provider, provider_games)
+                fetched[provider] = provider_games
+            
+            now = time.monotonic()
+            for future, (provider, deadline) in list(pending.items()):
+                if now >= deadline and not future.done():
+                    # Left running; the next aggregation skips this provider until it returns
+                    del pending[future]
+                    self.logger.warning(f"Timed out waiting for {provider.value} after "
+                                        f"{now - started:.2f}s; skipping it this time")
+                    self.last_fetch_stats[provider] = {'status': 'timeout', 'seconds': now - started,
+                                                       'games': 0}
+        
+        for provider in self.clients:
+            if provider in fetched:
+                self._merge_games(all_games, provider, fetched[provider])
         
         games_list = list(all_games.values())
         self.logger.info(f"Aggregated {len(games_list)} unique games")
@@ -118,6 +175,87 @@ class MarketDataAggregator:
         
         return games_list
     
+    def _provider_timeout(self, client: DataProvider) -> float:
+        """Seconds to wait for one provider's games"""
+        timeout = getattr(client, 'fetch_timeout_seconds', None)
+        return self.provider_timeout_seconds if timeout is None else timeout
+    
+    def _merge_games(self, all_games: GameKeyIndex, provider: Provider, provider_games: List[Game]):
+        """Merge one provider's games into the deduplicated index"""
+        for game in provider_games:
+            game_key = game.game_key()
+            existing_game = all_games.find(game_key, game.start_time, provider)
+            
+            if existing_game is not None:
+                # Merge with existing game
+                # Merge provider IDs
+                for p, pid in game.provider_ids.items():
+                    existing_game.add_provider_id(p, pid)
+                
+                # Merge odds
+                for odds_key, odds in game.odds.items():
+                    existing_game.add_odds(odds_key, odds)
+                
+                # Update metadata if missing
+                if not existing_game.venue and game.venue:
+                    existing_game.venue = game.venue
+                if not existing_game.status and game.status:
+                    existing_game.status = game.status
+                
+                all_games.add(game_key, existing_game, existing_game.start_time, provider)
+                self.logger.debug(f"Merged game: {game}")
+            else:
+                all_games.add(game_key, game, game.start_time, provider)
+                self.logger.debug(f"Added new game: {game}")
+    
+    def _record_ticks(self, provider: Provider, games: List[Game]):
+        """Append every quote from one provider's fetch to the tick store in a single batch"""
+        if self.tick_store is None or not games:
+            return
+        
+        ticks = []
+        registry = get_team_registry()
+        for game in games:
+            game_key = canonical_game_key(game.sport.value, game.start_time.date().isoformat(),
+                                          registry.code(game.sport, game.home_team),
+                                          registry.code(game.sport, game.away_team))
+            for odds in game.odds.values():
+                if odds.bet_type == BetType.MONEYLINE:
+                    sides = [('h2h', 'home', odds.home_ml, None), ('h2h', 'away', odds.away_ml, None)]
+                elif odds.bet_type == BetType.SPREAD:
+                    sides = [('spreads', 'home', odds.home_spread_odds, odds.spread_line),
+                             ('spreads', 'away', odds.away_spread_odds, odds.spread_line)]
+                else:
+                    sides = [('totals', 'over', odds.over_odds, odds.total_line),
+                             ('totals', 'under', odds.under_odds, odds.total_line)]
+                
+                for market, side, american, line in sides:
+                    if american is None:
+                        continue
+                    ticks.append({
+                        'platform': odds.bookmaker or provider.value,
+                        'sport': game.sport.value.upper(),
+                        'game_key': game_key,
+                        'market': market,
+                        'side': side,
+                        'ts': odds.timestamp,
+                        'american': american,
+                        'line': line,
+                        'source_id': game.provider_ids.get(provider, game.game_id)
+                    })
+        
+        # Implied probabilities for the whole fetch in one vectorized pass
+        if ticks:
+            probabilities = american_to_probability(np.array([tick['american'] for tick in ticks]))
+            for tick, probability in zip(ticks, probabilities.tolist()):
+                tick['implied_probability'] = probability
+        
+        try:
+            written = self.tick_store.append_ticks(ticks)
+            self.logger.debug(f"Recorded {written} ticks from {provider.value}")
+        except Exception as e:
+            self.logger.error(f"Error recording ticks from {provider.value}: {e}")
+    
     def get_best_odds(self, game: Game, bet_type: BetType) -> Dict[str, Odds]:
         """Find best odds across all providers for a specific bet type"""
         best_odds = {
@@ -131,10 +269,7 @@ class MarketDataAggregator:
         
         self.logger.debug(f"Finding best {bet_type.value} odds for {game}")
         
-        for odds_key, odds in game.odds.items():
-            if odds.bet_type != bet_type:
-                continue
-            
+        for odds in game.get_odds_by_bet_type(bet_type):
             if bet_type == BetType.MONEYLINE:
                 # Better moneyline = higher positive odds or less negative odds
                 if odds.home_ml is not None:
@@ -198,41 +333,22 @@ class MarketDataAggregator:
         """
         Find potential arbitrage opportunities for a game
         Returns dictionary with arbitrage details if found, None otherwise
-        """
-        best_odds = self.get_best_odds(game, bet_type)
         
-        if bet_type == BetType.MONEYLINE:
-            if 'home' not in best_odds or 'away' not in best_odds:
-                return None
-            
-            home_odds = best_odds['home'].home_ml
-            away_odds = best_odds['away'].away_ml
-            
-            # Convert to implied probabilities
-            home_prob = self._american_to_probability(home_odds)
-            away_prob = self._american_to_probability(away_odds)
-            
-            total_prob = home_prob + away_prob
-            
-            if total_prob < 1.0:  # Arbitrage opportunity
-                return {
-                    'type': 'arbitrage',
-                    'bet_type': bet_type,
-                    'total_probability': total_prob,
-                    'profit_margin': 1.0 - total_prob,
-                    'home_bet': {
-                        'odds': home_odds,
-                        'provider': best_odds['home'].provider,
-                        'stake_percentage': home_prob / total_prob
-                    },
-                    'away_bet': {
-                        'odds': away_odds,
-                        'provider': best_odds['away'].provider,
-                        'stake_percentage': away_prob / total_prob
-                    }
-                }
+        Spreads and totals only pair quotes on the same line; when several lines are
+        arbitrageable the largest margin is returned.
+        """
+        opportunities = ArbitrageScanner([bet_type]).scan([game])
+        return opportunities[0] if opportunities else None
+    
+    def scan_arbitrage(self, games: List[Game], total_stake: float = 100.0, min_margin: float = 0.0,
+                       bet_types: Optional[List[BetType]] = None) -> List[Dict]:
+        """
+        Scan many games for cross-book arbitrage in one vectorized pass
         
-        return None
+        Covers moneylines and line-matched spreads/totals; each opportunity carries the best
+        quote per side and its share of total_stake. Sorted by profit margin, largest first.
+        """
+        return ArbitrageScanner(bet_types).scan(games, total_stake=total_stake, min_margin=min_margin)
     
     def _american_to_probability(self, american_odds: int) -> float:
         """Convert American odds to implied probability"""
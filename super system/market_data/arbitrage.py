@@ -0,0 +1,163 @@
+"""
+Cross-Book Arbitrage Scanner - Best prices and arbitrage margins for many games in one vectorized pass
+Every quote is laid out as (market, outcome, decimal price) rows; spreads and totals are grouped by line
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from config.constants import BetType
+from models import Game, Odds
+
+# Two-way outcomes per bet type and the Odds fields quoting them
+OUTCOMES = {
+    BetType.MONEYLINE: (('home', 'home_ml'), ('away', 'away_ml')),
+    BetType.SPREAD: (('home', 'home_spread_odds'), ('away', 'away_spread_odds')),
+    BetType.TOTAL: (('over', 'over_odds'), ('under', 'under_odds')),
+}
+
+LINE_FIELDS = {BetType.MONEYLINE: None, BetType.SPREAD: 'spread_line', BetType.TOTAL: 'total_line'}
+
+def american_to_decimal(american: np.ndarray) -> np.ndarray:
+    """Decimal odds for an array of (non-zero) American odds"""
+    american = american.astype(float)
+    return np.where(american > 0, 1.0 + american / 100.0, 1.0 + 100.0 / np.abs(american))
+
+def american_to_probability(american: np.ndarray) -> np.ndarray:
+    """Implied probabilities for an array of (non-zero) American odds, same rule as Odds.to_implied_probability"""
+    american = american.astype(float)
+    return np.where(american > 0, 100.0 / (american + 100.0), np.abs(american) / (np.abs(american) + 100.0))
+
+class ArbitrageScanner:
+    """Scans games x books x outcomes for the best price per outcome and two-way arbitrage"""
+
+    def __init__(self, bet_types: Optional[Iterable[BetType]] = None):
+        """
+        Args:
+            bet_types: Bet types to scan (defaults to moneyline, spread and total)
+        """
+        self.bet_types = tuple(bet_types) if bet_types is not None else tuple(OUTCOMES)
+
+    def _flatten(self, games: List[Game]) -> Tuple[List[Tuple[Game, BetType, Optional[float]]],
+                                                   np.ndarray, np.ndarray, np.ndarray, List[Odds]]:
+        """
+        Lay every quote out as rows
+
+        Returns:
+            (markets, market index per row, outcome per row, American odds per row, Odds per row)
+            where a market is one (game, bet type, line)
+        """
+        market_ids: Dict[Tuple[int, BetType, Optional[float]], int] = {}
+        markets = []
+        row_market = []
+        row_outcome = []
+        row_american = []
+        row_odds = []
+
+        scanned = [(bet_type, LINE_FIELDS[bet_type], OUTCOMES[bet_type]) for bet_type in self.bet_types]
+        for game_index, game in enumerate(games):
+            for bet_type, line_field, outcomes in scanned:
+                for odds in game.get_odds_by_bet_type(bet_type):
+                    line = getattr(odds, line_field) if line_field else None
+                    if line_field and line is None:
+                        continue
+
+                    market_key = (game_index, bet_type, line)
+                    market_id = market_ids.get(market_key)
+                    for outcome, (_, price_field) in enumerate(outcomes):
+                        american = getattr(odds, price_field)
+                        if not american:
+                            continue
+                        if market_id is None:
+                            market_id = market_ids[market_key] = len(markets)
+                            markets.append((game, bet_type, line))
+                        row_market.append(market_id)
+                        row_outcome.append(outcome)
+                        row_american.append(american)
+                        row_odds.append(odds)
+
+        return (markets, np.asarray(row_market, dtype=np.int64), np.asarray(row_outcome, dtype=np.int64),
+                np.asarray(row_american, dtype=np.int64), row_odds)
+
+    def best_prices(self, games: List[Game]) -> Tuple[List[Tuple[Game, BetType, Optional[float]]],
+                                                      np.ndarray, np.ndarray, np.ndarray, List[Odds]]:
+        """
+        Best decimal price per (market, outcome)
+
+        Returns:
+            (markets, best decimal odds [markets x 2] with 0 where unquoted,
+             row index of each best quote [markets x 2] with -1 where unquoted, American odds per row,
+             Odds per row)
+        """
+        markets, row_market, row_outcome, row_american, row_odds = self._flatten(games)
+        best = np.zeros((len(markets), 2))
+        best_row = np.full((len(markets), 2), -1, dtype=np.int64)
+        if not len(row_market):
+            return markets, best, best_row, row_american, row_odds
+
+        decimal = american_to_decimal(row_american)
+        slot = row_market * 2 + row_outcome
+        # Highest price first within each slot; the first row of each slot is its best quote
+        order = np.lexsort((-decimal, slot))
+        slots, first = np.unique(slot[order], return_index=True)
+        winners = order[first]
+        best.reshape(-1)[slots] = decimal[winners]
+        best_row.reshape(-1)[slots] = winners
+        return markets, best, best_row, row_american, row_odds
+
+    def scan(self, games: List[Game], total_stake: float = 100.0, min_margin: float = 0.0) -> List[Dict]:
+        """
+        Two-way arbitrage across books for every scanned market
+
+        Args:
+            games: Aggregated games (odds from any number of providers/bookmakers)
+            total_stake: Dollars split across both sides of each opportunity
+            min_margin: Only report guaranteed margins above this (0.01 = 1%)
+
+        Returns:
+            Opportunities sorted by profit margin (largest first)
+        """
+        markets, best, best_row, row_american, row_odds = self.best_prices(games)
+        if not markets:
+            return []
+
+        quoted = (best > 0).all(axis=1)
+        implied = np.divide(1.0, best, out=np.zeros_like(best), where=best > 0)
+        total_probability = implied.sum(axis=1)
+        margin = 1.0 - total_probability
+        hits = np.flatnonzero(quoted & (margin > min_margin))
+        if not len(hits):
+            return []
+
+        stake_fraction = implied[hits] / total_probability[hits, None]
+        opportunities = []
+        for i, market_index in enumerate(hits):
+            game, bet_type, line = markets[market_index]
+            opportunity = {
+                'type': 'arbitrage',
+                'game': game,
+                'bet_type': bet_type,
+                'line': line,
+                'total_probability': float(total_probability[market_index]),
+                'profit_margin': float(margin[market_index]),
+                'guaranteed_return': float(total_stake / total_probability[market_index]),
+                'bets': []
+            }
+            for outcome, (side, _) in enumerate(OUTCOMES[bet_type]):
+                row = best_row[market_index, outcome]
+                odds = row_odds[row]
+                bet = {
+                    'side': side,
+                    'odds': int(row_american[row]),
+                    'provider': odds.provider,
+                    'bookmaker': odds.bookmaker,
+                    'stake_percentage': float(stake_fraction[i, outcome]),
+                    'stake': float(total_stake * stake_fraction[i, outcome])
+                }
+                opportunity['bets'].append(bet)
+                opportunity[f'{side}_bet'] = bet
+            opportunities.append(opportunity)
+
+        opportunities.sort(key=lambda opportunity: opportunity['profit_margin'], reverse=True)
+        return opportunities
@@ -1,14 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
 
+from utils.provider_cache import get_provider_cache, get_rate_limiter
+
 class DataProvider(ABC):
-    """Abstract base class for all data providers"""
+    """
+    Abstract base class for all data providers
+    
+    The aggregator calls get_games on a worker thread, concurrently with the other providers,
+    and stops waiting after fetch_timeout_seconds (None uses the aggregator's default)
+    
+    get_games results are cached per (provider, sport, date) for cache_ttl_seconds (None uses
+    CACHE_TTL_SECONDS, 0 disables caching) and upstream fetches share a REQUESTS_PER_MINUTE
+    token bucket per provider
+    """
+    
+    fetch_timeout_seconds: Optional[float] = None
+    cache_ttl_seconds: Optional[float] = None
     
     def __init__(self, provider_name: str):
         self.provider_name = provider_name
         self.logger = self._setup_logger()
+        self.cache = get_provider_cache()
+        self.rate_limiter = get_rate_limiter(provider_name)
     
     @abstractmethod
     def fetch_games(self, sport: str, date: Optional[datetime] = None) -> List[Dict[str, Any]]:
@@ -25,9 +41,26 @@ class DataProvider(ABC):
         """Normalize parsed data into common Game objects"""
         pass
     
-    def get_games(self, sport: str, date: Optional[datetime] = None) -> List['Game']:
-        """Main method to get normalized games"""
+    def get_games(self, sport: str, date: Optional[datetime] = None, use_cache: bool = True) -> List['Game']:
+        """
+        Main method to get normalized games
+        
+        Served from the shared cache while a fetch of the same (provider, sport, date) is
+        younger than the TTL; callers always get their own copies to merge into.
+        """
+        cache_key = self._cache_key(sport, date)
+        use_cache = use_cache and self._cache_enabled()
+        if use_cache:
+            found, cached = self.cache.get(cache_key, self.cache_ttl_seconds)
+            if found:
+                self.logger.info(f"Serving {len(cached[1])} cached {sport} games from {self.provider_name}")
+                return [game.copy() for game in cached[1]]
+        
         try:
+            waited = self.rate_limiter.acquire()
+            if waited:
+                self.logger.info(f"Rate limited {self.provider_name} for {waited:.2f}s")
+            
             self.logger.info(f"Fetching {sport} games from {self.provider_name}")
             raw_data = self.fetch_games(sport, date)
             
@@ -36,14 +69,33 @@ class DataProvider(ABC):
             
             self.logger.info(f"Normalizing {len(parsed_data)} parsed games")
             normalized_games = self.normalize_games(parsed_data)
+            for game in normalized_games:
+                game.game_key()  # Resolved once here, reused by every merge and lookup
             
             self.logger.info(f"Successfully processed {len(normalized_games)} games")
+            if use_cache:
+                # Payload and games are kept together; callers get copies so merges never leak in
+                self.cache.put(cache_key, (raw_data, normalized_games))
+                return [game.copy() for game in normalized_games]
             return normalized_games
             
         except Exception as e:
             self.logger.error(f"Error processing games from {self.provider_name}: {e}")
             raise
     
+    def _cache_key(self, sport: str, date: Optional[datetime]) -> Tuple[str, str, Optional[str]]:
+        """Cache key for one provider's games for a sport and (optional) date"""
+        day = date.date() if isinstance(date, datetime) else date
+        return (self.provider_name, sport, day.isoformat() if day else None)
+    
+    def _cache_enabled(self) -> bool:
+        ttl = self.cache.ttl_seconds if self.cache_ttl_seconds is None else self.cache_ttl_seconds
+        return ttl > 0
+    
+    def invalidate_cache(self, sport: Optional[str] = None):
+        """Drop this provider's cached fetches (one sport, or all)"""
+        self.cache.invalidate(lambda key: key[0] == self.provider_name and (sport is None or key[1] == sport))
+    
     def _setup_logger(self):
         """Setup logger for the provider"""
         logger = logging.getLogger(f"{self.provider_name}_provider")
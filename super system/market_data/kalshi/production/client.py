@@ -1,30 +1,18 @@
 import requests
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
-import re
 import logging
 
 from market_data.base import DataProvider
-from config.constants import Provider, Sport, BetType
+from config.constants import Provider, Sport, BetType, NFL_TEAMS
 from models import Game, Odds
+from utils.ticker_parser import parse_ticker
 
 class KalshiClient(DataProvider):
     """Implementation for Kalshi API provider"""
     
     # NFL team abbreviation mappings
-    TEAM_ABBR_MAP = {
-        'ARI': 'Arizona Cardinals', 'ATL': 'Atlanta Falcons', 'BAL': 'Baltimore Ravens',
-        'BUF': 'Buffalo Bills', 'CAR': 'Carolina Panthers', 'CHI': 'Chicago Bears',
-        'CIN': 'Cincinnati Bengals', 'CLE': 'Cleveland Browns', 'DAL': 'Dallas Cowboys',
-        'DEN': 'Denver Broncos', 'DET': 'Detroit Lions', 'GB': 'Green Bay Packers',
-        'HOU': 'Houston Texans', 'IND': 'Indianapolis Colts', 'JAX': 'Jacksonville Jaguars',
-        'KC': 'Kansas City Chiefs', 'LV': 'Las Vegas Raiders', 'LAC': 'Los Angeles Chargers',
-        'LAR': 'Los Angeles Rams', 'MIA': 'Miami Dolphins', 'MIN': 'Minnesota Vikings',
-        'NE': 'New England Patriots', 'NO': 'New Orleans Saints', 'NYG': 'New York Giants',
-        'NYJ': 'New York Jets', 'PHI': 'Philadelphia Eagles', 'PIT': 'Pittsburgh Steelers',
-        'SF': 'San Francisco 49ers', 'SEA': 'Seattle Seahawks', 'TB': 'Tampa Bay Buccaneers',
-        'TEN': 'Tennessee Titans', 'WAS': 'Washington Commanders'
-    }
+    TEAM_ABBR_MAP = NFL_TEAMS
     
     # Reverse mapping for matching
     TEAM_NAME_TO_ABBR = {v.upper(): k for k, v in TEAM_ABBR_MAP.items()}
@@ -169,17 +157,16 @@ class KalshiClient(DataProvider):
     def _extract_teams_from_ticker(self, ticker: str, title: str) -> Optional[Dict[str, str]]:
         """Extract team names from ticker or title"""
         try:
-            # Try to parse from ticker format: NFLGAME-25SEP08-DAL-PHI
-            if 'NFLGAME' in ticker.upper():
-                parts = ticker.upper().split('-')
-                if len(parts) >= 4:
-                    away_abbr = parts[-2]
-                    home_abbr = parts[-1]
-                    
-                    away_team = self.TEAM_ABBR_MAP.get(away_abbr, away_abbr)
-                    home_team = self.TEAM_ABBR_MAP.get(home_abbr, home_abbr)
-                    
-                    return {'away': away_team, 'home': home_team}
+            # Try to parse from ticker format: NFLGAME-25SEP08-DAL-PHI or KXNFLGAME-25SEP08DALPHI-PHI
+            info = parse_ticker(ticker)
+            if info and 'NFLGAME' in info.series and info.away_code:
+                away_abbr = info.away_code
+                home_abbr = info.home_code
+                
+                away_team = self.TEAM_ABBR_MAP.get(away_abbr, away_abbr)
+                home_team = self.TEAM_ABBR_MAP.get(home_abbr, home_abbr)
+                
+                return {'away': away_team, 'home': home_team}
             
             # Try to parse from title (e.g., "Dallas Cowboys vs Philadelphia Eagles")
             if ' vs ' in title or ' @ ' in title:
@@ -206,18 +193,10 @@ class KalshiClient(DataProvider):
                             return datetime.fromisoformat(time_str.replace('Z', '+00:00'))
             
             # Try to parse from ticker (e.g., 25SEP08)
-            if 'NFLGAME' in ticker.upper():
-                date_match = re.search(r'(\d{2}[A-Z]{3}\d{2})', ticker.upper())
-                if date_match:
-                    date_str = date_match.group(1)
-                    # Parse format like 25SEP08
-                    year = 2000 + int(date_str[:2])
-                    month_map = {'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4, 'MAY': 5, 'JUN': 6,
-                                'JUL': 7, 'AUG': 8, 'SEP': 9, 'OCT': 10, 'NOV': 11, 'DEC': 12}
-                    month = month_map.get(date_str[2:5], 9)
-                    day = int(date_str[5:7])
-                    
-                    return datetime(year, month, day, 13, 0, tzinfo=timezone.utc)  # Default 1 PM UTC
+            info = parse_ticker(ticker)
+            if info and 'NFLGAME' in info.series:
+                game_date = datetime.strptime(info.date, '%Y-%m-%d')
+                return game_date.replace(hour=13, tzinfo=timezone.utc)  # Default 1 PM UTC
                     
         except Exception as e:
             self.logger.warning(f"Could not parse game time from {ticker}: {e}")
@@ -6,19 +6,30 @@ import os
 from market_data.base import DataProvider
 from config.constants import Sport, Provider, PROVIDER_SPORT_MAPPING, BetType
 from models import Game, Odds
+from utils.odds_api_scheduler import OddsApiScheduler, configure_shared_scheduler, estimate_request_cost
 
 class OddsAPIClient(DataProvider):
     """Implementation for The Odds API provider"""
     
-    def __init__(self):
+    REGIONS = 'us,us2,eu,uk,au'  # Include more regions for more sportsbooks
+    MARKETS = 'h2h,spreads,totals'
+    BOOKMAKERS = 'draftkings,fanduel,betmgm,caesars,williamhill_us,bovada,betrivers,betonlineag,betus,mybookieag,lowvig,pointsbetus,twinspires,circasports,barstool,wynnbet,superbook,unibet_us,betway,betfred,betparx,sugarhouse,foxbet,tipico_us,sisportsbook,intertops,betfair_ex_us,pinnacle'
+    
+    def __init__(self, scheduler: Optional[OddsApiScheduler] = None):
         super().__init__(Provider.ODDS_API.value)
         
         # Import here to avoid circular imports
-        from config.settings import ODDS_API_KEY
+        from config.settings import ODDS_API_KEY, ODDS_API_CACHE_TTL_SECONDS, ODDS_API_DAILY_REQUEST_BUDGET
         
         self.api_key = ODDS_API_KEY
         self.base_url = "https://api.the-odds-api.com/v4"
         
+        if scheduler is None:
+            # Settings are applied to the shared instance so its quota state and cache survive
+            scheduler = configure_shared_scheduler(default_ttl=ODDS_API_CACHE_TTL_SECONDS,
+                                                   daily_budget=ODDS_API_DAILY_REQUEST_BUDGET)
+        self.scheduler = scheduler
+        
         if not self.api_key:
             raise ValueError("ODDS_API_KEY is required. Please add it to config/odds_api_key.txt or set as environment variable")
     
@@ -33,10 +44,10 @@ class OddsAPIClient(DataProvider):
         
         params = {
             'api_key': self.api_key,
-            'regions': 'us,us2,eu,uk,au',  # Include more regions for more sportsbooks
-            'markets': 'h2h,spreads,totals',
+            'regions': self.REGIONS,
+            'markets': self.MARKETS,
             'oddsFormat': 'american',
-            'bookmakers': 'draftkings,fanduel,betmgm,caesars,williamhill_us,bovada,betrivers,betonlineag,betus,mybookieag,lowvig,pointsbetus,twinspires,circasports,barstool,wynnbet,superbook,unibet_us,betway,betfred,betparx,sugarhouse,foxbet,tipico_us,sisportsbook,intertops,betfair_ex_us,pinnacle'
+            'bookmakers': self.BOOKMAKERS
         }
         
         if date:
@@ -44,21 +55,31 @@ class OddsAPIClient(DataProvider):
             pass
         
         try:
-            response = requests.get(
+            data, from_cache, fetched_at = self.scheduler.get_json_entry(
                 f"{self.base_url}/sports/{sport_key}/odds",
-                params=params,
-                timeout=30
+                params,
+                (sport_key, self.MARKETS, self.BOOKMAKERS),
+                lambda url, params: requests.get(url, params=params, timeout=30),
+                request_cost=estimate_request_cost(self.MARKETS, self.REGIONS, self.BOOKMAKERS)
             )
-            response.raise_for_status()
-            
-            data = response.json()
-            self.logger.info(f"Fetched {len(data)} games from Odds API")
-            return data
+            source = "cache" if from_cache else "Odds API"
+            self.logger.info(f"Fetched {len(data)} games from {source} "
+                             f"({self.scheduler.requests_remaining} requests remaining)")
+            # Quotes are as old as the upstream fetch, not the cache hit that served them
+            return [dict(game, fetched_at=fetched_at) for game in data]
             
         except requests.RequestException as e:
             self.logger.error(f"Error fetching from Odds API: {e}")
             raise
     
+    def get_poll_interval(self, sport: str) -> float:
+        """Minimum seconds between fetches of a sport that keeps within the daily request budget"""
+        sport_key = PROVIDER_SPORT_MAPPING[Provider.ODDS_API][Sport(sport)]
+        return self.scheduler.poll_interval(
+            (sport_key, self.MARKETS, self.BOOKMAKERS),
+            estimate_request_cost(self.MARKETS, self.REGIONS, self.BOOKMAKERS)
+        )
+    
     def parse_games(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Parse Odds API response"""
         if not isinstance(raw_data, list):
@@ -75,7 +96,8 @@ class OddsAPIClient(DataProvider):
                     'away_team': game['away_team'],
                     'commence_time': game['commence_time'],
                     'sport_key': game.get('sport_key'),
-                    'bookmakers': game.get('bookmakers', [])
+                    'bookmakers': game.get('bookmakers', []),
+                    'fetched_at': game.get('fetched_at')
                 }
                 parsed_games.append(parsed_game)
                 
@@ -179,8 +201,10 @@ class OddsAPIClient(DataProvider):
             return datetime.now()
     
     def _extract_odds(self, bookmaker: Dict, game_data: Dict) -> List[Odds]:
-        """Extract odds from bookmaker data"""
+        """Extract odds from bookmaker data, stamped with the time the payload was fetched"""
         odds_list = []
+        fetched_at = game_data.get('fetched_at')
+        timestamp = datetime.fromtimestamp(fetched_at) if fetched_at is not None else datetime.now()
         
         try:
             bookmaker_key = bookmaker['key']
@@ -191,17 +215,17 @@ class OddsAPIClient(DataProvider):
                 outcomes = market.get('outcomes', [])
                 
                 if market_key == 'h2h':  # Moneyline
-                    odds = self._create_moneyline_odds(outcomes, bookmaker_key, game_data)
+                    odds = self._create_moneyline_odds(outcomes, bookmaker_key, game_data, timestamp)
                     if odds:
                         odds_list.append(odds)
                         
                 elif market_key == 'spreads':  # Point spread
-                    odds = self._create_spread_odds(outcomes, bookmaker_key)
+                    odds = self._create_spread_odds(outcomes, bookmaker_key, timestamp)
                     if odds:
                         odds_list.append(odds)
                         
                 elif market_key == 'totals':  # Over/Under
-                    odds = self._create_total_odds(outcomes, bookmaker_key)
+                    odds = self._create_total_odds(outcomes, bookmaker_key, timestamp)
                     if odds:
                         odds_list.append(odds)
                         
@@ -210,7 +234,8 @@ class OddsAPIClient(DataProvider):
         
         return odds_list
     
-    def _create_moneyline_odds(self, outcomes: List[Dict], bookmaker_key: str, game_data: Dict) -> Optional[Odds]:
+    def _create_moneyline_odds(self, outcomes: List[Dict], bookmaker_key: str, game_data: Dict,
+                               timestamp: datetime) -> Optional[Odds]:
         """Create moneyline odds from outcomes"""
         home_ml = None
         away_ml = None
@@ -241,7 +266,7 @@ class OddsAPIClient(DataProvider):
             return Odds(
                 provider=Provider.ODDS_API,
                 bet_type=BetType.MONEYLINE,
-                timestamp=datetime.now(),
+                timestamp=timestamp,
                 home_ml=home_ml,
                 away_ml=away_ml,
                 bookmaker=bookmaker_key
@@ -249,7 +274,7 @@ class OddsAPIClient(DataProvider):
         
         return None
     
-    def _create_spread_odds(self, outcomes: List[Dict], bookmaker_key: str) -> Optional[Odds]:
+    def _create_spread_odds(self, outcomes: List[Dict], bookmaker_key: str, timestamp: datetime) -> Optional[Odds]:
         """Create spread odds from outcomes"""
         spread_line = None
         home_spread_odds = None
@@ -277,7 +302,7 @@ class OddsAPIClient(DataProvider):
             return Odds(
                 provider=Provider.ODDS_API,
                 bet_type=BetType.SPREAD,
-                timestamp=datetime.now(),
+                timestamp=timestamp,
                 spread_line=spread_line,
                 home_spread_odds=home_spread_odds,
                 away_spread_odds=away_spread_odds,
@@ -286,7 +311,7 @@ class OddsAPIClient(DataProvider):
         
         return None
     
-    def _create_total_odds(self, outcomes: List[Dict], bookmaker_key: str) -> Optional[Odds]:
+    def _create_total_odds(self, outcomes: List[Dict], bookmaker_key: str, timestamp: datetime) -> Optional[Odds]:
         """Create total (over/under) odds from outcomes"""
         total_line = None
         over_odds = None
@@ -314,7 +339,7 @@ class OddsAPIClient(DataProvider):
             return Odds(
                 provider=Provider.ODDS_API,
                 bet_type=BetType.TOTAL,
-                timestamp=datetime.now(),
+                timestamp=timestamp,
                 total_line=total_line,
                 over_odds=over_odds,
                 under_odds=under_odds,
@@ -1,10 +1,11 @@
 from .game import Game
-from .odds import Odds
+from .odds import Odds, OddsIndex
 from .order import Order, Position, OrderStatus, OrderSide
 
 __all__ = [
     'Game',
     'Odds', 
+    'OddsIndex',
     'Order',
     'Position',
     'OrderStatus',
@@ -1,7 +1,9 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Dict, List, Optional
-from config.constants import Sport, Provider
+from typing import Dict, List, Optional, Tuple
+from config.constants import Sport, Provider, BetType
+from utils.game_index import get_team_registry
+from .odds import Odds, OddsIndex
 
 @dataclass
 class Game:
@@ -16,8 +18,8 @@ class Game:
     # Store provider-specific IDs for reference
     provider_ids: Dict[Provider, str] = field(default_factory=dict)
     
-    # Odds for this game
-    odds: Dict[str, 'Odds'] = field(default_factory=dict)
+    # Odds for this game (string key -> Odds, indexed by provider/bookmaker/bet type)
+    odds: OddsIndex = field(default_factory=OddsIndex)
     
     # Game status
     status: Optional[str] = None  # scheduled, live, finished, postponed
@@ -26,33 +28,57 @@ class Game:
     season: Optional[str] = None
     week: Optional[int] = None
     
+    # Interned (sport, home, away, UTC day) ids, set once by game_key()
+    canonical_key: Optional[Tuple[int, int, int, int]] = field(default=None, repr=False)
+    
+    def __post_init__(self):
+        if not isinstance(self.odds, OddsIndex):
+            self.odds = OddsIndex(self.odds)
+    
+    def game_key(self) -> Tuple[int, int, int, int]:
+        """Canonical key shared by every provider's spelling of this matchup and day"""
+        if self.canonical_key is None:
+            self.canonical_key = get_team_registry().game_key(
+                self.sport, self.home_team, self.away_team, self.start_time)
+        return self.canonical_key
+    
     def __hash__(self):
-        """Hash based on teams and start time for deduplication"""
-        return hash(f"{self.home_team}_{self.away_team}_{self.start_time.date()}")
+        """Hash based on canonical teams and UTC start date for deduplication"""
+        return hash(self.game_key())
     
     def __eq__(self, other):
         """Equality check for game matching"""
         if not isinstance(other, Game):
             return False
-        return (self.home_team == other.home_team and 
-                self.away_team == other.away_team and 
-                self.start_time.date() == other.start_time.date())
+        return self.game_key() == other.game_key()
     
     def __str__(self):
         """String representation"""
         return f"{self.away_team} @ {self.home_team} ({self.start_time.strftime('%Y-%m-%d %H:%M')})"
     
+    def copy(self) -> 'Game':
+        """Copy with its own provider ids and odds index (the Odds records are shared)"""
+        return replace(self, provider_ids=dict(self.provider_ids), odds=OddsIndex(self.odds))
+    
     def add_provider_id(self, provider: Provider, provider_id: str):
         """Add a provider-specific ID"""
         self.provider_ids[provider] = provider_id
     
-    def add_odds(self, odds_key: str, odds: 'Odds'):
+    def add_odds(self, odds_key: str, odds: Odds):
         """Add odds for this game"""
         self.odds[odds_key] = odds
     
-    def get_odds_by_provider(self, provider: Provider) -> List['Odds']:
+    def get_odds_by_provider(self, provider: Provider) -> List[Odds]:
         """Get all odds from a specific provider"""
-        return [odds for key, odds in self.odds.items() if provider.value in key]
+        return self.odds.by_provider(provider)
+    
+    def get_odds_by_bet_type(self, bet_type: BetType) -> List[Odds]:
+        """Get all odds for a specific bet type"""
+        return self.odds.by_bet_type(bet_type)
+    
+    def get_odds(self, provider: Provider, bookmaker: Optional[str], bet_type: BetType) -> Optional[Odds]:
+        """Get one book's odds for a bet type"""
+        return self.odds.lookup(provider, bookmaker, bet_type)
     
     def is_today(self) -> bool:
         """Check if game is today"""
@@ -1,11 +1,22 @@
+import sys
+from collections.abc import MutableMapping
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from config.constants import BetType, Provider
 
-@dataclass
+# (provider, bookmaker, bet type) identifying one book's market for a game
+OddsKey = Tuple[Provider, str, BetType]
+
+@lru_cache(maxsize=4096)
+def odds_key(provider: Provider, bookmaker: str, bet_type: BetType) -> OddsKey:
+    """Index key shared by every game's quote from the same book (one tuple per book and bet type)"""
+    return (provider, bookmaker, bet_type)
+
+@dataclass(slots=True)
 class Odds:
-    """Normalized odds representation"""
+    """Normalized odds representation (slotted: games hold dozens of these)"""
     provider: Provider
     bet_type: BetType
     timestamp: datetime
@@ -29,6 +40,16 @@ class Odds:
     liquidity: Optional[float] = None
     bookmaker: Optional[str] = None
     
+    def __post_init__(self):
+        # The same few dozen bookmaker names repeat across every game
+        if self.bookmaker:
+            self.bookmaker = sys.intern(self.bookmaker)
+    
+    @property
+    def key(self) -> OddsKey:
+        """(provider, bookmaker, bet type) this quote is indexed under"""
+        return odds_key(self.provider, self.bookmaker or self.provider.value, self.bet_type)
+    
     def to_american_odds(self, decimal_odds: float) -> int:
         """Convert decimal odds to American format"""
         if decimal_odds >= 2.0:
@@ -92,4 +113,82 @@ class Odds:
             if self.total_line and self.over_odds and self.under_odds:
                 parts.append(f"Total: {self.total_line} (O/U: {self.over_odds:+d}/{self.under_odds:+d})")
         
-        return " - ".join(parts)
\ No newline at end of file
+        return " - ".join(parts)
+
+class OddsIndex(MutableMapping):
+    """
+    A game's odds by string key, also indexed by (provider, bookmaker, bet type), provider and bet type
+    
+    Behaves like the plain dict Game.odds used to be; the extra indexes are kept in step on every
+    write so provider and bet type queries are dictionary lookups rather than scans. Index keys are
+    shared process-wide and buckets are lists, so the index costs less than slotting Odds saves.
+    """
+    
+    __slots__ = ('_odds', '_by_key', '_buckets')
+    
+    def __init__(self, odds: Optional[Dict[str, Odds]] = None):
+        self._odds: Dict[str, Odds] = {}
+        self._by_key: Dict[OddsKey, Odds] = {}
+        self._buckets: Dict[Provider, Dict[BetType, List[Odds]]] = {}
+        if odds:
+            self.update(odds)
+    
+    def __getitem__(self, odds_key: str) -> Odds:
+        return self._odds[odds_key]
+    
+    def __setitem__(self, odds_key: str, odds: Odds):
+        previous = self._odds.get(odds_key)
+        self._odds[odds_key] = odds
+        bucket = self._buckets.setdefault(odds.provider, {}).setdefault(odds.bet_type, [])
+        if previous is not None and previous.provider == odds.provider and previous.bet_type == odds.bet_type:
+            # Same bucket: replace in place so query order follows first insertion like the dict
+            bucket[self._position(bucket, previous)] = odds
+            if self._by_key.get(previous.key) is previous:
+                del self._by_key[previous.key]
+        else:
+            if previous is not None:
+                self._unindex(previous)
+            bucket.append(odds)
+        self._by_key[odds.key] = odds
+    
+    def __delitem__(self, odds_key: str):
+        self._unindex(self._odds.pop(odds_key))
+    
+    @staticmethod
+    def _position(bucket: List[Odds], odds: Odds) -> int:
+        return next(i for i, candidate in enumerate(bucket) if candidate is odds)
+    
+    def _unindex(self, odds: Odds):
+        bucket = self._buckets[odds.provider][odds.bet_type]
+        del bucket[self._position(bucket, odds)]
+        if self._by_key.get(odds.key) is odds:
+            del self._by_key[odds.key]
+            # Another string key may still quote the same book and bet type
+            for candidate in reversed(bucket):
+                if candidate.key is odds.key:
+                    self._by_key[odds.key] = candidate
+                    break
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._odds)
+    
+    def __len__(self) -> int:
+        return len(self._odds)
+    
+    def __contains__(self, odds_key) -> bool:
+        return odds_key in self._odds
+    
+    def __repr__(self) -> str:
+        return repr(self._odds)
+    
+    def lookup(self, provider: Provider, bookmaker: Optional[str], bet_type: BetType) -> Optional[Odds]:
+        """One book's odds for a bet type (bookmaker None means the provider itself)"""
+        return self._by_key.get((provider, bookmaker or provider.value, bet_type))
+    
+    def by_provider(self, provider: Provider) -> List[Odds]:
+        """Every quote from one provider"""
+        return [odds for bucket in self._buckets.get(provider, {}).values() for odds in bucket]
+    
+    def by_bet_type(self, bet_type: BetType) -> List[Odds]:
+        """Every quote for one bet type"""
+        return [odds for buckets in self._buckets.values() for odds in buckets.get(bet_type, ())]
@@ -4,6 +4,8 @@ Tests for the market data aggregator
 """
 
 import pytest
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
@@ -11,10 +13,13 @@ from market_data.aggregator import MarketDataAggregator
 from market_data.base import DataProvider
 from models import Game, Odds
 from config.constants import Sport, Provider, BetType
+from utils.tick_store import OddsTickStore
 
 class MockDataProvider(DataProvider):
     """Mock data provider for testing"""
     
+    cache_ttl_seconds = 0  # Each test supplies its own games under the same provider names
+    
     def __init__(self, provider_name: str, games_data: list = None):
         super().__init__(provider_name)
         self.games_data = games_data or []
@@ -120,6 +125,54 @@ class TestMarketDataAggregator:
         assert "odds_api_ml" in merged_game.odds
         assert "kalshi_ml" in merged_game.odds
     
+    def test_deduplication_across_team_spellings(self):
+        """Codes, full names and nicknames of the same matchup merge into one game"""
+        aggregator = MarketDataAggregator(providers=[])
+        
+        start_time = datetime(2025, 9, 8, 0, 15)
+        odds_game = Game(game_id="odds_123", sport=Sport.NFL, home_team="KC", away_team="BUF", start_time=start_time)
+        kalshi_game = Game(game_id="kalshi_456", sport=Sport.NFL, home_team="Kansas City Chiefs",
+                           away_team="Buffalo Bills", start_time=start_time)
+        poly_game = Game(game_id="poly_789", sport=Sport.NFL, home_team="Chiefs", away_team="Bills",
+                         start_time=start_time)
+        for game, provider in ((odds_game, Provider.ODDS_API), (kalshi_game, Provider.KALSHI),
+                               (poly_game, Provider.POLYMARKET)):
+            game.add_provider_id(provider, game.game_id)
+            aggregator.add_client(provider, MockDataProvider(provider.value, [game]))
+        
+        games = aggregator.get_all_games(Sport.NFL)
+        
+        assert len(games) == 1
+        assert set(games[0].provider_ids) == {Provider.ODDS_API, Provider.KALSHI, Provider.POLYMARKET}
+    
+    def test_deduplication_matches_start_times(self):
+        """Quotes within 12h across midnight merge; rematches and same-provider games never chain"""
+        evening = datetime(2025, 9, 7, 23, 30)
+        
+        def matchup(game_id, provider, hours):
+            game = Game(game_id=game_id, sport=Sport.NFL, home_team="KC", away_team="BUF",
+                        start_time=evening + timedelta(hours=hours))
+            game.add_provider_id(provider, game_id)
+            return game
+        
+        for _ in range(5):
+            aggregator = MarketDataAggregator(providers=[])
+            aggregator.add_client(Provider.ODDS_API, MockDataProvider("odds_api", [matchup("odds_1", Provider.ODDS_API, 0)]))
+            aggregator.add_client(Provider.KALSHI, MockDataProvider("kalshi", [
+                matchup("kalshi_1", Provider.KALSHI, 2),
+                matchup("kalshi_2", Provider.KALSHI, 5),  # Same provider: never merged with kalshi_1
+            ]))
+            # 46h after the odds game and 44h after kalshi_2: a rematch, not the same game
+            aggregator.add_client(Provider.POLYMARKET, MockDataProvider("polymarket", [
+                matchup("poly_1", Provider.POLYMARKET, 46)]))
+            
+            games = aggregator.get_all_games(Sport.NFL)
+            
+            assert [game.game_id for game in games] == ["odds_1", "kalshi_2", "poly_1"]
+            assert games[0].provider_ids == {Provider.ODDS_API: "odds_1", Provider.KALSHI: "kalshi_1"}
+            assert games[1].provider_ids == {Provider.KALSHI: "kalshi_2"}
+            assert games[2].provider_ids == {Provider.POLYMARKET: "poly_1"}
+    
     def test_best_odds_selection(self):
         """Test best odds selection logic"""
         aggregator = MarketDataAggregator(providers=[])
@@ -197,6 +250,34 @@ class TestMarketDataAggregator:
         arb = aggregator.find_arbitrage_opportunities(game, BetType.MONEYLINE)
         assert arb is None
     
+    def test_tick_recording(self):
+        """Test every fetched quote is appended to the tick store"""
+        store = OddsTickStore(':memory:')
+        aggregator = MarketDataAggregator(providers=[Provider.ODDS_API], tick_store=store)
+        
+        game = self.create_sample_game("odds_123", Provider.ODDS_API)
+        game.add_odds("odds_api_ml", self.create_sample_odds(
+            Provider.ODDS_API, BetType.MONEYLINE, home_ml=-110, away_ml=100, bookmaker="pinnacle"))
+        game.add_odds("odds_api_total", self.create_sample_odds(
+            Provider.ODDS_API, BetType.TOTAL, total_line=47.5, over_odds=-105, under_odds=-115))
+        aggregator.add_client(Provider.ODDS_API, MockDataProvider("odds_api", [game]))
+        
+        aggregator.get_all_games(Sport.NFL)
+        aggregator.get_all_games(Sport.NFL)  # Unchanged quotes are not written again
+        
+        ticks = store.query_ticks()
+        assert len(ticks) == 4
+        moneyline = [t for t in ticks if t['market'] == 'h2h']
+        assert {t['platform'] for t in moneyline} == {'pinnacle'}
+        assert moneyline[0]['game_key'].startswith('NFL:') and moneyline[0]['game_key'].endswith(':BUF@KC')
+        totals = store.query_ticks(market='totals', side='over')
+        assert totals[0]['platform'] == 'odds_api' and totals[0]['line'] == 47.5
+        # Batch-computed probabilities match the scalar Odds conversion
+        scalar = self.create_sample_odds(Provider.ODDS_API, BetType.MONEYLINE)
+        for tick in ticks:
+            assert abs(tick['implied_probability'] - scalar.to_implied_probability(tick['american'])) < 1e-12
+        store.close()
+    
     def test_provider_status(self):
         """Test provider status reporting"""
         aggregator = MarketDataAggregator(providers=[Provider.ODDS_API, Provider.KALSHI])
@@ -255,6 +336,75 @@ class TestMarketDataAggregator:
         games = aggregator.get_all_games(Sport.NFL)
         assert len(games) == 0
 
+    def test_providers_fetch_concurrently(self):
+        """Aggregation takes as long as the slowest provider, not the sum"""
+        aggregator = MarketDataAggregator(providers=[])
+        
+        def slow_client(name, provider, game):
+            client = MockDataProvider(name, [game])
+            fetch = client.fetch_games
+            def sleepy_fetch(sport, date=None):
+                time.sleep(0.3)
+                return fetch(sport, date)
+            client.fetch_games = sleepy_fetch
+            return client
+        
+        aggregator.add_client(Provider.ODDS_API, slow_client(
+            "odds_api", Provider.ODDS_API, self.create_sample_game("odds_123", Provider.ODDS_API)))
+        aggregator.add_client(Provider.KALSHI, slow_client(
+            "kalshi", Provider.KALSHI, self.create_sample_game("kalshi_456", Provider.KALSHI, "DAL", "PHI")))
+        aggregator.add_client(Provider.POLYMARKET, slow_client(
+            "polymarket", Provider.POLYMARKET, self.create_sample_game("poly_789", Provider.POLYMARKET, "SF", "SEA")))
+        
+        started = time.monotonic()
+        games = aggregator.get_all_games(Sport.NFL)
+        elapsed = time.monotonic() - started
+        
+        assert len(games) == 3
+        assert elapsed < 0.6
+        assert {stats['status'] for stats in aggregator.last_fetch_stats.values()} == {'ok'}
+    
+    def test_slow_provider_times_out(self):
+        """A provider past its timeout is skipped without stalling the others"""
+        aggregator = MarketDataAggregator(providers=[], provider_timeout_seconds=0.1)
+        
+        fast_client = MockDataProvider("odds_api", [self.create_sample_game("odds_123", Provider.ODDS_API)])
+        stalled_client = MockDataProvider("kalshi", [self.create_sample_game("kalshi_456", Provider.KALSHI, "DAL", "PHI")])
+        release = threading.Event()
+        stalled_calls = []
+        def stalled_fetch(sport, date=None):
+            stalled_calls.append(sport)
+            release.wait(timeout=5)
+            return []
+        stalled_client.fetch_games = stalled_fetch
+        aggregator.add_client(Provider.ODDS_API, fast_client)
+        aggregator.add_client(Provider.KALSHI, stalled_client)
+        
+        try:
+            started = time.monotonic()
+            games = aggregator.get_all_games(Sport.NFL)
+            elapsed = time.monotonic() - started
+            
+            assert len(games) == 1
+            assert games[0].provider_ids == {Provider.ODDS_API: "odds_123"}
+            assert elapsed < 0.4
+            assert aggregator.last_fetch_stats[Provider.KALSHI]['status'] == 'timeout'
+            
+            # The stalled call is still running: it is not resubmitted and the pool is reused
+            executor = aggregator._executor
+            assert len(aggregator.get_all_games(Sport.NFL)) == 1
+            assert aggregator._executor is executor
+            assert aggregator.last_fetch_stats[Provider.KALSHI]['status'] == 'in_flight'
+            assert stalled_calls == ['nfl']
+        finally:
+            release.set()
+            aggregator._in_flight[Provider.KALSHI].result(timeout=5)
+            aggregator.close()
+        
+        # A client's own timeout overrides the aggregator default
+        stalled_client.fetch_timeout_seconds = 0.05
+        assert aggregator._provider_timeout(stalled_client) == 0.05
+    
 def run_tests():
     """Run all tests manually"""
     print("Running aggregator tests...")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch cross-book arbitrage scanner
+"""
+
+import time
+from datetime import datetime
+
+from market_data.arbitrage import ArbitrageScanner
+from models import Game, Odds
+from config.constants import Sport, Provider, BetType
+
+def make_game(game_id: str, home_team: str = "KC", away_team: str = "BUF") -> Game:
+    return Game(game_id=game_id, sport=Sport.NFL, home_team=home_team, away_team=away_team,
+                start_time=datetime(2025, 9, 8, 0, 15))
+
+def add_odds(game: Game, bookmaker: str, bet_type: BetType, **kwargs):
+    game.add_odds(f"odds_api_{bookmaker}_{bet_type.value}_{len(game.odds)}",
+                  Odds(provider=Provider.ODDS_API, bet_type=bet_type, timestamp=datetime.now(),
+                       bookmaker=bookmaker, **kwargs))
+
+class TestArbitrageScanner:
+    """Test cases for ArbitrageScanner"""
+
+    def test_moneyline_stake_split(self):
+        """Best price per side comes from different books and stakes equalize the payout"""
+        game = make_game("g1")
+        add_odds(game, "draftkings", BetType.MONEYLINE, home_ml=120, away_ml=-150)
+        add_odds(game, "fanduel", BetType.MONEYLINE, home_ml=-140, away_ml=130)
+
+        opportunities = ArbitrageScanner().scan([game], total_stake=1000)
+
+        assert len(opportunities) == 1
+        arb = opportunities[0]
+        assert arb['bet_type'] == BetType.MONEYLINE
+        assert (arb['home_bet']['odds'], arb['home_bet']['bookmaker']) == (120, "draftkings")
+        assert (arb['away_bet']['odds'], arb['away_bet']['bookmaker']) == (130, "fanduel")
+        assert abs(arb['profit_margin'] - (1 - 100 / 220 - 100 / 230)) < 1e-9
+        # Either side winning returns the same amount
+        home_payout = arb['home_bet']['stake'] * 2.2
+        away_payout = arb['away_bet']['stake'] * 2.3
+        assert abs(home_payout - away_payout) < 1e-6
+        assert abs(home_payout - arb['guaranteed_return']) < 1e-6
+        assert abs(arb['home_bet']['stake'] + arb['away_bet']['stake'] - 1000) < 1e-6
+
+    def test_spreads_and_totals_are_line_matched(self):
+        """Quotes on different lines are never paired"""
+        game = make_game("g1")
+        add_odds(game, "draftkings", BetType.SPREAD, spread_line=3.5, home_spread_odds=105, away_spread_odds=-125)
+        add_odds(game, "fanduel", BetType.SPREAD, spread_line=2.5, home_spread_odds=-130, away_spread_odds=110)
+        add_odds(game, "betmgm", BetType.TOTAL, total_line=47.5, over_odds=108, under_odds=-128)
+        add_odds(game, "caesars", BetType.TOTAL, total_line=47.5, over_odds=-125, under_odds=106)
+
+        opportunities = ArbitrageScanner().scan([game])
+
+        assert len(opportunities) == 1
+        arb = opportunities[0]
+        assert (arb['bet_type'], arb['line']) == (BetType.TOTAL, 47.5)
+        assert arb['over_bet']['bookmaker'] == "betmgm"
+        assert arb['under_bet']['bookmaker'] == "caesars"
+
+    def test_no_arbitrage_and_missing_sides(self):
+        """Normal markets and one-sided quotes give nothing"""
+        game = make_game("g1")
+        add_odds(game, "draftkings", BetType.MONEYLINE, home_ml=-110, away_ml=-110)
+        add_odds(game, "fanduel", BetType.MONEYLINE, home_ml=-105, away_ml=-115)
+        one_sided = make_game("g2", home_team="DAL", away_team="PHI")
+        add_odds(one_sided, "fanduel", BetType.MONEYLINE, home_ml=300)
+        assert ArbitrageScanner().scan([game, one_sided]) == []
+        assert ArbitrageScanner().scan([]) == []
+
+    def test_full_slate_scan_is_fast(self):
+        """A day of games across 28 books and three markets scans in well under a second"""
+        games = []
+        for game_index in range(60):
+            game = make_game(f"g{game_index}", home_team=f"H{game_index}", away_team=f"A{game_index}")
+            for book in range(28):
+                skew = (book % 7) - 3
+                add_odds(game, f"book{book}", BetType.MONEYLINE, home_ml=-120 + skew, away_ml=100 + skew)
+                add_odds(game, f"book{book}", BetType.SPREAD, spread_line=3.5 + (book % 2),
+                         home_spread_odds=-110 + skew, away_spread_odds=-110 - skew)
+                add_odds(game, f"book{book}", BetType.TOTAL, total_line=44.5, over_odds=-112 + skew,
+                         under_odds=-108 - skew)
+            games.append(game)
+
+        started = time.perf_counter()
+        opportunities = ArbitrageScanner().scan(games)
+        elapsed = time.perf_counter() - started
+
+        assert opportunities == []
+        assert elapsed < 0.5
+
+if __name__ == "__main__":
+    tests = TestArbitrageScanner()
+    for name in [method for method in dir(tests) if method.startswith('test_')]:
+        getattr(tests, name)()
+        print(f"  ✅ {name}")
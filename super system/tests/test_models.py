@@ -53,6 +53,18 @@ class TestGame:
         # Should be equal despite different IDs
         assert game1 == game2
         assert hash(game1) == hash(game2)
+        
+        # Provider spellings of the same teams share the canonical key
+        game3 = Game(
+            game_id="test_003",
+            sport=Sport.NFL,
+            home_team="Kansas City Chiefs",
+            away_team="Buffalo Bills",
+            start_time=start_time
+        )
+        assert game3 == game1
+        assert game3.game_key() == game1.game_key()
+        assert all(isinstance(part, int) for part in game3.game_key())
     
     def test_game_provider_ids(self):
         """Test adding provider IDs"""
@@ -166,6 +178,44 @@ class TestOdds:
         odds.spread_line = -2.5  # Away favored by 2.5
         assert odds.get_spread_favorite() == "away"
 
+class TestOddsIndex:
+    """Test cases for the per-game odds index"""
+    
+    def make_odds(self, provider, bet_type, bookmaker=None, **kwargs):
+        return Odds(provider=provider, bet_type=bet_type, timestamp=datetime.now(), bookmaker=bookmaker, **kwargs)
+    
+    def test_odds_are_slotted(self):
+        """Odds records carry no per-instance __dict__"""
+        odds = self.make_odds(Provider.ODDS_API, BetType.MONEYLINE, bookmaker="draftkings", home_ml=-110)
+        assert not hasattr(odds, '__dict__')
+        assert odds.key == (Provider.ODDS_API, "draftkings", BetType.MONEYLINE)
+    
+    def test_provider_and_bet_type_lookups(self):
+        """Queries go through the index and stay in step with overwrites and deletes"""
+        game = Game(game_id="test_001", sport=Sport.NFL, home_team="KC", away_team="BUF", start_time=datetime.now())
+        dk_ml = self.make_odds(Provider.ODDS_API, BetType.MONEYLINE, bookmaker="draftkings", home_ml=-110, away_ml=100)
+        dk_total = self.make_odds(Provider.ODDS_API, BetType.TOTAL, bookmaker="draftkings", total_line=47.5,
+                                  over_odds=-110, under_odds=-110)
+        kalshi_ml = self.make_odds(Provider.KALSHI, BetType.MONEYLINE, home_ml=-105, away_ml=-105)
+        game.add_odds("odds_api_draftkings_moneyline", dk_ml)
+        game.add_odds("odds_api_draftkings_total", dk_total)
+        game.add_odds("kalshi_kalshi_moneyline", kalshi_ml)
+        
+        assert game.get_odds_by_provider(Provider.ODDS_API) == [dk_ml, dk_total]
+        assert game.get_odds_by_provider(Provider.POLYMARKET) == []
+        assert game.get_odds_by_bet_type(BetType.MONEYLINE) == [dk_ml, kalshi_ml]
+        assert game.get_odds(Provider.ODDS_API, "draftkings", BetType.TOTAL) is dk_total
+        assert game.get_odds(Provider.KALSHI, None, BetType.MONEYLINE) is kalshi_ml
+        
+        # Overwriting a key replaces its index entries
+        updated = self.make_odds(Provider.ODDS_API, BetType.MONEYLINE, bookmaker="draftkings", home_ml=-120, away_ml=110)
+        game.add_odds("odds_api_draftkings_moneyline", updated)
+        assert game.get_odds_by_bet_type(BetType.MONEYLINE) == [updated, kalshi_ml]
+        
+        del game.odds["kalshi_kalshi_moneyline"]
+        assert game.get_odds(Provider.KALSHI, None, BetType.MONEYLINE) is None
+        assert len(game.odds) == 2 and "odds_api_draftkings_total" in game.odds
+
 class TestOrder:
     """Test cases for Order model"""
     
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the provider fetch cache and rate limiter
+"""
+
+from datetime import datetime
+
+from market_data.base import DataProvider
+from models import Game, Odds
+from config.constants import Sport, Provider, BetType
+from utils.provider_cache import TTLCache, TokenBucket
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+class CountingProvider(DataProvider):
+    """Provider that counts upstream fetches"""
+
+    fetches = 0
+
+    def fetch_games(self, sport: str, date=None):
+        CountingProvider.fetches += 1
+        return [{'id': 'g1'}]
+
+    def parse_games(self, raw_data):
+        return raw_data
+
+    def normalize_games(self, parsed_data):
+        game = Game(game_id=f"counting_{parsed_data[0]['id']}", sport=Sport.NFL, home_team="KC",
+                    away_team="BUF", start_time=datetime(2025, 9, 8, 0, 15))
+        game.add_odds("counting_moneyline", Odds(provider=Provider.ODDS_API, bet_type=BetType.MONEYLINE,
+                                                 timestamp=datetime.now(), home_ml=-110, away_ml=100))
+        return [game]
+
+class TestTTLCache:
+    """Test cases for TTLCache"""
+
+    def test_expiry_and_lru_eviction(self):
+        """Entries expire after the TTL and the least recently used go first"""
+        clock = FakeClock()
+        cache = TTLCache(ttl_seconds=10, max_entries=2, clock=clock)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == (True, 1)  # 'a' is now most recently used
+        cache.put('c', 3)
+        assert cache.get('b') == (False, None)
+        assert cache.get('c') == (True, 3)
+
+        clock.now = 11
+        assert cache.get('a') == (False, None)
+        stats = cache.get_stats()
+        assert stats['evictions'] == 1 and stats['expired'] == 1
+
+class TestTokenBucket:
+    """Test cases for TokenBucket"""
+
+    def test_burst_then_refill_rate(self):
+        """A full bucket allows a burst; later requests wait for the refill"""
+        clock = FakeClock()
+        bucket = TokenBucket(requests_per_minute=60, capacity=2, clock=clock, sleep=clock.sleep)
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert abs(bucket.acquire() - 1.0) < 1e-9
+        assert bucket.waits == 1
+
+    def test_disabled_when_rate_is_zero(self):
+        assert TokenBucket(requests_per_minute=0).acquire() == 0.0
+
+class TestProviderCaching:
+    """Test cases for DataProvider.get_games caching"""
+
+    def test_repeat_calls_served_from_memory(self):
+        """A second instance within the TTL reuses the fetch and gets independent copies"""
+        CountingProvider.fetches = 0
+        first = CountingProvider("counting_test")
+        first.invalidate_cache()
+        games = first.get_games('nfl')
+        games[0].add_provider_id(Provider.KALSHI, "merged_in")
+        games[0].add_odds("kalshi_moneyline", Odds(provider=Provider.KALSHI, bet_type=BetType.MONEYLINE,
+                                                   timestamp=datetime.now(), home_ml=-105, away_ml=-105))
+
+        again = CountingProvider("counting_test").get_games('nfl')
+        assert CountingProvider.fetches == 1
+        assert list(again[0].odds) == ["counting_moneyline"]
+        assert again[0].provider_ids == {}
+
+        # Other sports and dates are separate entries; invalidation forces a refetch
+        first.get_games('nfl', datetime(2025, 9, 8))
+        assert CountingProvider.fetches == 2
+        first.invalidate_cache('nfl')
+        first.get_games('nfl')
+        assert CountingProvider.fetches == 3
+
+    def test_cache_can_be_bypassed(self):
+        CountingProvider.fetches = 0
+        provider = CountingProvider("counting_bypass")
+        provider.get_games('nfl', use_cache=False)
+        provider.get_games('nfl', use_cache=False)
+        assert CountingProvider.fetches == 2
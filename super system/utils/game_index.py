@@ -0,0 +1,153 @@
+"""
+Game Key Index - Interned canonical game keys for cross-provider merging
+A game's key is (sport id, home team id, away team id, UTC day) as small ints, so providers that
+spell teams differently ('KC' vs 'Kansas City Chiefs') land on the same key
+"""
+
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from config.constants import Sport, TEAM_CODES
+
+GameKey = Tuple[int, int, int, int]
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+_EPOCH_DAY_SECONDS = 86400
+
+def normalize_team_key(team_name: str) -> str:
+    """Lookup key for a team name: uppercase, punctuation stripped, single spaces"""
+    key = _PUNCTUATION.sub('', team_name.upper())
+    return _WHITESPACE.sub(' ', key).strip()
+
+def utc_seconds(start_time: datetime) -> float:
+    """Epoch seconds of a start time (naive times are taken as UTC)"""
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    return start_time.timestamp()
+
+def utc_day(start_time: datetime) -> int:
+    """Days since the epoch of a start time in UTC (naive times are taken as UTC)"""
+    return int(utc_seconds(start_time) // _EPOCH_DAY_SECONDS)
+
+class TeamIdRegistry:
+    """Resolves provider team spellings to standard codes and interns them as small ints"""
+
+    def __init__(self, team_codes: Optional[Dict] = None):
+        """
+        Compile the alias maps
+
+        Args:
+            team_codes: Sport -> ({code: full name}, {alternate code: code}) (defaults to TEAM_CODES)
+        """
+        team_codes = team_codes if team_codes is not None else TEAM_CODES
+        self._aliases: Dict[str, Dict[str, str]] = {}
+        for sport, (teams, alternate_codes) in team_codes.items():
+            aliases = {}
+            nicknames = {}
+            cities = {}
+            for code, full_name in teams.items():
+                aliases[normalize_team_key(code)] = code
+                aliases[normalize_team_key(full_name)] = code
+                city, _, nickname = full_name.rpartition(' ')
+                nicknames.setdefault(normalize_team_key(nickname), set()).add(code)
+                cities.setdefault(normalize_team_key(city), set()).add(code)
+            # Bare nicknames and cities only when they name exactly one team (not 'New York')
+            for partial in (nicknames, cities):
+                for key, codes in partial.items():
+                    if key and len(codes) == 1:
+                        aliases.setdefault(key, next(iter(codes)))
+            for alternate, code in alternate_codes.items():
+                aliases.setdefault(normalize_team_key(alternate), code)
+            self._aliases[sport.value] = aliases
+
+        self._sport_ids = {sport: i for i, sport in enumerate(Sport)}
+        self._lock = threading.Lock()
+        self._ids: Dict[Tuple[str, str], int] = {}
+
+    def code(self, sport: Sport, team_name: str) -> str:
+        """Standard code for a team name, or its normalized form if it has no alias entry"""
+        key = normalize_team_key(team_name or '')
+        return self._aliases.get(sport.value, {}).get(key, key)
+
+    def intern(self, sport: Sport, value: str) -> int:
+        """Small int id for a (sport, value) pair, assigned on first sight"""
+        id_key = (sport.value, value)
+        team_id = self._ids.get(id_key)
+        if team_id is None:
+            with self._lock:
+                team_id = self._ids.setdefault(id_key, len(self._ids))
+        return team_id
+
+    def team_id(self, sport: Sport, team_name: str) -> int:
+        """Interned id of a team's standard code"""
+        return self.intern(sport, self.code(sport, team_name))
+
+    def game_key(self, sport: Sport, home_team: str, away_team: str, start_time: datetime) -> GameKey:
+        """Canonical (sport, home, away, UTC day) key"""
+        return (
+            self._sport_ids[sport],
+            self.team_id(sport, home_team),
+            self.team_id(sport, away_team),
+            utc_day(start_time)
+        )
+
+class GameKeyIndex:
+    """One aggregation's merged items per matchup, matched on start time rather than day bucket"""
+
+    def __init__(self, max_gap_hours: float = 12):
+        """
+        Args:
+            max_gap_hours: Largest start-time difference between quotes of the same game
+        """
+        self.max_gap_seconds = max_gap_hours * 3600
+        self._span_days = int(self.max_gap_seconds // _EPOCH_DAY_SECONDS) + 1
+        self._entries: Dict[GameKey, List[list]] = {}  # key -> [[start seconds, item, sources]]
+        self._by_item: Dict[int, list] = {}
+
+    def find(self, key: GameKey, start_time: datetime, source: Hashable = None):
+        """
+        Stored item of the same matchup starting closest to start_time within max_gap_hours
+
+        Items that already hold a game from source are skipped, so one provider's rematches
+        never merge with each other.
+        """
+        started = utc_seconds(start_time)
+        sport_id, home_id, away_id, day = key
+        best, best_gap = None, None
+        for shifted in range(day - self._span_days, day + self._span_days + 1):
+            for entry_start, item, sources in self._entries.get((sport_id, home_id, away_id, shifted), ()):
+                gap = abs(entry_start - started)
+                if gap <= self.max_gap_seconds and source not in sources and (best_gap is None or gap < best_gap):
+                    best, best_gap = item, gap
+        return best
+
+    def add(self, key: GameKey, item, start_time: datetime, source: Hashable = None):
+        """Store a new item, or record another source merged into an item already stored"""
+        entry = self._by_item.get(id(item))
+        if entry is None:
+            entry = self._by_item[id(item)] = [utc_seconds(start_time), item, set()]
+            self._entries.setdefault(key, []).append(entry)
+        if source is not None:
+            entry[2].add(source)
+
+    def values(self) -> Iterable:
+        return [entry[1] for entry in self._by_item.values()]
+
+    def __len__(self) -> int:
+        return len(self._by_item)
+
+
+_shared_registry = None
+_shared_lock = threading.Lock()
+
+def get_team_registry() -> TeamIdRegistry:
+    """Get the process-wide registry shared by every provider and the aggregator"""
+    global _shared_registry
+    if _shared_registry is None:
+        with _shared_lock:
+            if _shared_registry is None:
+                _shared_registry = TeamIdRegistry()
+    return _shared_registry
@@ -0,0 +1,142 @@
+"""
+Provider Cache - TTL/LRU cache of provider fetches and a token-bucket request limiter
+Shared process-wide so every aggregator, viewer and demo in the process reuses recent fetches
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after a TTL"""
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 256,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache
+
+        Args:
+            ttl_seconds: Seconds an entry stays fresh (0 disables caching)
+            max_entries: Least recently used entries are evicted beyond this
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()  # key -> (stored_at, value)
+        self._counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'expired': 0}
+
+    def get(self, key: Hashable, ttl_seconds: Optional[float] = None) -> Tuple[bool, Any]:
+        """(found, value) for a key stored within the TTL"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._clock() - entry[0] < ttl:
+                    self._entries.move_to_end(key)
+                    self._counters['hits'] += 1
+                    return True, entry[1]
+                del self._entries[key]
+                self._counters['expired'] += 1
+            self._counters['misses'] += 1
+            return False, None
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entries over max_entries"""
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None):
+        """Drop entries whose key matches the predicate, or all of them"""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if predicate(key)]:
+                    del self._entries[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._counters)
+            stats['entries'] = len(self._entries)
+        return stats
+
+
+class TokenBucket:
+    """Token-bucket limiter: bursts up to capacity, refilled at requests_per_minute"""
+
+    def __init__(self, requests_per_minute: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize the bucket (full)
+
+        Args:
+            requests_per_minute: Sustained request rate (0 or less disables limiting)
+            capacity: Largest burst (defaults to one minute's worth)
+            clock: Monotonic time source (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.rate_per_second = requests_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, float(requests_per_minute))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self.waits = 0
+        self.waited_seconds = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+        self._updated_at = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, sleeping until they are available; returns seconds waited"""
+        if self.rate_per_second <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(self._clock())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    if waited:
+                        self.waits += 1
+                        self.waited_seconds += waited
+                    return waited
+                delay = (tokens - self._tokens) / self.rate_per_second
+            self._sleep(delay)
+            waited += delay
+
+
+_shared_cache = None
+_shared_limiters: Dict[str, TokenBucket] = {}
+_shared_lock = threading.Lock()
+
+def get_provider_cache() -> TTLCache:
+    """Get the process-wide cache of provider fetches (CACHE_TTL_SECONDS, CACHE_MAX_ENTRIES)"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                from config.settings import CACHE_TTL_SECONDS, CACHE_MAX_ENTRIES
+                _shared_cache = TTLCache(ttl_seconds=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES)
+    return _shared_cache
+
+def get_rate_limiter(provider_name: str) -> TokenBucket:
+    """Get the process-wide limiter for one provider (REQUESTS_PER_MINUTE)"""
+    limiter = _shared_limiters.get(provider_name)
+    if limiter is None:
+        with _shared_lock:
+            limiter = _shared_limiters.get(provider_name)
+            if limiter is None:
+                from config.settings import REQUESTS_PER_MINUTE
+                limiter = _shared_limiters[provider_name] = TokenBucket(REQUESTS_PER_MINUTE)
+    return limiter
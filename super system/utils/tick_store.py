@@ -0,0 +1,190 @@
+"""
+Odds Tick Store - Append-only SQLite history of quotes across platforms
+Ticks are keyed by (platform, sport, game_key, market, side, ts) and indexed for game/time range reads
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Union
+
+TICK_FIELDS = ('platform', 'sport', 'game_key', 'market', 'side', 'ts',
+               'american', 'implied_probability', 'price', 'line', 'source_id')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ticks (
+    platform TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    game_key TEXT NOT NULL,
+    market TEXT NOT NULL DEFAULT 'h2h',
+    side TEXT NOT NULL,
+    ts REAL NOT NULL,
+    american INTEGER,
+    implied_probability REAL,
+    price REAL,
+    line REAL,
+    source_id TEXT,
+    PRIMARY KEY (platform, sport, game_key, market, side, ts)
+);
+CREATE INDEX IF NOT EXISTS idx_ticks_game_time ON ticks (game_key, ts);
+CREATE INDEX IF NOT EXISTS idx_ticks_sport_time ON ticks (sport, ts);
+"""
+
+def canonical_game_key(sport: str, game_date: Optional[str], home_team: str, away_team: str) -> str:
+    """Platform-independent game id, e.g. 'MLB:2025-08-21:BOS@NYY' (teams as standardized codes)"""
+    return f"{sport.upper()}:{game_date or 'unknown'}:{away_team}@{home_team}"
+
+def to_epoch(timestamp: Union[str, float, int, datetime, None]) -> Optional[float]:
+    """Epoch seconds from an ISO string (Z or offset), datetime or number"""
+    if timestamp is None or isinstance(timestamp, (int, float)):
+        return timestamp
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+
+class OddsTickStore:
+    """SQLite-backed tick history shared by every fetch path in the process"""
+
+    def __init__(self, db_path: str, dedupe: bool = True):
+        """
+        Open (or create) the store
+
+        Args:
+            db_path: SQLite file path (':memory:' for a throwaway store)
+            dedupe: Skip ticks whose quote equals the last one written for the same key
+        """
+        if db_path != ':memory:':
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self.dedupe = dedupe
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ':memory:':
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        # (platform, sport, game_key, market, side) -> (american, price, line) of the last written tick
+        self._last_quotes: Dict[tuple, tuple] = {}
+
+    def append_ticks(self, ticks: Iterable[Dict]) -> int:
+        """
+        Write a batch of ticks in one transaction
+
+        Args:
+            ticks: Dicts with platform, sport, game_key, side, ts plus any of market,
+                   american, implied_probability, price, line, source_id
+
+        Returns:
+            Number of ticks written (duplicates and unchanged quotes are skipped)
+        """
+        insert = f"INSERT OR IGNORE INTO ticks ({', '.join(TICK_FIELDS)}) VALUES ({', '.join('?' * len(TICK_FIELDS))})"
+        written = 0
+        with self._lock:
+            quotes = {}
+            with self._conn:
+                for tick in ticks:
+                    key = (tick['platform'], tick['sport'], tick['game_key'], tick.get('market', 'h2h'), tick['side'])
+                    quote = (tick.get('american'), tick.get('price'), tick.get('line'))
+                    if self.dedupe and quotes.get(key, self._last_quotes.get(key)) == quote:
+                        continue
+                    row = key + (to_epoch(tick['ts']), tick.get('american'), tick.get('implied_probability'),
+                                 tick.get('price'), tick.get('line'), tick.get('source_id'))
+                    # A row ignored on a (key, ts) collision was not stored, so it is not the last quote
+                    if self._conn.execute(insert, row).rowcount:
+                        quotes[key] = quote
+                        written += 1
+            # Only remember quotes once they are committed
+            self._last_quotes.update(quotes)
+            return written
+
+    def query_ticks(self, game_key: Optional[str] = None, platform: Optional[str] = None,
+                    sport: Optional[str] = None, market: Optional[str] = None, side: Optional[str] = None,
+                    start=None, end=None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Range query ordered by time
+
+        Args:
+            game_key: Canonical game id
+            platform: Platform name (e.g. 'pinnacle', 'kalshi', 'polymarket')
+            sport: Sport code
+            market: Market type ('h2h', 'spreads', 'totals')
+            side: Side ('home', 'away', 'over', 'under')
+            start: Inclusive lower time bound (ISO string, datetime or epoch seconds)
+            end: Exclusive upper time bound
+            limit: Maximum rows to return
+
+        Returns:
+            List of tick dicts in ascending ts order
+        """
+        clauses, params = [], []
+        for column, value in (('game_key', game_key), ('platform', platform), ('sport', sport),
+                              ('market', market), ('side', side)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(to_epoch(start))
+        if end is not None:
+            clauses.append("ts < ?")
+            params.append(to_epoch(end))
+
+        sql = f"SELECT {', '.join(TICK_FIELDS)} FROM ticks"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def latest_quotes(self, game_key: str) -> List[Dict]:
+        """Most recent tick for every (platform, market, side) of a game"""
+        sql = f"""
+            SELECT {', '.join(TICK_FIELDS)} FROM ticks AS t
+            WHERE game_key = ? AND ts = (
+                SELECT MAX(ts) FROM ticks
+                WHERE game_key = t.game_key AND platform = t.platform AND market = t.market AND side = t.side
+            )
+            ORDER BY platform, market, side
+        """
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, (game_key,))]
+
+    def game_keys(self, sport: Optional[str] = None, start=None, end=None) -> List[str]:
+        """Distinct games with ticks, optionally for one sport and time range"""
+        clauses, params = [], []
+        if sport is not None:
+            clauses.append("sport = ?")
+            params.append(sport)
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(to_epoch(start))
+        if end is not None:
+            clauses.append("ts < ?")
+            params.append(to_epoch(end))
+        sql = "SELECT DISTINCT game_key FROM ticks"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY game_key"
+        with self._lock:
+            return [row[0] for row in self._conn.execute(sql, params)]
+
+    def count(self) -> int:
+        """Total ticks stored"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM ticks").fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
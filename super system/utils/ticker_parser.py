@@ -0,0 +1,148 @@
+"""
+Kalshi Ticker Parser - Compiled, cached parsing of Kalshi market tickers
+Single source of truth for series, date, team codes and side across clients and the dashboard
+"""
+
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+MONTHS = {
+    'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4, 'MAY': 5, 'JUN': 6,
+    'JUL': 7, 'AUG': 8, 'SEP': 9, 'OCT': 10, 'NOV': 11, 'DEC': 12
+}
+
+# SERIES-YYMMMDD[MATCHUP][-TAIL], e.g. KXMLBGAME-25AUG21HOUBAL-HOU or NFLGAME-25SEP08-DAL-PHI;
+# the tail may carry a decimal strike (KXHIGHNY-25AUG17-B85.5)
+_TICKER_PATTERN = re.compile(
+    r'^(?P<series>[A-Z0-9]+)-(?P<year>\d{2})(?P<month>' + '|'.join(MONTHS) + r')(?P<day>\d{2})'
+    r'(?P<matchup>[A-Z0-9]*)(?:-(?P<tail>[A-Z0-9.-]+))?$'
+)
+
+# Between/threshold strike of a range market, e.g. B85.5 or T6399.99
+_STRIKE_PATTERN = re.compile(r'^[BT]\d+(?:\.\d+)?$')
+
+class TickerInfo(NamedTuple):
+    """Structured Kalshi ticker: team_codes are in ticker order (away first for game series)"""
+    ticker: str
+    series: str
+    year: int
+    date: str  # YYYY-MM-DD
+    team_codes: Tuple[str, ...]
+    side: Optional[str]  # Team the YES contract is on, None for event tickers
+
+    @property
+    def event_ticker(self) -> str:
+        """Ticker of the game event both side markets belong to (side suffix dropped)"""
+        if self.side and self.ticker.endswith(f"-{self.side}"):
+            return self.ticker[:-len(self.side) - 1]
+        return self.ticker
+
+    @property
+    def away_code(self) -> Optional[str]:
+        return self.team_codes[0] if len(self.team_codes) == 2 else None
+
+    @property
+    def home_code(self) -> Optional[str]:
+        return self.team_codes[1] if len(self.team_codes) == 2 else None
+
+    def to_dict(self) -> Dict:
+        """JSON-friendly form (used to embed parsed tickers in the dashboard)"""
+        return {
+            'series': self.series,
+            'year': self.year,
+            'date': self.date,
+            'team_codes': list(self.team_codes),
+            'side': self.side,
+            'event_ticker': self.event_ticker
+        }
+
+def _is_edge_code(matchup: str, code: str) -> bool:
+    """Whether code is a strict prefix or suffix of a concatenated matchup"""
+    return len(matchup) > len(code) and (matchup.startswith(code) or matchup.endswith(code))
+
+def _split_matchup(matchup: str, side: Optional[str]) -> Tuple[str, ...]:
+    """Split concatenated team codes (e.g. HOUBAL) using the side code, else evenly"""
+    if side and _is_edge_code(matchup, side):
+        if matchup.startswith(side):
+            return (side, matchup[len(side):])
+        return (matchup[:-len(side)], side)
+    if len(matchup) >= 4 and len(matchup) % 2 == 0:
+        half = len(matchup) // 2
+        return (matchup[:half], matchup[half:])
+    return (matchup,) if matchup else ()
+
+@lru_cache(maxsize=65536)
+def parse_ticker(ticker: Optional[str]) -> Optional[TickerInfo]:
+    """
+    Parse a Kalshi market or event ticker
+
+    Handles KXMLBGAME-25AUG21HOUBAL-HOU (matchup + side), KXMLBGAME-25AUG21HOUBAL (event),
+    KX...-25AUG21-STAANN-STA (separate matchup segment), NFLGAME-25SEP08-DAL-PHI (away-home)
+    and range markets such as KXINX-25AUG17H1600-T6399.99 (dated, no teams).
+
+    Returns:
+        TickerInfo, or None when the ticker carries no YYMMMDD date segment
+    """
+    if not ticker:
+        return None
+    match = _TICKER_PATTERN.match(ticker.strip().upper())
+    if not match:
+        return None
+
+    year = 2000 + int(match.group('year'))
+    month = MONTHS[match.group('month')]
+    day = int(match.group('day'))
+    try:
+        date(year, month, day)
+    except ValueError:
+        return None
+
+    matchup = match.group('matchup')
+    tail = match.group('tail').split('-') if match.group('tail') else []
+    side = None
+    if tail and _STRIKE_PATTERN.match(tail[-1]):
+        # Range markets carry a strike (and maybe an hour like H1600), not teams
+        team_codes = ()
+    elif matchup:
+        # -SIDE after an inline matchup
+        side = tail[-1] if tail else None
+        team_codes = _split_matchup(matchup, side)
+    elif len(tail) == 2 and _is_edge_code(tail[0], tail[1]):
+        # -MATCHUP-SIDE
+        side = tail[1]
+        team_codes = _split_matchup(tail[0], side)
+    elif len(tail) >= 2:
+        # -AWAY-HOME
+        team_codes = (tail[-2], tail[-1])
+    else:
+        team_codes = _split_matchup(tail[0], None) if tail else ()
+
+    return TickerInfo(
+        ticker=match.string,
+        series=match.group('series'),
+        year=year,
+        date=f"{year:04d}-{month:02d}-{day:02d}",
+        team_codes=team_codes,
+        side=side
+    )
+
+def parse_tickers(tickers: Iterable[Optional[str]]) -> List[Optional[TickerInfo]]:
+    """Parse many tickers at once (repeats hit the cache), preserving input order"""
+    return [parse_ticker(ticker) for ticker in tickers]
+
+def parse_ticker_map(tickers: Iterable[Optional[str]]) -> Dict[str, Dict]:
+    """Distinct parseable tickers -> to_dict() records, for embedding in generated pages"""
+    parsed = {}
+    for ticker in tickers:
+        if ticker and ticker not in parsed:
+            info = parse_ticker(ticker)
+            if info is not None:
+                parsed[ticker] = info.to_dict()
+    return parsed
+
+def ticker_date(ticker: Optional[str]) -> Optional[str]:
+    """YYYY-MM-DD game date carried by a ticker, or None"""
+    info = parse_ticker(ticker)
+    return info.date if info else None